@@ -6,7 +6,7 @@ import json
 import math
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
 
 
 SUMMARY_SYSTEM_PROMPT = """You are creating a compact checkpoint summary for a long-running LN2 inventory agent session.
@@ -94,6 +94,36 @@ def _estimate_text_token_count(text: str) -> int:
     return max(1, int(math.ceil(len(raw) / 3.0)))
 
 
+def _utf8_size(text: str) -> int:
+    return len(str(text or "").encode("utf-8", errors="ignore"))
+
+
+def _bytes_to_tokens(size: int) -> int:
+    return max(1, int(math.ceil(size / 3.0)))
+
+
+# Optional real tokenizers keyed by provider id (see ``detect_llm_identity``).
+# A counter takes compact JSON text and returns its token count.
+_PROVIDER_TOKEN_COUNTERS: dict[str, Callable[[str], int]] = {}
+
+
+def register_token_counter(provider: str, counter: Callable[[str], int] | None) -> None:
+    """Install (or with ``None`` remove) a real tokenizer for one provider."""
+    key = _coerce_text(provider).lower()
+    if not key:
+        return
+    if counter is None:
+        _PROVIDER_TOKEN_COUNTERS.pop(key, None)
+    else:
+        _PROVIDER_TOKEN_COUNTERS[key] = counter
+
+
+def resolve_token_counter(llm_client) -> Callable[[str], int] | None:
+    """Return the tokenizer for ``llm_client``; None means the byte estimate."""
+    provider, _model = detect_llm_identity(llm_client)
+    return _PROVIDER_TOKEN_COUNTERS.get(provider)
+
+
 def _dump_json_compact(value: Any) -> str:
     return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
 
@@ -174,20 +204,168 @@ def build_resume_messages(summary_state) -> list[dict]:
     ]
 
 
-def estimate_main_call_tokens(system_content: str, raw_messages: list[dict], tool_schemas, summary_state) -> int:
+class ContextTokenLedger:
+    """Running token estimate of the main-call payload across ReAct steps.
+
+    Each message is serialized once and its size is cached by identity;
+    ``sync`` then only measures messages appended since the previous step and
+    drops the prefix folded into a checkpoint.  Messages are never mutated
+    after being appended to ``raw_messages``, which is what makes identity a
+    safe cache key.  The system prompt, resume messages and tool schemas are
+    memoized the same way.
+
+    Without a tokenizer the ledger counts UTF-8 bytes and converts them with
+    the same ``ceil(bytes / 3)`` rule as ``estimate_token_count`` over the
+    whole payload, so results match the uncached estimate exactly.  With a
+    tokenizer every item is counted separately and the counts are summed.
+    """
+
+    __slots__ = ("_tokenizer", "_entries", "_units_total", "_message_units", "_memo")
+
+    def __init__(self, tokenizer: Callable[[str], int] | None = None):
+        self._tokenizer = tokenizer
+        self._entries: list[tuple[dict, int]] = []
+        self._units_total = 0
+        self._message_units: dict[int, tuple[Any, int]] = {}
+        self._memo: dict[str, tuple[Any, int]] = {}
+
+    @classmethod
+    def for_client(cls, llm_client) -> "ContextTokenLedger":
+        return cls(tokenizer=resolve_token_counter(llm_client))
+
+    def _units(self, value: Any) -> int:
+        text = value if isinstance(value, str) else _dump_json_compact(value)
+        if self._tokenizer is None:
+            return _utf8_size(text)
+        return max(0, int(self._tokenizer(text)))
+
+    def _to_tokens(self, units: int) -> int:
+        return _bytes_to_tokens(units) if self._tokenizer is None else units
+
+    def _list_tokens(self, item_units: int, item_count: int) -> int:
+        # A compact JSON list adds "[", "]" and one "," between items.
+        if self._tokenizer is None:
+            return _bytes_to_tokens(item_units + 2 + max(0, item_count - 1))
+        return item_units
+
+    def message_units(self, message: Any) -> int:
+        cached = self._message_units.get(id(message))
+        if cached is not None and cached[0] is message:
+            return cached[1]
+        units = self._units(message)
+        self._message_units[id(message)] = (message, units)
+        return units
+
+    def message_tokens(self, message: Any) -> int:
+        return self._to_tokens(self.message_units(message))
+
+    def _memoized_units(self, kind: str, key: Any, units_factory: Callable[[], int]) -> int:
+        # One slot per kind: the system prompt, summary and schemas of a run
+        # change rarely, so the last value is the only one worth keeping.
+        cached = self._memo.get(kind)
+        if cached is not None and (cached[0] is key or (isinstance(key, str) and cached[0] == key)):
+            return cached[1]
+        units = units_factory()
+        self._memo[kind] = (key, units)
+        return units
+
+    def _system_units(self, system_content: str) -> int:
+        text = str(system_content or "")
+        return self._memoized_units("system", text, lambda: self._units({"role": "system", "content": text}))
+
+    def _resume_units(self, summary_state) -> tuple[int, int]:
+        resume_messages = build_resume_messages(summary_state)
+        if not resume_messages:
+            return 0, 0
+        key = "\n".join(str(item.get("content") or "") for item in resume_messages)
+        units = self._memoized_units("resume", key, lambda: sum(self._units(item) for item in resume_messages))
+        return units, len(resume_messages)
+
+    def _schema_tokens(self, tool_schemas) -> int:
+        if tool_schemas in (None, "", [], {}, ()):
+            return 0
+        # tool_schemas() attaches its cached compact JSON; reuse it when present.
+        serialized = getattr(tool_schemas, "compact_json", None)
+        source = serialized if isinstance(serialized, str) else tool_schemas
+        return self._to_tokens(self._memoized_units("schemas", tool_schemas, lambda: self._units(source)))
+
+    def sync(self, raw_messages: list[dict]) -> int:
+        """Align the running total with ``raw_messages`` and return its units."""
+        messages = raw_messages or []
+        entries = self._entries
+        if entries and messages:
+            first = messages[0]
+            start = next((idx for idx, entry in enumerate(entries) if entry[0] is first), None)
+            if start is None:
+                start = len(entries)
+            for message, units in entries[:start]:
+                self._units_total -= units
+                self._message_units.pop(id(message), None)
+            del entries[:start]
+
+        common = 0
+        limit = min(len(entries), len(messages))
+        while common < limit and entries[common][0] is messages[common]:
+            common += 1
+        for _message, units in entries[common:]:
+            self._units_total -= units
+        del entries[common:]
+
+        for message in messages[common:]:
+            units = self.message_units(message)
+            entries.append((message, units))
+            self._units_total += units
+        return self._units_total
+
+    def static_tokens(self, system_content: str, tool_schemas, summary_state) -> int:
+        """Tokens of the system prompt, resume messages and tool schemas."""
+        resume_units, resume_count = self._resume_units(summary_state)
+        tokens = self._list_tokens(self._system_units(system_content), 1)
+        if resume_count:
+            tokens += self._list_tokens(resume_units, resume_count)
+        return tokens + self._schema_tokens(tool_schemas)
+
+    def main_call_tokens(self, system_content: str, raw_messages: list[dict], tool_schemas, summary_state) -> int:
+        resume_units, resume_count = self._resume_units(summary_state)
+        message_units = self.sync(raw_messages)
+        item_units = self._system_units(system_content) + resume_units + message_units
+        item_count = 1 + resume_count + len(raw_messages or [])
+        return self._list_tokens(item_units, item_count) + self._schema_tokens(tool_schemas)
+
+
+def estimate_main_call_tokens(
+    system_content: str,
+    raw_messages: list[dict],
+    tool_schemas,
+    summary_state,
+    ledger: ContextTokenLedger | None = None,
+) -> int:
+    if ledger is not None:
+        return ledger.main_call_tokens(system_content, raw_messages, tool_schemas, summary_state)
     payload = [{"role": "system", "content": str(system_content or "")}]
     payload.extend(build_resume_messages(summary_state))
     payload.extend(list(raw_messages or []))
     return estimate_token_count(payload) + estimate_token_count(tool_schemas)
 
 
-def needs_checkpoint(system_content: str, raw_messages: list[dict], tool_schemas, summary_state, llm_client) -> bool:
+def _max_main_input_tokens(llm_client) -> int:
     budget = resolve_model_budget(llm_client)
-    max_input_tokens = max(
+    return max(
         256,
         budget["context_window"] - budget["main_output_reserve"] - budget["safety_margin"],
     )
-    return estimate_main_call_tokens(system_content, raw_messages, tool_schemas, summary_state) > max_input_tokens
+
+
+def needs_checkpoint(
+    system_content: str,
+    raw_messages: list[dict],
+    tool_schemas,
+    summary_state,
+    llm_client,
+    ledger: ContextTokenLedger | None = None,
+) -> bool:
+    max_input_tokens = _max_main_input_tokens(llm_client)
+    return estimate_main_call_tokens(system_content, raw_messages, tool_schemas, summary_state, ledger=ledger) > max_input_tokens
 
 
 def _estimate_summary_overhead(summary_state) -> int:
@@ -196,35 +374,52 @@ def _estimate_summary_overhead(summary_state) -> int:
     return current + _DEFAULT_SUMMARY_GROWTH_ALLOWANCE
 
 
-def select_tail_messages(system_content: str, raw_messages: list[dict], tool_schemas, summary_state, llm_client) -> list[dict]:
+def _select_tail_count(
+    system_content: str,
+    raw_messages: list[dict],
+    tool_schemas,
+    summary_state,
+    llm_client,
+    ledger: ContextTokenLedger | None = None,
+) -> int:
     if not raw_messages:
-        return []
+        return 0
 
-    budget = resolve_model_budget(llm_client)
-    max_input_tokens = max(
-        256,
-        budget["context_window"] - budget["main_output_reserve"] - budget["safety_margin"],
-    )
-    base_tokens = estimate_token_count([{"role": "system", "content": str(system_content or "")}])
-    base_tokens += estimate_token_count(build_resume_messages(summary_state))
-    base_tokens += estimate_token_count(tool_schemas)
+    max_input_tokens = _max_main_input_tokens(llm_client)
+    if ledger is not None:
+        base_tokens = ledger.static_tokens(system_content, tool_schemas, summary_state)
+        message_tokens_of = ledger.message_tokens
+    else:
+        base_tokens = estimate_token_count([{"role": "system", "content": str(system_content or "")}])
+        base_tokens += estimate_token_count(build_resume_messages(summary_state))
+        base_tokens += estimate_token_count(tool_schemas)
+        message_tokens_of = estimate_token_count
     keep_budget = max(0, max_input_tokens - base_tokens - _estimate_summary_overhead(summary_state))
 
-    tail: list[dict] = []
+    tail_count = 0
     running_tokens = 0
-    for message in reversed(list(raw_messages or [])):
-        message_tokens = estimate_token_count(message)
-        if tail and running_tokens + message_tokens > keep_budget:
+    for message in reversed(raw_messages):
+        message_tokens = message_tokens_of(message)
+        if tail_count and running_tokens + message_tokens > keep_budget:
             break
-        tail.append(dict(message))
+        tail_count += 1
         running_tokens += message_tokens
-
-    tail.reverse()
-    if tail:
-        return tail
-
-    minimum_tail = min(len(raw_messages), _MIN_TAIL_MESSAGES)
-    return [dict(item) for item in raw_messages[-minimum_tail:]]
+    return tail_count or min(len(raw_messages), _MIN_TAIL_MESSAGES)
+
+
+def select_tail_messages(
+    system_content: str,
+    raw_messages: list[dict],
+    tool_schemas,
+    summary_state,
+    llm_client,
+    ledger: ContextTokenLedger | None = None,
+) -> list[dict]:
+    messages = list(raw_messages or [])
+    tail_count = _select_tail_count(system_content, messages, tool_schemas, summary_state, llm_client, ledger=ledger)
+    if not tail_count:
+        return []
+    return [dict(item) for item in messages[-tail_count:]]
 
 
 def build_summary_call_messages(summary_state, fold_messages: list[dict]) -> list[dict]:
@@ -318,33 +513,51 @@ def call_summary_model(llm_client, summary_state, fold_messages: list[dict], sto
     }
 
 
-def checkpoint_context(system_content: str, raw_messages: list[dict], tool_schemas, summary_state, llm_client, stop_event=None) -> tuple[list[dict], dict | None, dict | None]:
+def checkpoint_context(
+    system_content: str,
+    raw_messages: list[dict],
+    tool_schemas,
+    summary_state,
+    llm_client,
+    stop_event=None,
+    ledger: ContextTokenLedger | None = None,
+) -> tuple[list[dict], dict | None, dict | None]:
+    """Fold old messages into the summary until the main call fits its budget.
+
+    Returns a new list that shares the kept message dicts with ``raw_messages``.
+    Pass the same ``ledger`` on every step of a run so only new messages are
+    measured.
+    """
     normalized_state = normalize_summary_state(summary_state, llm_client=llm_client)
-    current_messages = [dict(item) for item in list(raw_messages or [])]
+    current_messages = list(raw_messages or [])
     latest_event = None
+    if ledger is None:
+        ledger = ContextTokenLedger.for_client(llm_client)
 
     for _attempt in range(6):
-        if not needs_checkpoint(system_content, current_messages, tool_schemas, normalized_state, llm_client):
+        if not needs_checkpoint(system_content, current_messages, tool_schemas, normalized_state, llm_client, ledger=ledger):
             return current_messages, normalized_state, latest_event
 
         if current_messages:
-            tail = select_tail_messages(system_content, current_messages, tool_schemas, normalized_state, llm_client)
-            tail_count = len(tail)
+            tail_count = _select_tail_count(
+                system_content,
+                current_messages,
+                tool_schemas,
+                normalized_state,
+                llm_client,
+                ledger=ledger,
+            )
             fold_messages = current_messages[:-tail_count] if tail_count else list(current_messages)
             if not fold_messages and len(current_messages) > 1:
                 fold_messages = current_messages[:-1]
-                tail = current_messages[-1:]
         else:
             fold_messages = []
-            tail = []
 
         if not fold_messages and normalized_state is None:
             return current_messages, normalized_state, latest_event
 
         fold_messages = _cap_fold_messages_for_summary(normalized_state, fold_messages, llm_client)
         current_messages = current_messages[len(fold_messages):]
-        if tail:
-            current_messages = [dict(item) for item in current_messages]
 
         normalized_state = call_summary_model(
             llm_client,
@@ -28,6 +28,14 @@ def _parse_tool_content(content: str) -> dict | None:
         return None
 
 
+def _keep_page_cursor(summary: dict[str, Any], result: dict) -> None:
+    """Carry the paging cursor of a paged result into its summary."""
+    page = result.get("page")
+    if isinstance(page, dict) and page.get("has_more") and page.get("next_cursor"):
+        summary["available"] = page.get("available")
+        summary["next_cursor"] = page["next_cursor"]
+
+
 def _summarize_tool_result(content: str) -> str:
     """Compress a tool result into a one-line summary preserving key fields.
 
@@ -71,6 +79,7 @@ def _summarize_tool_result(content: str) -> str:
             if compact_items:
                 summary["items"] = compact_items
                 summary["count"] = len(compact_items)
+                _keep_page_cursor(summary, result)
                 return json.dumps(summary, ensure_ascii=False)
 
         # Extract key fields directly from result dict.
@@ -88,6 +97,7 @@ def _summarize_tool_result(content: str) -> str:
             else:
                 summary["records"] = records[:2]
                 summary["truncated"] = True
+            _keep_page_cursor(summary, result)
             return json.dumps(summary, ensure_ascii=False)
 
     # Fallback: keep the message field if present.
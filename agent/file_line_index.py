@@ -0,0 +1,188 @@
+"""Line index and ranged reads for ``fs_read``.
+
+Migration inputs can be CSV/YAML files of many megabytes.  Instead of
+decoding a whole file, ``fs_read`` reads line windows, byte ranges and
+grep-style match windows through a memory-mapped view.  Line start offsets
+are computed once per file version (path, mtime, size) and cached, so paging
+through a large file only touches the bytes of each requested window.
+
+Encodings whose newline is not the single byte ``\\n`` (UTF-16/32) cannot be
+indexed by byte offsets; those files are decoded in memory instead.
+
+Windows are bounded in bytes as well as lines: ``fit_window`` shrinks a
+line range to a byte budget and ``text_prefix`` cuts a range that cannot be
+shrunk (a single huge line) at that budget.
+"""
+
+from __future__ import annotations
+
+from array import array
+import codecs
+from collections import OrderedDict
+import mmap
+import os
+import threading
+
+
+_MAX_CACHED_INDEXES = 8
+
+
+def _is_byte_newline_encoding(encoding):
+    return "\n".encode(encoding) == b"\n" and "a".encode(encoding) == b"a"
+
+
+def _file_stamp(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _build_line_starts(path, size):
+    starts = array("q")
+    if size <= 0:
+        return starts
+    starts.append(0)
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        position = view.find(b"\n")
+        while position >= 0 and position + 1 < size:
+            starts.append(position + 1)
+            position = view.find(b"\n", position + 1)
+    return starts
+
+
+class _MappedLines:
+    """Lines of an ASCII-compatible text file addressed through a line index."""
+
+    def __init__(self, path, encoding, starts, size):
+        self._path = path
+        self._encoding = encoding
+        self._starts = starts
+        self._size = size
+
+    @property
+    def count(self):
+        return len(self._starts)
+
+    def _span(self, first, last):
+        start = self._starts[first]
+        end = self._starts[last] if last < len(self._starts) else self._size
+        return start, end
+
+    def text(self, first, last):
+        """Decode lines ``[first, last)``."""
+        if first >= last:
+            return ""
+        start, end = self._span(first, last)
+        with open(self._path, "rb") as handle:
+            handle.seek(start)
+            return handle.read(end - start).decode(self._encoding)
+
+    def byte_length(self, first, last):
+        if first >= last:
+            return 0
+        start, end = self._span(first, last)
+        return end - start
+
+    def text_prefix(self, first, last, max_bytes):
+        """Decode at most ``max_bytes`` bytes of lines ``[first, last)``."""
+        if first >= last:
+            return ""
+        start, end = self._span(first, last)
+        with open(self._path, "rb") as handle:
+            handle.seek(start)
+            data = handle.read(min(end - start, max(0, int(max_bytes))))
+        # A character split by the cut is held back by the decoder.
+        return codecs.getincrementaldecoder(self._encoding)(errors="replace").decode(data)
+
+    def iter_lines(self):
+        if not self._starts:
+            return
+        with open(self._path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for index in range(len(self._starts)):
+                start, end = self._span(index, index + 1)
+                yield index, view[start:end].decode(self._encoding, errors="replace")
+
+
+class _DecodedLines:
+    """In-memory fallback for encodings that cannot be indexed by bytes."""
+
+    def __init__(self, lines, encoding):
+        self._lines = lines
+        self._encoding = encoding
+
+    @property
+    def count(self):
+        return len(self._lines)
+
+    def text(self, first, last):
+        return "".join(self._lines[first:last])
+
+    def byte_length(self, first, last):
+        return sum(len(line.encode(self._encoding)) for line in self._lines[first:last])
+
+    def text_prefix(self, first, last, max_bytes):
+        data = self.text(first, last).encode(self._encoding)[: max(0, int(max_bytes))]
+        return codecs.getincrementaldecoder(self._encoding)(errors="replace").decode(data)
+
+    def iter_lines(self):
+        yield from enumerate(self._lines)
+
+
+_INDEX_CACHE = OrderedDict()
+_INDEX_LOCK = threading.Lock()
+
+
+def _cached_line_starts(path):
+    key = os.path.normcase(os.path.abspath(str(path)))
+    stamp = _file_stamp(path)
+    with _INDEX_LOCK:
+        cached = _INDEX_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            _INDEX_CACHE.move_to_end(key)
+            return cached[1], stamp[1]
+    starts = _build_line_starts(path, stamp[1])
+    with _INDEX_LOCK:
+        _INDEX_CACHE[key] = (stamp, starts)
+        _INDEX_CACHE.move_to_end(key)
+        while len(_INDEX_CACHE) > _MAX_CACHED_INDEXES:
+            _INDEX_CACHE.popitem(last=False)
+    return starts, stamp[1]
+
+
+def open_text_lines(path, encoding):
+    """Return a line source for ``path`` with ``count``, ``text`` and ``iter_lines``."""
+    if _is_byte_newline_encoding(encoding):
+        starts, size = _cached_line_starts(path)
+        return _MappedLines(path, encoding, starts, size)
+    with open(path, "r", encoding=encoding, newline="") as handle:
+        return _DecodedLines(handle.read().splitlines(keepends=True), encoding)
+
+
+def fit_window(lines, first, last, max_bytes, *, keep_end=False):
+    """Shrink lines ``[first, last)`` to the longest range within ``max_bytes``.
+
+    The range keeps ``first`` (or ``last`` with ``keep_end``) and may come
+    back empty when that single line is over budget.
+    """
+    low, high = 0, max(0, last - first)
+    while low < high:
+        size = (low + high + 1) // 2
+        span = (last - size, last) if keep_end else (first, first + size)
+        if lines.byte_length(*span) <= max_bytes:
+            low = size
+        else:
+            high = size - 1
+    return (last - low, last) if keep_end else (first, first + low)
+
+
+def read_byte_range(path, offset, limit):
+    """Return ``(data, total_bytes)`` for ``limit`` bytes starting at ``offset``."""
+    total = os.stat(path).st_size
+    start = min(max(0, int(offset)), total)
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        return handle.read(max(0, int(limit))), total
+
+
+def clear_line_index_cache():
+    with _INDEX_LOCK:
+        _INDEX_CACHE.clear()
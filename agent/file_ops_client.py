@@ -4,8 +4,12 @@ from __future__ import annotations
 
 from .tool_runtime_paths import derive_migrate_root, derive_repo_root_from_yaml
 
-def run_file_tool(tool_name, args, *, yaml_path):
-    """Execute a file tool via in-process file-operation service."""
+def run_file_tool(tool_name, args, *, yaml_path, shell_pool=None, on_output=None):
+    """Execute a file tool via in-process file-operation service.
+
+    ``shell_pool`` runs ``shell`` commands on persistent workers, which
+    stream output to ``on_output`` as it arrives.
+    """
     repo_root = derive_repo_root_from_yaml(yaml_path)
     migrate_root = derive_migrate_root(repo_root)
     payload = {
@@ -18,7 +22,7 @@ def run_file_tool(tool_name, args, *, yaml_path):
     try:
         from .file_ops_service import handle_request
 
-        response = handle_request(payload)
+        response = handle_request(payload, shell_pool=shell_pool, on_output=on_output)
     except Exception as exc:
         return {
             "ok": False,
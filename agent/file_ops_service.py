@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from pathlib import Path
+import re
 import shutil
 import sys
 
+from .file_line_index import fit_window, open_text_lines, read_byte_range
 from .file_ops_policy import (
     FileOpsPolicyError,
     normalize_roots,
@@ -59,6 +62,16 @@ def _ok_base(repo_root, resolved_path=None):
     return payload
 
 
+# fs_read returns whole files only up to this size; larger files are windowed.
+_FS_READ_FULL_MAX_BYTES = 256 * 1024
+_FS_READ_DEFAULT_LINES = 200
+_FS_READ_MAX_LINES = 2000
+_FS_READ_DEFAULT_BYTES = 64 * 1024
+_FS_READ_MAX_BYTES = 256 * 1024
+_FS_READ_DEFAULT_MATCHES = 50
+_FS_READ_MAX_MATCHES = 500
+
+
 def _parse_positive_int(value, *, field_name, default):
     if value in (None, ""):
         return int(default)
@@ -71,6 +84,18 @@ def _parse_positive_int(value, *, field_name, default):
     return parsed
 
 
+def _parse_non_negative_int(value, *, field_name, default):
+    if value in (None, ""):
+        return int(default)
+    try:
+        parsed = int(value)
+    except Exception as exc:
+        raise FileOpsPolicyError("invalid_tool_input", f"{field_name} must be an integer.") from exc
+    if parsed < 0:
+        raise FileOpsPolicyError("invalid_tool_input", f"{field_name} must be >= 0.")
+    return parsed
+
+
 def _list_dir_entries(target_path, max_entries):
     entries = []
     for idx, item in enumerate(sorted(target_path.iterdir(), key=lambda p: p.name.lower())):
@@ -109,6 +134,145 @@ def _handle_fs_list(args, *, repo_root, migrate_root):
     return payload
 
 
+def _parse_read_window(args):
+    """Return the requested fs_read window, or ``None`` for a whole-file read."""
+    modes = [name for name in ("head", "tail", "pattern") if args.get(name) not in (None, "")]
+    ranged = any(args.get(name) not in (None, "") for name in ("offset", "limit"))
+    if len(modes) + int(ranged) > 1:
+        raise FileOpsPolicyError(
+            "invalid_tool_input",
+            "Use only one of offset/limit, head, tail or pattern.",
+        )
+    unit = str(args.get("unit") or "lines").strip().lower()
+    if unit not in {"lines", "bytes"}:
+        raise FileOpsPolicyError("invalid_tool_input", "unit must be one of: lines, bytes.")
+    if unit == "bytes" and modes:
+        raise FileOpsPolicyError("invalid_tool_input", "unit=bytes only supports offset/limit.")
+
+    if unit == "bytes":
+        if not ranged:
+            return None
+        limit = _parse_positive_int(args.get("limit"), field_name="limit", default=_FS_READ_DEFAULT_BYTES)
+        return {
+            "mode": "bytes",
+            "offset": _parse_non_negative_int(args.get("offset"), field_name="offset", default=0),
+            "limit": min(limit, _FS_READ_MAX_BYTES),
+        }
+    if ranged:
+        limit = _parse_positive_int(args.get("limit"), field_name="limit", default=_FS_READ_DEFAULT_LINES)
+        return {
+            "mode": "lines",
+            "offset": _parse_non_negative_int(args.get("offset"), field_name="offset", default=0),
+            "limit": min(limit, _FS_READ_MAX_LINES),
+        }
+    if "head" in modes:
+        head = _parse_positive_int(args.get("head"), field_name="head", default=_FS_READ_DEFAULT_LINES)
+        return {"mode": "lines", "offset": 0, "limit": min(head, _FS_READ_MAX_LINES)}
+    if "tail" in modes:
+        tail = _parse_positive_int(args.get("tail"), field_name="tail", default=_FS_READ_DEFAULT_LINES)
+        return {"mode": "tail", "limit": min(tail, _FS_READ_MAX_LINES)}
+    if "pattern" in modes:
+        try:
+            pattern = re.compile(str(args.get("pattern")))
+        except re.error as exc:
+            raise FileOpsPolicyError("invalid_tool_input", f"pattern is not a valid regular expression: {exc}") from exc
+        return {
+            "mode": "pattern",
+            "pattern": pattern,
+            "context": min(
+                _parse_non_negative_int(args.get("context"), field_name="context", default=0),
+                _FS_READ_MAX_LINES,
+            ),
+            "max_matches": min(
+                _parse_positive_int(
+                    args.get("max_matches"),
+                    field_name="max_matches",
+                    default=_FS_READ_DEFAULT_MATCHES,
+                ),
+                _FS_READ_MAX_MATCHES,
+            ),
+        }
+    return None
+
+
+def _read_line_window(payload, lines, offset, limit, *, keep_end=False):
+    total = lines.count
+    start = min(offset, total)
+    end = min(start + limit, total)
+    fitted_start, fitted_end = fit_window(lines, start, end, _FS_READ_MAX_BYTES, keep_end=keep_end)
+    if fitted_start < fitted_end or start == end:
+        start, end = fitted_start, fitted_end
+        payload["content"] = lines.text(start, end)
+    else:
+        # One line alone is over the byte cap: return its head.
+        start = end - 1 if keep_end else start
+        end = start + 1
+        payload["content"] = lines.text_prefix(start, end, _FS_READ_MAX_BYTES)
+        payload["truncated_line"] = end
+    payload["unit"] = "lines"
+    payload["start_line"] = start + 1
+    payload["end_line"] = end
+    payload["total_lines"] = total
+    payload["has_more"] = end < total
+    payload["next_offset"] = end if end < total else None
+    return payload
+
+
+def _read_match_windows(payload, lines, pattern, context, max_matches):
+    match_lines = []
+    truncated = False
+    for index, line in lines.iter_lines():
+        if pattern.search(line.rstrip("\r\n")):
+            if len(match_lines) >= max_matches:
+                truncated = True
+                break
+            match_lines.append(index)
+
+    windows = []
+    for index in match_lines:
+        first = max(0, index - context)
+        last = min(lines.count, index + context + 1)
+        if windows and first <= windows[-1]["last"]:
+            windows[-1]["last"] = max(windows[-1]["last"], last)
+            windows[-1]["match_lines"].append(index + 1)
+            continue
+        windows.append({"first": first, "last": last, "match_lines": [index + 1]})
+
+    matches = []
+    budget = _FS_READ_MAX_BYTES
+    for window in windows:
+        size = lines.byte_length(window["first"], window["last"])
+        if size > budget:
+            truncated = True
+            if not matches:
+                # A single window over the byte cap is returned cut short.
+                matches.append(
+                    {
+                        "start_line": window["first"] + 1,
+                        "end_line": window["last"],
+                        "match_lines": window["match_lines"],
+                        "content": lines.text_prefix(window["first"], window["last"], budget),
+                        "content_truncated": True,
+                    }
+                )
+            break
+        budget -= size
+        matches.append(
+            {
+                "start_line": window["first"] + 1,
+                "end_line": window["last"],
+                "match_lines": window["match_lines"],
+                "content": lines.text(window["first"], window["last"]),
+            }
+        )
+
+    payload["matches"] = matches
+    payload["match_count"] = sum(len(match["match_lines"]) for match in matches)
+    payload["truncated"] = truncated
+    payload["total_lines"] = lines.count
+    return payload
+
+
 def _handle_fs_read(args, *, repo_root, migrate_root):
     del migrate_root
     encoding = str(args.get("encoding") or "utf-8").strip() or "utf-8"
@@ -122,15 +286,57 @@ def _handle_fs_read(args, *, repo_root, migrate_root):
             repo_root=repo_root,
             resolved_path=resolved,
         )
-    try:
-        content = resolved.read_text(encoding=encoding)
-    except Exception as exc:
-        return _error_payload("file_read_failed", str(exc), repo_root=repo_root, resolved_path=resolved)
+    window = _parse_read_window(args)
 
     payload = _ok_base(repo_root, resolved)
     payload["encoding"] = encoding
-    payload["content"] = content
-    return payload
+    try:
+        size = resolved.stat().st_size
+        if window is None and size <= _FS_READ_FULL_MAX_BYTES:
+            payload["content"] = resolved.read_text(encoding=encoding)
+            return payload
+        payload["size_bytes"] = size
+
+        if window is not None and window["mode"] == "bytes":
+            data, total = read_byte_range(resolved, window["offset"], window["limit"])
+            start = min(window["offset"], total)
+            end = start + len(data)
+            payload["content"] = data.decode(encoding, errors="replace")
+            payload["unit"] = "bytes"
+            payload["byte_offset"] = start
+            payload["byte_end"] = end
+            payload["has_more"] = end < total
+            payload["next_offset"] = end if end < total else None
+            return payload
+
+        lines = open_text_lines(resolved, encoding)
+        if window is None:
+            _read_line_window(payload, lines, 0, _FS_READ_DEFAULT_LINES)
+            payload["truncated"] = payload["has_more"] or "truncated_line" in payload
+            payload["message"] = (
+                f"File is {size} bytes; returned lines {payload['start_line']}-{payload['end_line']} "
+                f"of {payload['total_lines']}. Use offset/limit, head, tail or pattern to read more."
+            )
+            return payload
+        if window["mode"] == "tail":
+            return _read_line_window(
+                payload,
+                lines,
+                max(0, lines.count - window["limit"]),
+                window["limit"],
+                keep_end=True,
+            )
+        if window["mode"] == "pattern":
+            return _read_match_windows(
+                payload,
+                lines,
+                window["pattern"],
+                window["context"],
+                window["max_matches"],
+            )
+        return _read_line_window(payload, lines, window["offset"], window["limit"])
+    except Exception as exc:
+        return _error_payload("file_read_failed", str(exc), repo_root=repo_root, resolved_path=resolved)
 
 
 def _handle_fs_write(args, *, repo_root, migrate_root):
@@ -395,7 +601,7 @@ def _preflight_shell_workdir_policy(command, *, repo_root, workdir):
     return None
 
 
-def _handle_shell(args, *, repo_root, migrate_root):
+def _handle_shell(args, *, repo_root, migrate_root, shell_pool=None, on_output=None):
     command = args.get("command")
     if not isinstance(command, str) or not command.strip():
         return _error_payload("invalid_tool_input", "command must be a non-empty string.", repo_root=repo_root)
@@ -419,7 +625,11 @@ def _handle_shell(args, *, repo_root, migrate_root):
     if policy_issue:
         return policy_issue
 
-    response = run_terminal_command(
+    if shell_pool is not None:
+        run_command = functools.partial(shell_pool.run, on_output=on_output)
+    else:
+        run_command = run_terminal_command
+    response = run_command(
         command,
         timeout_seconds=(timeout_ms / 1000.0),
         cwd=str(workdir),
@@ -454,7 +664,7 @@ def _handle_shell(args, *, repo_root, migrate_root):
     return enriched
 
 
-def handle_request(request):
+def handle_request(request, *, shell_pool=None, on_output=None):
     if not isinstance(request, dict):
         return _error_payload("invalid_request", "Request payload must be a JSON object.")
 
@@ -482,7 +692,7 @@ def handle_request(request):
         "fs_write": _handle_fs_write,
         "fs_copy": _handle_fs_copy,
         "fs_edit": _handle_fs_edit,
-        "shell": _handle_shell,
+        "shell": functools.partial(_handle_shell, shell_pool=shell_pool, on_output=on_output),
     }
     handler = handlers.get(tool_name)
     if not callable(handler):
@@ -8,6 +8,9 @@ from abc import ABC, abstractmethod
 from urllib import error as urlerror
 from urllib import request as urlrequest
 
+from . import llm_transport
+from . import sse_stream
+
 
 PROVIDER_DEFAULTS = {
     "deepseek": {
@@ -235,8 +238,9 @@ class OpenAICompatibleClient(LLMClient, ABC):
                 "id": tool_call_id,
                 "function": {
                     "name": "",
-                    "arguments": "",
                 },
+                # Argument deltas are joined once in _finalize_tool_calls.
+                "argument_parts": [],
             }
 
         entry = pending[key]
@@ -259,7 +263,7 @@ class OpenAICompatibleClient(LLMClient, ABC):
                 args_text = json.dumps(args_part, ensure_ascii=False)
             else:
                 args_text = str(args_part)
-            entry["function"]["arguments"] += args_text
+            entry["argument_parts"].append(args_text)
 
     @staticmethod
     def _parse_tool_arguments(raw_args):
@@ -288,27 +292,33 @@ class OpenAICompatibleClient(LLMClient, ABC):
                     pass
             return {"_raw_arguments": text}
 
+    @classmethod
+    def _finalize_tool_call_entry(cls, entry, index):
+        func = entry.get("function") if isinstance(entry, dict) else None
+        if not isinstance(func, dict):
+            return None
+
+        name = str(func.get("name") or "").strip()
+        if not name:
+            return None
+
+        if not entry.get("id"):
+            # Keep the generated id so an early ready event and the final
+            # tool_call event describe the same call.
+            entry["id"] = f"call_{uuid.uuid4().hex[:12]}_{index}"
+        return {
+            "id": str(entry["id"]),
+            "name": name,
+            "arguments": cls._parse_tool_arguments("".join(entry.get("argument_parts") or [])),
+        }
+
     @classmethod
     def _finalize_tool_calls(cls, pending):
         finalized = []
         for index, entry in enumerate(pending.values()):
-            func = entry.get("function") if isinstance(entry, dict) else None
-            if not isinstance(func, dict):
-                continue
-
-            name = str(func.get("name") or "").strip()
-            if not name:
-                continue
-
-            call_id = str(entry.get("id") or f"call_{uuid.uuid4().hex[:12]}_{index}")
-            arguments = cls._parse_tool_arguments(func.get("arguments"))
-            finalized.append(
-                {
-                    "id": call_id,
-                    "name": name,
-                    "arguments": arguments,
-                }
-            )
+            tool_call = cls._finalize_tool_call_entry(entry, index)
+            if tool_call is not None:
+                finalized.append(tool_call)
         return finalized
 
     @classmethod
@@ -324,6 +334,28 @@ class OpenAICompatibleClient(LLMClient, ABC):
         for tool_call in raw_tool_calls:
             cls._accumulate_tool_call(pending_tool_calls, tool_call)
 
+    @classmethod
+    def _accumulate_tool_calls_and_yield_ready(cls, pending_tool_calls, *sources):
+        """Accumulate tool-call deltas and announce calls whose arguments are complete.
+
+        Providers stream parallel tool calls one after another, so once a later
+        call starts the earlier ones can no longer change.  Those are reported as
+        ``tool_call_ready`` events ahead of the final ``tool_call`` events, which
+        lets the agent start read-only tools while the stream is still running.
+        """
+        known = len(pending_tool_calls)
+        cls._accumulate_tool_calls_from_sources(pending_tool_calls, *sources)
+        if len(pending_tool_calls) <= max(known, 1):
+            return
+        entries = list(pending_tool_calls.values())
+        for index, entry in enumerate(entries[:-1]):
+            if entry.get("announced"):
+                continue
+            entry["announced"] = True
+            tool_call = cls._finalize_tool_call_entry(entry, index)
+            if tool_call is not None and "_raw_arguments" not in tool_call["arguments"]:
+                yield {"type": "tool_call_ready", "tool_call": tool_call}
+
     @classmethod
     def _yield_finalized_tool_call_events(cls, pending_tool_calls):
         for tool_call in cls._finalize_tool_calls(pending_tool_calls):
@@ -333,6 +365,13 @@ class OpenAICompatibleClient(LLMClient, ABC):
     def _is_stopping(self, stop_event=None):
         return self._local_stop.is_set() or _is_stop_requested(stop_event)
 
+    def _set_active_response(self, resp):
+        with self._stop_lock:
+            self._active_response = resp
+        # A stop that raced with opening the request still closes it.
+        if resp is not None and self._local_stop.is_set():
+            self._close_response_quietly(resp)
+
     def request_stop(self):
         self._local_stop.set()
         resp = None
@@ -489,45 +528,61 @@ class OpenAICompatibleClient(LLMClient, ABC):
         pending_tool_calls = {}
         saw_sse = False
         plain_lines = []
+        done_token = self.STREAM_DONE_TOKEN.encode("utf-8")
+
+        # Text deltas are merged over a short window, which bounds the UI
+        # update rate however the provider frames its stream.
+        throttle = sse_stream.TextDeltaThrottle()
 
         try:
-            with urlrequest.urlopen(req, timeout=self._timeout) as resp:
-                with self._stop_lock:
-                    self._active_response = resp
+            with llm_transport.open_request(req, timeout=self._timeout, on_open=self._set_active_response) as resp:
+                self._set_active_response(resp)
                 try:
-                    for raw_line in resp:
+                    for items in sse_stream.iter_sse_items(resp, self.STREAM_PREFIX):
                         if self._is_stopping(stop_event):
                             return
 
-                        line = raw_line.decode("utf-8", errors="replace").strip()
-                        if not line:
-                            continue
-
-                        if not line.startswith(self.STREAM_PREFIX):
-                            plain_lines.append(line)
-                            continue
-
-                        saw_sse = True
-                        data = line[len(self.STREAM_PREFIX) :].strip()
-                        if data == self.STREAM_DONE_TOKEN:
-                            break
-
-                        try:
-                            chunk = json.loads(data)
-                        except json.JSONDecodeError:
-                            continue
+                        block_events = []
+                        stream_done = False
+                        for kind, data in items:
+                            if kind != sse_stream.SSE_DATA:
+                                plain_lines.append(data.decode("utf-8", errors="replace"))
+                                continue
+
+                            saw_sse = True
+                            if data == done_token:
+                                stream_done = True
+                                break
+
+                            chunk = self._decode_stream_chunk(data)
+                            if chunk is None:
+                                continue
+
+                            if isinstance(chunk, dict) and chunk.get("error"):
+                                for event in throttle.push(block_events) + throttle.flush():
+                                    yield event
+                                yield self._build_api_error_event(chunk.get("error"), endpoint=endpoint)
+                                return
 
-                        if isinstance(chunk, dict) and chunk.get("error"):
-                            yield self._build_api_error_event(chunk.get("error"), endpoint=endpoint)
-                            return
+                            block_events.extend(self._yield_events_from_chunk(chunk, pending_tool_calls))
 
-                        for event in self._yield_events_from_chunk(chunk, pending_tool_calls):
+                        for event in throttle.push(block_events):
                             if self._is_stopping(stop_event):
                                 return
                             yield event
+                        if stream_done:
+                            break
+
+                    for event in throttle.flush():
+                        if self._is_stopping(stop_event):
+                            return
+                        yield event
                 finally:
                     with self._stop_lock:
                         self._active_response = None
+                    if self._is_stopping(stop_event):
+                        # Do not drain an abandoned stream; drop its connection.
+                        self._close_response_quietly(resp)
 
             if not saw_sse and plain_lines:
                 if self._is_stopping(stop_event):
@@ -551,10 +606,27 @@ class OpenAICompatibleClient(LLMClient, ABC):
         except urlerror.HTTPError as exc:
             yield self._build_http_error_event(exc, endpoint=endpoint)
         except urlerror.URLError as exc:
+            for event in throttle.flush():
+                yield event
             yield self._build_url_error_event(exc, endpoint=endpoint)
         except Exception as exc:
+            # Text held back before a dropped connection still reaches the UI.
+            for event in throttle.flush():
+                yield event
             yield self._build_unexpected_error_event(exc, endpoint=endpoint)
 
+    @staticmethod
+    def _decode_stream_chunk(data):
+        try:
+            return json.loads(data)
+        except UnicodeDecodeError:
+            try:
+                return json.loads(data.decode("utf-8", errors="replace"))
+            except ValueError:
+                return None
+        except ValueError:
+            return None
+
     def chat(self, messages, tools=None, temperature=0.0, stop_event=None):
         content_parts = []
         thought_parts = []
@@ -643,7 +715,7 @@ class DeepSeekLLMClient(OpenAICompatibleClient):
         if content:
             yield {"type": "answer", "text": content}
 
-        self._accumulate_tool_calls_from_sources(pending_tool_calls, delta, message, choice)
+        yield from self._accumulate_tool_calls_and_yield_ready(pending_tool_calls, delta, message, choice)
 
         finish_reason = choice.get("finish_reason") if isinstance(choice, dict) else None
         if finish_reason == "tool_calls" and pending_tool_calls:
@@ -696,7 +768,7 @@ class ZhipuLLMClient(OpenAICompatibleClient):
         if content:
             yield {"type": "answer", "text": content}
 
-        self._accumulate_tool_calls_from_sources(pending_tool_calls, delta, message, choice)
+        yield from self._accumulate_tool_calls_and_yield_ready(pending_tool_calls, delta, message, choice)
 
         finish_reason = choice.get("finish_reason") if isinstance(choice, dict) else None
         if finish_reason == "tool_calls" and pending_tool_calls:
@@ -761,7 +833,7 @@ class MiniMaxLLMClient(OpenAICompatibleClient):
         if content:
             yield {"type": "answer", "text": content}
 
-        self._accumulate_tool_calls_from_sources(pending_tool_calls, delta, message, choice)
+        yield from self._accumulate_tool_calls_and_yield_ready(pending_tool_calls, delta, message, choice)
 
         finish_reason = choice.get("finish_reason") if isinstance(choice, dict) else None
         if finish_reason == "stop" and pending_tool_calls:
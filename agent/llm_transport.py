@@ -0,0 +1,334 @@
+"""Pooled HTTP/1.1 transport for the OpenAI-compatible LLM clients.
+
+Every ReAct step posts a streaming chat completion to the same provider
+host.  Opening a fresh ``urllib`` connection per call repeats the TCP and
+TLS handshakes each time, so requests go through a process-wide pool of
+keep-alive ``http.client`` connections instead.  Connections are keyed by
+scheme, host, port and proxy, returned to the pool once a response has been
+read to the end, and dropped when a response is abandoned early, aborted
+through ``close`` or the server asks to close.
+
+The transport can be pinned with ``SNOWFOX_LLM_TRANSPORT``
+(``pooled``/``urllib``); ``urllib`` restores one ``urlopen`` per request.
+Failures surface as ``urllib.error.HTTPError``/``URLError`` on both
+transports so callers handle them identically.
+"""
+
+from __future__ import annotations
+
+import base64
+import http.client
+import io
+import os
+import socket
+import ssl
+import threading
+import time
+from urllib import error as urlerror
+from urllib import request as urlrequest
+from urllib.parse import unquote, urlsplit
+
+
+LLM_TRANSPORT_ENV_VAR = "SNOWFOX_LLM_TRANSPORT"
+LLM_TRANSPORT_POOLED = "pooled"
+LLM_TRANSPORT_URLLIB = "urllib"
+
+_MAX_IDLE_PER_HOST = 4
+_IDLE_TIMEOUT_SECONDS = 60.0
+_DRAIN_LIMIT_BYTES = 64 * 1024
+_DRAIN_TIMEOUT_SECONDS = 2.0
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+# Failures that mean a reused keep-alive connection went stale while idle.
+_STALE_CONNECTION_ERRORS = (ConnectionError, http.client.BadStatusLine)
+
+
+def llm_transport(name: str | None = None) -> str:
+    """Resolve the effective transport name (``pooled`` or ``urllib``)."""
+    requested = str(name or os.environ.get(LLM_TRANSPORT_ENV_VAR) or LLM_TRANSPORT_POOLED).strip().lower()
+    return LLM_TRANSPORT_URLLIB if requested == LLM_TRANSPORT_URLLIB else LLM_TRANSPORT_POOLED
+
+
+class PooledResponse:
+    """Response bound to one pooled connection, iterated line by line.
+
+    Leaving the ``with`` block normally returns the connection to the pool
+    after draining what is left of the body.  ``close`` may be called from
+    another thread to abort a blocked read; the connection is then dropped.
+    """
+
+    def __init__(self, pool, key, conn, url):
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._response = None
+        self._lock = threading.Lock()
+        self._released = False
+        self.aborted = False
+        self.url = url
+        self.status = None
+        self.headers = None
+
+    def _attach(self, response):
+        self._response = response
+        self.status = response.status
+        self.headers = response.headers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.release()
+        else:
+            self.close()
+        return False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def _guarded_read(self, method_name, *args):
+        if self.aborted or self._response is None:
+            return b""
+        try:
+            return getattr(self._response, method_name)(*args)
+        except (OSError, ValueError, AttributeError, http.client.HTTPException):
+            # A concurrent ``close`` tears the socket down under the reader.
+            if self.aborted:
+                return b""
+            raise
+
+    def readline(self, limit=-1):
+        return self._guarded_read("readline", limit)
+
+    def read(self, amt=None):
+        return self._guarded_read("read", amt)
+
+    def read1(self, amt=-1):
+        return self._guarded_read("read1", amt)
+
+    def getcode(self):
+        return self.status
+
+    def _drain(self):
+        response = self._response
+        if response is None:
+            return False
+        sock = self._conn.sock
+        previous_timeout = sock.gettimeout() if sock is not None else None
+        try:
+            if sock is not None:
+                sock.settimeout(_DRAIN_TIMEOUT_SECONDS)
+            drained = 0
+            while not response.isclosed() and drained <= _DRAIN_LIMIT_BYTES:
+                chunk = response.read(8192)
+                if not chunk:
+                    break
+                drained += len(chunk)
+            return response.isclosed() and not response.will_close
+        except (OSError, http.client.HTTPException):
+            return False
+        finally:
+            if sock is not None and self._conn.sock is sock:
+                try:
+                    sock.settimeout(previous_timeout)
+                except OSError:
+                    pass
+
+    def release(self):
+        """Finish the exchange and keep the connection if it is reusable."""
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        if self._drain():
+            self._pool._checkin(self._key, self._conn)
+        else:
+            self._conn.close()
+
+    def close(self):
+        """Abort the exchange; safe to call from any thread."""
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+            self.aborted = True
+        sock = self._conn.sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._conn.close()
+
+
+class HTTPConnectionPool:
+    """Keep-alive ``http.client`` connections shared across LLM requests."""
+
+    def __init__(self, max_idle_per_host=_MAX_IDLE_PER_HOST, idle_timeout=_IDLE_TIMEOUT_SECONDS):
+        self._max_idle_per_host = int(max_idle_per_host)
+        self._idle_timeout = float(idle_timeout)
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._ssl_context = None
+
+    def _checkout(self, key):
+        now = time.monotonic()
+        stale = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key) or []
+            while idle:
+                candidate, released_at = idle.pop()
+                if now - released_at <= self._idle_timeout and candidate.sock is not None:
+                    conn = candidate
+                    break
+                stale.append(candidate)
+        for candidate in stale:
+            candidate.close()
+        return conn
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle_per_host:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def idle_count(self, key=None):
+        with self._lock:
+            if key is not None:
+                return len(self._idle.get(key) or [])
+            return sum(len(idle) for idle in self._idle.values())
+
+    def clear(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle_lists = list(self._idle.values())
+            self._idle.clear()
+        for idle in idle_lists:
+            for conn, _released_at in idle:
+                conn.close()
+
+    @staticmethod
+    def _proxy_for(scheme, host):
+        proxy = urlrequest.getproxies().get(scheme)
+        if not proxy or urlrequest.proxy_bypass(host):
+            return ""
+        return proxy
+
+    def _context(self):
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
+
+    def _connect(self, scheme, host, port, proxy, timeout):
+        if not proxy:
+            if scheme == "https":
+                return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._context())
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+
+        # Plain TCP to the proxy; HTTPS origins go through a CONNECT tunnel.
+        proxy_parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        proxy_port = proxy_parts.port or _DEFAULT_PORTS.get(proxy_parts.scheme, 80)
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(proxy_parts.hostname, proxy_port, timeout=timeout, context=self._context())
+            conn.set_tunnel(host, port, headers=_proxy_auth_headers(proxy_parts))
+            return conn
+        return http.client.HTTPConnection(proxy_parts.hostname, proxy_port, timeout=timeout)
+
+    def open(self, req, timeout=None, on_open=None):
+        """Send ``req`` (a ``urllib.request.Request``) and return its response.
+
+        ``on_open`` receives the response handle before the request is sent,
+        so a caller can abort a request that is still waiting for headers.
+        """
+        url = req.full_url
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in _DEFAULT_PORTS or not parts.hostname:
+            raise urlerror.URLError(f"unsupported URL: {url}")
+        host = parts.hostname
+        port = parts.port or _DEFAULT_PORTS[scheme]
+        proxy = self._proxy_for(scheme, host)
+        key = (scheme, host, port, proxy)
+
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        headers = dict(req.header_items())
+        if proxy and scheme == "http":
+            target = url
+            headers.update(_proxy_auth_headers(urlsplit(proxy if "://" in proxy else f"http://{proxy}")))
+
+        for attempt in range(2):
+            conn = self._checkout(key)
+            reused = conn is not None
+            if conn is None:
+                conn = self._connect(scheme, host, port, proxy, timeout)
+            else:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+
+            handle = PooledResponse(self, key, conn, url)
+            if callable(on_open):
+                on_open(handle)
+            try:
+                if handle.aborted:
+                    raise urlerror.URLError("request aborted")
+                conn.request(req.get_method(), target, body=req.data, headers=headers)
+                response = conn.getresponse()
+            except urlerror.URLError:
+                handle.close()
+                raise
+            except _STALE_CONNECTION_ERRORS as exc:
+                stopped = handle.aborted
+                handle.close()
+                if reused and attempt == 0 and not stopped:
+                    continue
+                raise urlerror.URLError(exc) from exc
+            except (OSError, http.client.HTTPException) as exc:
+                handle.close()
+                raise urlerror.URLError(exc) from exc
+
+            handle._attach(response)
+            if response.status >= 400:
+                try:
+                    body = handle.read()
+                finally:
+                    handle.release()
+                raise urlerror.HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(body))
+            return handle
+        raise urlerror.URLError("connection retry exhausted")
+
+
+def _proxy_auth_headers(proxy_parts):
+    if not proxy_parts.username:
+        return {}
+    credentials = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+    token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    return {"Proxy-Authorization": f"Basic {token}"}
+
+
+_default_pool = HTTPConnectionPool()
+
+
+def default_pool() -> HTTPConnectionPool:
+    return _default_pool
+
+
+def open_request(req, timeout=None, on_open=None):
+    """Open ``req`` on the configured transport; see the module docstring."""
+    if llm_transport() == LLM_TRANSPORT_URLLIB:
+        resp = urlrequest.urlopen(req, timeout=timeout)
+        if callable(on_open):
+            on_open(resp)
+        return resp
+    return _default_pool.open(req, timeout=timeout, on_open=on_open)
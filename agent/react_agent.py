@@ -98,7 +98,7 @@ Rules:
 6) Migration import is an explicit exception: use `validate` with `path` set to `migrate/output/ln2_inventory.yaml` and `import_migration_output` for migration onboarding. Before `import_migration_output`, first ask user for target dataset name via `question`, then ask user confirmation via `question` including option `CONFIRM_IMPORT`; import only when user selects that option and pass both `confirmation_token=CONFIRM_IMPORT` and `target_dataset_name`. During migration, work only within `migrate/` directories; do not read from `inventories/` or existing managed datasets unless the user explicitly requests comparison. In migration-readiness checks, treat both validation errors and warnings as blockers before import.
 7) You do NOT have permission to add, remove, or rename inventory fields. Field management can only be done by the user via Settings > Manage Fields.
 8) High-impact actions require extra care: `manage_boxes` requires human confirmation, and `rollback` must use explicit backup_path selected from `list_audit_timeline` action=backup rows ordered by audit_seq (never infer by timestamp).
-9) For files, prefer `fs_list`/`fs_read`; use `fs_edit` for targeted edits, `fs_copy` for whole-file copies, and `fs_write` only for small new text files. Use `shell` for non-interactive commands. All paths are repo-relative.
+9) For files, prefer `fs_list`/`fs_read` (page large files with `fs_read` offset/limit, head/tail or pattern instead of reading them whole); use `fs_edit` for targeted edits, `fs_copy` for whole-file copies, and `fs_write` only for small new text files. Use `shell` for non-interactive commands. All paths are repo-relative.
 10) When a request clearly matches a built-in skill advertised in the system message, call `use_skill` with the exact skill name before following that skill's workflow. Do not silently assume a skill is loaded.
 11) Keep replies concise and action-oriented.
 12) Choose the read tool by user intent: use `search_records` for direct lookup by free-text clue / slot / record_id, and use `filter_records` when the user is thinking in Overview-table terms such as field filters, color filters, include taken-out rows, in-table keyword search, or sort-by-column. Example: "find record 235" => `search_records`; "show genomic DNA in box 3 sorted by stored_at" => `filter_records`.
@@ -355,6 +355,7 @@ class ReactAgent:
 
     _run_tool_call = _runtime._run_tool_call
     _ask_user_continue = _runtime._ask_user_continue
+    _prefetch_stream_tool_call = _runtime._prefetch_stream_tool_call
     _collect_model_response = _runtime._collect_model_response
     _request_direct_answer = _runtime._request_direct_answer
     run = _runtime.run
@@ -10,7 +10,9 @@ from lib.builtin_skills import build_skill_catalog_prompt
 from lib.tool_registry import WRITE_TOOLS
 from lib.yaml_ops import clear_read_snapshot, read_snapshot_context
 
-from .context_checkpoint import build_resume_messages, checkpoint_context, normalize_summary_state
+from .context_checkpoint import ContextTokenLedger, build_resume_messages, checkpoint_context, normalize_summary_state
+from .shell_session import shell_output_context
+from .tool_prefetch import SpeculativeToolPrefetcher
 from .tool_status_formatter import format_tool_status
 from .tool_runtime_paths import build_tool_hook_context
 
@@ -73,6 +75,32 @@ def _stopped_result(self, *, on_event, trace_id, step, memory, raw_messages, sum
     }
 
 
+def _tool_output_emitter(self, action, tool_call_id, trace_id):
+    """Return a callback that forwards incremental tool output as events."""
+    on_event = getattr(self, "_on_event", None)
+    if not callable(on_event):
+        return None
+
+    def emit(text):
+        if text:
+            self._emit_event(
+                on_event,
+                {
+                    "event": "tool_output",
+                    "type": "tool_output",
+                    "trace_id": trace_id,
+                    "data": {
+                        "name": action,
+                        "output": {"tool_call_id": tool_call_id, "text": text},
+                    },
+                    "action": action,
+                    "tool_call_id": tool_call_id,
+                },
+            )
+
+    return emit
+
+
 def _run_tool_call(self, call, tool_names, trace_id, stop_event=None):
     action = call["name"]
     action_input = call["arguments"]
@@ -92,15 +120,16 @@ def _run_tool_call(self, call, tool_names, trace_id, stop_event=None):
             "_hint": "Choose action from available tools.",
         }
     else:
-        if action in WRITE_TOOLS:
-            if getattr(self._tools, "_plan_store", None) is not None:
-                with read_snapshot_context(trace_id):
+        with shell_output_context(_tool_output_emitter(self, action, tool_call_id, trace_id)):
+            if action in WRITE_TOOLS:
+                if getattr(self._tools, "_plan_store", None) is not None:
+                    with read_snapshot_context(trace_id):
+                        observation = self._tools.run(action, action_input, trace_id=trace_id)
+                else:
                     observation = self._tools.run(action, action_input, trace_id=trace_id)
             else:
-                observation = self._tools.run(action, action_input, trace_id=trace_id)
-        else:
-            with read_snapshot_context(trace_id):
-                observation = self._tools.run(action, action_input, trace_id=trace_id)
+                with read_snapshot_context(trace_id):
+                    observation = self._tools.run(action, action_input, trace_id=trace_id)
 
     # Handle question tool: emit event to GUI, block until user answers
     if (
@@ -287,7 +316,49 @@ def _ask_user_continue(self, on_event, trace_id, stop_event=None):
     return answered and not runner._answer_cancelled
 
 
-def _collect_model_response(self, messages, tool_schemas, trace_id, step, on_event, stop_event=None):
+def _prefetch_stream_tool_call(self, prefetch, raw_tool_call, index):
+    """Start a streamed read-only tool call early; stop speculating once a step writes."""
+    if prefetch is None:
+        return
+    call = self._normalize_tool_call(raw_tool_call, index)
+    if not call:
+        return
+    if call["name"] in WRITE_TOOLS or call["name"] == "question":
+        # Steps with writes or a question run sequentially; nothing is reused.
+        prefetch.discard()
+        return
+    prefetch.submit(call)
+
+
+def _claim_prefetched_results(prefetch, tool_calls):
+    """Claim speculative futures the step can reuse, then drop the rest."""
+    if prefetch is None:
+        return {}
+    claimed = {}
+    parallel_reads = bool(tool_calls) and not any(
+        call["name"] in WRITE_TOOLS or call["name"] == "question" for call in tool_calls
+    )
+    if parallel_reads:
+        for call in tool_calls:
+            future = prefetch.take(call)
+            if future is not None:
+                claimed[call["id"]] = future
+    prefetch.discard()
+    return claimed
+
+
+def _deliver_prefetched_result(self, result, trace_id):
+    """Let the tool runner account for a prefetched result the model will see."""
+    deliver = getattr(self._tools, "deliver_prefetched_result", None)
+    if not callable(deliver):
+        return result
+    observation = deliver(result["action"], result["action_input"], result["observation"], trace_id=trace_id)
+    if observation is result["observation"]:
+        return result
+    return dict(result, observation=observation, output_text=self._serialize_tool_output(observation))
+
+
+def _collect_model_response(self, messages, tool_schemas, trace_id, step, on_event, stop_event=None, prefetch=None):
     stream_fn = getattr(self._llm, "stream_chat", None)
     if callable(stream_fn):
         try:
@@ -342,6 +413,8 @@ def _collect_model_response(self, messages, tool_schemas, trace_id, step, on_eve
     tool_calls = []
     for raw_event in getattr(iterator, "__iter__", lambda: iter(()))():
         if _is_stop_requested(stop_event):
+            if prefetch is not None:
+                prefetch.discard()
             return {
                 "error": None,
                 "stopped": True,
@@ -392,9 +465,16 @@ def _collect_model_response(self, messages, tool_schemas, trace_id, step, on_eve
             normalized = self._normalize_tool_call(raw_tool_call, len(tool_calls))
             if normalized:
                 tool_calls.append(normalized)
+                self._prefetch_stream_tool_call(prefetch, normalized, len(tool_calls) - 1)
+            continue
+
+        if event_type == "tool_call_ready":
+            self._prefetch_stream_tool_call(prefetch, raw_event.get("tool_call"), len(tool_calls))
             continue
 
         if event_type == "error":
+            if prefetch is not None:
+                prefetch.discard()
             return {
                 "error": str(raw_event.get("error") or "LLM stream failed"),
                 "error_code": str(raw_event.get("error_code") or "llm_stream_failed"),
@@ -406,6 +486,8 @@ def _collect_model_response(self, messages, tool_schemas, trace_id, step, on_eve
             }
 
     if _is_stop_requested(stop_event):
+        if prefetch is not None:
+            prefetch.discard()
         return {
             "error": None,
             "stopped": True,
@@ -532,6 +614,7 @@ def run(self, user_query, conversation_history=None, on_event=None, stop_event=N
     forced_final_retry = False
 
     original_max_steps = self._max_steps
+    token_ledger = ContextTokenLedger.for_client(self._llm)
     step = 1
     while True:
         if _is_stop_requested(stop_event):
@@ -554,6 +637,8 @@ def run(self, user_query, conversation_history=None, on_event=None, stop_event=N
                 "step": step,
             },
         )
+        if hasattr(self._tools, "note_step"):
+            self._tools.note_step(trace_id, step)
 
         raw_messages, summary_state, checkpoint_event = checkpoint_context(
             system_content,
@@ -562,6 +647,7 @@ def run(self, user_query, conversation_history=None, on_event=None, stop_event=N
             summary_state,
             self._llm,
             stop_event=stop_event,
+            ledger=token_ledger,
         )
         if checkpoint_event:
             self._emit_event(
@@ -582,7 +668,12 @@ def run(self, user_query, conversation_history=None, on_event=None, stop_event=N
         request_messages = _build_main_messages(system_content, raw_messages, summary_state=summary_state)
 
         model_response = {}
+        prefetch = None
         for retry_idx in range(2):
+            prefetch = SpeculativeToolPrefetcher(
+                lambda call: self._run_tool_call(call, tool_names, trace_id, stop_event),
+                tool_names,
+            )
             model_response = self._collect_model_response(
                 messages=request_messages,
                 tool_schemas=tool_schemas,
@@ -590,6 +681,7 @@ def run(self, user_query, conversation_history=None, on_event=None, stop_event=N
                 step=step,
                 on_event=on_event,
                 stop_event=stop_event,
+                prefetch=prefetch,
             )
 
             if model_response.get("stopped"):
@@ -662,6 +754,7 @@ def run(self, user_query, conversation_history=None, on_event=None, stop_event=N
 
         if normalized_tool_calls is None:
             normalized_tool_calls = []
+        prefetched_results = _claim_prefetched_results(prefetch, normalized_tool_calls)
 
         if model_response.get("tool_calls") and not normalized_tool_calls:
             observation = {
@@ -801,17 +894,24 @@ def run(self, user_query, conversation_history=None, on_event=None, stop_event=N
             else:
                 max_workers = max(1, len(normalized_tool_calls))
                 with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    futures = [
-                        executor.submit(
-                            self._run_tool_call,
-                            call,
-                            tool_names,
-                            trace_id,
-                            stop_event,
-                        )
-                        for call in normalized_tool_calls
+                    futures = []
+                    for call in normalized_tool_calls:
+                        # Reuse reads already started while the response streamed.
+                        future = prefetched_results.get(call["id"])
+                        prefetched = future is not None and not future.cancelled()
+                        if not prefetched:
+                            future = executor.submit(
+                                self._run_tool_call,
+                                call,
+                                tool_names,
+                                trace_id,
+                                stop_event,
+                            )
+                        futures.append((future, prefetched))
+                    results = [
+                        _deliver_prefetched_result(self, future.result(), trace_id) if prefetched else future.result()
+                        for future, prefetched in futures
                     ]
-                    results = [future.result() for future in futures]
 
             for result in results:
                 action = result["action"]
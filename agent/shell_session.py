@@ -2,14 +2,41 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 
+from .shell_worker import ShellWorkerPool
+
+
+# Receives incremental ``shell`` output while a tool call runs in this context.
+_shell_output_sink = ContextVar("snowfox_shell_output_sink", default=None)
+
+
+@contextmanager
+def shell_output_context(callback):
+    """Stream output of ``shell`` commands run inside the block to ``callback``."""
+    token = _shell_output_sink.set(callback if callable(callback) else None)
+    try:
+        yield
+    finally:
+        _shell_output_sink.reset(token)
+
+
+def current_shell_output_sink():
+    return _shell_output_sink.get()
+
 
 class ShellSessionState:
-    """Track the agent shell cwd as a repo-relative path."""
+    """Track the agent shell cwd as a repo-relative path.
+
+    Also owns the session's persistent shell workers, started on first use;
+    ``reset`` and ``close`` shut them down.
+    """
 
     def __init__(self, current_workdir="."):
         self.current_workdir = _normalize_repo_relative(current_workdir)
+        self.workers = ShellWorkerPool()
 
     def resolve_workdir(self, repo_root, requested_workdir=None):
         raw = str(requested_workdir or "").strip()
@@ -22,6 +49,11 @@ class ShellSessionState:
 
     def reset(self):
         self.current_workdir = "."
+        workers, self.workers = self.workers, ShellWorkerPool()
+        workers.close()
+
+    def close(self):
+        self.workers.close()
 
 
 def repo_relative_workdir(repo_root, absolute_path):
@@ -0,0 +1,380 @@
+"""Persistent bash workers for the agent ``shell`` tool.
+
+Spawning ``bash -l`` for every command costs a process start plus profile
+sourcing, which dominates migration sessions that run hundreds of small
+commands.  A worker keeps one bash process alive and feeds it framed
+commands on stdin: each command runs in a subshell (``cd`` into the
+requested workdir, ``eval`` of the quoted command text, stdin from
+``/dev/null``), so ``exit``/``set -e``/exported variables behave exactly as
+in a fresh process while only a ``fork`` is paid.  The end of a command is
+detected by a per-worker sentinel line carrying its exit status.
+
+The worker runs with job control on, so each command's subshell leads its
+own process group.  Once the subshell exits, that group is killed before
+the sentinel is printed: background jobs a command left behind cannot write
+into the output of the next command.
+
+Timeouts kill the worker's and the running command's process groups; a
+worker whose bash died is replaced on the next call.  PowerShell and non-POSIX hosts keep the one-shot
+``run_terminal_command`` path.
+"""
+
+from __future__ import annotations
+
+import codecs
+import os
+from pathlib import Path
+import selectors
+import shlex
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+
+from .terminal_tool import (
+    DEFAULT_TERMINAL_TIMEOUT_SECONDS,
+    SHELL_ENGINE_AUTO,
+    SHELL_ENGINE_BASH,
+    _child_process_env,
+    _normalize_terminal_output,
+    _resolve_auto_engine,
+    _resolve_effective_cwd,
+    run_terminal_command,
+)
+
+
+_MAX_SHELL_WORKERS = 2
+_STARTUP_TIMEOUT_SECONDS = 15
+_READ_CHUNK_BYTES = 65536
+_WORKER_SETUP = "set -m\n__snowfox_return() { return \"$1\"; }"
+
+
+def _env_key(extra_env):
+    if not isinstance(extra_env, dict):
+        return ()
+    return tuple(sorted((str(key), str(value or "")) for key, value in extra_env.items() if str(key or "").strip()))
+
+
+def _remove_files(paths):
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _shut_down_worker(process, temp_files):
+    """Kill a worker's bash session and remove its temp files."""
+    if process.poll() is None:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (OSError, AttributeError):
+            process.kill()
+    try:
+        process.wait(timeout=5)
+    except Exception:
+        pass
+    for stream in (process.stdin, process.stdout):
+        try:
+            stream.close()
+        except Exception:
+            pass
+    _remove_files(temp_files)
+
+
+class ShellWorkerError(RuntimeError):
+    """Raised when a persistent shell cannot be started."""
+
+
+class PersistentShellWorker:
+    """One long-lived ``bash -l`` process executing framed commands."""
+
+    def __init__(self, bash_path, extra_env=None):
+        self.env_key = _env_key(extra_env)
+        self._token = uuid.uuid4().hex
+        self._sequence = 0
+        fd, self._cwd_file = tempfile.mkstemp(prefix="snowfox-shell-cwd-", text=True)
+        os.close(fd)
+        fd, self._job_file = tempfile.mkstemp(prefix="snowfox-shell-job-", text=True)
+        os.close(fd)
+        try:
+            self._process = subprocess.Popen(
+                [bash_path, "-l"],
+                shell=False,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env=_child_process_env(extra_env=extra_env),
+                start_new_session=True,
+            )
+        except Exception as exc:
+            _remove_files((self._cwd_file, self._job_file))
+            raise ShellWorkerError(str(exc)) from exc
+        # A worker dropped without close() (or still open at exit) is shut
+        # down by the finalizer, so no bash session or temp file outlives it.
+        self._finalizer = weakref.finalize(
+            self, _shut_down_worker, self._process, (self._cwd_file, self._job_file)
+        )
+        _status, _output, failure = self._exchange(_WORKER_SETUP, _STARTUP_TIMEOUT_SECONDS)
+        if failure:
+            self.close()
+            raise ShellWorkerError("Persistent shell did not become ready.")
+
+    @property
+    def alive(self):
+        return self._process is not None and self._process.poll() is None
+
+    def _kill_command_group(self):
+        """Kill the process group of a command that did not finish."""
+        try:
+            pgid = int(Path(self._job_file).read_text(encoding="ascii").strip())
+        except (OSError, ValueError):
+            return
+        try:
+            os.killpg(pgid, signal.SIGKILL)
+        except OSError:
+            pass
+
+    def _exchange(self, script, timeout_seconds, on_output=None):
+        """Send ``script`` followed by a sentinel and read output up to it.
+
+        Returns ``(status, output, failure)``; ``failure`` is ``"timeout"`` or
+        ``"crashed"`` when the sentinel was not seen, else ``None``.
+        """
+        self._sequence += 1
+        sentinel = f"__SNOWFOX_DONE_{self._token}_{self._sequence}__"
+        framed = f"{script}\nprintf '\\n%s %s\\n' '{sentinel}' \"$?\"\n"
+        try:
+            self._process.stdin.write(framed.encode("utf-8"))
+            self._process.stdin.flush()
+        except (OSError, ValueError):
+            return None, "", "crashed"
+
+        marker = ("\n" + sentinel + " ").encode("ascii")
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        buffer = bytearray()
+        emitted = 0
+        deadline = time.monotonic() + float(timeout_seconds)
+        stdout_fd = self._process.stdout.fileno()
+        with selectors.DefaultSelector() as selector:
+            selector.register(stdout_fd, selectors.EVENT_READ)
+            while True:
+                found = buffer.find(marker)
+                if found >= 0:
+                    line_end = buffer.find(b"\n", found + len(marker))
+                    if line_end >= 0:
+                        status_text = buffer[found + len(marker):line_end].decode("ascii", "replace").strip()
+                        body = bytes(buffer[:found])
+                        if on_output is not None and len(body) > emitted:
+                            on_output(decoder.decode(body[emitted:], final=True))
+                        try:
+                            status = int(status_text)
+                        except ValueError:
+                            status = -1
+                        return status, body.decode("utf-8", "replace"), None
+                elif on_output is not None:
+                    # Hold back only a tail that could still grow into the sentinel.
+                    safe_end = len(buffer)
+                    tail = buffer.rfind(b"\n", max(emitted, len(buffer) - len(marker) + 1))
+                    if tail >= 0 and marker.startswith(bytes(buffer[tail:])):
+                        safe_end = tail
+                    if safe_end > emitted:
+                        on_output(decoder.decode(bytes(buffer[emitted:safe_end])))
+                        emitted = safe_end
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None, bytes(buffer).decode("utf-8", "replace"), "timeout"
+                if not selector.select(timeout=remaining):
+                    continue
+                try:
+                    chunk = os.read(stdout_fd, _READ_CHUNK_BYTES)
+                except OSError:
+                    chunk = b""
+                if not chunk:
+                    return None, bytes(buffer).decode("utf-8", "replace"), "crashed"
+                buffer.extend(chunk)
+
+    def run(self, command_text, cwd, timeout_seconds, on_output=None):
+        """Run one command; return ``(exit_code, raw_output, final_cwd, failure)``.
+
+        On a timeout or a dead bash process ``failure`` names the reason and
+        the worker is closed.
+        """
+        Path(self._cwd_file).write_text("", encoding="utf-8")
+        Path(self._job_file).write_text("", encoding="ascii")
+        capture = shlex.quote(self._cwd_file)
+        script = (
+            f"( trap 'printf \"%s\\n\" \"$PWD\" > {capture}' EXIT\n"
+            f"cd -- {shlex.quote(str(cwd))} || exit $?\n"
+            f"eval {shlex.quote(str(command_text))}\n"
+            ") </dev/null &\n"
+            "__snowfox_job=$!\n"
+            f"printf '%s' \"$__snowfox_job\" > {shlex.quote(self._job_file)}\n"
+            "wait \"$__snowfox_job\"\n"
+            "__snowfox_status=$?\n"
+            "kill -KILL -- \"-$__snowfox_job\" 2>/dev/null\n"
+            "__snowfox_return \"$__snowfox_status\""
+        )
+        status, output, failure = self._exchange(script, timeout_seconds, on_output=on_output)
+        if failure:
+            self._kill_command_group()
+            self.close()
+            return None, output, "", failure
+        try:
+            final_cwd = Path(self._cwd_file).read_text(encoding="utf-8", errors="replace").strip()
+        except OSError:
+            final_cwd = ""
+        return status, output, final_cwd, None
+
+    def close(self):
+        self._process = None
+        self._finalizer()
+
+
+class ShellWorkerPool:
+    """Session-scoped pool of persistent bash workers.
+
+    ``run`` has the signature and response shape of ``run_terminal_command``
+    and falls back to it for PowerShell, non-POSIX hosts, or when every
+    worker is busy.
+    """
+
+    def __init__(self, max_workers=_MAX_SHELL_WORKERS):
+        self._max_workers = max(1, int(max_workers))
+        self._idle = []
+        self._busy = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @staticmethod
+    def supports(engine):
+        name = str(engine or SHELL_ENGINE_AUTO).strip().lower()
+        if name == SHELL_ENGINE_AUTO:
+            name = _resolve_auto_engine()
+        return os.name == "posix" and name == SHELL_ENGINE_BASH and bool(shutil.which("bash"))
+
+    def _acquire(self, extra_env):
+        key = _env_key(extra_env)
+        stale = []
+        worker = None
+        with self._lock:
+            if self._closed:
+                return None
+            while self._idle:
+                candidate = self._idle.pop()
+                if candidate.alive and candidate.env_key == key:
+                    worker = candidate
+                    break
+                stale.append(candidate)
+            if worker is None and self._busy + len(self._idle) >= self._max_workers:
+                for candidate in stale:
+                    candidate.close()
+                return None
+            self._busy += 1
+        for candidate in stale:
+            candidate.close()
+        if worker is not None:
+            return worker
+        try:
+            return PersistentShellWorker(shutil.which("bash"), extra_env=extra_env)
+        except ShellWorkerError:
+            with self._lock:
+                self._busy -= 1
+            return None
+
+    def _release(self, worker):
+        with self._lock:
+            self._busy -= 1
+            if worker.alive and not self._closed:
+                self._idle.append(worker)
+                return
+        worker.close()
+
+    def run(
+        self,
+        command,
+        timeout_seconds=DEFAULT_TERMINAL_TIMEOUT_SECONDS,
+        cwd=None,
+        engine=SHELL_ENGINE_AUTO,
+        extra_env=None,
+        capture_cwd=False,
+        on_output=None,
+    ):
+        """Execute one command on a persistent worker when possible."""
+        command_text = str(command or "")
+        worker = None
+        if command_text.strip() and self.supports(engine):
+            worker = self._acquire(extra_env)
+        if worker is None:
+            return run_terminal_command(
+                command,
+                timeout_seconds=timeout_seconds,
+                cwd=cwd,
+                engine=engine,
+                extra_env=extra_env,
+                capture_cwd=capture_cwd,
+            )
+
+        effective_cwd = _resolve_effective_cwd(cwd)
+        try:
+            exit_code, raw_output, final_cwd, failure = worker.run(
+                command_text,
+                effective_cwd,
+                timeout_seconds,
+                on_output=on_output,
+            )
+        finally:
+            self._release(worker)
+
+        normalized_output = _normalize_terminal_output(raw_output)
+        final_cwd = _normalize_terminal_output(final_cwd).strip() if capture_cwd else ""
+        base = {
+            "raw_output": normalized_output,
+            "effective_cwd": effective_cwd,
+            "engine": SHELL_ENGINE_BASH,
+        }
+        if failure == "crashed":
+            return {
+                "ok": False,
+                "error_code": "terminal_exec_failed",
+                "message": "Persistent shell exited unexpectedly; it will be restarted on the next command.",
+                "exit_code": -1,
+                "final_cwd": "",
+                **base,
+            }
+        if failure:
+            return {
+                "ok": False,
+                "error_code": "terminal_timeout",
+                "message": f"Terminal command timed out after {timeout_seconds} second(s).",
+                "exit_code": -1,
+                "final_cwd": "",
+                **base,
+            }
+        if exit_code != 0:
+            return {
+                "ok": False,
+                "error_code": "terminal_nonzero_exit",
+                "message": f"Terminal command exited with status {exit_code}.",
+                "exit_code": exit_code,
+                "final_cwd": final_cwd,
+                **base,
+            }
+        return {
+            "ok": True,
+            "exit_code": exit_code,
+            "final_cwd": final_cwd,
+            **base,
+        }
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
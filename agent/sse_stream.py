@@ -0,0 +1,171 @@
+"""Incremental Server-Sent Events decoding for streaming LLM responses.
+
+Responses are read in large blocks (``read1`` returns whatever has arrived,
+up to the block size, so latency is unchanged) and split with ``bytes.find``
+on the block itself.  ``data:`` payloads are sliced straight out of the block
+as bytes for ``json.loads``; lines are never decoded or stripped on the hot
+path.  Items are grouped per block.
+
+Remote providers flush one event per token, so a block usually holds a
+single delta; ``TextDeltaThrottle`` therefore merges text deltas over a
+time window, bounding UI events to about one per ``SSE_TEXT_FLUSH_SECONDS``
+whatever the network framing.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Iterable, Iterator
+
+
+SSE_READ_BLOCK_BYTES = 64 * 1024
+SSE_TEXT_FLUSH_SECONDS = 0.04
+
+SSE_DATA = "data"
+SSE_PLAIN = "plain"
+
+
+class SSEDecoder:
+    """Split a byte stream into SSE ``data:`` payloads and plain lines."""
+
+    __slots__ = ("_prefix", "_pending")
+
+    def __init__(self, prefix: bytes = b"data:"):
+        self._prefix = prefix
+        self._pending = b""
+
+    def _classify(self, data: bytes, start: int, end: int, out: list) -> None:
+        prefix = self._prefix
+        if data.startswith(prefix, start, end):
+            out.append((SSE_DATA, data[start + len(prefix):end].strip()))
+            return
+        line = data[start:end].strip()
+        if not line:
+            return
+        if line.startswith(prefix):
+            out.append((SSE_DATA, line[len(prefix):].strip()))
+        else:
+            out.append((SSE_PLAIN, line))
+
+    def feed(self, block: bytes) -> list[tuple[str, bytes]]:
+        """Return the items completed by ``block``; a partial line is kept."""
+        data = self._pending + block if self._pending else block
+        items: list[tuple[str, bytes]] = []
+        find = data.find
+        start = 0
+        while True:
+            end = find(b"\n", start)
+            if end < 0:
+                break
+            self._classify(data, start, end, items)
+            start = end + 1
+        self._pending = data[start:]
+        return items
+
+    def flush(self) -> list[tuple[str, bytes]]:
+        """Return the trailing line of a stream that did not end in a newline."""
+        data, self._pending = self._pending, b""
+        items: list[tuple[str, bytes]] = []
+        if data:
+            self._classify(data, 0, len(data), items)
+        return items
+
+
+def _iter_blocks(resp, block_size: int) -> Iterator[bytes]:
+    read1 = getattr(resp, "read1", None)
+    if callable(read1):
+        while True:
+            block = read1(block_size)
+            if not block:
+                return
+            yield block
+        return
+    # Line-iterable responses (and test doubles) hand over one line at a time.
+    for line in resp:
+        if isinstance(line, str):
+            line = line.encode("utf-8")
+        yield line if line.endswith(b"\n") else line + b"\n"
+
+
+def iter_sse_items(resp, prefix: str = "data:", block_size: int = SSE_READ_BLOCK_BYTES) -> Iterator[list[tuple[str, bytes]]]:
+    """Yield the ``(kind, payload)`` items of ``resp`` grouped per read block."""
+    decoder = SSEDecoder(prefix.encode("utf-8"))
+    for block in _iter_blocks(resp, block_size):
+        items = decoder.feed(block)
+        if items:
+            yield items
+    tail = decoder.flush()
+    if tail:
+        yield tail
+
+
+def coalesce_text_events(events: Iterable[dict]) -> list[dict]:
+    """Merge consecutive plain ``answer``/``thought`` events of the same type."""
+    merged: list[dict] = []
+    run_type = None
+    run_parts: list[str] = []
+
+    def _close_run():
+        if run_type is not None:
+            merged.append({"type": run_type, "text": "".join(run_parts)})
+
+    for event in events:
+        event_type = event.get("type")
+        mergeable = event_type in ("answer", "thought") and set(event) == {"type", "text"}
+        if mergeable and event_type == run_type:
+            run_parts.append(event["text"])
+            continue
+        _close_run()
+        run_type = None
+        run_parts = []
+        if mergeable:
+            run_type = event_type
+            run_parts = [event["text"]]
+        else:
+            merged.append(event)
+    _close_run()
+    return merged
+
+
+def _is_text_delta(event: dict) -> bool:
+    return event.get("type") in ("answer", "thought") and set(event) == {"type", "text"}
+
+
+class TextDeltaThrottle:
+    """Release plain ``answer``/``thought`` deltas at most once per interval.
+
+    Text arriving after a quiet interval is released at once; text arriving
+    within ``interval`` of the last release is held and merged.  Held text is
+    released, ahead of the event, when any other event arrives (so ordering
+    is kept), by the first ``push`` once the interval has passed, and by
+    ``flush`` at the end of the stream.
+    """
+
+    __slots__ = ("_interval", "_clock", "_held", "_last_release")
+
+    def __init__(self, interval: float = SSE_TEXT_FLUSH_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self._interval = float(interval)
+        self._clock = clock
+        self._held: list[dict] = []
+        self._last_release = float("-inf")
+
+    def push(self, events: Iterable[dict]) -> list[dict]:
+        """Accept the events of one block; return those due for the UI now."""
+        out: list[dict] = []
+        for event in events:
+            if _is_text_delta(event):
+                self._held.append(event)
+                continue
+            out.extend(self.flush())
+            out.append(event)
+        if self._held and self._clock() - self._last_release >= self._interval:
+            out.extend(self.flush())
+        return out
+
+    def flush(self) -> list[dict]:
+        """Release all held text, merged per run of the same type."""
+        if not self._held:
+            return []
+        held, self._held = self._held, []
+        self._last_release = self._clock()
+        return coalesce_text_events(held)
@@ -0,0 +1,123 @@
+"""Speculative execution of read-only tool calls during model streaming.
+
+A tool call's arguments are usually complete well before the model finishes
+its response (the LLM clients emit ``tool_call_ready`` as soon as a later call
+starts).  Calls to side-effect-free read tools are started on a worker pool at
+that point, so their latency hides behind the rest of the generation.  The
+step's executor later claims a finished result by call id; results of a
+stream that errors or is stopped, and calls the step does not run in
+parallel, are discarded.  Because a speculative result may never reach the
+model, prefetched runs are marked (``is_speculative_tool_run``) so callers
+such as the read-result cache do not treat them as delivered.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from lib.tool_registry import SPECULATIVE_READ_TOOLS
+
+
+_MAX_PREFETCH_WORKERS = 4
+
+_speculative_tool_run: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "snowfox_speculative_tool_run",
+    default=False,
+)
+
+
+def is_speculative_tool_run():
+    """Return whether the current tool run was started by the prefetcher."""
+    return _speculative_tool_run.get()
+
+
+def _call_key(call):
+    try:
+        arguments = json.dumps(call.get("arguments"), ensure_ascii=False, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return (str(call.get("name") or ""), arguments)
+
+
+class SpeculativeToolPrefetcher:
+    """Start read-only tool calls early and hand their results back once."""
+
+    def __init__(self, run_call, tool_names, max_workers=_MAX_PREFETCH_WORKERS):
+        self._run_call = run_call
+        self._tool_names = frozenset(tool_names or ())
+        self._max_workers = max(1, int(max_workers))
+        self._executor = None
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, call):
+        """Start ``call`` if it is a known read-only tool; return whether it was started."""
+        if not isinstance(call, dict):
+            return False
+        name = call.get("name")
+        call_id = str(call.get("id") or "")
+        arguments = call.get("arguments")
+        if (
+            not call_id
+            or name not in SPECULATIVE_READ_TOOLS
+            or name not in self._tool_names
+            or not isinstance(arguments, dict)
+            or "_raw_arguments" in arguments
+        ):
+            return False
+        key = _call_key(call)
+        if key is None:
+            return False
+        with self._lock:
+            if self._closed or call_id in self._pending:
+                return False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="snowfox-prefetch",
+                )
+            snapshot_call = {"id": call_id, "name": name, "arguments": json.loads(key[1])}
+            self._pending[call_id] = (key, self._executor.submit(self._run_speculative, snapshot_call))
+        return True
+
+    def _run_speculative(self, call):
+        token = _speculative_tool_run.set(True)
+        try:
+            return self._run_call(call)
+        finally:
+            _speculative_tool_run.reset(token)
+
+    def take(self, call):
+        """Return the future for ``call`` if it was prefetched with the same arguments."""
+        call_id = str(call.get("id") or "")
+        with self._lock:
+            entry = self._pending.pop(call_id, None)
+        if entry is None:
+            return None
+        key, future = entry
+        if key != _call_key(call):
+            future.cancel()
+            return None
+        return future
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending)
+
+    def discard(self):
+        """Drop every unclaimed result and stop accepting new calls."""
+        with self._lock:
+            self._closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+            executor, self._executor = self._executor, None
+        for _key, future in pending:
+            future.cancel()
+        if executor is not None:
+            # Claimed futures still run; discarded calls that already started
+            # finish in the background and nothing waits on them.
+            executor.shutdown(wait=False)
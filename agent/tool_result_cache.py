@@ -0,0 +1,132 @@
+"""Session-scoped memoization of read-only tool results.
+
+Agents often repeat the same ``search_records``/``filter_records``/
+``generate_stats`` call across steps and turns.  Results of side-effect-free
+read tools are kept per session, keyed by inventory path, tool name and
+canonical arguments, and are valid only for the dataset version they were
+computed against (YAML and audit log stamps plus the calendar day, which
+``recent_*`` windows depend on).  Any write or rollback clears the cache.
+
+A repeat inside the same run is answered with a compact "unchanged since
+step N" observation, since the full result is already in the conversation.
+Asking again right after that, or from a later run, returns the full cached
+result without re-running the tool.  Speculative prefetches store and read
+entries without stamping a run and step: their result may never reach the
+model, so the next real call is answered in full.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from datetime import date
+
+from lib.tool_registry import SPECULATIVE_READ_TOOLS, WRITE_TOOLS
+from lib.yaml_ops import dataset_version
+
+
+_MAX_CACHED_RESULTS = 64
+
+# ``fetch_more`` already serves pages from session memory.
+MEMOIZED_READ_TOOLS = SPECULATIVE_READ_TOOLS - {"fetch_more"}
+# Tools that change the dataset in place; running any of them clears the cache.
+DATASET_MUTATING_TOOLS = WRITE_TOOLS | frozenset({"manage_boxes", "import_migration_output"})
+
+
+def _canonical_arguments(payload):
+    try:
+        return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    except (TypeError, ValueError):
+        return None
+
+
+class _CachedResult:
+    __slots__ = ("version", "response", "trace_id", "step", "compact_served")
+
+    def __init__(self, version, response, trace_id, step):
+        self.version = version
+        self.response = response
+        self.trace_id = trace_id
+        self.step = step
+        self.compact_served = False
+
+
+class ToolResultCache:
+    """Bounded LRU of read tool results shared by the runners of one session."""
+
+    def __init__(self, max_entries=_MAX_CACHED_RESULTS):
+        self._max_entries = max(1, int(max_entries))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def version(yaml_path):
+        return (dataset_version(yaml_path), date.today().isoformat())
+
+    @staticmethod
+    def _key(yaml_path, tool_name, payload):
+        arguments = _canonical_arguments(payload)
+        if arguments is None:
+            return None
+        return (os.path.normcase(os.path.abspath(str(yaml_path))), tool_name, arguments)
+
+    def lookup(self, yaml_path, tool_name, payload, version, *, trace_id=None, step=None, stamp=True):
+        """Return ``(kind, value)`` for a valid entry or ``None``.
+
+        ``kind`` is ``"unchanged"`` with the step of the earlier result when
+        it is still visible in the current run, else ``"full"`` with a copy of
+        the cached response.  With ``stamp=False`` (a result the model may
+        never see) the answer is always ``"full"`` and the entry keeps the run
+        and step it was last delivered in.
+        """
+        key = self._key(yaml_path, tool_name, payload)
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            if not stamp:
+                return "full", deepcopy(entry.response)
+            if trace_id and entry.trace_id == trace_id and entry.step is not None and not entry.compact_served:
+                entry.compact_served = True
+                return "unchanged", entry.step
+            # The full result is handed out again, so later repeats in this
+            # run can point back to the current step.
+            entry.trace_id = trace_id
+            entry.step = step
+            entry.compact_served = False
+            response = entry.response
+        return "full", deepcopy(response)
+
+    def store(self, yaml_path, tool_name, payload, version, response, *, trace_id=None, step=None, stamp=True):
+        if not isinstance(response, dict) or response.get("ok") is not True:
+            return
+        key = self._key(yaml_path, tool_name, payload)
+        if key is None:
+            return
+        if not stamp:
+            trace_id = step = None
+        with self._lock:
+            self._entries[key] = _CachedResult(version, deepcopy(response), trace_id, step)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
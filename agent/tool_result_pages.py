@@ -0,0 +1,188 @@
+"""Cursor paging for large read tool observations.
+
+Read tools such as ``search_records`` or ``list_audit_timeline`` can return
+hundreds of rows, and every one of them used to be serialized into the
+conversation.  Their list results are now cut to a page bounded by item count
+and serialized size; the remaining rows stay in session memory behind an
+opaque cursor that the ``fetch_more`` tool pages through without re-running
+the query.  Result sets are bound to the dataset version they were read
+from, so a cursor goes stale as soon as the inventory changes.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import uuid
+from collections import OrderedDict
+
+
+DEFAULT_PAGE_ITEMS = 25
+DEFAULT_PAGE_CHARS = 16000
+MAX_PAGE_ITEMS = 100
+_MAX_RESULT_SETS = 16
+
+# Tool name -> list field inside ``result`` that is paged.
+PAGED_RESULT_FIELDS = {
+    "search_records": "records",
+    "filter_records": "rows",
+    "query_takeout_events": "records",
+    "list_audit_timeline": "items",
+    "recent_frozen": "records",
+    "recent_stored": "records",
+}
+
+_CURSOR_PREFIX = "cur_"
+
+
+def _item_size(item):
+    try:
+        return len(json.dumps(item, ensure_ascii=False, default=str))
+    except (TypeError, ValueError):
+        return len(str(item))
+
+
+def _page_end(items, start, max_items, max_chars):
+    """Return the end index of the page starting at ``start`` (at least one item)."""
+    end = start
+    used = 0
+    limit = min(len(items), start + max_items)
+    while end < limit:
+        size = _item_size(items[end])
+        if end > start and used + size > max_chars:
+            break
+        used += size
+        end += 1
+    return end
+
+
+class _ResultSet:
+    __slots__ = ("tool_name", "field", "items", "version")
+
+    def __init__(self, tool_name, field, items, version):
+        self.tool_name = tool_name
+        self.field = field
+        self.items = items
+        self.version = version
+
+
+class ToolResultPager:
+    """Session store of paged result sets addressed by cursor tokens."""
+
+    def __init__(self, page_items=DEFAULT_PAGE_ITEMS, page_chars=DEFAULT_PAGE_CHARS, max_result_sets=_MAX_RESULT_SETS):
+        self._page_items = max(1, int(page_items))
+        self._page_chars = max(1, int(page_chars))
+        self._max_result_sets = max(1, int(max_result_sets))
+        self._sets = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cursor(set_id, offset):
+        return f"{_CURSOR_PREFIX}{set_id}_{offset}"
+
+    @staticmethod
+    def _parse_cursor(cursor):
+        text = str(cursor or "").strip()
+        if not text.startswith(_CURSOR_PREFIX):
+            return None, None
+        set_id, _sep, offset_text = text[len(_CURSOR_PREFIX):].rpartition("_")
+        try:
+            offset = int(offset_text)
+        except ValueError:
+            return None, None
+        if not set_id or offset < 0:
+            return None, None
+        return set_id, offset
+
+    def needs_paging(self, tool_name, response):
+        field = PAGED_RESULT_FIELDS.get(tool_name)
+        if field is None or not isinstance(response, dict) or response.get("ok") is not True:
+            return False
+        result = response.get("result")
+        items = result.get(field) if isinstance(result, dict) else None
+        if not isinstance(items, list) or len(items) <= 1:
+            return False
+        return _page_end(items, 0, self._page_items, self._page_chars) < len(items)
+
+    def paginate(self, tool_name, response, version):
+        """Return ``response`` cut to its first page, with the rest kept behind a cursor.
+
+        Responses that already fit in one page are returned unchanged.
+        """
+        if not self.needs_paging(tool_name, response):
+            return response
+        field = PAGED_RESULT_FIELDS[tool_name]
+        result = dict(response["result"])
+        items = result[field]
+        end = _page_end(items, 0, self._page_items, self._page_chars)
+        set_id = uuid.uuid4().hex[:12]
+        with self._lock:
+            self._sets[set_id] = _ResultSet(tool_name, field, items, version)
+            while len(self._sets) > self._max_result_sets:
+                self._sets.popitem(last=False)
+
+        result[field] = items[:end]
+        if "display_count" in result:
+            result["display_count"] = end
+        elif "count" in result:
+            result["count"] = end
+        result["page"] = {
+            "offset": 0,
+            "returned": end,
+            "available": len(items),
+            "has_more": True,
+            "next_cursor": self._cursor(set_id, end),
+        }
+        paged = dict(response)
+        paged["result"] = result
+        return paged
+
+    def fetch(self, cursor, version, page_size=None):
+        """Return the page addressed by ``cursor`` as a tool response."""
+        set_id, offset = self._parse_cursor(cursor)
+        with self._lock:
+            result_set = self._sets.get(set_id) if set_id else None
+            if result_set is not None:
+                self._sets.move_to_end(set_id)
+        if result_set is None:
+            return {
+                "ok": False,
+                "error_code": "cursor_not_found",
+                "message": "Unknown or expired cursor; rerun the original query.",
+            }
+        if result_set.version != version:
+            with self._lock:
+                self._sets.pop(set_id, None)
+            return {
+                "ok": False,
+                "error_code": "cursor_stale",
+                "message": "The inventory changed since this cursor was issued; rerun the original query.",
+            }
+
+        items = result_set.items
+        offset = min(offset, len(items))
+        max_items = self._page_items if page_size is None else max(1, min(int(page_size), MAX_PAGE_ITEMS))
+        end = _page_end(items, offset, max_items, self._page_chars)
+        has_more = end < len(items)
+        return {
+            "ok": True,
+            "result": {
+                "tool": result_set.tool_name,
+                result_set.field: items[offset:end],
+                "page": {
+                    "offset": offset,
+                    "returned": end - offset,
+                    "available": len(items),
+                    "has_more": has_more,
+                    "next_cursor": self._cursor(set_id, end) if has_more else None,
+                },
+            },
+        }
+
+    def clear(self):
+        with self._lock:
+            self._sets.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sets)
@@ -5,6 +5,7 @@ import os
 import re
 import threading
 import uuid
+import weakref
 
 from lib.tool_api import (
     build_actor_context,
@@ -29,6 +30,9 @@ from . import tool_runtime_registry as _tool_runtime_registry
 from . import tool_runtime_paths as _tool_runtime_paths
 from . import tool_status_formatter as _tool_status_formatter
 from .shell_session import ShellSessionState
+from .tool_prefetch import is_speculative_tool_run
+from .tool_result_cache import DATASET_MUTATING_TOOLS, MEMOIZED_READ_TOOLS, ToolResultCache
+from .tool_result_pages import PAGED_RESULT_FIELDS, ToolResultPager
 
 
 def _default_tr(key, default=None, **kwargs):
@@ -75,13 +79,25 @@ class AgentToolRunner:
         preflight_fn=None,
         tr_func=None,
         shell_state=None,
+        language=None,
+        result_cache=None,
+        result_pager=None,
     ):
         self._yaml_path = assert_allowed_inventory_yaml_path(yaml_path, must_exist=True)
         self._session_id = session_id
         self._plan_store = plan_store
         self._preflight_fn = preflight_fn
         self._tr = tr_func if callable(tr_func) else _default_tr
-        self._shell_state = shell_state if isinstance(shell_state, ShellSessionState) else ShellSessionState()
+        self._language = str(language or "").strip()
+        if isinstance(shell_state, ShellSessionState):
+            self._shell_state = shell_state
+        else:
+            # A runner without a session-owned shell state closes its own workers.
+            self._shell_state = ShellSessionState()
+            weakref.finalize(self, self._shell_state.close)
+        self._result_cache = result_cache if isinstance(result_cache, ToolResultCache) else ToolResultCache()
+        self._result_pager = result_pager if isinstance(result_pager, ToolResultPager) else ToolResultPager()
+        self._step_marker = (None, None)
         self._runtime_specs_cache = None
         self._hook_manager = _tool_hooks.build_default_tool_hook_manager(self._runtime_specs())
         # Question tool synchronization
@@ -438,9 +454,102 @@ class AgentToolRunner:
     _stage_items_rollback = _runner_staging._stage_items_rollback
     _build_stage_blocked_response = _runner_staging._build_stage_blocked_response
 
+    def note_step(self, trace_id, step):
+        """Record the ReAct step whose tool calls run next (for cache hits)."""
+        self._step_marker = (trace_id, step)
+
     def run(self, tool_name, tool_input, trace_id=None):
         payload = self._sanitize_tool_input_payload(tool_input)
-        return self._run_dispatch(tool_name, payload, trace_id)
+        if tool_name in MEMOIZED_READ_TOOLS:
+            response = self._run_memoized(tool_name, payload, trace_id)
+        else:
+            response = self._run_dispatch(tool_name, payload, trace_id)
+            if tool_name in DATASET_MUTATING_TOOLS:
+                self._result_cache.clear()
+                self._result_pager.clear()
+        if tool_name in PAGED_RESULT_FIELDS:
+            response = self._paginate_response(tool_name, response)
+        return response
+
+    def _paginate_response(self, tool_name, response):
+        pager = self._result_pager
+        if not pager.needs_paging(tool_name, response):
+            return response
+        paged = pager.paginate(tool_name, response, ToolResultCache.version(self._yaml_path))
+        page = paged["result"]["page"]
+        paged["_hint"] = _runner_guidance.merge_hint_text(
+            paged.get("_hint"),
+            self._msg(
+                "response.pagedHint",
+                "Showing {returned} of {available} `{field}`. Call `fetch_more` with cursor=\"{cursor}\" for the next page instead of re-running the query.",
+                returned=page["returned"],
+                available=page["available"],
+                field=PAGED_RESULT_FIELDS[tool_name],
+                cursor=page["next_cursor"],
+            ),
+        )
+        return paged
+
+    def _current_step(self, trace_id):
+        marker_trace, marker_step = self._step_marker
+        return marker_step if marker_trace == trace_id else None
+
+    def _unchanged_response(self, tool_name, step):
+        return {
+            "ok": True,
+            "unchanged": True,
+            "unchanged_since_step": step,
+            "message": self._msg(
+                "response.unchangedSinceStep",
+                "Result unchanged since step {step}: same `{tool_name}` arguments and the inventory has not been modified. Reuse that earlier result.",
+                step=step,
+                tool_name=tool_name,
+            ),
+            "_hint": self._msg(
+                "response.unchangedHint",
+                "If the earlier result is no longer in context, repeat the identical call to receive it in full.",
+            ),
+        }
+
+    def deliver_prefetched_result(self, tool_name, tool_input, response, trace_id=None):
+        """Account for a prefetched read result the model is about to see.
+
+        Prefetched runs leave the cache entry unstamped, because the stream
+        may still fail.  Once the step claims the result, it is stamped with
+        the current step, or swapped for the compact "unchanged" reply when
+        this run already saw it.
+        """
+        if tool_name not in MEMOIZED_READ_TOOLS:
+            return response
+        payload = self._sanitize_tool_input_payload(tool_input)
+        cache = self._result_cache
+        hit = cache.lookup(
+            self._yaml_path,
+            tool_name,
+            payload,
+            cache.version(self._yaml_path),
+            trace_id=trace_id,
+            step=self._current_step(trace_id),
+        )
+        if hit is not None and hit[0] == "unchanged":
+            return self._unchanged_response(tool_name, hit[1])
+        return response
+
+    def _run_memoized(self, tool_name, payload, trace_id=None):
+        step = self._current_step(trace_id)
+        # A prefetched result may be dropped before the model sees it.
+        stamp = not is_speculative_tool_run()
+        cache = self._result_cache
+        version = cache.version(self._yaml_path)
+        hit = cache.lookup(self._yaml_path, tool_name, payload, version, trace_id=trace_id, step=step, stamp=stamp)
+        if hit is not None:
+            kind, value = hit
+            if kind == "full":
+                return value
+            return self._unchanged_response(tool_name, value)
+        response = self._run_dispatch(tool_name, payload, trace_id)
+        cache.store(self._yaml_path, tool_name, payload, version, response, trace_id=trace_id, step=step, stamp=stamp)
+        return response
 
     def _unknown_tool_response(self, tool_name):
         return self._with_hint(
@@ -467,6 +576,7 @@ class AgentToolRunner:
     _run_query_takeout_events = _runner_read._run_query_takeout_events
     _run_list_audit_timeline = _runner_read._run_list_audit_timeline
     _run_recommend_positions = _runner_read._run_recommend_positions
+    _run_inventory_summary = _runner_read._run_inventory_summary
     _run_generate_stats = _runner_read._run_generate_stats
     _run_get_raw_entries = _runner_read._run_get_raw_entries
     _run_shell = _runner_fileops._run_shell
@@ -483,6 +593,7 @@ class AgentToolRunner:
     _run_move = _runner_write._run_move
     _run_rollback = _runner_write._run_rollback
     _run_staged_plan = _runner_plan._run_staged_plan
+    _run_fetch_more = _runner_read._run_fetch_more
 
     def _dispatch_handlers(self):
         return {
@@ -1,12 +1,13 @@
 """File and shell dispatch handlers for AgentToolRunner."""
 
 from .file_ops_client import run_file_tool
+from .shell_session import current_shell_output_sink
 
 
-def _run_file_tool(self, tool_name, payload):
+def _run_file_tool(self, tool_name, payload, **kwargs):
     return self._safe_call(
         tool_name,
-        lambda: run_file_tool(tool_name, payload, yaml_path=self._yaml_path),
+        lambda: run_file_tool(tool_name, payload, yaml_path=self._yaml_path, **kwargs),
         include_expected_schema=True,
     )
 
@@ -20,7 +21,13 @@ def _run_shell(self, payload, _trace_id=None):
         )
     except Exception:
         args["workdir"] = args.get("workdir") or "."
-    response = _run_file_tool(self, "shell", args)
+    response = _run_file_tool(
+        self,
+        "shell",
+        args,
+        shell_pool=self._shell_state.workers,
+        on_output=current_shell_output_sink(),
+    )
     if (
         isinstance(response, dict)
         and response.get("error_code") != "workdir_out_of_scope"
@@ -5,6 +5,7 @@ from lib.tool_api import (
     tool_filter_records,
     tool_generate_stats,
     tool_get_raw_entries,
+    tool_inventory_summary,
     tool_list_audit_timeline,
     tool_list_empty_positions,
     tool_query_takeout_events,
@@ -15,6 +16,8 @@ from lib.tool_api import (
 )
 from lib import tool_api_write_adapter as _write_adapter
 
+from .tool_result_cache import ToolResultCache
+
 
 def _run_list_empty_positions(self, payload, _trace_id=None):
     tool_name = "list_empty_positions"
@@ -219,6 +222,13 @@ def _run_recommend_positions(self, payload, _trace_id=None):
     )
 
 
+def _run_inventory_summary(self, _payload, _trace_id=None):
+    return self._safe_call(
+        "inventory_summary",
+        lambda: tool_inventory_summary(yaml_path=self._yaml_path),
+    )
+
+
 def _run_generate_stats(self, payload, _trace_id=None):
     if "full_records_for_gui" in payload:
         return self._with_hint(
@@ -250,3 +260,15 @@ def _run_get_raw_entries(self, payload, _trace_id=None):
         )
 
     return self._safe_call(tool_name, _call_get_raw_entries, include_expected_schema=True)
+
+
+def _run_fetch_more(self, payload, _trace_id=None):
+    tool_name = "fetch_more"
+    return self._safe_call(
+        tool_name,
+        lambda: self._result_pager.fetch(
+            payload.get("cursor"),
+            ToolResultCache.version(self._yaml_path),
+            page_size=self._optional_int(payload, "page_size"),
+        ),
+    )
@@ -1,6 +1,9 @@
 """Input/schema validation helpers for AgentToolRunner."""
 
 from copy import deepcopy
+import hashlib
+import json
+import os
 from pathlib import Path
 
 from lib.legacy_field_policy import (
@@ -15,6 +18,24 @@ from lib.tool_registry import TOOL_CONTRACTS
 _HIDDEN_LLM_FIELDS = {"dry_run"}
 _POSITION_FIELD_KEYS = {"position", "from_position", "to_position"}
 
+# tool_schemas() cache: compact JSON keyed by (meta fingerprint, language,
+# tool names), plus the last fingerprint seen for each inventory file so an
+# unchanged file needs no YAML load at all.
+_TOOL_SCHEMA_CACHE_LIMIT = 16
+_tool_schema_cache = {}
+_schema_fingerprints = {}
+
+
+class ToolSchemaList(list):
+    """Tool schemas with their compact JSON serialization attached."""
+
+    __slots__ = ("compact_json",)
+
+
+def clear_tool_schema_cache():
+    _tool_schema_cache.clear()
+    _schema_fingerprints.clear()
+
 
 def _tool_contracts():
     return TOOL_CONTRACTS
@@ -352,12 +373,8 @@ def _tool_input_field_sets(self, tool_name):
     return required, optional
 
 
-def tool_schemas(self):
-    """OpenAI-compatible function tool schemas for native tool calling."""
+def _build_tool_schemas(self, tool_names, schema_context):
     schemas = []
-    schema_context = _build_tool_schema_context(self)
-
-    tool_names = self.list_tools() if hasattr(self, "list_tools") else list(_tool_contracts().keys())
     for name in tool_names:
         contract = _tool_contracts().get(name) or {}
         desc_default = contract.get("description") or self._msg(
@@ -378,10 +395,77 @@ def tool_schemas(self):
                 },
             }
         )
-
     return schemas
 
 
+def _inventory_file_stamp(self):
+    yaml_path = str(getattr(self, "_yaml_path", "") or "")
+    if not yaml_path:
+        return None, None
+    abs_path = os.path.abspath(yaml_path)
+    try:
+        file_stat = os.stat(abs_path)
+    except OSError:
+        return None, None
+    cache_key = os.path.normcase(os.path.normpath(abs_path))
+    return cache_key, (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _schema_context_fingerprint(meta):
+    layout = meta.get("box_layout") if isinstance(meta.get("box_layout"), dict) else {}
+    payload = json.dumps(
+        {"meta": meta, "layout": layout},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def tool_schemas(self):
+    """OpenAI-compatible function tool schemas for native tool calling.
+
+    Schemas depend only on dataset meta (custom fields, legacy field policy
+    and ``box_layout``), the translator and the tool list, so the compact
+    JSON is cached under those.  While the inventory file is unchanged the
+    cached meta fingerprint is reused and no YAML is loaded.  The returned
+    list is a fresh copy carrying ``compact_json`` for token estimation.
+    """
+    tool_names = tuple(self.list_tools() if hasattr(self, "list_tools") else _tool_contracts().keys())
+    stamp_key, stamp = _inventory_file_stamp(self)
+
+    meta = None
+    fingerprint = None
+    known = _schema_fingerprints.get(stamp_key) if stamp_key else None
+    if known is not None and known[0] == stamp:
+        fingerprint = known[1]
+    else:
+        meta = self._load_meta() if hasattr(self, "_load_meta") else {}
+        fingerprint = _schema_context_fingerprint(meta)
+        if stamp_key:
+            _schema_fingerprints[stamp_key] = (stamp, fingerprint)
+
+    language_key = (getattr(self, "_tr", None), str(getattr(self, "_language", "") or ""))
+    cache_key = (fingerprint, language_key, tool_names)
+    compact_json = _tool_schema_cache.get(cache_key)
+    if compact_json is None:
+        if meta is None:
+            meta = self._load_meta() if hasattr(self, "_load_meta") else {}
+        layout = meta.get("box_layout") if isinstance(meta.get("box_layout"), dict) else {}
+        # The schema-phase field policy ignores records, so no inventory load.
+        schema_context = {"meta": meta, "inventory": [], "layout": layout}
+        schemas = _build_tool_schemas(self, tool_names, schema_context)
+        compact_json = json.dumps(schemas, ensure_ascii=False, separators=(",", ":"))
+        while len(_tool_schema_cache) >= _TOOL_SCHEMA_CACHE_LIMIT:
+            _tool_schema_cache.pop(next(iter(_tool_schema_cache)))
+        _tool_schema_cache[cache_key] = compact_json
+
+    result = ToolSchemaList(json.loads(compact_json))
+    result.compact_json = compact_json
+    return result
+
+
 def _is_integer(value):
     return isinstance(value, int) and not isinstance(value, bool)
 
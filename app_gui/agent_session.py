@@ -11,9 +11,11 @@ from agent.llm_client import (
 )
 from agent.react_agent import ReactAgent
 from agent.shell_session import ShellSessionState
+from agent.tool_result_cache import ToolResultCache
+from agent.tool_result_pages import ToolResultPager
 from agent.tool_runner import AgentToolRunner
 from app_gui.gui_config import DEFAULT_MAX_STEPS, MAX_AGENT_STEPS
-from app_gui.i18n import tr
+from app_gui.i18n import get_language, tr
 from lib.inventory_paths import assert_allowed_inventory_yaml_path
 from lib.tool_api import build_actor_context
 
@@ -35,10 +37,16 @@ class AgentSessionService:
         self._session_id = session_id
         self._api_keys = {}
         self._shell_state = ShellSessionState()
+        self._tool_result_cache = ToolResultCache()
+        self._tool_result_pager = ToolResultPager()
 
     def reset_shell_state(self):
         self._shell_state.reset()
 
+    def close(self):
+        """Shut down the session's persistent shell workers."""
+        self._shell_state.close()
+
     def set_api_keys(self, api_keys):
         """Set per-provider API keys for LLM clients."""
         self._api_keys = api_keys if isinstance(api_keys, dict) else {}
@@ -124,6 +132,9 @@ class AgentSessionService:
                 preflight_fn=preflight_plan,
                 tr_func=tr,
                 shell_state=self._shell_state,
+                language=get_language(),
+                result_cache=self._tool_result_cache,
+                result_pager=self._tool_result_pager,
             )
             if callable(_expose_runner):
                 _expose_runner(runner)
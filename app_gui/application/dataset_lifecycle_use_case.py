@@ -4,8 +4,7 @@ import os
 from dataclasses import dataclass
 from typing import Callable, Optional
 
-import yaml
-
+from lib import yaml_codec
 from lib.inventory_paths import (
     assert_allowed_inventory_yaml_path,
     build_dataset_delete_payload,
@@ -110,12 +109,7 @@ class DatasetLifecycleUseCase:
         if target_dir:
             os.makedirs(target_dir, exist_ok=True)
         with open(target_path, "w", encoding="utf-8") as handle:
-            yaml.safe_dump(
-                payload or self.default_inventory_payload(),
-                handle,
-                allow_unicode=True,
-                sort_keys=False,
-            )
+            yaml_codec.safe_dump(payload or self.default_inventory_payload(), handle)
         return target_path
 
     def resolve_startup_yaml_path(self, *, configured_yaml_path: str) -> str:
@@ -2,8 +2,12 @@
 
 from .contracts import (
     describe_local_open_api_route,
+    LOCAL_OPEN_API_BATCH_MAX_OPERATIONS,
+    LOCAL_OPEN_API_BATCH_OPERATIONS,
+    LOCAL_OPEN_API_CHANGES_MAX_WAIT_SECONDS,
     iter_local_open_api_route_descriptions,
     LOCAL_OPEN_API_DEFAULT_PORT,
+    LOCAL_OPEN_API_EXPORT_FORMATS,
     LOCAL_OPEN_API_ROUTE_ALLOWLIST,
     LOCAL_OPEN_API_ROUTE_SPECS,
     LOCAL_OPEN_API_STAGE_ALLOWED_ACTIONS,
@@ -27,7 +31,11 @@ def __getattr__(name):
     raise AttributeError(name)
 
 __all__ = [
+    "LOCAL_OPEN_API_BATCH_MAX_OPERATIONS",
+    "LOCAL_OPEN_API_BATCH_OPERATIONS",
+    "LOCAL_OPEN_API_CHANGES_MAX_WAIT_SECONDS",
     "LOCAL_OPEN_API_DEFAULT_PORT",
+    "LOCAL_OPEN_API_EXPORT_FORMATS",
     "LOCAL_OPEN_API_ROUTE_ALLOWLIST",
     "LOCAL_OPEN_API_ROUTE_SPECS",
     "LOCAL_OPEN_API_STAGE_ALLOWED_ACTIONS",
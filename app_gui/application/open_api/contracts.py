@@ -2,6 +2,7 @@
 
 from copy import deepcopy
 
+from lib.csv_export import EXPORT_STREAM_FORMATS
 from lib.tool_registry import TOOL_CONTRACTS
 
 LOCAL_OPEN_API_DEFAULT_PORT = 37666
@@ -23,6 +24,16 @@ LOCAL_OPEN_API_SEARCH_MODES = tuple(
     )
     or ("fuzzy", "exact")
 )
+LOCAL_OPEN_API_EXPORT_FORMATS = tuple(EXPORT_STREAM_FORMATS)
+LOCAL_OPEN_API_BATCH_OPERATIONS = {
+    "search": ("GET", "/api/v1/inventory/search"),
+    "filter": ("GET", "/api/v1/inventory/filter"),
+    "stats": ("GET", "/api/v1/inventory/stats"),
+    "summary": ("GET", "/api/v1/inventory/summary"),
+    "validate": ("GET", "/api/v1/inventory/validate"),
+}
+LOCAL_OPEN_API_BATCH_MAX_OPERATIONS = 5000
+LOCAL_OPEN_API_CHANGES_MAX_WAIT_SECONDS = 30
 
 LOCAL_OPEN_API_ROUTE_SPECS = {
     ("GET", "/api/v1/capabilities"): {
@@ -112,6 +123,50 @@ LOCAL_OPEN_API_ROUTE_SPECS = {
             {"name": "summary_only", "in": "query", "type": "boolean", "required": False},
         ],
     },
+    ("GET", "/api/v1/inventory/summary"): {
+        "handler": "_handle_inventory_summary",
+        "request_arg": None,
+        "status_code": 200,
+        "effect": "inventory_read",
+        "summary": "Return record count and per-box occupancy for the current GUI dataset from maintained counters.",
+        "params": [],
+    },
+    ("GET", "/api/v1/inventory/export"): {
+        "handler": "_handle_inventory_export",
+        "request_arg": "query_params",
+        "status_code": 200,
+        "effect": "inventory_read",
+        "summary": (
+            "Stream current GUI dataset records as a chunked NDJSON (default) or CSV body; "
+            "since_audit_seq limits rows to records changed after that audit sequence."
+        ),
+        "params": [
+            {
+                "name": "format",
+                "in": "query",
+                "type": "string",
+                "required": False,
+                "accepted_values": list(LOCAL_OPEN_API_EXPORT_FORMATS),
+            },
+            {"name": "columns", "in": "query", "type": "comma-separated-string", "required": False},
+            {"name": "since_audit_seq", "in": "query", "type": "integer", "required": False},
+        ],
+    },
+    ("GET", "/api/v1/changes"): {
+        "handler": "_handle_changes",
+        "request_arg": "query_params",
+        "status_code": 200,
+        "effect": "inventory_read",
+        "summary": (
+            "Return audit events newer than after_seq with the current state of the records they touched; "
+            "wait_seconds long-polls until a new event is appended."
+        ),
+        "params": [
+            {"name": "after_seq", "in": "query", "type": "integer", "required": False},
+            {"name": "limit", "in": "query", "type": "integer", "required": False},
+            {"name": "wait_seconds", "in": "query", "type": "integer", "required": False},
+        ],
+    },
     ("GET", "/api/v1/inventory/validate"): {
         "handler": "_handle_inventory_validate",
         "request_arg": "query_params",
@@ -129,6 +184,25 @@ LOCAL_OPEN_API_ROUTE_SPECS = {
             {"name": "fail_on_warnings", "in": "query", "type": "boolean", "required": False},
         ],
     },
+    ("POST", "/api/v1/batch"): {
+        "handler": "_handle_batch",
+        "request_arg": "payload",
+        "status_code": 200,
+        "effect": "inventory_read",
+        "summary": (
+            "Run many inventory read operations against one consistent snapshot of the current GUI dataset; "
+            "each operation takes the query params of its GET route as a JSON object."
+        ),
+        "params": [
+            {
+                "name": "operations",
+                "in": "body",
+                "type": "array",
+                "required": True,
+                "accepted_values": sorted(LOCAL_OPEN_API_BATCH_OPERATIONS),
+            },
+        ],
+    },
     ("POST", "/api/v1/gui/focus"): {
         "handler": "_handle_focus",
         "request_arg": None,
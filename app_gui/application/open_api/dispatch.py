@@ -2,41 +2,182 @@
 
 from __future__ import annotations
 
-from queue import Empty, Queue
+import threading
+import time
+from collections import deque
 
 from PySide6.QtCore import QObject, Qt, QThread, Signal, Slot
 
+from lib.diagnostics import log_event
+
+from .service import LocalOpenApiBusyError
+
+
+# Longest stretch one drain slot keeps the GUI thread busy before it yields
+# back to the event loop; the remaining calls run in a re-posted slot.
+_DRAIN_BUDGET_SECONDS = 0.01
+
+
+class _PendingCall:
+    __slots__ = ("fn", "coalesce_key", "enqueued_at", "done", "ok", "payload", "waiters")
+
+    def __init__(self, fn, coalesce_key):
+        self.fn = fn
+        self.coalesce_key = coalesce_key
+        self.enqueued_at = time.perf_counter()
+        self.done = threading.Event()
+        self.ok = False
+        self.payload = None
+        self.waiters = 1
+
 
 class MainThreadDispatcher(QObject):
-    """Run callables on the QObject thread and wait for the result."""
+    """Run callables on the QObject thread and wait for the result.
 
-    _call_requested = Signal(object, object)
+    Calls from worker threads are appended to one bounded queue.  A drain
+    slot runs queued calls one after another until ``drain_budget`` seconds
+    have passed, then re-posts itself so user input is handled between
+    chunks of a burst.  Calls sharing a ``coalesce_key`` while still queued
+    run once and share the result; calls whose every waiter timed out are
+    dropped before they run.  When ``max_pending`` calls are already waiting,
+    ``call`` raises ``LocalOpenApiBusyError`` instead of piling more work onto
+    the GUI.
+    """
 
-    def __init__(self, parent=None):
+    _drain_requested = Signal()
+
+    def __init__(self, parent=None, *, max_pending=32, retry_after=1.0, drain_budget=_DRAIN_BUDGET_SECONDS):
         super().__init__(parent)
-        self._call_requested.connect(self._execute, Qt.QueuedConnection)
+        self._max_pending = max(1, int(max_pending))
+        self._retry_after = max(0.0, float(retry_after))
+        self._drain_budget = max(0.0, float(drain_budget))
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._pending_by_key = {}
+        self._drain_scheduled = False
+        self._metrics = {
+            "calls": 0,
+            "coalesced": 0,
+            "rejected": 0,
+            "timeouts": 0,
+            "abandoned": 0,
+            "errors": 0,
+            "completed": 0,
+            "queue_wait_ms_total": 0.0,
+            "queue_wait_ms_max": 0.0,
+            "run_ms_total": 0.0,
+            "run_ms_max": 0.0,
+        }
+        self._drain_requested.connect(self._drain, Qt.QueuedConnection)
+
+    def metrics(self):
+        """Return a snapshot of dispatch counters and latencies (milliseconds)."""
+        with self._lock:
+            snapshot = dict(self._metrics)
+            snapshot["pending"] = len(self._pending)
+        snapshot["max_pending"] = self._max_pending
+        completed = snapshot["completed"]
+        snapshot["queue_wait_ms_avg"] = round(snapshot["queue_wait_ms_total"] / completed, 3) if completed else 0.0
+        snapshot["run_ms_avg"] = round(snapshot["run_ms_total"] / completed, 3) if completed else 0.0
+        for key in ("queue_wait_ms_total", "queue_wait_ms_max", "run_ms_total", "run_ms_max"):
+            snapshot[key] = round(snapshot[key], 3)
+        return snapshot
+
+    @Slot()
+    def _drain(self):
+        deadline = time.perf_counter() + self._drain_budget
+        ran = 0
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._drain_scheduled = False
+                    return
+                if ran and time.perf_counter() >= deadline:
+                    # Leave _drain_scheduled set; the re-posted slot owns the rest.
+                    break
+                item = self._pending.popleft()
+                if self._pending_by_key.get(item.coalesce_key) is item:
+                    del self._pending_by_key[item.coalesce_key]
+            ran += 1
+            self._run_pending(item, ran)
+        self._drain_requested.emit()
 
-    @Slot(object, object)
-    def _execute(self, fn, queue_obj):
+    def _run_pending(self, item, slot_index):
+        started = time.perf_counter()
         try:
-            result = fn()
+            item.payload = item.fn()
+            item.ok = True
         except Exception as exc:  # pragma: no cover - defensive transport guard
-            queue_obj.put((False, exc))
-            return
-        queue_obj.put((True, result))
+            item.payload = exc
+        finished = time.perf_counter()
+        queue_wait_ms = (started - item.enqueued_at) * 1000.0
+        run_ms = (finished - started) * 1000.0
+        with self._lock:
+            metrics = self._metrics
+            metrics["completed"] += 1
+            if not item.ok:
+                metrics["errors"] += 1
+            metrics["queue_wait_ms_total"] += queue_wait_ms
+            metrics["queue_wait_ms_max"] = max(metrics["queue_wait_ms_max"], queue_wait_ms)
+            metrics["run_ms_total"] += run_ms
+            metrics["run_ms_max"] = max(metrics["run_ms_max"], run_ms)
+        item.done.set()
+        log_event(
+            "open_api.gui_dispatch",
+            queue_wait_ms=round(queue_wait_ms, 3),
+            run_ms=round(run_ms, 3),
+            slot_index=slot_index,
+            coalesced=item.coalesce_key is not None,
+            status="ok" if item.ok else "error",
+        )
 
-    def call(self, fn, *, timeout=5.0):
+    def _abandon(self, item):
+        """Drop ``item`` from the queue once its last waiter has given up."""
+        with self._lock:
+            self._metrics["timeouts"] += 1
+            item.waiters -= 1
+            if item.waiters > 0 or item.done.is_set():
+                return
+            try:
+                self._pending.remove(item)
+            except ValueError:
+                return  # already running on the GUI thread
+            if self._pending_by_key.get(item.coalesce_key) is item:
+                del self._pending_by_key[item.coalesce_key]
+            self._metrics["abandoned"] += 1
+
+    def call(self, fn, *, timeout=5.0, coalesce_key=None):
         if not callable(fn):
             raise TypeError("fn must be callable")
         if QThread.currentThread() == self.thread():
             return fn()
 
-        queue_obj = Queue(maxsize=1)
-        self._call_requested.emit(fn, queue_obj)
-        try:
-            ok, payload = queue_obj.get(timeout=float(timeout or 0))
-        except Empty as exc:
-            raise TimeoutError("Main-thread dispatch timed out") from exc
-        if ok:
-            return payload
-        raise payload
+        schedule = False
+        with self._lock:
+            item = self._pending_by_key.get(coalesce_key) if coalesce_key is not None else None
+            if item is not None:
+                item.waiters += 1
+                self._metrics["coalesced"] += 1
+            else:
+                if len(self._pending) >= self._max_pending:
+                    self._metrics["rejected"] += 1
+                    raise LocalOpenApiBusyError(
+                        "GUI is busy handling other local API requests; retry later.",
+                        retry_after=self._retry_after,
+                    )
+                item = _PendingCall(fn, coalesce_key)
+                self._pending.append(item)
+                if coalesce_key is not None:
+                    self._pending_by_key[coalesce_key] = item
+                self._metrics["calls"] += 1
+                schedule = not self._drain_scheduled
+                self._drain_scheduled = True
+        if schedule:
+            self._drain_requested.emit()
+
+        if not item.done.wait(timeout=float(timeout or 0)):
+            self._abandon(item)
+            raise TimeoutError("Main-thread dispatch timed out")
+        if item.ok:
+            return item.payload
+        raise item.payload
@@ -10,6 +10,7 @@ from urllib.parse import parse_qs, urlsplit
 from .contracts import LOCAL_OPEN_API_DEFAULT_PORT
 from .service import (
     LocalOpenApiRequestError,
+    LocalOpenApiStreamResponse,
     _coerce_int,
     _response_envelope,
 )
@@ -89,15 +90,43 @@ class LocalOpenApiService:
                     )
                 return payload
 
-            def _send_json(self, status_code, payload_dict):
+            def _send_json(self, status_code, payload_dict, headers=None):
                 body = json.dumps(payload_dict, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
                 self.send_response(int(status_code))
                 self.send_header("Content-Type", "application/json; charset=utf-8")
                 self.send_header("Content-Length", str(len(body)))
+                for name, value in dict(headers or {}).items():
+                    self.send_header(name, value)
                 self.end_headers()
                 self.wfile.write(body)
 
+            def _send_stream(self, status_code, stream):
+                # Chunked framing needs HTTP/1.1; older clients get a
+                # close-delimited body instead.
+                chunked = self.request_version != "HTTP/1.0"
+                if chunked:
+                    self.protocol_version = "HTTP/1.1"
+                self.send_response(int(status_code))
+                self.send_header("Content-Type", stream.content_type)
+                for name, value in stream.headers.items():
+                    self.send_header(name, value)
+                if chunked:
+                    self.send_header("Transfer-Encoding", "chunked")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+                for chunk in stream.iter_chunks():
+                    if not chunk:
+                        continue
+                    if chunked:
+                        self.wfile.write(f"{len(chunk):X}\r\n".encode("ascii") + chunk + b"\r\n")
+                    else:
+                        self.wfile.write(chunk)
+                if chunked:
+                    self.wfile.write(b"0\r\n\r\n")
+
             def _handle_request(self, method):
+                headers = None
                 try:
                     parsed = urlsplit(self.path)
                     payload = self._read_payload() if method == "POST" else None
@@ -109,6 +138,7 @@ class LocalOpenApiService:
                     )
                 except LocalOpenApiRequestError as exc:
                     status_code, response_payload = exc.to_response()
+                    headers = exc.response_headers()
                 except ValueError as exc:
                     status_code, response_payload = LocalOpenApiRequestError(str(exc)).to_response()
                 except Exception as exc:  # pragma: no cover - defensive server guard
@@ -118,7 +148,10 @@ class LocalOpenApiService:
                         error_code="internal_error",
                         message=str(exc),
                     )
-                self._send_json(status_code, response_payload)
+                if isinstance(response_payload, LocalOpenApiStreamResponse):
+                    self._send_stream(status_code, response_payload)
+                    return
+                self._send_json(status_code, response_payload, headers=headers)
 
         return _Handler
 
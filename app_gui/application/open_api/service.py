@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import copy
+import json
+import math
 import os
+import time
+import uuid
 from typing import Any, Callable
 
 from app_gui.plan_executor import preflight_plan
@@ -17,15 +21,28 @@ from lib.plan_gate import validate_stage_request
 from lib.plan_item_factory import normalize_plan_action
 from lib.tool_api import (
     coerce_position_value,
+    open_inventory_export_stream,
     tool_filter_records,
     tool_generate_stats,
+    tool_inventory_summary,
+    tool_list_audit_changes,
     tool_search_records,
 )
 from lib.validate_service import validate_yaml_file
-from lib.yaml_ops import load_yaml
+from lib.yaml_ops import (
+    audit_append_generation,
+    clear_read_snapshot,
+    load_yaml,
+    read_snapshot_context,
+    wait_for_audit_append,
+)
 
 from .contracts import (
+    LOCAL_OPEN_API_BATCH_MAX_OPERATIONS,
+    LOCAL_OPEN_API_BATCH_OPERATIONS,
+    LOCAL_OPEN_API_CHANGES_MAX_WAIT_SECONDS,
     LOCAL_OPEN_API_DEFAULT_PORT,
+    LOCAL_OPEN_API_EXPORT_FORMATS,
     LOCAL_OPEN_API_ROUTE_ALLOWLIST,
     LOCAL_OPEN_API_ROUTE_SPECS,
     LOCAL_OPEN_API_STAGE_ALLOWED_ACTIONS,
@@ -80,6 +97,51 @@ class LocalOpenApiRequestError(ValueError):
             example_request=self.example_request,
         )
 
+    def response_headers(self) -> dict[str, str]:
+        return {}
+
+
+class LocalOpenApiBusyError(LocalOpenApiRequestError):
+    """Backpressure error raised when GUI handoff work is already queued."""
+
+    def __init__(self, message: str, *, retry_after: float = 1.0):
+        super().__init__(message, status_code=429, error_code="gui_busy")
+        self.retry_after = max(0.0, float(retry_after))
+
+    def to_response(self):
+        status_code, payload = super().to_response()
+        payload["retry_after_seconds"] = self.retry_after
+        return status_code, payload
+
+    def response_headers(self) -> dict[str, str]:
+        return {"Retry-After": str(max(1, math.ceil(self.retry_after)))}
+
+
+class LocalOpenApiStreamResponse:
+    """Response body rendered lazily and sent with chunked transfer encoding."""
+
+    # Coalesce small rendered lines into chunks of roughly this many bytes.
+    chunk_size = 64 * 1024
+
+    def __init__(self, lines, *, content_type: str, headers: dict[str, str] | None = None):
+        self._lines = lines
+        self.content_type = str(content_type or "application/octet-stream")
+        self.headers = dict(headers or {})
+
+    def iter_chunks(self):
+        pending = []
+        pending_size = 0
+        for line in self._lines:
+            encoded = str(line).encode("utf-8")
+            pending.append(encoded)
+            pending_size += len(encoded)
+            if pending_size >= self.chunk_size:
+                yield b"".join(pending)
+                pending = []
+                pending_size = 0
+        if pending:
+            yield b"".join(pending)
+
 
 def _error_response(
     *,
@@ -169,6 +231,35 @@ def _coerce_json_object(value, *, field_name):
     return parsed
 
 
+def _batch_query_params(params) -> dict[str, list[str]]:
+    """Project one batch operation's JSON params onto the GET query-param shape."""
+    query_params = {}
+    for key, value in dict(params or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            text = "true" if value else "false"
+        elif isinstance(value, (dict, list)):
+            text = json.dumps(value, ensure_ascii=False)
+        else:
+            text = str(value)
+        query_params[str(key)] = [text]
+    return query_params
+
+
+_BATCH_EXAMPLE_REQUEST = {
+    "operations": [
+        {"id": "k562", "op": "search", "params": {"query": "K562", "mode": "exact"}},
+        {"id": "box-1", "op": "stats", "params": {"box": 1, "summary_only": True}},
+    ]
+}
+
+
+def _coalesce_token(payload) -> str:
+    """Stable key for merging identical GUI handoff calls that are still queued."""
+    return json.dumps(payload, sort_keys=True, default=str)
+
+
 def _normalize_route_path(path: str) -> str:
     text = str(path or "").strip() or "/"
     if text != "/" and text.endswith("/"):
@@ -286,17 +377,19 @@ class LocalOpenApiController:
             return None
         return data if isinstance(data, dict) else None
 
-    def _call_gui(self, fn: Callable[[], object]):
+    def _call_gui(self, fn: Callable[[], object], *, coalesce_key=None):
         dispatcher = self._gui_dispatcher
         if dispatcher is None or not hasattr(dispatcher, "call"):
             return fn()
-        return dispatcher.call(fn)
+        if coalesce_key is None:
+            return dispatcher.call(fn)
+        return dispatcher.call(fn, coalesce_key=coalesce_key)
 
     def _focus_window(self):
         focus_fn = self._focus_window_fn
         if not callable(focus_fn):
             raise RuntimeError("GUI focus handler is unavailable")
-        return self._call_gui(focus_fn)
+        return self._call_gui(focus_fn, coalesce_key=("focus",))
 
     def _handle_health(self):
         current_yaml = str(self._yaml_path_getter() or "").strip()
@@ -307,9 +400,16 @@ class LocalOpenApiController:
                 "service": "local_open_api",
                 "dataset_path": current_yaml,
                 "dataset_exists": bool(current_yaml and os.path.isfile(current_yaml)),
+                "gui_dispatch": self._gui_dispatch_metrics(),
             },
         )
 
+    def _gui_dispatch_metrics(self):
+        metrics_fn = getattr(self._gui_dispatcher, "metrics", None)
+        if not callable(metrics_fn):
+            return None
+        return metrics_fn()
+
     def _handle_capabilities(self):
         dataset_schema = build_inventory_dataset_schema_payload(
             self._load_current_dataset_data_for_capabilities()
@@ -436,6 +536,78 @@ class LocalOpenApiController:
                 response["result"] = _build_stats_summary(result)
         return response
 
+    def _handle_inventory_summary(self):
+        yaml_path = self._current_yaml_path(must_exist=True)
+        return tool_inventory_summary(yaml_path=yaml_path)
+
+    def _handle_inventory_export(self, query_params):
+        yaml_path = self._current_yaml_path(must_exist=True)
+        requested_format = str(_first(query_params.get("format")) or "ndjson").strip().lower()
+        if requested_format not in LOCAL_OPEN_API_EXPORT_FORMATS:
+            raise LocalOpenApiRequestError(
+                f"Invalid export format: {requested_format}",
+                field="format",
+                expected_type="string",
+                accepted_values=list(LOCAL_OPEN_API_EXPORT_FORMATS),
+                example_request={"format": "ndjson", "columns": "id,box,position", "since_audit_seq": 0},
+            )
+        since_audit_seq = _coerce_int(
+            _first(query_params.get("since_audit_seq")),
+            field_name="since_audit_seq",
+            minimum=0,
+        )
+        response = open_inventory_export_stream(
+            yaml_path=yaml_path,
+            export_format=requested_format,
+            columns=_first(query_params.get("columns")),
+            since_audit_seq=since_audit_seq,
+        )
+        if not response.get("ok"):
+            status_code = 400 if response.get("error_code") == "invalid_tool_input" else 500
+            return status_code, response
+
+        summary = dict(response.get("result") or {})
+        latest_seq = summary.get("latest_audit_seq")
+        content_type = (
+            "application/x-ndjson; charset=utf-8"
+            if requested_format == "ndjson"
+            else "text/csv; charset=utf-8"
+        )
+        return 200, LocalOpenApiStreamResponse(
+            response["lines"],
+            content_type=content_type,
+            headers={
+                "X-SnowFox-Record-Count": str(summary.get("count", 0)),
+                "X-SnowFox-Columns": ",".join(summary.get("columns") or []),
+                "X-SnowFox-Latest-Audit-Seq": "" if latest_seq is None else str(latest_seq),
+                "X-SnowFox-Full-Resync": "true" if summary.get("full_resync") else "false",
+            },
+        )
+
+    def _handle_changes(self, query_params):
+        yaml_path = self._current_yaml_path(must_exist=True)
+        after_seq = _coerce_int(_first(query_params.get("after_seq")), field_name="after_seq", minimum=0, default=0)
+        limit = _coerce_int(_first(query_params.get("limit")), field_name="limit", minimum=1, default=200)
+        wait_seconds = _coerce_int(
+            _first(query_params.get("wait_seconds")),
+            field_name="wait_seconds",
+            minimum=0,
+            default=0,
+        )
+        deadline = time.monotonic() + min(wait_seconds, LOCAL_OPEN_API_CHANGES_MAX_WAIT_SECONDS)
+        while True:
+            generation = audit_append_generation()
+            response = tool_list_audit_changes(yaml_path=yaml_path, after_seq=after_seq, limit=limit)
+            if not response.get("ok"):
+                status_code = 400 if response.get("error_code") in {"invalid_tool_input", "invalid_limit"} else 500
+                return status_code, response
+            remaining = deadline - time.monotonic()
+            if (response.get("result") or {}).get("changes") or remaining <= 0:
+                return response
+            # Wake on in-process appends immediately; re-read at least once a
+            # second so writes from other processes are still picked up.
+            wait_for_audit_append(generation, min(remaining, 1.0))
+
     def _handle_inventory_validate(self, query_params):
         yaml_path = self._current_yaml_path(must_exist=True)
         requested_mode = _first(query_params.get("mode"))
@@ -455,6 +627,108 @@ class LocalOpenApiController:
             fail_on_warnings=_coerce_bool(_first(query_params.get("fail_on_warnings")), default=False),
         )
 
+    def _run_batch_operation(self, index, raw_operation):
+        operation_id = None
+        op_name = None
+        try:
+            if not isinstance(raw_operation, dict):
+                raise LocalOpenApiRequestError(
+                    f"operations[{index}] must be an object.",
+                    field=f"operations[{index}]",
+                    expected_type="object",
+                    example_request=_BATCH_EXAMPLE_REQUEST,
+                )
+            operation_id = raw_operation.get("id")
+            op_name = str(raw_operation.get("op") or "").strip().lower()
+            route_key = LOCAL_OPEN_API_BATCH_OPERATIONS.get(op_name)
+            if route_key is None:
+                raise LocalOpenApiRequestError(
+                    f"Unsupported batch operation: {raw_operation.get('op')}",
+                    field=f"operations[{index}].op",
+                    expected_type="string",
+                    accepted_values=sorted(LOCAL_OPEN_API_BATCH_OPERATIONS),
+                    example_request=_BATCH_EXAMPLE_REQUEST,
+                )
+            params = raw_operation.get("params")
+            if params is not None and not isinstance(params, dict):
+                raise LocalOpenApiRequestError(
+                    f"operations[{index}].params must be an object.",
+                    field=f"operations[{index}].params",
+                    expected_type="json-object",
+                    example_request=_BATCH_EXAMPLE_REQUEST,
+                )
+            status_code, response = self.handle_request(*route_key, _batch_query_params(params))
+        except LocalOpenApiRequestError as exc:
+            status_code, response = exc.to_response()
+        except ValueError as exc:
+            status_code, response = LocalOpenApiRequestError(str(exc)).to_response()
+
+        return {
+            "index": index,
+            "id": operation_id,
+            "op": op_name,
+            "status_code": int(status_code),
+            "ok": bool(200 <= int(status_code) < 300 and isinstance(response, dict) and response.get("ok")),
+            "response": response,
+        }
+
+    def _handle_batch(self, payload):
+        body = dict(payload or {}) if isinstance(payload, dict) else {}
+        operations = body.get("operations")
+        if not isinstance(operations, list) or not operations:
+            return _error_response(
+                status_code=400,
+                error_code="invalid_request",
+                message="operations must be a non-empty list.",
+                field="operations",
+                expected_type="non-empty array",
+                accepted_values=sorted(LOCAL_OPEN_API_BATCH_OPERATIONS),
+                example_request=_BATCH_EXAMPLE_REQUEST,
+            )
+        if len(operations) > LOCAL_OPEN_API_BATCH_MAX_OPERATIONS:
+            return _error_response(
+                status_code=413,
+                error_code="batch_too_large",
+                message=(
+                    f"operations has {len(operations)} items; "
+                    f"at most {LOCAL_OPEN_API_BATCH_MAX_OPERATIONS} are allowed per batch."
+                ),
+                field="operations",
+                expected_type="array",
+            )
+
+        yaml_path = self._current_yaml_path(must_exist=True)
+        # One snapshot per batch: every operation reads the same parsed
+        # document, so results stay consistent even if the GUI writes mid-batch.
+        # The batch only runs read tools, so they share one read-only view of
+        # it (and its lookup indexes) instead of copying it per operation.
+        snapshot_id = f"open-api-batch-{uuid.uuid4().hex}"
+        results = []
+        try:
+            with read_snapshot_context(snapshot_id, shared=True):
+                for index, raw_operation in enumerate(operations):
+                    results.append(self._run_batch_operation(index, raw_operation))
+        finally:
+            clear_read_snapshot(snapshot_id)
+
+        failed_count = sum(1 for item in results if not item.get("ok"))
+        return 200, _response_envelope(
+            ok=True,
+            message="Batch read completed",
+            effect="inventory_read",
+            executed=False,
+            staged=False,
+            inventory_written=False,
+            gui_changed=False,
+            result={
+                "dataset_path": yaml_path,
+                "count": len(results),
+                "succeeded_count": len(results) - failed_count,
+                "failed_count": failed_count,
+                "results": results,
+            },
+        )
+
     def _resolve_switch_target_yaml(self, body):
         dataset_name = str((body or {}).get("dataset_name") or "").strip()
         yaml_path = str((body or {}).get("yaml_path") or "").strip()
@@ -506,7 +780,7 @@ class LocalOpenApiController:
         if focus:
             focus_fn = self._focus_window_fn
             if callable(focus_fn):
-                self._call_gui(focus_fn)
+                self._call_gui(focus_fn, coalesce_key=("focus",))
 
         dataset_name = os.path.basename(os.path.dirname(switched_yaml)) or os.path.basename(switched_yaml) or ""
         return 200, _response_envelope(
@@ -584,7 +858,7 @@ class LocalOpenApiController:
                     focus_fn()
             return True
 
-        self._call_gui(_apply)
+        self._call_gui(_apply, coalesce_key=("prefill_takeout", _coalesce_token(prefill), focus))
         return 200, _response_envelope(
             ok=True,
             message="Prepared takeout context in GUI",
@@ -650,7 +924,7 @@ class LocalOpenApiController:
                     focus_fn()
             return True
 
-        self._call_gui(_apply)
+        self._call_gui(_apply, coalesce_key=("prefill_add", _coalesce_token(prefill), focus))
         return 200, _response_envelope(
             ok=True,
             message="Prepared add-entry context in GUI",
@@ -687,7 +961,7 @@ class LocalOpenApiController:
             handler(prompt, focus)
             return True
 
-        self._call_gui(_apply)
+        self._call_gui(_apply, coalesce_key=("prefill_ai_prompt", prompt, focus))
         return 200, _response_envelope(
             ok=True,
             message="Prepared AI prompt in GUI",
@@ -811,7 +1085,7 @@ class LocalOpenApiController:
         if focus and (accepted or noop_items):
             focus_fn = self._focus_window_fn
             if callable(focus_fn):
-                self._call_gui(focus_fn)
+                self._call_gui(focus_fn, coalesce_key=("focus",))
 
         return 200, _response_envelope(
             ok=True,
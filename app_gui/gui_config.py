@@ -4,8 +4,6 @@ import copy
 import os
 import sys
 
-import yaml
-
 from agent.agent_defaults import AGENT_HISTORY_MAX_TURNS, DEFAULT_MAX_STEPS
 from app_gui.application.ai_provider_catalog import (
     DEFAULT_AI_PROVIDER,
@@ -14,10 +12,12 @@ from app_gui.application.ai_provider_catalog import (
     normalize_ai_provider,
 )
 from app_gui.application.open_api.contracts import LOCAL_OPEN_API_DEFAULT_PORT
+from lib import yaml_codec
 from lib.app_storage import (
     get_legacy_config_file,
     get_user_config_dir,
     get_user_config_file,
+    invalidate_path_caches,
     normalize_data_root,
 )
 
@@ -114,7 +114,7 @@ def load_gui_config(path=None):
         return _apply_defaults(cfg)
     try:
         with open(candidate_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml_codec.safe_load(f) or {}
         merged = copy.deepcopy(DEFAULT_GUI_CONFIG)
         for key in (
             "data_root",
@@ -155,6 +155,7 @@ def save_gui_config(config, path=None):
     payload["data_root"] = normalize_data_root(payload.get("data_root")) or None
     os.makedirs(os.path.dirname(target), exist_ok=True)
     with open(target, "w", encoding="utf-8") as f:
-        yaml.safe_dump(payload, f, allow_unicode=True, sort_keys=False)
+        yaml_codec.safe_dump(payload, f)
         f.flush()  # Ensure data is written to disk
         os.fsync(f.fileno())  # Force write to disk
+    invalidate_path_caches()
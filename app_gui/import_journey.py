@@ -1,10 +1,12 @@
 """Unified import journey orchestration for GUI entrypoints."""
 
 import os
+import threading
 from dataclasses import dataclass, field
 from typing import Dict, List
 
-from PySide6.QtWidgets import QFileDialog
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QFileDialog, QProgressDialog
 
 from app_gui.i18n import t, tr
 from app_gui.import_state import ImportJourneyState
@@ -68,7 +70,7 @@ class ImportJourneyService:
             )
 
         state.set_stage("preconvert_inputs")
-        preconvert_result = self._run_preconvert(staged_inputs)
+        preconvert_result = self._run_preconvert(staged_inputs, parent=parent)
 
         return self._result_from_state(
             state,
@@ -95,7 +97,7 @@ class ImportJourneyService:
         )
         return [str(p or "").strip() for p in (paths or []) if str(p or "").strip()]
 
-    def _run_preconvert(self, staged_inputs: List[str]) -> XlsxPreconvertResult:
+    def _run_preconvert(self, staged_inputs: List[str], *, parent=None) -> XlsxPreconvertResult:
         normalized_root = str(getattr(self._workspace, "normalized_dir", "") or "").strip()
         if not normalized_root:
             return XlsxPreconvertResult(
@@ -103,10 +105,15 @@ class ImportJourneyService:
                 message="Normalized workspace is unavailable; staged files will be used directly.",
             )
 
+        progress_kwargs = {}
+        progress = None
+        if parent is not None:
+            progress, progress_kwargs = self._build_preconvert_progress(parent)
         try:
             return self._preconvert.convert_staged_files(
                 staged_inputs,
                 normalized_root=normalized_root,
+                **progress_kwargs,
             )
         except Exception as exc:  # pragma: no cover - defensive fallback
             return XlsxPreconvertResult(
@@ -114,6 +121,36 @@ class ImportJourneyService:
                 message=f"XLSX pre-conversion failed: {exc}. Fallback to staged raw files.",
                 normalized_root=normalized_root,
             )
+        finally:
+            if progress is not None:
+                progress.close()
+
+    def _build_preconvert_progress(self, parent):
+        """Show a cancellable busy dialog fed by pre-conversion progress events."""
+        progress = QProgressDialog(parent)
+        progress.setWindowTitle(tr("main.importPreconvertProgressTitle"))
+        progress.setLabelText(tr("main.importPreconvertProgressTitle"))
+        progress.setCancelButtonText(tr("common.cancel"))
+        progress.setRange(0, 0)
+        progress.setMinimumDuration(500)
+        progress.setWindowModality(Qt.ApplicationModal)
+        cancel_event = threading.Event()
+
+        def _on_progress(event):
+            sheet_name = event.get("sheet_name")
+            if sheet_name:
+                progress.setLabelText(
+                    t(
+                        "main.importPreconvertProgressLabel",
+                        sheet=f"{os.path.basename(str(event.get('source_path') or ''))} / {sheet_name}",
+                        rows=int(event.get("rows") or 0),
+                    )
+                )
+            QApplication.processEvents()
+            if progress.wasCanceled():
+                cancel_event.set()
+
+        return progress, {"progress_callback": _on_progress, "cancel_event": cancel_event}
 
     def _build_ai_prompt(self, staged_inputs: List[str], preconvert: XlsxPreconvertResult) -> str:
         output_yaml = self._display_path(self._workspace.output_yaml_path)
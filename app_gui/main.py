@@ -1,5 +1,6 @@
 """Desktop GUI for LN2 inventory operations (Refactored)."""
 
+import multiprocessing
 import os
 import sys
 from contextlib import suppress
@@ -1284,4 +1285,7 @@ def main():
     sys.exit(exit_code)
 
 if __name__ == "__main__":
+    # Must run first: in the frozen app, process-pool workers (XLSX
+    # pre-conversion) start by re-executing this entry point.
+    multiprocessing.freeze_support()
     main()
@@ -495,6 +495,10 @@ class WindowStateFlow:
         if local_api_service is not None and hasattr(local_api_service, "stop"):
             with suppress(Exception):
                 local_api_service.stop()
+        agent_session = getattr(window, "agent_session", None)
+        if agent_session is not None and hasattr(agent_session, "close"):
+            with suppress(Exception):
+                agent_session.close()
         return True
 
 
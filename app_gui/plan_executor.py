@@ -20,7 +20,7 @@ from app_gui import plan_executor_reports as _plan_reports
 from lib import tool_api_write_adapter as _write_adapter
 from lib.bulk_operations import get_write_capability
 from lib.diagnostics import span
-from lib.yaml_ops import load_yaml
+from lib.yaml_ops import load_yaml, write_transaction
 
 def preflight_plan(
     yaml_path: str,
@@ -97,6 +97,7 @@ def run_plan(
     bridge: object,
     date_str: Optional[str] = None,
     mode: str = "execute",
+    transactional: bool = True,
 ) -> Dict[str, object]:
     """Execute or validate a plan against a YAML file.
 
@@ -106,6 +107,9 @@ def run_plan(
         bridge: GuiToolBridge instance for executing operations.
         date_str: Optional date string for operations.
         mode: "execute" for real execution, "preflight" for validation-only.
+        transactional: In execute mode, stage the add/edit/move/takeout phases
+            in one in-memory document and write it once (one validation, one
+            backup reference, one audit append) instead of once per phase.
 
     Returns:
         Dict with keys:
@@ -224,6 +228,97 @@ def run_plan(
             include_snapshot_before_rollback=True,
         )
 
+    use_transaction = bool(
+        transactional
+        and mode == "execute"
+        and not rollbacks
+        and request_backup_path
+        and os.path.isfile(yaml_path)
+    )
+    if use_transaction:
+        commit_failed = False
+        with span("plan.execute.transaction", yaml_path=yaml_path, batch_size=len(remaining)):
+            with write_transaction(yaml_path) as transaction:
+                last_backup = _run_item_phases(
+                    reports,
+                    remaining,
+                    yaml_path=yaml_path,
+                    bridge=bridge,
+                    mode=mode,
+                    effective_date=effective_date,
+                    request_backup_path=request_backup_path,
+                    last_backup=last_backup,
+                )
+                if transaction is not None:
+                    try:
+                        transaction.commit()
+                    except Exception:
+                        commit_failed = True
+        if commit_failed:
+            # Nothing reached disk, but blocked items already have their reports
+            # and audit rows: re-run only the passed items phase by phase.
+            reports, remaining, last_backup = _rerun_uncommitted_items(
+                reports,
+                remaining,
+                items=items,
+                yaml_path=yaml_path,
+                bridge=bridge,
+                mode=mode,
+                effective_date=effective_date,
+                request_backup_path=request_backup_path,
+            )
+    else:
+        last_backup = _run_item_phases(
+            reports,
+            remaining,
+            yaml_path=yaml_path,
+            bridge=bridge,
+            mode=mode,
+            effective_date=effective_date,
+            request_backup_path=request_backup_path,
+            last_backup=last_backup,
+        )
+
+    # Finalize
+    ok_count = sum(1 for r in reports if r.get("ok"))
+    blocked_count = sum(1 for r in reports if r.get("blocked"))
+    has_blocked = blocked_count > 0
+
+    if has_blocked:
+        summary = f"Blocked: {blocked_count}/{len(reports)} items cannot execute."
+    elif ok_count == len(reports):
+        summary = f"All {ok_count} operation(s) succeeded."
+    else:
+        summary = f"Completed: {ok_count} ok, {blocked_count} blocked, {len(remaining)} remaining."
+
+    if mode == "execute":
+        undo_backup = request_backup_path or _first_success_backup_path(reports) or last_backup
+    else:
+        undo_backup = _first_success_backup_path(reports) or last_backup
+
+    return {
+        "ok": not has_blocked,
+        "blocked": has_blocked,
+        "items": reports,
+        "stats": {"total": len(reports), "ok": ok_count, "blocked": blocked_count, "remaining": len(remaining)},
+        "summary": summary,
+        "backup_path": undo_backup,
+        "remaining_items": remaining,
+    }
+
+
+def _run_item_phases(
+    reports: List[Dict[str, object]],
+    remaining: List[Dict[str, object]],
+    *,
+    yaml_path: str,
+    bridge: object,
+    mode: str,
+    effective_date: str,
+    request_backup_path: Optional[str],
+    last_backup: Optional[str],
+) -> Optional[str]:
+    """Run the add, edit, move and takeout phases in executor order."""
     # Phase 1: add operations
     adds = _items_with_action(remaining, "add")
     last_backup = _apply_batch_phase_reports(
@@ -311,32 +406,42 @@ def run_plan(
         last_backup=last_backup,
     )
 
-    # Finalize
-    ok_count = sum(1 for r in reports if r.get("ok"))
-    blocked_count = sum(1 for r in reports if r.get("blocked"))
-    has_blocked = blocked_count > 0
+    return last_backup
 
-    if has_blocked:
-        summary = f"Blocked: {blocked_count}/{len(reports)} items cannot execute."
-    elif ok_count == len(reports):
-        summary = f"All {ok_count} operation(s) succeeded."
-    else:
-        summary = f"Completed: {ok_count} ok, {blocked_count} blocked, {len(remaining)} remaining."
 
-    if mode == "execute":
-        undo_backup = request_backup_path or _first_success_backup_path(reports) or last_backup
-    else:
-        undo_backup = _first_success_backup_path(reports) or last_backup
+def _rerun_uncommitted_items(
+    reports: List[Dict[str, object]],
+    remaining: List[Dict[str, object]],
+    *,
+    items: List[Dict[str, object]],
+    yaml_path: str,
+    bridge: object,
+    mode: str,
+    effective_date: Optional[str],
+    request_backup_path: Optional[str],
+):
+    passed = [report.get("item") for report in reports if report.get("ok")]
+    rerun_reports: List[Dict[str, object]] = []
+    rerun_remaining = list(passed)
+    last_backup = _run_item_phases(
+        rerun_reports,
+        rerun_remaining,
+        yaml_path=yaml_path,
+        bridge=bridge,
+        mode=mode,
+        effective_date=effective_date,
+        request_backup_path=request_backup_path,
+        last_backup=None,
+    )
 
-    return {
-        "ok": not has_blocked,
-        "blocked": has_blocked,
-        "items": reports,
-        "stats": {"total": len(reports), "ok": ok_count, "blocked": blocked_count, "remaining": len(remaining)},
-        "summary": summary,
-        "backup_path": undo_backup,
-        "remaining_items": remaining,
-    }
+    rerun_by_item = {id(report.get("item")): report for report in rerun_reports}
+    merged = [
+        rerun_by_item.pop(id(report.get("item")), report) if report.get("ok") else report
+        for report in reports
+    ]
+    merged.extend(rerun_by_item.values())
+    left = {id(item) for item in remaining} | {id(item) for item in rerun_remaining}
+    return merged, [item for item in items if id(item) in left], last_backup
 
 
 def _run_bulk_plan_phase(action: str, phase_items: List[Dict[str, object]], mode: str, fn):
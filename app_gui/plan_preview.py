@@ -14,7 +14,7 @@ Loc = Tuple[int, int]  # (box, position)
 
 
 def _copy_record(rec: Dict[str, Any]) -> Dict[str, Any]:
-    out = dict(rec)
+    out = rec.copy()
     pos = rec.get("position")
     out["position"] = pos
     return out
@@ -40,92 +40,234 @@ def _build_owner_map(records_by_id: Dict[int, Dict[str, Any]]) -> tuple[Dict[Loc
     return owner, errors
 
 
-def simulate_plan_pos_map(
-    *,
-    base_records_by_id: Dict[int, Dict[str, Any]],
-    plan_items: List[Dict[str, Any]],
-) -> Dict[str, Any]:
-    """Simulate the post-execution occupancy map for a plan (best-effort).
-
-    Returns:
-        dict with keys:
-        - ok: bool
-        - pos_map: Dict[(box,pos), record]
-        - errors: List[str]
-        - predicted_new_ids: List[int] (for add actions)
-    """
-    items = [it for it in (plan_items or []) if isinstance(it, dict)]
-    rollback_items = [it for it in items if str(it.get("action") or "").lower() == "rollback"]
-    if rollback_items:
-        if len(items) != 1:
-            return {
-                "ok": False,
-                "pos_map": {},
-                "errors": ["Rollback must be the only item in the plan preview."],
-                "predicted_new_ids": [],
-            }
-
-        payload = rollback_items[0].get("payload") or {}
-        backup_path = payload.get("backup_path")
-        if not backup_path:
-            return {
-                "ok": False,
-                "pos_map": {},
-                "errors": ["rollback payload.backup_path is required for preview."],
-                "predicted_new_ids": [],
-            }
-        try:
-            data = load_yaml(str(backup_path))
-        except Exception as exc:
-            return {
-                "ok": False,
-                "pos_map": {},
-                "errors": [f"Failed to load rollback backup for preview: {exc}"],
-                "predicted_new_ids": [],
-            }
-
-        inv = data.get("inventory", []) if isinstance(data, dict) else []
-        records_by_id: Dict[int, Dict[str, Any]] = {}
-        for rec in inv:
-            if not isinstance(rec, dict):
-                continue
-            rid = to_int(rec.get("id"), default=0)
-            if rid <= 0:
-                continue
-            records_by_id[rid] = _copy_record(rec)
+def _rollback_preview(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if len(items) != 1:
+        return {
+            "ok": False,
+            "pos_map": {},
+            "errors": ["Rollback must be the only item in the plan preview."],
+            "predicted_new_ids": [],
+        }
 
-        owner, errors = _build_owner_map(records_by_id)
-        pos_map = {loc: records_by_id[rid] for loc, rid in owner.items() if rid in records_by_id}
+    payload = items[0].get("payload") or {}
+    backup_path = payload.get("backup_path")
+    if not backup_path:
+        return {
+            "ok": False,
+            "pos_map": {},
+            "errors": ["rollback payload.backup_path is required for preview."],
+            "predicted_new_ids": [],
+        }
+    try:
+        data = load_yaml(str(backup_path))
+    except Exception as exc:
         return {
-            "ok": not errors,
-            "pos_map": pos_map,
-            "errors": errors,
+            "ok": False,
+            "pos_map": {},
+            "errors": [f"Failed to load rollback backup for preview: {exc}"],
             "predicted_new_ids": [],
         }
 
-    # Copy base inventory state so the preview doesn't mutate the real cache.
+    inv = data.get("inventory", []) if isinstance(data, dict) else []
     records_by_id: Dict[int, Dict[str, Any]] = {}
-    for rid, rec in (base_records_by_id or {}).items():
+    for rec in inv:
         if not isinstance(rec, dict):
             continue
-        rid_i = to_int(rid, default=0)
-        if rid_i <= 0:
+        rid = to_int(rec.get("id"), default=0)
+        if rid <= 0:
             continue
-        records_by_id[rid_i] = _copy_record(rec)
+        records_by_id[rid] = _copy_record(rec)
 
-    predicted_new_ids: List[int] = []
-    errors: List[str] = []
+    owner, errors = _build_owner_map(records_by_id)
+    pos_map = {loc: records_by_id[rid] for loc, rid in owner.items() if rid in records_by_id}
+    return {
+        "ok": not errors,
+        "pos_map": pos_map,
+        "errors": errors,
+        "predicted_new_ids": [],
+    }
 
-    owner, owner_errors = _build_owner_map(records_by_id)
-    errors.extend(owner_errors)
 
-    next_id = (max(records_by_id.keys()) + 1) if records_by_id else 1
+# Executor order: every add, then every move, then every takeout.
+_PREVIEW_PHASES = ("add", "move", "takeout")
 
-    # Phase 1: add (sequential, like executor)
-    for item in items:
-        if str(item.get("action") or "").lower() != "add":
-            continue
 
+def _item_signature(item: Dict[str, Any]) -> tuple:
+    """Fields of a plan item that affect the preview (ignores validation state)."""
+    payload = item.get("payload") if isinstance(item.get("payload"), dict) else {}
+    fields = payload.get("fields") if isinstance(payload.get("fields"), dict) else {}
+    return (
+        item.get("record_id"),
+        item.get("box"),
+        item.get("position"),
+        item.get("to_box"),
+        item.get("to_position"),
+        payload.get("box"),
+        payload.get("positions"),
+        payload.get("stored_at"),
+        payload.get("frozen_at"),
+        tuple(fields.items()),
+    )
+
+
+class _OverlayState:
+    """Sparse slot/record changes layered over the base occupancy.
+
+    ``owner`` maps a location to the record id now there, or ``None`` when
+    the plan vacates it; ``records`` holds replacement records (never
+    mutated in place, so states can be checkpointed with shallow copies).
+    """
+
+    __slots__ = ("owner", "records", "errors", "predicted_new_ids", "next_id")
+
+    def __init__(self, next_id: int):
+        self.owner: Dict[Loc, Any] = {}
+        self.records: Dict[int, Dict[str, Any]] = {}
+        self.errors: List[str] = []
+        self.predicted_new_ids: List[int] = []
+        self.next_id = next_id
+
+    def copy(self) -> "_OverlayState":
+        out = _OverlayState(self.next_id)
+        out.owner = dict(self.owner)
+        out.records = dict(self.records)
+        out.errors = list(self.errors)
+        out.predicted_new_ids = list(self.predicted_new_ids)
+        return out
+
+
+class PlanPreviewOverlay:
+    """Incremental plan preview over an immutable base inventory.
+
+    The base records and their owner map are built once; a plan is applied
+    as a sparse overlay of slot changes with a checkpoint after each
+    executor phase (add, move, takeout).  ``update`` re-applies only from
+    the first phase whose items changed, and when that phase only gained
+    items at the end, only the new items are applied on top of its
+    checkpoint.  Base record dicts are shared, not copied: callers must not
+    mutate records returned by ``pos_map``/``record_at``.
+    """
+
+    def __init__(self, base_records_by_id: Dict[int, Dict[str, Any]]):
+        records: Dict[int, Dict[str, Any]] = {}
+        for rid, rec in (base_records_by_id or {}).items():
+            if not isinstance(rec, dict):
+                continue
+            rid_i = to_int(rid, default=0)
+            if rid_i <= 0:
+                continue
+            records[rid_i] = rec
+        self._base_records = records
+        self._base_owner, base_errors = _build_owner_map(records)
+        base_state = _OverlayState((max(records.keys()) + 1) if records else 1)
+        base_state.errors.extend(base_errors)
+        # _states[i] is the overlay after phases [0, i); _states[0] is the base.
+        self._states: List[_OverlayState] = [base_state] + [base_state.copy() for _ in _PREVIEW_PHASES]
+        self._phase_items: List[List[Dict[str, Any]]] = [[] for _ in _PREVIEW_PHASES]
+        self._phase_signatures: List[List[tuple]] = [[] for _ in _PREVIEW_PHASES]
+        self._rollback_items: List[Dict[str, Any]] = []
+        self.last_applied_count = 0
+
+    def update(self, plan_items: List[Dict[str, Any]]) -> "PlanPreviewOverlay":
+        """Bring the overlay in line with the current plan items."""
+        items = [it for it in (plan_items or []) if isinstance(it, dict)]
+        self.last_applied_count = 0
+        has_rollback = any(str(it.get("action") or "").lower() == "rollback" for it in items)
+        # Rollback previews replace the whole inventory; they bypass the overlay.
+        self._rollback_items = items if has_rollback else []
+        if has_rollback:
+            return self
+
+        phase_items: List[List[Dict[str, Any]]] = [[] for _ in _PREVIEW_PHASES]
+        for item in items:
+            action = str(item.get("action") or "").lower()
+            if action in _PREVIEW_PHASES:
+                phase_items[_PREVIEW_PHASES.index(action)].append(item)
+        phase_signatures = [[_item_signature(it) for it in group] for group in phase_items]
+
+        first_changed = None
+        for phase, signatures in enumerate(phase_signatures):
+            if signatures != self._phase_signatures[phase]:
+                first_changed = phase
+                break
+        if first_changed is None:
+            return self
+
+        for phase in range(first_changed, len(_PREVIEW_PHASES)):
+            old = self._phase_signatures[phase]
+            new = phase_signatures[phase]
+            if phase == first_changed and len(new) > len(old) and new[: len(old)] == old:
+                # Items appended to this phase: continue from its checkpoint.
+                state = self._states[phase + 1]
+                pending = phase_items[phase][len(old):]
+            else:
+                state = self._states[phase].copy()
+                pending = phase_items[phase]
+            apply_item = getattr(self, f"_apply_{_PREVIEW_PHASES[phase]}")
+            for item in pending:
+                apply_item(state, item)
+            self.last_applied_count += len(pending)
+            self._states[phase + 1] = state
+            self._phase_items[phase] = phase_items[phase]
+            self._phase_signatures[phase] = new
+        return self
+
+    # -- lookups -----------------------------------------------------------
+
+    def _owner_at(self, state: _OverlayState, loc: Loc):
+        if loc in state.owner:
+            return state.owner[loc]
+        return self._base_owner.get(loc)
+
+    def _record(self, state: _OverlayState, rid: int):
+        if rid in state.records:
+            return state.records[rid]
+        return self._base_records.get(rid)
+
+    def changed_slots(self) -> Dict[Loc, Any]:
+        """Return ``{loc: record or None}`` for slots the plan changes."""
+        state = self._states[-1]
+        return {
+            loc: (self._record(state, rid) if rid is not None else None)
+            for loc, rid in state.owner.items()
+            if rid != self._base_owner.get(loc) or rid in state.records
+        }
+
+    def record_at(self, loc: Loc):
+        state = self._states[-1]
+        rid = self._owner_at(state, loc)
+        return self._record(state, rid) if rid is not None else None
+
+    def pos_map(self) -> Dict[Loc, Dict[str, Any]]:
+        state = self._states[-1]
+        pos_map = {
+            loc: self._base_records[rid]
+            for loc, rid in self._base_owner.items()
+            if loc not in state.owner
+        }
+        for loc, rid in state.owner.items():
+            if rid is None:
+                continue
+            rec = self._record(state, rid)
+            if rec is not None:
+                pos_map[loc] = rec
+        return pos_map
+
+    def result(self) -> Dict[str, Any]:
+        """Return the same payload shape as ``simulate_plan_pos_map``."""
+        if self._rollback_items:
+            return _rollback_preview(self._rollback_items)
+        state = self._states[-1]
+        return {
+            "ok": not state.errors,
+            "pos_map": self.pos_map(),
+            "errors": list(state.errors),
+            "predicted_new_ids": list(state.predicted_new_ids),
+        }
+
+    # -- phase appliers (mirror the executor's semantics) -------------------
+
+    def _apply_add(self, state: _OverlayState, item: Dict[str, Any]) -> None:
         payload = item.get("payload") or {}
         box = to_int(payload.get("box", item.get("box")), default=0)
         positions = payload.get("positions")
@@ -135,17 +277,17 @@ def simulate_plan_pos_map(
         for pos_raw in positions:
             pos = to_int(pos_raw, default=0)
             if box <= 0 or pos <= 0:
-                errors.append("Invalid add preview item (box/position).")
+                state.errors.append("Invalid add preview item (box/position).")
                 continue
 
             loc = (box, pos)
-            if loc in owner:
-                errors.append(f"Add conflict: Box {box}:{pos} already occupied.")
+            if self._owner_at(state, loc) is not None:
+                state.errors.append(f"Add conflict: Box {box}:{pos} already occupied.")
                 continue
 
-            rid = next_id
-            next_id += 1
-            predicted_new_ids.append(rid)
+            rid = state.next_id
+            state.next_id += 1
+            state.predicted_new_ids.append(rid)
 
             rec = {
                 "id": rid,
@@ -156,25 +298,22 @@ def simulate_plan_pos_map(
             }
             fields = payload.get("fields") or {}
             rec.update(fields)
-            records_by_id[rid] = rec
-            owner[loc] = rid
-
-    # Phase 2: moves (batch semantics, sequential swap behavior)
-    for item in items:
-        if str(item.get("action") or "").lower() != "move":
-            continue
+            state.records[rid] = rec
+            state.owner[loc] = rid
 
+    def _apply_move(self, state: _OverlayState, item: Dict[str, Any]) -> None:
+        errors = state.errors
         record_id = to_int(item.get("record_id"), default=0)
         from_pos = to_int(item.get("position"), default=0)
         to_pos = to_int(item.get("to_position"), default=0)
         if record_id <= 0 or from_pos <= 0 or to_pos <= 0:
             errors.append("Invalid move preview item (record_id/position/to_position).")
-            continue
+            return
 
-        rec = records_by_id.get(record_id)
+        rec = self._record(state, record_id)
         if not rec:
             errors.append(f"Move preview failed: ID {record_id} not found.")
-            continue
+            return
 
         current_box = to_int(rec.get("box"), default=0)
         current_position = rec.get("position")
@@ -182,7 +321,7 @@ def simulate_plan_pos_map(
             errors.append(
                 f"Move preview failed: ID {record_id} source pos {from_pos} does not match {current_position}."
             )
-            continue
+            return
 
         entry_to_box = item.get("to_box")
         to_box = to_int(entry_to_box, default=0) if entry_to_box not in (None, "") else 0
@@ -192,83 +331,99 @@ def simulate_plan_pos_map(
         src_loc = (current_box, from_pos)
         dst_loc = (target_box, to_pos)
 
-        if owner.get(src_loc) != record_id:
+        if self._owner_at(state, src_loc) != record_id:
             errors.append(f"Move preview failed: source owner mismatch at Box {src_loc[0]}:{src_loc[1]}.")
-            continue
+            return
 
-        dest_owner = owner.get(dst_loc)
+        dest_owner = self._owner_at(state, dst_loc)
         if dest_owner is None:
-            owner.pop(src_loc, None)
-            owner[dst_loc] = record_id
-            rec["position"] = to_pos
+            moved = rec.copy()
+            moved["position"] = to_pos
             if cross_box:
-                rec["box"] = target_box
-            continue
+                moved["box"] = target_box
+            state.records[record_id] = moved
+            state.owner[src_loc] = None
+            state.owner[dst_loc] = record_id
+            return
 
         if dest_owner == record_id:
             errors.append(f"Move preview failed: target already owned by ID {record_id}.")
-            continue
+            return
 
         if cross_box:
             errors.append(
                 f"Move preview failed: cross-box target occupied at Box {target_box}:{to_pos} by ID {dest_owner}."
             )
-            continue
+            return
 
         # Same-box swap
-        dest_rec = records_by_id.get(dest_owner)
+        dest_rec = self._record(state, dest_owner)
         if not dest_rec:
             errors.append(f"Move preview failed: swap target ID {dest_owner} missing.")
-            continue
+            return
 
         dest_box = to_int(dest_rec.get("box"), default=0)
         if dest_box != current_box:
             errors.append(f"Move preview failed: swap target ID {dest_owner} is not in the same box.")
-            continue
+            return
 
         dest_position = dest_rec.get("position")
         if dest_position != to_pos:
             errors.append(f"Move preview failed: swap target pos {to_pos} does not match {dest_position}.")
-            continue
-
-        dest_rec["position"] = from_pos
-        rec["position"] = to_pos
-        owner[src_loc] = dest_owner
-        owner[dst_loc] = record_id
+            return
+
+        swapped = dest_rec.copy()
+        swapped["position"] = from_pos
+        moved = rec.copy()
+        moved["position"] = to_pos
+        state.records[dest_owner] = swapped
+        state.records[record_id] = moved
+        state.owner[src_loc] = dest_owner
+        state.owner[dst_loc] = record_id
+
+    def _apply_takeout(self, state: _OverlayState, item: Dict[str, Any]) -> None:
+        action_name = "takeout"
+        record_id = to_int(item.get("record_id"), default=0)
+        pos = to_int(item.get("position"), default=0)
+        if record_id <= 0 or pos <= 0:
+            state.errors.append(f"Invalid {action_name} preview item (record_id/position).")
+            return
 
-    # Phase 3: takeout (order by action group like executor)
-    for action_name in ("takeout",):
-        for item in items:
-            if str(item.get("action") or "").lower() != action_name:
-                continue
+        rec = self._record(state, record_id)
+        if not rec:
+            state.errors.append(f"{action_name.capitalize()} preview failed: ID {record_id} not found.")
+            return
 
-            record_id = to_int(item.get("record_id"), default=0)
-            pos = to_int(item.get("position"), default=0)
-            if record_id <= 0 or pos <= 0:
-                errors.append(f"Invalid {action_name} preview item (record_id/position).")
-                continue
+        current_box = to_int(rec.get("box"), default=0)
+        current_position = rec.get("position")
+        if current_position != pos:
+            state.errors.append(
+                f"{action_name.capitalize()} preview failed: ID {record_id} pos {pos} does not match {current_position}."
+            )
+            return
 
-            rec = records_by_id.get(record_id)
-            if not rec:
-                errors.append(f"{action_name.capitalize()} preview failed: ID {record_id} not found.")
-                continue
+        taken = rec.copy()
+        taken["position"] = None
+        state.records[record_id] = taken
+        state.owner[(current_box, pos)] = None
 
-            current_box = to_int(rec.get("box"), default=0)
-            current_position = rec.get("position")
-            if current_position != pos:
-                errors.append(
-                    f"{action_name.capitalize()} preview failed: ID {record_id} pos {pos} does not match {current_position}."
-                )
-                continue
 
-            rec["position"] = None
-            owner.pop((current_box, pos), None)
+def simulate_plan_pos_map(
+    *,
+    base_records_by_id: Dict[int, Dict[str, Any]],
+    plan_items: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Simulate the post-execution occupancy map for a plan (best-effort).
 
-    pos_map = {loc: records_by_id[rid] for loc, rid in owner.items() if rid in records_by_id}
-    return {
-        "ok": not errors,
-        "pos_map": pos_map,
-        "errors": errors,
-        "predicted_new_ids": predicted_new_ids,
-    }
+    One-shot wrapper around ``PlanPreviewOverlay``; callers that re-preview
+    on every plan change should keep an overlay and call ``update``.
+    Records in ``pos_map`` that the plan does not touch are the base dicts.
 
+    Returns:
+        dict with keys:
+        - ok: bool
+        - pos_map: Dict[(box,pos), record]
+        - errors: List[str]
+        - predicted_new_ids: List[int] (for add actions)
+    """
+    return PlanPreviewOverlay(base_records_by_id).update(plan_items).result()
@@ -1492,6 +1492,7 @@ class AIPanel(QWidget):
     _handle_progress_context_checkpoint = _ai_runtime._handle_progress_context_checkpoint
     _handle_progress_tool_end = _ai_runtime._handle_progress_tool_end
     _handle_progress_tool_start = _ai_runtime._handle_progress_tool_start
+    _handle_progress_tool_output = _ai_runtime._handle_progress_tool_output
     _handle_progress_chunk = _ai_runtime._handle_progress_chunk
     _handle_progress_step_end = _ai_runtime._handle_progress_step_end
     _handle_progress_error = staticmethod(_ai_runtime._handle_progress_error)
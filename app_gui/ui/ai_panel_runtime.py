@@ -530,6 +530,7 @@ def on_progress(self, event):
         "context_checkpoint": self._handle_progress_context_checkpoint,
         "tool_end": self._handle_progress_tool_end,
         "tool_start": self._handle_progress_tool_start,
+        "tool_output": self._handle_progress_tool_output,
         "chunk": self._handle_progress_chunk,
         "error": self._handle_progress_error,
         "stream_end": self._handle_progress_stream_end,
@@ -667,6 +668,18 @@ def _handle_progress_tool_start(self, event):
     self._append_tool_message(f"Running `{name}`...")
 
 
+def _handle_progress_tool_output(self, event):
+    data = event.get("data") or {}
+    text = str((data.get("output") or {}).get("text") or "")
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    indicator = getattr(self, "_activity_indicator", None)
+    if indicator is None or not lines:
+        return
+    # Show the latest output line so long-running commands visibly progress.
+    name = str(data.get("name") or event.get("action") or "tool")
+    indicator.set_tool_name(f"{name}: {lines[-1]}")
+
+
 def _handle_progress_chunk(self, event):
     chunk = event.get("data")
     channel = str(((event.get("meta") or {}).get("channel") or "answer")).strip().lower()
@@ -1,11 +1,14 @@
 ﻿import json
 import os
+import threading
 from html import escape as _escape_html
-from PySide6.QtCore import Qt, QDate, QSize
-from PySide6.QtGui import QColor
+from PySide6.QtCore import (
+    Qt, QDate, QSize, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Signal
+)
+from PySide6.QtGui import QColor, QFont
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QComboBox, QTableWidget, QTableWidgetItem,
+    QPushButton, QComboBox, QTableView,
     QAbstractItemView, QStyle, QStyledItemDelegate,
     QFormLayout, QDateEdit
 )
@@ -384,6 +387,210 @@ class _AuditBackupTintDelegate(QStyledItemDelegate):
         painter.restore()
 
 
+def _summarize_event(event, field_order=None):
+    """Return the details-column text for one audit event."""
+    details = event.get("details") or {}
+    error = event.get("error") or {}
+    if event.get("status") == "failed":
+        if isinstance(error, dict):
+            return str(error.get("message", ""))[:80] if error else str(details)[:80]
+        return str(error)[:80] if error else str(details)[:80]
+    return _summarize_details(details, field_order=field_order)
+
+
+class _AuditPageFetch:
+    """One background page request; ``done`` is set once ``response`` is ready."""
+
+    __slots__ = ("offset", "done", "response")
+
+    def __init__(self, offset):
+        self.offset = offset
+        self.done = threading.Event()
+        self.response = None
+
+    def run(self, page_loader, limit):
+        try:
+            self.response = page_loader(offset=self.offset, limit=limit)
+        except Exception as exc:
+            self.response = {"ok": False, "message": str(exc)}
+        finally:
+            self.done.set()
+
+
+class AuditTimelineModel(QAbstractTableModel):
+    """Paged audit timeline rows for a ``QTableView``.
+
+    Pages are requested through ``page_loader(offset=, limit=)`` (a
+    ``list_audit_timeline`` response) only when the view scrolls near the end
+    of the loaded rows, and the following page is prefetched on a daemon
+    thread so scrolling rarely waits on disk.  Details summaries are computed
+    the first time a row is painted and cached.
+    """
+
+    page_failed = Signal(str)
+
+    def __init__(self, headers, parent=None, *, page_size=200):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._page_size = max(1, int(page_size))
+        self._events = []
+        self._summaries = {}
+        self._seen_seqs = set()
+        self._field_order = []
+        self._page_loader = None
+        self._total = 0
+        self._next_offset = 0
+        self._exhausted = True
+        self._prefetch = None
+
+    @property
+    def page_size(self):
+        return self._page_size
+
+    def reset_events(self, events, *, total=None, field_order=None, page_loader=None):
+        """Replace rows with a first page; further pages come from ``page_loader``."""
+        self.beginResetModel()
+        self._events = []
+        self._summaries = {}
+        self._seen_seqs = set()
+        self._field_order = list(field_order or [])
+        self._page_loader = page_loader
+        self._prefetch = None
+        page = list(events or [])
+        self._events = self._accept_page(page)
+        self._next_offset = len(page)
+        self._total = max(int(total or 0), len(page))
+        self._exhausted = (
+            page_loader is None
+            or len(page) < self._page_size
+            or self._next_offset >= self._total
+        )
+        self.endResetModel()
+        self._start_prefetch()
+
+    def _accept_page(self, page):
+        accepted = []
+        for event in AuditLogDialog._sort_events_newest_first(page, reverse_if_no_seq=False):
+            seq = AuditLogDialog._coerce_audit_seq(event.get("audit_seq")) if isinstance(event, dict) else None
+            if seq is not None:
+                # Events appended while paging shift offsets; skip rows already shown.
+                if seq in self._seen_seqs:
+                    continue
+                self._seen_seqs.add(seq)
+            accepted.append(event)
+        return accepted
+
+    def _start_prefetch(self):
+        if self._exhausted or self._page_loader is None:
+            return
+        if self._prefetch is not None and self._prefetch.offset == self._next_offset:
+            return
+        fetch = _AuditPageFetch(self._next_offset)
+        self._prefetch = fetch
+        threading.Thread(
+            target=fetch.run,
+            args=(self._page_loader, self._page_size),
+            name="snowfox-audit-prefetch",
+            daemon=True,
+        ).start()
+
+    def events(self):
+        return self._events
+
+    def event_at(self, row):
+        if 0 <= row < len(self._events):
+            return self._events[row]
+        return None
+
+    def total(self):
+        return self._total
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._events)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        event = self.event_at(index.row())
+        if event is None:
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return event.get("timestamp", "")
+            if column == 1:
+                return _translate_action(event.get("action", ""))
+            if column == 2:
+                return event.get("status", "")
+            if column == 3:
+                return self.summary_for_row(index.row())
+            return None
+        if role == Qt.UserRole:
+            return index.row()
+        if role == _AUDIT_BACKUP_ROW_ROLE:
+            return AuditLogDialog._is_backup_event(event)
+        if role == Qt.FontRole and AuditLogDialog._is_backup_event(event):
+            font = QFont()
+            font.setBold(True)
+            return font
+        return None
+
+    def summary_for_row(self, row):
+        summary = self._summaries.get(row)
+        if summary is None:
+            summary = _summarize_event(self._events[row], field_order=self._field_order)
+            self._summaries[row] = summary
+        return summary
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        fetch = self._prefetch
+        if fetch is not None and fetch.offset == self._next_offset:
+            fetch.done.wait()
+            response = fetch.response
+        else:
+            try:
+                response = self._page_loader(offset=self._next_offset, limit=self._page_size)
+            except Exception as exc:
+                response = {"ok": False, "message": str(exc)}
+        self._prefetch = None
+
+        if not isinstance(response, dict) or not response.get("ok"):
+            self._exhausted = True
+            message = response.get("message") if isinstance(response, dict) else ""
+            self.page_failed.emit(str(message or tr("operations.unknownError")))
+            return
+
+        result = response.get("result") or {}
+        page = list(result.get("items") or [])
+        appended = self._accept_page(page)
+        if appended:
+            first_new = len(self._events)
+            self.beginInsertRows(QModelIndex(), first_new, first_new + len(appended) - 1)
+            self._events.extend(appended)
+            self.endInsertRows()
+
+        self._next_offset += len(page)
+        try:
+            self._total = max(int(result.get("total") or 0), self._next_offset)
+        except (TypeError, ValueError):
+            self._total = max(self._total, self._next_offset)
+        self._exhausted = len(page) < self._page_size or self._next_offset >= self._total
+        self._start_prefetch()
+
+
 class AuditLogDialog(QDialog):
     """Independent audit log viewer with filtering and rollback staging."""
 
@@ -392,7 +599,6 @@ class AuditLogDialog(QDialog):
         self.yaml_path_getter = yaml_path_getter
         self.bridge = bridge
         self._audit_view_use_case = audit_view_use_case or AuditViewUseCase()
-        self._audit_events = []
         self._audit_field_order = []
 
         self.setWindowTitle(tr("operations.auditLog"))
@@ -455,24 +661,35 @@ class AuditLogDialog(QDialog):
         self.audit_info = QLabel(tr("operations.clickLoadAudit"))
         layout.addWidget(self.audit_info)
 
-        # Audit table
-        self.audit_table = QTableWidget()
-        self.audit_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.audit_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        self.audit_table.setItemDelegate(_AuditBackupTintDelegate(self.audit_table))
-        layout.addWidget(self.audit_table, 1)
-        self._setup_table(
-            self.audit_table,
+        # Audit table: rows are paged in by the model as the view scrolls.
+        self._audit_model = AuditTimelineModel(
             [
                 tr("operations.colTimestamp"),
                 tr("operations.colAction"),
                 tr("operations.colStatus"),
                 tr("operations.colDetails"),
             ],
-            sortable=True,
+            self,
+        )
+        self._audit_model.page_failed.connect(self._on_audit_page_failed)
+        self._audit_proxy = QSortFilterProxyModel(self)
+        self._audit_proxy.setSourceModel(self._audit_model)
+        self.audit_table = QTableView()
+        self.audit_table.setModel(self._audit_proxy)
+        self.audit_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.audit_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.audit_table.setItemDelegate(_AuditBackupTintDelegate(self.audit_table))
+        self.audit_table.horizontalHeader().setStretchLastSection(True)
+        # No initial sort: keep the newest-first order the timeline returns.
+        self.audit_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.audit_table.setSortingEnabled(True)
+        layout.addWidget(self.audit_table, 1)
+        self.audit_table.clicked.connect(
+            lambda index: self._on_audit_row_clicked(index.row(), index.column())
+        )
+        self.audit_table.selectionModel().selectionChanged.connect(
+            lambda *_args: self._update_rollback_button_state()
         )
-        self.audit_table.cellClicked.connect(self._on_audit_row_clicked)
-        self.audit_table.itemSelectionChanged.connect(self._update_rollback_button_state)
 
         # Event detail display
         self.event_detail = QLabel()
@@ -482,15 +699,22 @@ class AuditLogDialog(QDialog):
         self.event_detail.setVisible(False)
         layout.addWidget(self.event_detail)
 
-    def _setup_table(self, table, headers, sortable=False):
-        """Setup table with headers."""
-        table.clear()
-        table.setRowCount(0)
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
-        table.horizontalHeader().setStretchLastSection(True)
-        if sortable:
-            table.setSortingEnabled(True)
+    @property
+    def _audit_events(self):
+        return self._audit_model.events()
+
+    def _show_audit_events(self, events, *, total=None, page_loader=None):
+        """Reset the table to ``events``; ``page_loader`` serves later pages."""
+        self._audit_model.reset_events(
+            events,
+            total=total,
+            field_order=self._audit_field_order,
+            page_loader=page_loader,
+        )
+        self._update_rollback_button_state()
+
+    def _on_audit_page_failed(self, message):
+        self.audit_info.setText(tr("operations.failedToLoadAudit", error=message))
 
     @staticmethod
     def _coerce_audit_seq(value):
@@ -558,15 +782,21 @@ class AuditLogDialog(QDialog):
             )
             return
 
-        response = timeline_loader(
-            yaml_path=yaml_abs,
-            limit=None,
-            offset=0,
-            action_filter=None if action_filter == "All" else action_filter,
-            status_filter=None if status_filter == "All" else status_filter,
-            start_date=start,
-            end_date=end,
-        )
+        action_value = None if action_filter == "All" else action_filter
+        status_value = None if status_filter == "All" else status_filter
+
+        def _load_page(*, offset, limit):
+            return timeline_loader(
+                yaml_path=yaml_abs,
+                limit=limit,
+                offset=offset,
+                action_filter=action_value,
+                status_filter=status_value,
+                start_date=start,
+                end_date=end,
+            )
+
+        response = _load_page(offset=0, limit=self._audit_model.page_size)
         if not isinstance(response, dict) or not response.get("ok"):
             message = (
                 (response or {}).get("message")
@@ -575,61 +805,24 @@ class AuditLogDialog(QDialog):
             )
             self.audit_info.setText(tr("operations.failedToLoadAudit", error=message))
             return
-        events = list((response.get("result") or {}).get("items") or [])
-
-        events = self._sort_events_newest_first(
-            events,
-            reverse_if_no_seq=False,
+        result = response.get("result") or {}
+        self._show_audit_events(
+            list(result.get("items") or []),
+            total=result.get("total"),
+            page_loader=_load_page,
         )
-        self._audit_events = events
-
-        self._setup_table(
-            self.audit_table,
-            [
-                tr("operations.colTimestamp"),
-                tr("operations.colAction"),
-                tr("operations.colStatus"),
-                tr("operations.colDetails"),
-            ],
-            sortable=True,
-        )
-        for row, ev in enumerate(events):
-            self.audit_table.insertRow(row)
-            ts_item = QTableWidgetItem(ev.get("timestamp", ""))
-            ts_item.setData(Qt.UserRole, row)
-            self.audit_table.setItem(row, 0, ts_item)
-            action_item = QTableWidgetItem(_translate_action(ev.get("action", "")))
-            self.audit_table.setItem(row, 1, action_item)
-            self.audit_table.setItem(row, 2, QTableWidgetItem(ev.get("status", "")))
-
-            details = ev.get("details") or {}
-            error = ev.get("error") or {}
-            if ev.get("status") == "failed":
-                if isinstance(error, dict):
-                    summary = str(error.get("message", ""))[:80] if error else str(details)[:80]
-                else:
-                    summary = str(error)[:80] if error else str(details)[:80]
-            else:
-                summary = _summarize_details(details, field_order=self._audit_field_order)
-            self.audit_table.setItem(row, 3, QTableWidgetItem(summary))
-            if self._is_backup_event(ev):
-                self._highlight_backup_row(row)
-
-        self._update_rollback_button_state()
 
         self.audit_info.setText(
-            tr("operations.auditEventsShown", count=len(events), start=start, end=end)
+            tr("operations.auditEventsShown", count=self._audit_model.total(), start=start, end=end)
         )
 
     def _event_index_for_table_row(self, row):
         if row < 0:
             return None
-        item = self.audit_table.item(row, 0)
-        source_idx = item.data(Qt.UserRole) if item is not None else row
-        try:
-            event_idx = int(source_idx)
-        except (TypeError, ValueError):
-            event_idx = row
+        source_index = self._audit_proxy.mapToSource(self._audit_proxy.index(row, 0))
+        if not source_index.isValid():
+            return None
+        event_idx = source_index.row()
         if 0 <= event_idx < len(self._audit_events):
             return event_idx
         return None
@@ -649,15 +842,6 @@ class AuditLogDialog(QDialog):
         except Exception:
             return False
 
-    def _highlight_backup_row(self, row):
-        for col in range(self.audit_table.columnCount()):
-            cell = self.audit_table.item(row, col)
-            if cell is not None:
-                cell.setData(_AUDIT_BACKUP_ROW_ROLE, True)
-                font = cell.font()
-                font.setBold(True)
-                cell.setFont(font)
-
     def _update_rollback_button_state(self):
         selected_events = self._get_selected_audit_events()
         enabled = len(selected_events) == 1 and self._is_backup_event(selected_events[0])
@@ -1,12 +1,16 @@
 """Pre-convert staged XLSX files into AI-friendly normalized text assets."""
 
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
+from itertools import islice
 import csv
 import json
+import multiprocessing
+from multiprocessing import util as multiprocessing_util
 import os
 import re
-from typing import Dict, Iterable, List
+from typing import Callable, Dict, Iterable, List, Optional
 
 from openpyxl import load_workbook
 
@@ -14,6 +18,13 @@ from openpyxl import load_workbook
 _SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
 _SAMPLE_LIMIT = 12
 _SUPPORTED_EXT = ".xlsx"
+_CHUNK_ROWS = 2000
+# Below this many staged XLSX bytes a process pool costs more than it saves.
+_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+_PARALLEL_POLL_SECONDS = 0.1
+# Cancellation flag shared with pool workers (set by _init_preconvert_worker).
+_WORKER_CANCEL = None
+_WORKER_WORKBOOKS: Dict[str, object] = {}
 
 
 @dataclass
@@ -28,10 +39,40 @@ class XlsxPreconvertResult:
     report: Dict[str, object] = field(default_factory=dict)
 
 
-class XlsxPreconvertService:
-    """Convert staged XLSX files into normalized CSV + schema summaries."""
+class XlsxPreconvertCancelled(Exception):
+    """Raised inside a sheet conversion once cancellation was requested."""
+
 
-    def convert_staged_files(self, source_paths: Iterable[str], *, normalized_root: str) -> XlsxPreconvertResult:
+class XlsxPreconvertService:
+    """Convert staged XLSX files into normalized CSV + schema summaries.
+
+    Small inputs are converted in-process, one sheet after another.  Once the
+    staged workbooks reach ``parallel_min_bytes`` the sheets are fanned out to
+    a process pool (one task per workbook sheet).  Either way rows are read in
+    ``chunk_rows`` batches, ``progress_callback`` receives one dict per
+    progress step, and setting ``cancel_event`` stops work between chunks.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        parallel_min_bytes: int = _PARALLEL_MIN_BYTES,
+        chunk_rows: int = _CHUNK_ROWS,
+    ):
+        self._max_workers = max(1, int(max_workers or os.cpu_count() or 1))
+        self._parallel_min_bytes = max(0, int(parallel_min_bytes))
+        self._chunk_rows = max(1, int(chunk_rows))
+
+    def convert_staged_files(
+        self,
+        source_paths: Iterable[str],
+        *,
+        normalized_root: str,
+        progress_callback: Optional[Callable[[Dict[str, object]], None]] = None,
+        cancel_event=None,
+        parallel: Optional[bool] = None,
+    ) -> XlsxPreconvertResult:
         normalized_root_abs = os.path.abspath(str(normalized_root or "").strip())
         if not normalized_root_abs:
             raise ValueError("normalized_root is required")
@@ -39,23 +80,24 @@ class XlsxPreconvertService:
 
         staged_paths = _normalize_paths(source_paths)
         xlsx_paths = [path for path in staged_paths if str(path).lower().endswith(_SUPPORTED_EXT)]
-        source_reports = []
+        if parallel is None:
+            parallel = self._max_workers > 1 and _total_size(xlsx_paths) >= self._parallel_min_bytes
+        if parallel and xlsx_paths:
+            source_reports = self._convert_parallel(
+                xlsx_paths,
+                normalized_root_abs,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event,
+            )
+        else:
+            source_reports = self._convert_sequential(
+                xlsx_paths,
+                normalized_root_abs,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event,
+            )
         generated_assets = []
-
-        for source_path in xlsx_paths:
-            try:
-                report = self._convert_one_xlsx(source_path, normalized_root_abs)
-            except Exception as exc:  # pragma: no cover - defensive fallback
-                report = {
-                    "source_path": source_path,
-                    "status": "failed",
-                    "message": f"Failed to convert xlsx: {exc}",
-                    "generated_files": [],
-                    "warnings": [],
-                    "errors": [{"message": str(exc)}],
-                    "sheet_count": 0,
-                }
-            source_reports.append(report)
+        for report in source_reports:
             generated_assets.extend(report.get("generated_files") or [])
 
         status = _merge_status(source_reports, xlsx_count=len(xlsx_paths))
@@ -65,6 +107,8 @@ class XlsxPreconvertService:
             message = "XLSX pre-conversion partially succeeded; fallback to raw files if needed."
         elif status == "failed":
             message = "XLSX pre-conversion failed; fallback to staged raw files."
+        elif status == "cancelled":
+            message = "XLSX pre-conversion cancelled; fallback to staged raw files."
         else:
             message = "No .xlsx files detected; staged files are kept as-is."
 
@@ -74,6 +118,7 @@ class XlsxPreconvertService:
             "normalized_root": normalized_root_abs,
             "source_count": len(staged_paths),
             "xlsx_detected": len(xlsx_paths),
+            "mode": "parallel" if parallel and xlsx_paths else "sequential",
             "generated_assets": _dedupe_preserve_order(generated_assets),
             "sources": source_reports,
             "generated_at": _utc_timestamp(),
@@ -91,18 +136,36 @@ class XlsxPreconvertService:
             report=report_payload,
         )
 
-    def _convert_one_xlsx(self, source_path: str, normalized_root: str) -> Dict[str, object]:
+    def _convert_sequential(self, xlsx_paths, normalized_root, *, progress_callback, cancel_event):
+        reports = []
+        for source_path in xlsx_paths:
+            try:
+                report = self._convert_one_xlsx(
+                    source_path,
+                    normalized_root,
+                    progress_callback=progress_callback,
+                    cancel_event=cancel_event,
+                )
+            except Exception as exc:  # pragma: no cover - defensive fallback
+                report = _failed_source_report(source_path, exc)
+            reports.append(report)
+        return reports
+
+    def _convert_one_xlsx(
+        self,
+        source_path: str,
+        normalized_root: str,
+        *,
+        progress_callback=None,
+        cancel_event=None,
+    ) -> Dict[str, object]:
         source_abs = os.path.abspath(source_path)
-        source_name = os.path.basename(source_abs)
-        source_stem = _safe_name(os.path.splitext(source_name)[0], fallback="source")
-        source_dir = _dedupe_dir(os.path.join(normalized_root, source_stem))
-        sheets_dir = os.path.join(source_dir, "sheets")
-        os.makedirs(sheets_dir, exist_ok=False)
+        source_dir, sheets_dir = _prepare_source_dir(source_abs, normalized_root)
 
-        warnings = []
         errors = []
-        generated_files = []
         sheet_summaries = []
+        cancelled = False
+        should_cancel = _cancel_checker(cancel_event)
 
         workbook = load_workbook(source_abs, read_only=True, data_only=True)
         try:
@@ -111,16 +174,35 @@ class XlsxPreconvertService:
                 raise ValueError("workbook has no worksheets")
 
             for sheet_index, sheet_name in enumerate(sheet_names, start=1):
-                safe_sheet_name = _safe_name(sheet_name, fallback=f"sheet_{sheet_index}")
-                csv_name = f"{sheet_index:02d}_{safe_sheet_name}.csv"
-                csv_path = os.path.join(sheets_dir, csv_name)
+                if should_cancel():
+                    cancelled = True
+                    break
+                csv_path = _sheet_csv_path(sheets_dir, sheet_name, sheet_index)
+
+                def _report_rows(rows_done, _sheet_name=sheet_name, _sheet_index=sheet_index):
+                    _emit_progress(
+                        progress_callback,
+                        source_path=source_abs,
+                        sheet_name=_sheet_name,
+                        sheet_index=_sheet_index,
+                        sheet_count=len(sheet_names),
+                        rows=rows_done,
+                        status="running",
+                    )
+
                 try:
                     sheet_summary = _write_sheet_csv_and_summary(
                         workbook[sheet_name],
                         csv_path,
                         sheet_name=sheet_name,
                         sheet_index=sheet_index,
+                        chunk_rows=self._chunk_rows,
+                        should_cancel=should_cancel,
+                        on_chunk=_report_rows,
                     )
+                except XlsxPreconvertCancelled:
+                    cancelled = True
+                    break
                 except Exception as exc:
                     errors.append(
                         {
@@ -133,47 +215,301 @@ class XlsxPreconvertService:
 
                 sheet_summary["csv_path"] = csv_path
                 sheet_summaries.append(sheet_summary)
-                generated_files.append(csv_path)
+                _emit_progress(
+                    progress_callback,
+                    source_path=source_abs,
+                    sheet_name=sheet_name,
+                    sheet_index=sheet_index,
+                    sheet_count=len(sheet_names),
+                    rows=sheet_summary["row_count"],
+                    status="done",
+                )
         finally:
             workbook.close()
 
-        if errors and sheet_summaries:
-            status = "partial"
-        elif errors:
-            status = "failed"
-        else:
-            status = "ok"
+        return _finalize_source_report(
+            source_abs,
+            source_dir,
+            sheet_summaries,
+            errors,
+            cancelled=cancelled,
+        )
 
-        schema_summary_payload = {
-            "source_path": source_abs,
-            "source_name": source_name,
-            "status": status,
-            "sheet_count": len(sheet_summaries),
-            "sheets": sheet_summaries,
-            "generated_at": _utc_timestamp(),
-        }
-        schema_summary_path = os.path.join(source_dir, "schema_summary.json")
-        _write_json(schema_summary_path, schema_summary_payload)
-        generated_files.append(schema_summary_path)
+    def _convert_parallel(self, xlsx_paths, normalized_root, *, progress_callback, cancel_event):
+        should_cancel = _cancel_checker(cancel_event)
+        # Never fork: the GUI process runs Qt, the local API server and
+        # prefetch threads whose held locks a forked child would inherit.
+        context = multiprocessing.get_context("spawn")
+        worker_cancel = context.Event()
+        states = {}
+        futures = {}
+        with ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=context,
+            initializer=_init_preconvert_worker,
+            initargs=(worker_cancel,),
+        ) as executor:
+            for source_path in xlsx_paths:
+                source_abs = os.path.abspath(source_path)
+                states[source_abs] = {
+                    "sheet_names": None,
+                    "summaries": {},
+                    "errors": [],
+                    "cancelled": False,
+                    "failure": None,
+                }
+                futures[executor.submit(_list_sheet_names_task, source_abs)] = ("list", source_abs, None)
+
+            while futures:
+                if should_cancel() and not worker_cancel.is_set():
+                    worker_cancel.set()
+                    for pending in list(futures):
+                        if pending.cancel():
+                            _kind, source_abs, _sheet = futures.pop(pending)
+                            states[source_abs]["cancelled"] = True
+                done, _ = wait(list(futures), timeout=_PARALLEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                if not done:
+                    # Heartbeat so GUI callers can pump events and poll cancel.
+                    _emit_progress(progress_callback, status="waiting", pending_tasks=len(futures))
+                for future in done:
+                    kind, source_abs, sheet = futures.pop(future)
+                    state = states[source_abs]
+                    try:
+                        outcome = future.result()
+                    except Exception as exc:
+                        if kind == "list":
+                            state["failure"] = exc
+                        else:
+                            state["errors"].append(
+                                {"sheet_name": sheet[1], "sheet_index": sheet[0], "message": str(exc)}
+                            )
+                        continue
+
+                    if kind == "list":
+                        if not outcome:
+                            state["failure"] = ValueError("workbook has no worksheets")
+                            continue
+                        if worker_cancel.is_set():
+                            state["cancelled"] = True
+                            continue
+                        state["sheet_names"] = list(outcome)
+                        state["source_dir"], sheets_dir = _prepare_source_dir(source_abs, normalized_root)
+                        for sheet_index, sheet_name in enumerate(outcome, start=1):
+                            csv_path = _sheet_csv_path(sheets_dir, sheet_name, sheet_index)
+                            task = executor.submit(
+                                _convert_sheet_task,
+                                source_abs,
+                                sheet_name,
+                                sheet_index,
+                                csv_path,
+                                self._chunk_rows,
+                            )
+                            futures[task] = ("sheet", source_abs, (sheet_index, sheet_name))
+                        continue
+
+                    sheet_index, sheet_name = sheet
+                    if outcome.get("cancelled"):
+                        state["cancelled"] = True
+                        continue
+                    state["summaries"][sheet_index] = outcome
+                    _emit_progress(
+                        progress_callback,
+                        source_path=source_abs,
+                        sheet_name=sheet_name,
+                        sheet_index=sheet_index,
+                        sheet_count=len(state["sheet_names"] or []),
+                        rows=outcome.get("row_count", 0),
+                        status="done",
+                    )
 
-        report_payload = {
-            "source_path": source_abs,
-            "source_name": source_name,
-            "status": status,
-            "message": _status_message(status),
-            "sheet_count": len(sheet_summaries),
-            "schema_summary_path": schema_summary_path,
-            "generated_files": list(generated_files),
-            "warnings": warnings,
-            "errors": errors,
-            "generated_at": _utc_timestamp(),
-        }
-        report_path = os.path.join(source_dir, "conversion_report.json")
-        _write_json(report_path, report_payload)
-        generated_files.append(report_path)
-        report_payload["report_path"] = report_path
-        report_payload["generated_files"] = generated_files
-        return report_payload
+        reports = []
+        for source_abs, state in states.items():
+            if state["failure"] is not None or state["sheet_names"] is None:
+                if state["failure"] is None:
+                    reports.append(_cancelled_source_report(source_abs))
+                else:
+                    reports.append(_failed_source_report(source_abs, state["failure"]))
+                continue
+            summaries = [state["summaries"][index] for index in sorted(state["summaries"])]
+            errors = sorted(state["errors"], key=lambda item: item["sheet_index"])
+            reports.append(
+                _finalize_source_report(
+                    source_abs,
+                    state["source_dir"],
+                    summaries,
+                    errors,
+                    cancelled=state["cancelled"],
+                )
+            )
+        return reports
+
+
+def _init_preconvert_worker(cancel_flag) -> None:
+    global _WORKER_CANCEL
+    _WORKER_CANCEL = cancel_flag
+    # Pool workers leave through multiprocessing's exit path, which runs
+    # registered finalizers but not atexit handlers.
+    multiprocessing_util.Finalize(None, _close_worker_workbooks, exitpriority=10)
+
+
+def _close_worker_workbooks() -> None:
+    while _WORKER_WORKBOOKS:
+        _source, workbook = _WORKER_WORKBOOKS.popitem()
+        try:
+            workbook.close()
+        except Exception:
+            pass
+
+
+def _worker_cancel_requested() -> bool:
+    flag = _WORKER_CANCEL
+    return bool(flag is not None and flag.is_set())
+
+
+def _worker_workbook(source_abs: str):
+    """Return a read-only workbook kept open for the life of the pool worker.
+
+    Opening a workbook parses its shared strings, so sheets of the same file
+    that land on the same worker reuse one handle instead of re-parsing.
+    """
+    workbook = _WORKER_WORKBOOKS.get(source_abs)
+    if workbook is None:
+        workbook = load_workbook(source_abs, read_only=True, data_only=True)
+        _WORKER_WORKBOOKS[source_abs] = workbook
+    return workbook
+
+
+def _list_sheet_names_task(source_abs: str) -> List[str]:
+    return list(_worker_workbook(source_abs).sheetnames or [])
+
+
+def _convert_sheet_task(source_abs: str, sheet_name: str, sheet_index: int, csv_path: str, chunk_rows: int):
+    if _worker_cancel_requested():
+        return {"cancelled": True}
+    try:
+        summary = _write_sheet_csv_and_summary(
+            _worker_workbook(source_abs)[sheet_name],
+            csv_path,
+            sheet_name=sheet_name,
+            sheet_index=sheet_index,
+            chunk_rows=chunk_rows,
+            should_cancel=_worker_cancel_requested,
+        )
+    except XlsxPreconvertCancelled:
+        return {"cancelled": True}
+    summary["csv_path"] = csv_path
+    return summary
+
+
+def _cancel_checker(cancel_event) -> Callable[[], bool]:
+    if cancel_event is None:
+        return lambda: False
+    return lambda: bool(cancel_event.is_set())
+
+
+def _emit_progress(progress_callback, **event) -> None:
+    if callable(progress_callback):
+        progress_callback(dict(event))
+
+
+def _total_size(paths: Iterable[str]) -> int:
+    total = 0
+    for path in paths or []:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            continue
+    return total
+
+
+def _prepare_source_dir(source_abs: str, normalized_root: str):
+    source_stem = _safe_name(os.path.splitext(os.path.basename(source_abs))[0], fallback="source")
+    source_dir = _dedupe_dir(os.path.join(normalized_root, source_stem))
+    sheets_dir = os.path.join(source_dir, "sheets")
+    os.makedirs(sheets_dir, exist_ok=False)
+    return source_dir, sheets_dir
+
+
+def _sheet_csv_path(sheets_dir: str, sheet_name: str, sheet_index: int) -> str:
+    safe_sheet_name = _safe_name(sheet_name, fallback=f"sheet_{sheet_index}")
+    return os.path.join(sheets_dir, f"{sheet_index:02d}_{safe_sheet_name}.csv")
+
+
+def _failed_source_report(source_path: str, exc: Exception) -> Dict[str, object]:
+    return {
+        "source_path": source_path,
+        "status": "failed",
+        "message": f"Failed to convert xlsx: {exc}",
+        "generated_files": [],
+        "warnings": [],
+        "errors": [{"message": str(exc)}],
+        "sheet_count": 0,
+    }
+
+
+def _cancelled_source_report(source_path: str) -> Dict[str, object]:
+    return {
+        "source_path": source_path,
+        "status": "cancelled",
+        "message": _status_message("cancelled"),
+        "generated_files": [],
+        "warnings": [],
+        "errors": [],
+        "sheet_count": 0,
+    }
+
+
+def _finalize_source_report(
+    source_abs: str,
+    source_dir: str,
+    sheet_summaries: List[Dict[str, object]],
+    errors: List[Dict[str, object]],
+    *,
+    cancelled: bool = False,
+) -> Dict[str, object]:
+    source_name = os.path.basename(source_abs)
+    warnings = []
+    generated_files = [summary["csv_path"] for summary in sheet_summaries]
+
+    if cancelled:
+        status = "cancelled"
+    elif errors and sheet_summaries:
+        status = "partial"
+    elif errors:
+        status = "failed"
+    else:
+        status = "ok"
+
+    schema_summary_payload = {
+        "source_path": source_abs,
+        "source_name": source_name,
+        "status": status,
+        "sheet_count": len(sheet_summaries),
+        "sheets": sheet_summaries,
+        "generated_at": _utc_timestamp(),
+    }
+    schema_summary_path = os.path.join(source_dir, "schema_summary.json")
+    _write_json(schema_summary_path, schema_summary_payload)
+    generated_files.append(schema_summary_path)
+
+    report_payload = {
+        "source_path": source_abs,
+        "source_name": source_name,
+        "status": status,
+        "message": _status_message(status),
+        "sheet_count": len(sheet_summaries),
+        "schema_summary_path": schema_summary_path,
+        "generated_files": list(generated_files),
+        "warnings": warnings,
+        "errors": errors,
+        "generated_at": _utc_timestamp(),
+    }
+    report_path = os.path.join(source_dir, "conversion_report.json")
+    _write_json(report_path, report_payload)
+    generated_files.append(report_path)
+    report_payload["report_path"] = report_path
+    report_payload["generated_files"] = generated_files
+    return report_payload
 
 
 def _status_message(status: str) -> str:
@@ -181,6 +517,8 @@ def _status_message(status: str) -> str:
         return "Workbook converted to normalized CSV assets."
     if status == "partial":
         return "Workbook partially converted; review missing/error sheets."
+    if status == "cancelled":
+        return "Workbook conversion cancelled; use staged raw file as fallback."
     return "Workbook conversion failed; use staged raw file as fallback."
 
 
@@ -218,6 +556,8 @@ def _merge_status(source_reports: List[Dict[str, object]], *, xlsx_count: int) -
     if xlsx_count <= 0:
         return "skipped"
     statuses = [str(report.get("status") or "").strip().lower() for report in source_reports]
+    if "cancelled" in statuses:
+        return "cancelled"
     success_count = sum(1 for status in statuses if status == "ok")
     partial_count = sum(1 for status in statuses if status == "partial")
     if success_count == xlsx_count:
@@ -249,32 +589,51 @@ def _dedupe_dir(base_path: str) -> str:
         idx += 1
 
 
-def _write_sheet_csv_and_summary(worksheet, output_csv_path: str, *, sheet_name: str, sheet_index: int) -> Dict[str, object]:
+def _write_sheet_csv_and_summary(
+    worksheet,
+    output_csv_path: str,
+    *,
+    sheet_name: str,
+    sheet_index: int,
+    chunk_rows: int = _CHUNK_ROWS,
+    should_cancel: Optional[Callable[[], bool]] = None,
+    on_chunk: Optional[Callable[[int], None]] = None,
+) -> Dict[str, object]:
     row_count = 0
     max_columns = 0
     non_empty_rows = 0
     header_candidate = None
     column_stats: List[Dict[str, object]] = []
+    rows_iter = worksheet.iter_rows(values_only=True)
 
     with open(output_csv_path, "w", newline="", encoding="utf-8-sig") as handle:
         writer = csv.writer(handle)
-        for row_index, row_values in enumerate(worksheet.iter_rows(values_only=True), start=1):
-            raw_row = _trim_trailing_none(list(row_values))
-            text_row = [_to_text(value) for value in raw_row]
-            writer.writerow(text_row)
-            row_count += 1
-            max_columns = max(max_columns, len(text_row))
-
-            non_empty_values = [value for value in text_row if str(value).strip()]
-            if non_empty_values:
-                non_empty_rows += 1
-                if header_candidate is None:
-                    header_candidate = {
-                        "row_index": row_index,
-                        "values": list(text_row),
-                    }
-
-            _update_column_stats(column_stats, raw_row, text_row)
+        while True:
+            if should_cancel is not None and should_cancel():
+                raise XlsxPreconvertCancelled(sheet_name)
+            chunk = list(islice(rows_iter, max(1, int(chunk_rows))))
+            if not chunk:
+                break
+            text_rows = []
+            for row_values in chunk:
+                raw_row = _trim_trailing_none(list(row_values))
+                text_row = [_to_text(value) for value in raw_row]
+                text_rows.append(text_row)
+                row_count += 1
+                max_columns = max(max_columns, len(text_row))
+
+                if any(str(value).strip() for value in text_row):
+                    non_empty_rows += 1
+                    if header_candidate is None:
+                        header_candidate = {
+                            "row_index": row_count,
+                            "values": list(text_row),
+                        }
+
+                _update_column_stats(column_stats, raw_row, text_row)
+            writer.writerows(text_rows)
+            if on_chunk is not None:
+                on_chunk(row_count)
 
     return {
         "sheet_name": sheet_name,
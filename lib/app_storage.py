@@ -11,10 +11,11 @@ from __future__ import annotations
 import os
 import shutil
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from . import yaml_codec
 
 
 APP_DIR_NAME = "SnowFox"
@@ -23,6 +24,46 @@ DATA_ROOT_ENV_VAR = "SNOWFOX_DATA_ROOT"
 
 _SESSION_DATA_ROOT: Optional[str] = None
 
+# Path-policy cache.  The configured data root is memoized per config file
+# (revalidated with one stat), and dependent caches such as the managed-path
+# checks in inventory_paths compare against the generation counter, which
+# bumps whenever the data root may have changed.
+_PATH_CACHE_LOCK = threading.Lock()
+_PATH_CACHE_GENERATION = 0
+_CONFIGURED_ROOT_CACHE: dict = {}
+_PATH_CACHE_STATS = {
+    "data_root_hits": 0,
+    "data_root_misses": 0,
+    "managed_path_hits": 0,
+    "managed_path_misses": 0,
+}
+
+
+def invalidate_path_caches() -> None:
+    """Drop cached data-root and managed-path results."""
+    global _PATH_CACHE_GENERATION
+    with _PATH_CACHE_LOCK:
+        _PATH_CACHE_GENERATION += 1
+        _CONFIGURED_ROOT_CACHE.clear()
+
+
+def path_cache_generation() -> int:
+    return _PATH_CACHE_GENERATION
+
+
+def record_path_cache_lookup(kind: str, hit: bool) -> None:
+    key = f"{kind}_{'hits' if hit else 'misses'}"
+    with _PATH_CACHE_LOCK:
+        _PATH_CACHE_STATS[key] = _PATH_CACHE_STATS.get(key, 0) + 1
+
+
+def path_cache_stats() -> dict:
+    """Return hit/miss counters of the path-policy caches."""
+    with _PATH_CACHE_LOCK:
+        stats = dict(_PATH_CACHE_STATS)
+        stats["generation"] = _PATH_CACHE_GENERATION
+    return stats
+
 
 def get_install_dir() -> str:
     """Return install directory (or project root in source mode)."""
@@ -76,12 +117,14 @@ def normalize_data_root(path: str) -> str:
 def set_session_data_root(path: str) -> str:
     global _SESSION_DATA_ROOT
     _SESSION_DATA_ROOT = normalize_data_root(path)
+    invalidate_path_caches()
     return str(_SESSION_DATA_ROOT or "")
 
 
 def clear_session_data_root() -> None:
     global _SESSION_DATA_ROOT
     _SESSION_DATA_ROOT = None
+    invalidate_path_caches()
 
 
 def _read_yaml_map(path: str) -> dict:
@@ -90,16 +133,33 @@ def _read_yaml_map(path: str) -> dict:
         return {}
     try:
         with open(target, "r", encoding="utf-8") as handle:
-            payload = yaml.safe_load(handle) or {}
+            payload = yaml_codec.safe_load(handle) or {}
     except Exception:
         return {}
     return payload if isinstance(payload, dict) else {}
 
 
 def load_configured_data_root(config_path: str = "") -> str:
-    target = str(config_path or "").strip() or get_user_config_file()
-    payload = _read_yaml_map(target)
-    return normalize_data_root(payload.get("data_root"))
+    target = os.path.abspath(str(config_path or "").strip() or get_user_config_file())
+    try:
+        stat = os.stat(target)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = None
+    with _PATH_CACHE_LOCK:
+        cached = _CONFIGURED_ROOT_CACHE.get(target)
+    if cached is not None and cached[0] == stamp:
+        record_path_cache_lookup("data_root", True)
+        return cached[1]
+
+    record_path_cache_lookup("data_root", False)
+    configured = ""
+    if stamp is not None:
+        payload = _read_yaml_map(target)
+        configured = normalize_data_root(payload.get("data_root"))
+    with _PATH_CACHE_LOCK:
+        _CONFIGURED_ROOT_CACHE[target] = (stamp, configured)
+    return configured
 
 
 def resolve_data_root(*, config_path: str = "", fallback_to_legacy: bool = True) -> str:
@@ -188,15 +248,18 @@ def migrate_data_root(source_root: str, target_root: str) -> dict:
         }
 
     ensure_data_root_layout(target)
-    _copy_tree_if_present(source, target, "inventories")
-    _copy_tree_if_present(source, target, "migrate")
-    from .data_root_migration import rewrite_migrated_inventory_tree
-
-    rewrite_migrated_inventory_tree(
-        source_root=source,
-        target_root=target,
-        inventories_root=get_inventories_root(data_root=target, fallback_to_legacy=False),
-    )
+    try:
+        _copy_tree_if_present(source, target, "inventories")
+        _copy_tree_if_present(source, target, "migrate")
+        from .data_root_migration import rewrite_migrated_inventory_tree
+
+        rewrite_migrated_inventory_tree(
+            source_root=source,
+            target_root=target,
+            inventories_root=get_inventories_root(data_root=target, fallback_to_legacy=False),
+        )
+    finally:
+        invalidate_path_caches()
     return {
         "data_root": target,
         "inventories_root": get_inventories_root(data_root=target, fallback_to_legacy=False),
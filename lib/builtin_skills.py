@@ -1,12 +1,20 @@
-"""Built-in skill catalog and loader helpers."""
+"""Built-in skill catalog and loader helpers.
+
+Skills are loaded once into an in-process registry.  Every lookup first
+compares cheap ``stat`` fingerprints (skill root, skill directories and
+``SKILL.md`` files, resource directories and files) and only rescans or
+re-reads what changed, so frequent agent turns do not re-parse every skill.
+"""
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+import os
 from pathlib import Path
 import re
 import sys
-from typing import Dict, List
+import threading
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
@@ -130,112 +138,192 @@ def _display_path(path: Path) -> str:
         return target.as_posix()
 
 
-def _list_resource_paths(skill_root: Path, resource_dir_name: str) -> List[str]:
-    root = skill_root / resource_dir_name
-    if not root.is_dir():
-        return []
-    entries: List[str] = []
-    for path in sorted(root.rglob("*")):
-        if path.is_file():
-            entries.append(_display_path(path))
-    return entries
+def _stat_key(path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
 
 
-def _read_text_documents(skill_root: Path, resource_dir_name: str) -> List[Dict[str, str]]:
-    root = skill_root / resource_dir_name
-    if not root.is_dir():
+def _skill_dirs(skills_root: Path) -> List[Path]:
+    try:
+        return sorted(path for path in skills_root.iterdir() if path.is_dir())
+    except OSError:
         return []
-    documents: List[Dict[str, str]] = []
-    for path in sorted(root.rglob("*")):
-        if not path.is_file():
-            continue
-        try:
-            content = path.read_text(encoding="utf-8")
-        except Exception:
-            continue
-        documents.append(
-            {
-                "path": _display_path(path),
-                "content": content,
-            }
-        )
-    return documents
 
 
-def list_builtin_skills() -> List[Dict[str, str]]:
-    """Return built-in skill metadata sorted by skill name."""
-    rows: List[Dict[str, str]] = []
-    seen_names = set()
-
-    for skills_root in _candidate_skill_roots():
-        if not skills_root.is_dir():
+def _catalog_fingerprint(roots: List[Path]) -> tuple:
+    """Return stat keys of everything the skill catalog is parsed from."""
+    parts = []
+    for skills_root in roots:
+        root_key = _stat_key(skills_root)
+        parts.append((str(skills_root), root_key))
+        if root_key is None or not skills_root.is_dir():
             continue
-        for skill_root in sorted(path for path in skills_root.iterdir() if path.is_dir()):
-            skill_file = skill_root / "SKILL.md"
-            if not skill_file.is_file():
-                continue
-            skill = _load_skill_file(skill_file)
-            if skill.name in seen_names:
-                continue
-            seen_names.add(skill.name)
-            rows.append(
-                {
-                    "name": skill.name,
-                    "description": skill.description,
-                }
-            )
-
-    rows.sort(key=lambda item: str(item.get("name") or ""))
-    return rows
+        for skill_root in _skill_dirs(skills_root):
+            parts.append((str(skill_root), _stat_key(skill_root), _stat_key(skill_root / "SKILL.md")))
+    return tuple(parts)
 
 
-def load_builtin_skill(skill_name: str) -> Dict[str, object]:
-    """Load one built-in skill by frontmatter name."""
-    requested = str(skill_name or "").strip().lower()
-    if not requested:
-        raise BuiltinSkillError(
-            "invalid_skill_name",
-            "skill_name must be a non-empty string.",
-        )
-
-    available: List[str] = []
-    for skills_root in _candidate_skill_roots():
-        if not skills_root.is_dir():
-            continue
-        for skill_root in sorted(path for path in skills_root.iterdir() if path.is_dir()):
-            skill_file = skill_root / "SKILL.md"
-            if not skill_file.is_file():
-                continue
-            skill = _load_skill_file(skill_file)
-            available.append(skill.name)
-            if skill.name != requested:
+def _resource_fingerprint(root: Path) -> tuple:
+    if not root.is_dir():
+        return ()
+    parts = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        parts.append((dirpath, _stat_key(dirpath)))
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            parts.append((path, _stat_key(path)))
+    return tuple(parts)
+
+
+class _ResourceEntry:
+    __slots__ = ("paths", "fingerprint", "documents")
+
+    def __init__(self, paths, fingerprint):
+        self.paths = paths
+        self.fingerprint = fingerprint
+        self.documents = None
+
+    def is_current(self) -> bool:
+        # Stat only the directories and files seen at load time; a file added
+        # or removed anywhere below changes its directory's mtime.
+        return all(_stat_key(path) == key for path, key in self.fingerprint)
+
+
+class _SkillRegistry:
+    """Process-wide cache of parsed skills, catalog prompt and resources."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fingerprint = None
+        self._skills: Dict[str, BuiltinSkill] = {}
+        self._rows: List[Dict[str, str]] = []
+        self._catalog_prompt = ""
+        self._resources: Dict[Path, _ResourceEntry] = {}
+
+    def _refresh(self) -> None:
+        roots = _candidate_skill_roots()
+        fingerprint = _catalog_fingerprint(roots)
+        if fingerprint == self._fingerprint:
+            return
+
+        skills: Dict[str, BuiltinSkill] = {}
+        for skills_root in roots:
+            if not skills_root.is_dir():
                 continue
+            for skill_root in _skill_dirs(skills_root):
+                skill_file = skill_root / "SKILL.md"
+                if not skill_file.is_file():
+                    continue
+                skill = _load_skill_file(skill_file)
+                skills.setdefault(skill.name, skill)
+
+        rows = [{"name": skill.name, "description": skill.description} for skill in skills.values()]
+        rows.sort(key=lambda item: str(item.get("name") or ""))
+        self._skills = skills
+        self._rows = rows
+        self._catalog_prompt = _format_catalog_prompt(rows)
+        self._resources.clear()
+        self._fingerprint = fingerprint
+
+    def _resource(self, root: Path) -> _ResourceEntry:
+        entry = self._resources.get(root)
+        if entry is None or not entry.is_current():
+            fingerprint = _resource_fingerprint(root)
+            paths = sorted(Path(path) for path, _key in fingerprint if os.path.isfile(path))
+            entry = _ResourceEntry(paths, fingerprint)
+            self._resources[root] = entry
+        return entry
+
+    def list_resource_paths(self, root: Path) -> List[str]:
+        return [_display_path(path) for path in self._resource(root).paths]
+
+    def read_text_documents(self, root: Path) -> List[Dict[str, str]]:
+        entry = self._resource(root)
+        if entry.documents is None:
+            documents: List[Dict[str, str]] = []
+            for path in entry.paths:
+                try:
+                    content = path.read_text(encoding="utf-8")
+                except Exception:
+                    continue
+                documents.append({"path": _display_path(path), "content": content})
+            entry.documents = documents
+        return [dict(document) for document in entry.documents]
+
+    def rows(self) -> List[Dict[str, str]]:
+        with self._lock:
+            self._refresh()
+            return [dict(row) for row in self._rows]
+
+    def catalog_prompt(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._catalog_prompt
+
+    def load(self, requested: str) -> Dict[str, object]:
+        with self._lock:
+            self._refresh()
+            skill = self._skills.get(requested)
+            if skill is None:
+                raise BuiltinSkillError(
+                    "unknown_skill",
+                    f"Unknown built-in skill: {requested}",
+                    details={"available_skills": sorted(self._skills)},
+                )
 
             payload: Dict[str, object] = {
                 "name": skill.name,
                 "description": skill.description,
                 "instructions_markdown": skill.body,
-                "references": _list_resource_paths(skill.skill_root, "references"),
-                "reference_documents": _read_text_documents(skill.skill_root, "references"),
-                "scripts": _list_resource_paths(skill.skill_root, "scripts"),
-                "assets": _list_resource_paths(skill.skill_root, "assets"),
+                "references": self.list_resource_paths(skill.skill_root / "references"),
+                "reference_documents": self.read_text_documents(skill.skill_root / "references"),
+                "scripts": self.list_resource_paths(skill.skill_root / "scripts"),
+                "assets": self.list_resource_paths(skill.skill_root / "assets"),
             }
             shared_root = skill.skill_root.parent / "shared"
             if shared_root.is_dir():
-                payload["shared_references"] = _list_resource_paths(shared_root, "references")
-                payload["shared_reference_documents"] = _read_text_documents(shared_root, "references")
+                payload["shared_references"] = self.list_resource_paths(shared_root / "references")
+                payload["shared_reference_documents"] = self.read_text_documents(shared_root / "references")
             return payload
 
-    raise BuiltinSkillError(
-        "unknown_skill",
-        f"Unknown built-in skill: {requested}",
-        details={"available_skills": sorted(set(available))},
-    )
+    def clear(self) -> None:
+        with self._lock:
+            self._fingerprint = None
+            self._skills = {}
+            self._rows = []
+            self._catalog_prompt = ""
+            self._resources.clear()
 
 
-def build_skill_catalog_prompt() -> str:
-    """Return a compact system-prompt block listing available skills."""
-    skills = list_builtin_skills()
+_REGISTRY = _SkillRegistry()
+
+
+def clear_builtin_skill_cache() -> None:
+    """Drop cached skills so the next lookup rescans the skill roots."""
+    _REGISTRY.clear()
+
+
+def list_builtin_skills() -> List[Dict[str, str]]:
+    """Return built-in skill metadata sorted by skill name."""
+    return _REGISTRY.rows()
+
+
+def load_builtin_skill(skill_name: str) -> Dict[str, object]:
+    """Load one built-in skill by frontmatter name."""
+    requested = str(skill_name or "").strip().lower()
+    if not requested:
+        raise BuiltinSkillError(
+            "invalid_skill_name",
+            "skill_name must be a non-empty string.",
+        )
+    return _REGISTRY.load(requested)
+
+
+def _format_catalog_prompt(skills: List[Dict[str, str]]) -> str:
     if not skills:
         return ""
 
@@ -248,3 +336,8 @@ def build_skill_catalog_prompt() -> str:
     for item in skills:
         lines.append(f"- `{item['name']}`: {item['description']}")
     return "\n".join(lines)
+
+
+def build_skill_catalog_prompt() -> str:
+    """Return a compact system-prompt block listing available skills."""
+    return _REGISTRY.catalog_prompt()
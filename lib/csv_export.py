@@ -1,6 +1,7 @@
 """CSV export helpers for full inventory snapshots."""
 
 import csv
+import json
 import os
 
 from .custom_fields import get_effective_fields
@@ -101,11 +102,62 @@ def _row_value(record, column, *, meta=None, split_location=False):
         return ""
     # Serialize complex types (list, dict) to JSON for display
     if isinstance(value, (list, dict)):
-        import json
         return json.dumps(value, ensure_ascii=False)
     return value
 
 
+EXPORT_STREAM_FORMATS = ("csv", "ndjson")
+
+
+def _sorted_export_records(records, record_ids=None):
+    wanted_ids = None
+    if record_ids is not None:
+        wanted_ids = {_safe_int(record_id, None) for record_id in record_ids}
+    normalized_records = [
+        record
+        for record in (records or [])
+        if isinstance(record, dict)
+        and (wanted_ids is None or _safe_int(record.get("id"), None) in wanted_ids)
+    ]
+    normalized_records.sort(key=_record_sort_key)
+    return normalized_records
+
+
+def resolve_export_columns(available_columns, columns=None):
+    """Return the projected column list, preserving the caller's order.
+
+    Raises:
+        ValueError: When ``columns`` names a column the export does not provide.
+    """
+    if columns in (None, "", [], ()):
+        return list(available_columns)
+    if isinstance(columns, str):
+        requested = [part.strip() for part in columns.split(",")]
+    else:
+        requested = [str(part or "").strip() for part in columns]
+    requested = [name for name in requested if name]
+    unknown = [name for name in requested if name not in available_columns]
+    if unknown:
+        raise ValueError(
+            f"Unknown export columns: {', '.join(unknown)}; "
+            f"available: {', '.join(available_columns)}"
+        )
+    projected = []
+    for name in requested:
+        if name not in projected:
+            projected.append(name)
+    return projected
+
+
+def iter_export_rows(records, meta=None, *, columns, split_location=False):
+    """Yield one normalized export row dict per record, in ``records`` order."""
+    for record in records or []:
+        yield {
+            column: _row_value(record, column, meta=meta, split_location=split_location)
+            for column in columns
+        }
+
+
 def build_export_rows(records, meta=None, *, split_location=False):
     """Build normalized rows for inventory export/display reuse.
 
@@ -114,22 +166,21 @@ def build_export_rows(records, meta=None, *, split_location=False):
         meta: Metadata dict with custom_fields
         split_location: Whether to output separate box/position columns.
     """
-    normalized_records = [record for record in (records or []) if isinstance(record, dict)]
-    normalized_records.sort(key=_record_sort_key)
+    normalized_records = _sorted_export_records(records)
 
     columns = build_export_columns(
         meta,
         inventory=normalized_records,
         split_location=split_location,
     )
-    rows = []
-    for record in normalized_records:
-        rows.append(
-            {
-                column: _row_value(record, column, meta=meta, split_location=split_location)
-                for column in columns
-            }
+    rows = list(
+        iter_export_rows(
+            normalized_records,
+            meta,
+            columns=columns,
+            split_location=split_location,
         )
+    )
 
     return {
         "columns": columns,
@@ -144,24 +195,106 @@ def build_export_rows_from_data(data, *, split_location=False):
     return build_export_rows(inventory, meta=meta, split_location=split_location)
 
 
-def export_inventory_to_csv(data, output_path):
-    """Write full inventory records to CSV and return export metadata."""
-    # CSV export uses split box/position columns to avoid Excel/WPS
-    # auto-coercing values like "5:65" into time serial numbers.
-    payload = build_export_rows_from_data(data, split_location=True)
-    columns = payload["columns"]
-    rows = payload["rows"]
+class _LineBuffer:
+    """Minimal file-like sink so ``csv.writer`` can render one line at a time."""
 
-    abs_output_path = os.path.abspath(os.fspath(output_path))
-    # Use UTF-8 BOM so Excel/WPS on Windows can open Chinese text without mojibake.
-    with open(abs_output_path, "w", newline="", encoding="utf-8-sig") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(columns)
+    def __init__(self):
+        self.value = ""
+
+    def write(self, text):
+        self.value += text
+
+    def pop(self):
+        text, self.value = self.value, ""
+        return text
+
+
+def prepare_inventory_export(data, *, columns=None, record_ids=None):
+    """Resolve the record order and projected columns for a streaming export.
+
+    ``record_ids`` restricts the export to those record ids (``None`` exports
+    every record). The returned dict is consumed by ``iter_export_lines``.
+    """
+    inventory = data.get("inventory", []) if isinstance(data, dict) else []
+    meta = data.get("meta", {}) if isinstance(data, dict) else {}
+    all_records = [record for record in (inventory or []) if isinstance(record, dict)]
+    available_columns = build_export_columns(meta, inventory=all_records, split_location=True)
+    return {
+        "meta": meta,
+        "records": _sorted_export_records(all_records, record_ids=record_ids),
+        "columns": resolve_export_columns(available_columns, columns),
+    }
+
+
+def iter_export_lines(prepared, *, fmt="csv"):
+    """Yield encoded export text line by line (header first for CSV).
+
+    Rows are rendered lazily from ``prepare_inventory_export`` output so the
+    caller can write them to a file or an HTTP response without holding the
+    full export in memory.
+    """
+    normalized_fmt = str(fmt or "csv").strip().lower()
+    if normalized_fmt not in EXPORT_STREAM_FORMATS:
+        raise ValueError(
+            f"Unsupported export format: {fmt}; expected one of {', '.join(EXPORT_STREAM_FORMATS)}"
+        )
+    columns = prepared["columns"]
+    rows = iter_export_rows(
+        prepared["records"],
+        prepared["meta"],
+        columns=columns,
+        split_location=True,
+    )
+    if normalized_fmt == "ndjson":
         for row in rows:
-            writer.writerow([row.get(column, "") for column in columns])
+            yield json.dumps(row, ensure_ascii=False, default=str) + "\n"
+        return
 
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.pop()
+    for row in rows:
+        writer.writerow([row.get(column, "") for column in columns])
+        yield buffer.pop()
+
+
+def write_export_lines(lines, output_path, *, fmt="csv"):
+    """Write rendered export lines to ``output_path`` and return its absolute path."""
+    abs_output_path = os.path.abspath(os.fspath(output_path))
+    # CSV keeps the UTF-8 BOM for Excel/WPS; NDJSON consumers expect plain UTF-8.
+    encoding = "utf-8-sig" if str(fmt or "csv").strip().lower() == "csv" else "utf-8"
+    with open(abs_output_path, "w", newline="", encoding=encoding) as handle:
+        for line in lines:
+            handle.write(line)
+    return abs_output_path
+
+
+def export_inventory_stream(data, output_path, *, fmt="csv", columns=None, record_ids=None):
+    """Stream inventory rows to ``output_path`` as CSV or NDJSON.
+
+    Returns the same metadata shape as ``export_inventory_to_csv`` plus the
+    effective ``format``.
+    """
+    normalized_fmt = str(fmt or "csv").strip().lower()
+    prepared = prepare_inventory_export(data, columns=columns, record_ids=record_ids)
+    abs_output_path = write_export_lines(
+        iter_export_lines(prepared, fmt=normalized_fmt),
+        output_path,
+        fmt=normalized_fmt,
+    )
     return {
         "path": abs_output_path,
-        "count": len(rows),
-        "columns": columns,
+        "format": normalized_fmt,
+        "count": len(prepared["records"]),
+        "columns": list(prepared["columns"]),
     }
+
+
+def export_inventory_to_csv(data, output_path):
+    """Write full inventory records to CSV and return export metadata."""
+    # CSV export uses split box/position columns to avoid Excel/WPS
+    # auto-coercing values like "5:65" into time serial numbers.
+    result = export_inventory_stream(data, output_path, fmt="csv")
+    result.pop("format", None)
+    return result
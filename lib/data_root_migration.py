@@ -12,7 +12,7 @@ import json
 import os
 from pathlib import Path
 
-import yaml
+from . import yaml_codec
 
 
 AUDIT_RUNTIME_PATH_FIELDS = ("yaml_path", "backup_path")
@@ -51,7 +51,7 @@ def _rewrite_migrated_inventory_yaml(yaml_path: Path, *, source_root: str, targe
     if not yaml_path.is_file():
         return
     try:
-        payload = yaml.safe_load(yaml_path.read_text(encoding="utf-8")) or {}
+        payload = yaml_codec.safe_load(yaml_path.read_text(encoding="utf-8")) or {}
     except Exception as exc:
         raise ValueError(f"failed to rewrite migrated inventory YAML: {yaml_path}") from exc
     if not isinstance(payload, dict):
@@ -65,7 +65,7 @@ def _rewrite_migrated_inventory_yaml(yaml_path: Path, *, source_root: str, targe
         source_root=source_root,
         target_root=target_root,
     )
-    content = yaml.safe_dump(payload, allow_unicode=True, sort_keys=False, width=120)
+    content = yaml_codec.safe_dump(payload)
     _write_text_atomic(yaml_path, content)
 
 
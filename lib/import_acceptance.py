@@ -3,8 +3,7 @@
 import os
 from typing import Any, Dict, List
 
-import yaml
-
+from . import yaml_codec
 from .schema_aliases import canonicalize_inventory_document
 from .legacy_field_policy import canonicalize_legacy_document
 from .validate_service import VALIDATION_MODE_DOCUMENT, validate_yaml_file
@@ -139,7 +138,7 @@ def import_validated_yaml(
             )
         data = legacy_result.get("data")
         with open(destination, "w", encoding="utf-8") as handle:
-            yaml.safe_dump(data, handle, allow_unicode=True, sort_keys=False)
+            yaml_codec.safe_dump(data, handle)
     except Exception as exc:
         return _error_payload("write_failed", f"Failed to write imported YAML: {exc}")
 
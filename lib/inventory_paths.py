@@ -10,6 +10,8 @@ import shutil
 from .app_storage import (
     get_install_dir,
     get_inventories_root as _get_data_root_inventories_root,
+    path_cache_generation,
+    record_path_cache_lookup,
 )
 
 INVENTORIES_DIR_NAME = "inventories"
@@ -17,6 +19,12 @@ INVENTORY_FILE_NAME = "inventory.yaml"
 
 _INVALID_DATASET_CHARS = set('<>:"/\\|?*')
 
+# inventories_root -> its normalized real path, valid for one app_storage
+# path-cache generation.  Only the root is cached: the per-path realpath
+# check must see a dataset dir that was swapped for a symlink later on.
+_REAL_ROOT_CACHE = {}
+_real_root_cache_generation = None
+
 
 class InventoryPathError(ValueError):
     """Raised when an inventory path violates managed-root policy."""
@@ -57,6 +65,23 @@ def _real_norm_path(path):
     return os.path.normcase(os.path.normpath(os.path.realpath(os.path.abspath(str(path or "")))))
 
 
+def _cached_real_root(root):
+    global _real_root_cache_generation
+    generation = path_cache_generation()
+    if _real_root_cache_generation != generation:
+        _REAL_ROOT_CACHE.clear()
+        _real_root_cache_generation = generation
+    cached = _REAL_ROOT_CACHE.get(root)
+    if cached is not None:
+        record_path_cache_lookup("managed_path", True)
+        return cached
+
+    record_path_cache_lookup("managed_path", False)
+    real_root = _real_norm_path(root)
+    _REAL_ROOT_CACHE[root] = real_root
+    return real_root
+
+
 def _is_managed_path_shape(path):
     abs_path = os.path.abspath(str(path or ""))
     if not abs_path:
@@ -64,18 +89,21 @@ def _is_managed_path_shape(path):
     if os.path.basename(abs_path).lower() != INVENTORY_FILE_NAME:
         return False
 
-    dataset_dir = os.path.dirname(abs_path)
     root = get_inventories_root()
+    return _check_managed_path_shape(abs_path, root, _cached_real_root(root))
+
+
+def _check_managed_path_shape(abs_path, root, real_root):
+    dataset_dir = os.path.dirname(abs_path)
 
     dataset_parent = os.path.dirname(dataset_dir)
     if (
         _norm_path(dataset_parent) != _norm_path(root)
-        and _real_norm_path(dataset_parent) != _real_norm_path(root)
+        and _real_norm_path(dataset_parent) != real_root
     ):
         return False
 
     # Prevent symlink/path escapes: real dataset dir must remain a direct child of root.
-    real_root = _real_norm_path(root)
     real_dataset_dir = _real_norm_path(dataset_dir)
     if _norm_path(os.path.dirname(real_dataset_dir)) != real_root:
         return False
@@ -0,0 +1,102 @@
+"""Read-only views of one loaded inventory document.
+
+A batch read shares a single parsed document between many read tools.
+Instead of deep-copying it for every tool, the document is frozen once:
+mappings, lists and record views keep their usual read behavior (including
+structural alias reads) but every mutator raises ``TypeError``.  ``copy``
+and ``deepcopy`` return ordinary mutable containers, so a tool that needs
+scratch data still gets a private copy.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any
+
+from .schema_aliases import StructuralRecordView
+
+
+def _refuse(self, *_args, **_kwargs):
+    raise TypeError(f"{type(self).__name__} is a read-only snapshot view")
+
+
+class ReadOnlyDict(dict):
+    """Mapping of a shared snapshot document; mutators raise ``TypeError``."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _refuse
+    clear = pop = popitem = setdefault = update = _refuse
+
+    def copy(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        result = {}
+        memo[id(self)] = result
+        for key, value in self.items():
+            result[deepcopy(key, memo)] = deepcopy(value, memo)
+        return result
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class ReadOnlyList(list):
+    """List of a shared snapshot document; mutators raise ``TypeError``."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _refuse
+    append = extend = insert = pop = remove = clear = sort = reverse = _refuse
+
+    def copy(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        result = []
+        memo[id(self)] = result
+        result.extend(deepcopy(value, memo) for value in self)
+        return result
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class ReadOnlyRecordView(StructuralRecordView):
+    """Record view of a shared snapshot document; mutators raise ``TypeError``."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _refuse
+    clear = pop = popitem = setdefault = update = _refuse
+
+    def copy(self):
+        return StructuralRecordView(self.stored_items())
+
+    def __deepcopy__(self, memo):
+        result = StructuralRecordView()
+        memo[id(self)] = result
+        for key, value in self.stored_items():
+            dict.__setitem__(result, key, deepcopy(value, memo))
+        return result
+
+    def __reduce__(self):
+        return StructuralRecordView, (dict(self.stored_items()),)
+
+
+def freeze_document(node: Any) -> Any:
+    """Return a read-only view tree of ``node`` (mappings, lists, records)."""
+    if isinstance(node, StructuralRecordView):
+        frozen = ReadOnlyRecordView()
+        for key, value in node.stored_items():
+            dict.__setitem__(frozen, key, freeze_document(value))
+        return frozen
+    if isinstance(node, dict):
+        frozen = ReadOnlyDict()
+        for key, value in node.items():
+            dict.__setitem__(frozen, key, freeze_document(value))
+        return frozen
+    if isinstance(node, list):
+        return ReadOnlyList(freeze_document(value) for value in node)
+    return node
@@ -11,10 +11,13 @@ canonical names.
 
 from __future__ import annotations
 
+import contextvars
+from contextlib import contextmanager
 from copy import deepcopy
 from typing import Any, Dict, Iterable, List, Tuple
 
 
+
 CANONICAL_STORED_AT_KEY = "stored_at"
 LEGACY_STORED_AT_KEY = "frozen_at"
 CANONICAL_STORAGE_EVENTS_KEY = "storage_events"
@@ -53,6 +56,8 @@ LEGACY_TO_CANONICAL_MAP = {
     for canonical_key, legacy_key in STRUCTURAL_ALIAS_MAP.items()
 }
 
+_ALIAS_PARTNER_MAP = {**STRUCTURAL_ALIAS_MAP, **LEGACY_TO_CANONICAL_MAP}
+
 
 def _is_present(value: Any) -> bool:
     return value not in (None, "")
@@ -108,6 +113,158 @@ def get_storage_events(record: Dict[str, Any] | None):
     return get_alias_value(record, CANONICAL_STORAGE_EVENTS_KEY, default=None)
 
 
+class StructuralRecordView(dict):
+    """Record mapping that answers structural alias keys on access.
+
+    Only the keys actually present in the document are stored, so a loaded
+    record carries no duplicate ``frozen_at``/``thaw_events`` entries.  To
+    every reader the view looks like a record holding both spellings:
+    ``[]``, ``get``, ``in``, iteration, ``keys``/``items``/``values``,
+    ``len`` and ``==`` all see the missing partner of each stored alias key,
+    so ``view == dict(view)`` and ``json.dumps(view)`` spells out both names.
+    Writes through either spelling land on the key the record stores, and
+    ``pop``/``del`` remove the field under both names.  Copies and pickles
+    carry the stored keys only (``stored_items``).
+    """
+
+    __slots__ = ()
+
+    def _missing_partners(self):
+        for key in dict.__iter__(self):
+            partner = _ALIAS_PARTNER_MAP.get(key)
+            if partner is not None and not dict.__contains__(self, partner):
+                yield partner, dict.__getitem__(self, key)
+
+    def __missing__(self, key):
+        partner = _ALIAS_PARTNER_MAP.get(key)
+        if partner is not None and dict.__contains__(self, partner):
+            return dict.__getitem__(self, partner)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if dict.__contains__(self, key):
+            return True
+        partner = _ALIAS_PARTNER_MAP.get(key)
+        return partner is not None and dict.__contains__(self, partner)
+
+    def __iter__(self):
+        yield from dict.__iter__(self)
+        for partner, _value in self._missing_partners():
+            yield partner
+
+    def __len__(self):
+        return dict.__len__(self) + sum(1 for _item in self._missing_partners())
+
+    def __eq__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return list(dict.items(self)) + list(self._missing_partners())
+
+    def values(self):
+        return [value for _key, value in self.items()]
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        partner = _ALIAS_PARTNER_MAP.get(key)
+        if partner is not None and dict.__contains__(self, partner):
+            return dict.__getitem__(self, partner)
+        return default
+
+    def __setitem__(self, key, value):
+        partner = _ALIAS_PARTNER_MAP.get(key)
+        partner_stored = partner is not None and dict.__contains__(self, partner)
+        if dict.__contains__(self, key) or not partner_stored:
+            dict.__setitem__(self, key, value)
+        if partner_stored:
+            dict.__setitem__(self, partner, value)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = self.copy()
+        result.update(other)
+        return result
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key, *default):
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self[key]
+        dict.pop(self, key, None)
+        partner = _ALIAS_PARTNER_MAP.get(key)
+        if partner is not None:
+            dict.pop(self, partner, None)
+        return value
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def stored_items(self):
+        """Return the ``(key, value)`` pairs the document actually holds."""
+        return list(dict.items(self))
+
+    def copy(self):
+        return type(self)(dict.items(self))
+
+    def __deepcopy__(self, memo):
+        result = type(self)()
+        memo[id(self)] = result
+        for key, value in dict.items(self):
+            dict.__setitem__(result, key, deepcopy(value, memo))
+        return result
+
+    def __reduce__(self):
+        return type(self), (dict(dict.items(self)),)
+
+    def get_alias_value(self, canonical_key: str, default=None):
+        return get_alias_value(self, canonical_key, default=default)
+
+    def get_stored_at(self, default=None):
+        return get_stored_at(self, default=default)
+
+
+def _stored_record(record: Any) -> Any:
+    """Return a record view as a plain dict of its stored keys."""
+    if isinstance(record, StructuralRecordView):
+        return dict(record.stored_items())
+    return record
+
+
+def has_legacy_structural_keys(record: Any) -> bool:
+    """Return whether one record stores any legacy structural key itself."""
+    if not isinstance(record, dict):
+        return False
+    return any(dict.__contains__(record, legacy_key) for legacy_key in LEGACY_TO_CANONICAL_MAP)
+
+
 def structural_field_label(canonical_key: str) -> str:
     """Return a human-readable canonical/legacy field label."""
     key = str(canonical_key or "").strip()
@@ -214,11 +371,19 @@ def canonicalize_record_structural_aliases(
     *,
     label: str = "Record",
 ) -> Tuple[Dict[str, Any] | None, List[str]]:
-    """Return a copy using only canonical structural keys plus conflict errors."""
+    """Return the record in canonical structural keys plus conflict errors.
+
+    Records that store no legacy key are already canonical and are returned
+    as-is (record views as a plain dict of their stored keys); otherwise a
+    canonical copy is built.
+    """
     if not isinstance(record, dict):
         return record, []
+    if not has_legacy_structural_keys(record):
+        return _stored_record(record), []
 
-    normalized = deepcopy(record)
+    # Plain dict so key checks below see stored keys, not view aliases.
+    normalized = deepcopy(_stored_record(record))
     errors: List[str] = []
 
     for canonical_key, legacy_key in STRUCTURAL_ALIAS_MAP.items():
@@ -241,7 +406,11 @@ def canonicalize_record_structural_aliases(
 
 
 def expand_document_structural_aliases(data: Any) -> Any:
-    """Populate missing structural aliases across one inventory document."""
+    """Expose structural aliases across one inventory document.
+
+    Records are wrapped in ``StructuralRecordView`` so alias keys resolve on
+    access instead of being materialized as duplicate entries.
+    """
     if not isinstance(data, dict):
         return data
 
@@ -249,15 +418,49 @@ def expand_document_structural_aliases(data: Any) -> Any:
     if not isinstance(inventory, list):
         return data
 
-    for record in inventory:
-        expand_record_structural_aliases(record)
+    for idx, record in enumerate(inventory):
+        if isinstance(record, dict) and not isinstance(record, StructuralRecordView):
+            inventory[idx] = StructuralRecordView(record)
     return data
 
 
+# Documents a write pipeline has already canonicalized, by identity.  Stamps
+# are scoped to the ``canonical_form_stamp`` block that created them.
+_canonical_form_stamps: contextvars.ContextVar[tuple] = contextvars.ContextVar(
+    "snowfox_canonical_form_stamps",
+    default=(),
+)
+
+
+@contextmanager
+def canonical_form_stamp(data: Any):
+    """Mark ``data`` as canonical for the duration of the block.
+
+    Inside the block ``canonicalize_inventory_document(data)`` returns ``data``
+    itself instead of a fresh copy.  The owner must not reintroduce legacy
+    keys while the stamp is active.
+    """
+    token = _canonical_form_stamps.set(_canonical_form_stamps.get() + (data,))
+    try:
+        yield data
+    finally:
+        _canonical_form_stamps.reset(token)
+
+
+def has_canonical_form_stamp(data: Any) -> bool:
+    """Return whether ``data`` is inside an active ``canonical_form_stamp``."""
+    return any(stamped is data for stamped in _canonical_form_stamps.get())
+
+
 def canonicalize_inventory_document(data: Any) -> Tuple[Any, List[str]]:
-    """Return canonicalized document copy plus structural alias conflict errors."""
+    """Return canonicalized document copy plus structural alias conflict errors.
+
+    Documents under an active ``canonical_form_stamp`` are returned as-is.
+    """
     if not isinstance(data, dict):
         return data, []
+    if has_canonical_form_stamp(data):
+        return data, []
 
     normalized = deepcopy(data)
     inventory = normalized.get("inventory")
@@ -266,6 +469,10 @@ def canonicalize_inventory_document(data: Any) -> Tuple[Any, List[str]]:
 
     errors: List[str] = []
     for idx, record in enumerate(inventory):
+        if not has_legacy_structural_keys(record):
+            # Already canonical; the document copy above is enough.
+            inventory[idx] = _stored_record(record)
+            continue
         label = (
             f"Record #{idx + 1} (id={record.get('id', 'N/A')})"
             if isinstance(record, dict)
@@ -81,6 +81,7 @@ def persist_custom_fields_update(
                 "details": dict(audit_details or {}),
             },
             validation_scope="meta_only",
+            occupancy_delta=(),
         )
     except ValueError as exc:
         return _error_result("validation_failed", str(exc))
@@ -391,6 +391,35 @@ def tool_export_inventory_csv(yaml_path, output_path):
     return _format_tool_response_positions(response, yaml_path=yaml_path)
 
 
+def tool_export_inventory_stream(
+    yaml_path,
+    output_path,
+    export_format="ndjson",
+    columns=None,
+    since_audit_seq=None,
+):
+    from .tool_api_impl import read_ops as _read_ops
+
+    return _read_ops.tool_export_inventory_stream(
+        yaml_path=yaml_path,
+        output_path=output_path,
+        export_format=export_format,
+        columns=columns,
+        since_audit_seq=since_audit_seq,
+    )
+
+
+def open_inventory_export_stream(yaml_path, export_format="ndjson", columns=None, since_audit_seq=None):
+    from .tool_api_impl import read_ops as _read_ops
+
+    return _read_ops.open_inventory_export_stream(
+        yaml_path=yaml_path,
+        export_format=export_format,
+        columns=columns,
+        since_audit_seq=since_audit_seq,
+    )
+
+
 def tool_list_empty_positions(yaml_path, box=None):
     from .tool_api_impl import read_ops as _read_ops
 
@@ -544,6 +573,17 @@ def tool_list_audit_timeline(
         end_date=end_date,
     )
     return _format_tool_response_positions(response, layout={})
+
+
+def tool_list_audit_changes(yaml_path, after_seq=0, limit=200):
+    from .tool_api_impl import read_ops as _read_ops
+
+    response = _read_ops.tool_list_audit_changes(
+        yaml_path=yaml_path,
+        after_seq=after_seq,
+        limit=limit,
+    )
+    return _format_tool_response_positions(response, yaml_path=yaml_path)
 _find_consecutive_slots = _support._find_consecutive_slots
 _find_same_row_slots = _support._find_same_row_slots
 
@@ -560,6 +600,14 @@ def tool_recommend_positions(yaml_path, count, box_preference=None, strategy="co
     return _format_tool_response_positions(response, yaml_path=yaml_path)
 
 
+def tool_inventory_summary(yaml_path):
+    from .tool_api_impl import read_ops as _read_ops
+
+    response = _read_ops.tool_inventory_summary(yaml_path=yaml_path)
+    layout = (response.get("result") or {}).get("layout") if isinstance(response, dict) else None
+    return _format_tool_response_positions(response, yaml_path=yaml_path, layout=layout)
+
+
 def tool_generate_stats(
     yaml_path,
     box=None,
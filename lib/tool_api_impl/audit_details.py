@@ -294,3 +294,64 @@ def failure_details(*, op, **context):
         if value is not None:
             details[key] = value
     return details
+
+
+# Ops whose successful events never change exported record rows.
+_ROW_NEUTRAL_OPS = frozenset({"set_box_tag"})
+_ROW_NEUTRAL_ACTIONS = frozenset({"backup"})
+
+
+def _coerce_record_id(value):
+    try:
+        record_id = int(value)
+    except (TypeError, ValueError):
+        return None
+    return record_id if record_id > 0 else None
+
+
+def audit_event_record_ids(event):
+    """Return the set of record ids one audit event changed.
+
+    Failed events, backups and row-neutral ops yield an empty set.  ``None``
+    means the event may have rewritten rows it does not enumerate (rollback,
+    box management, field migrations, legacy writes), so callers syncing by
+    record must fall back to a full resync.
+    """
+    if not isinstance(event, dict):
+        return set()
+    if str(event.get("status") or "success").strip().lower() != "success":
+        return set()
+    if str(event.get("action") or "").strip() in _ROW_NEUTRAL_ACTIONS:
+        return set()
+
+    details = event.get("details")
+    if not isinstance(details, dict):
+        return None
+    op = str(details.get("op") or "").strip()
+    if op in _ROW_NEUTRAL_OPS:
+        return set()
+
+    record_ids = set()
+    if op == "add_entry":
+        record_ids.update(details.get("record_ids") or [])
+    elif op == "edit_entry":
+        record_ids.add(details.get("record_id"))
+    elif op == "move":
+        record_ids.update(details.get("affected_record_ids") or [])
+        for move in details.get("moves") or []:
+            if isinstance(move, dict):
+                record_ids.add(move.get("record_id"))
+                record_ids.add(move.get("swap_with_record_id"))
+    elif isinstance(details.get("records"), list):
+        # takeout_details uses the takeout action name as its op.
+        for row in details.get("records") or []:
+            if isinstance(row, dict):
+                record_ids.add(row.get("record_id"))
+    else:
+        return None
+
+    return {
+        record_id
+        for record_id in (_coerce_record_id(value) for value in record_ids)
+        if record_id is not None
+    }
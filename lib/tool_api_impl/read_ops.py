@@ -6,7 +6,13 @@ from datetime import datetime, timedelta
 from functools import cmp_to_key
 
 from ..inventory_query_contracts import SEARCH_MODE_VALUES
-from ..csv_export import export_inventory_to_csv
+from ..csv_export import (
+    EXPORT_STREAM_FORMATS,
+    export_inventory_to_csv,
+    iter_export_lines,
+    prepare_inventory_export,
+    write_export_lines,
+)
 from ..custom_fields import get_color_key, unsupported_box_fields_issue
 from ..position_fmt import (
     display_to_box,
@@ -26,10 +32,14 @@ from ..validators import normalize_date_arg, parse_date, validate_box, validate_
 from ..yaml_ops import (
     coerce_audit_seq,
     compute_occupancy,
+    inventory_summary,
+    iter_audit_events_after,
     iter_audit_events_reverse,
     load_yaml,
+    read_snapshot_index,
 )
 from .. import tool_api_support as api
+from .audit_details import audit_event_record_ids
 
 INVENTORY_PREVIEW_LIMIT = 100
 
@@ -44,18 +54,47 @@ def _load_supported_data(yaml_path):
             "message": f"Failed to load YAML file: {exc}",
         }
 
-    issue = unsupported_box_fields_issue((data or {}).get("meta"))
-    if issue:
-        return None, {
-            "ok": False,
-            "error_code": issue.get("error_code", "unsupported_box_fields"),
-            "message": issue.get("message", "Unsupported dataset model."),
-            "details": issue.get("details"),
-        }
+    failure = _unsupported_dataset_failure((data or {}).get("meta"))
+    if failure:
+        return None, failure
 
     return data, None
 
 
+def _index_records_by_int_field(data, field):
+    index = defaultdict(list)
+    for rec in (data or {}).get("inventory") or []:
+        if not isinstance(rec, dict):
+            continue
+        try:
+            index[int(rec.get(field))].append(rec)
+        except (TypeError, ValueError):
+            continue
+    return dict(index)
+
+
+def _records_by_id(data):
+    """Records grouped by integer id, memoized per shared read snapshot."""
+    return read_snapshot_index(data, "records_by_id", lambda doc: _index_records_by_int_field(doc, "id"))
+
+
+def _records_by_box(data):
+    """Records grouped by integer box, memoized per shared read snapshot."""
+    return read_snapshot_index(data, "records_by_box", lambda doc: _index_records_by_int_field(doc, "box"))
+
+
+def _unsupported_dataset_failure(meta):
+    issue = unsupported_box_fields_issue(meta)
+    if not issue:
+        return None
+    return {
+        "ok": False,
+        "error_code": issue.get("error_code", "unsupported_box_fields"),
+        "message": issue.get("message", "Unsupported dataset model."),
+        "details": issue.get("details"),
+    }
+
+
 def tool_export_inventory_csv(yaml_path, output_path):
     """Export full inventory records to a CSV file."""
     if not output_path:
@@ -84,6 +123,135 @@ def tool_export_inventory_csv(yaml_path, output_path):
     }
 
 
+def _changed_record_ids_since(yaml_path, since_audit_seq):
+    """Return ``(record_ids, latest_audit_seq)`` for events after ``since_audit_seq``.
+
+    ``record_ids`` is ``None`` when a newer event is not record-scoped and the
+    caller has to resync everything.
+    """
+    changed = set()
+    latest_seq = None
+    for event in iter_audit_events_reverse(yaml_path):
+        seq = coerce_audit_seq(event.get("audit_seq"))
+        if seq is None:
+            continue
+        if latest_seq is None:
+            latest_seq = seq
+        if seq <= since_audit_seq:
+            break
+        record_ids = audit_event_record_ids(event)
+        if record_ids is None:
+            return None, latest_seq
+        changed.update(record_ids)
+    return changed, latest_seq
+
+
+def open_inventory_export_stream(yaml_path, export_format="ndjson", columns=None, since_audit_seq=None):
+    """Validate an export request and return its lazily rendered lines.
+
+    On success the response carries ``lines`` (an iterator of text lines)
+    next to the usual ``result`` summary; nothing is rendered until the
+    caller consumes it.
+    """
+    normalized_format = str(export_format or "ndjson").strip().lower()
+    if normalized_format not in EXPORT_STREAM_FORMATS:
+        return {
+            "ok": False,
+            "error_code": "invalid_tool_input",
+            "message": f"format must be one of: {', '.join(EXPORT_STREAM_FORMATS)}",
+        }
+
+    normalized_since = None
+    if since_audit_seq not in (None, ""):
+        try:
+            normalized_since = int(since_audit_seq)
+        except (TypeError, ValueError):
+            normalized_since = -1
+        if normalized_since < 0:
+            return {
+                "ok": False,
+                "error_code": "invalid_tool_input",
+                "message": "since_audit_seq must be an integer >= 0",
+            }
+
+    data, failure = _load_supported_data(yaml_path)
+    if failure:
+        return failure
+
+    record_ids = None
+    latest_seq = None
+    if normalized_since is not None:
+        record_ids, latest_seq = _changed_record_ids_since(yaml_path, normalized_since)
+    else:
+        for event in iter_audit_events_reverse(yaml_path):
+            latest_seq = coerce_audit_seq(event.get("audit_seq"))
+            if latest_seq is not None:
+                break
+
+    try:
+        prepared = prepare_inventory_export(data, columns=columns, record_ids=record_ids)
+    except ValueError as exc:
+        return {
+            "ok": False,
+            "error_code": "invalid_tool_input",
+            "message": str(exc),
+        }
+
+    return {
+        "ok": True,
+        "result": {
+            "format": normalized_format,
+            "columns": list(prepared["columns"]),
+            "count": len(prepared["records"]),
+            "since_audit_seq": normalized_since,
+            "latest_audit_seq": latest_seq,
+            "full_resync": bool(normalized_since is not None and record_ids is None),
+        },
+        "lines": iter_export_lines(prepared, fmt=normalized_format),
+    }
+
+
+def tool_export_inventory_stream(
+    yaml_path,
+    output_path,
+    export_format="ndjson",
+    columns=None,
+    since_audit_seq=None,
+):
+    """Stream inventory records to a CSV or NDJSON file, row by row."""
+    if not output_path:
+        return {
+            "ok": False,
+            "error_code": "invalid_output_path",
+            "message": "Export output path is required",
+        }
+
+    response = open_inventory_export_stream(
+        yaml_path,
+        export_format=export_format,
+        columns=columns,
+        since_audit_seq=since_audit_seq,
+    )
+    if not response.get("ok"):
+        return response
+
+    result = dict(response["result"])
+    try:
+        abs_output_path = write_export_lines(response["lines"], output_path, fmt=result["format"])
+    except Exception as exc:
+        return {
+            "ok": False,
+            "error_code": "export_failed",
+            "message": f"Inventory export failed: {exc}",
+        }
+
+    result["path"] = abs_output_path
+    return {
+        "ok": True,
+        "result": result,
+    }
+
+
 def tool_list_empty_positions(yaml_path, box=None):
     """List empty positions by box."""
     data, failure = _load_supported_data(yaml_path)
@@ -130,6 +298,35 @@ def tool_list_empty_positions(yaml_path, box=None):
     }
 
 
+def tool_inventory_summary(yaml_path):
+    """Return record count and per-box occupancy without listing records.
+
+    Served from the occupancy counters maintained by writes, so repeated calls
+    cost O(boxes) instead of a full inventory scan.
+    """
+    try:
+        summary = inventory_summary(yaml_path)
+    except Exception as exc:
+        return {
+            "ok": False,
+            "error_code": "load_failed",
+            "message": f"Failed to load YAML file: {exc}",
+        }
+
+    meta = summary.pop("meta")
+    failure = _unsupported_dataset_failure(meta)
+    if failure:
+        return failure
+
+    total_slots = summary["total_slots"]
+    summary["occupancy_rate"] = (summary["total_occupied"] / total_slots * 100) if total_slots > 0 else 0
+    summary["layout"] = meta.get("box_layout") or {}
+    return {
+        "ok": True,
+        "result": summary,
+    }
+
+
 def tool_search_records(
     yaml_path,
     query=None,
@@ -249,8 +446,14 @@ def tool_search_records(
     keywords = normalized_query.split() if normalized_query else []
     q = normalized_query
 
+    candidates = records
+    if normalized_record_id is not None:
+        candidates = _records_by_id(data).get(normalized_record_id, [])
+    elif normalized_box is not None:
+        candidates = _records_by_box(data).get(normalized_box, [])
+
     scoped_records = []
-    for rec in records:
+    for rec in candidates:
         if normalized_record_id is not None:
             try:
                 if int(rec.get("id")) != normalized_record_id:
@@ -394,7 +597,7 @@ def tool_search_records(
     slot_lookup = None
     if normalized_box is not None and normalized_position is not None:
         slot_matches = []
-        for rec in records:
+        for rec in _records_by_box(data).get(normalized_box, []):
             try:
                 rec_box = int(rec.get("box"))
                 rec_pos_raw = rec.get("position")
@@ -937,6 +1140,111 @@ def tool_list_audit_timeline(
     }
 
 
+def _audit_change_entry(event, seq):
+    record_ids = audit_event_record_ids(event)
+    return {
+        "audit_seq": seq,
+        "timestamp": event.get("timestamp"),
+        "action": event.get("action"),
+        "status": str(event.get("status") or "").strip() or "success",
+        "source": event.get("source"),
+        "tool_name": event.get("tool_name"),
+        "record_ids": None if record_ids is None else sorted(record_ids),
+        "details": event.get("details"),
+    }
+
+
+def tool_list_audit_changes(yaml_path, after_seq=0, limit=200):
+    """List audit events newer than ``after_seq`` with record-level deltas.
+
+    Changes are returned oldest first.  ``records`` holds the current state of
+    every record touched by the returned changes; ids that no longer exist are
+    listed in ``removed_record_ids``.  ``full_resync`` is set when one of the
+    changes is not record-scoped (box layout edits, rollbacks, ...), in which
+    case the caller should re-read the whole inventory.  Pass
+    ``next_after_seq`` back as ``after_seq`` to continue the feed.
+    """
+    try:
+        after_val = 0 if after_seq in (None, "") else int(after_seq)
+    except (TypeError, ValueError):
+        after_val = -1
+    if after_val < 0:
+        return {
+            "ok": False,
+            "error_code": "invalid_tool_input",
+            "message": "after_seq must be an integer >= 0",
+        }
+    try:
+        limit_val = 200 if limit in (None, "") else int(limit)
+    except (TypeError, ValueError):
+        limit_val = 0
+    if limit_val <= 0:
+        return {
+            "ok": False,
+            "error_code": "invalid_limit",
+            "message": "limit must be an integer >= 1",
+        }
+
+    yaml_abs = os.path.abspath(str(yaml_path or ""))
+    pending = []
+    latest_seq = None
+    try:
+        for event in iter_audit_events_reverse(yaml_abs):
+            seq = coerce_audit_seq(event.get("audit_seq")) if isinstance(event, dict) else None
+            if seq is not None:
+                latest_seq = seq
+                break
+        # Read forward from after_seq and stop one past the page.
+        for event in iter_audit_events_after(yaml_abs, after_val):
+            pending.append((coerce_audit_seq(event.get("audit_seq")), event))
+            if len(pending) > limit_val:
+                break
+    except Exception as exc:
+        return {
+            "ok": False,
+            "error_code": "load_failed",
+            "message": f"Failed to load audit log: {exc}",
+        }
+
+    has_more = len(pending) > limit_val
+    changes = [_audit_change_entry(event, seq) for seq, event in pending[:limit_val]]
+
+    full_resync = False
+    touched = set()
+    for change in changes:
+        if change["record_ids"] is None:
+            full_resync = True
+        else:
+            touched.update(change["record_ids"])
+
+    records = []
+    removed_record_ids = []
+    if touched:
+        data, failure = _load_supported_data(yaml_abs)
+        if failure:
+            return failure
+        by_id = {}
+        for rec in (data or {}).get("inventory") or []:
+            if isinstance(rec, dict) and rec.get("id") in touched:
+                by_id[rec.get("id")] = rec
+        records = [by_id[rid] for rid in sorted(by_id)]
+        removed_record_ids = sorted(touched - set(by_id))
+
+    return {
+        "ok": True,
+        "result": {
+            "after_seq": after_val,
+            "next_after_seq": changes[-1]["audit_seq"] if changes else after_val,
+            "latest_audit_seq": latest_seq,
+            "has_more": has_more,
+            "full_resync": full_resync,
+            "changes": changes,
+            "records": records,
+            "removed_record_ids": removed_record_ids,
+        },
+    }
+
+
 def tool_recommend_positions(yaml_path, count, box_preference=None, strategy="consecutive"):
     """Recommend positions for new samples."""
     if count <= 0:
@@ -347,6 +347,7 @@ def _persist_add_entry(
             yaml_path,
             auto_backup=auto_backup,
             backup_path=request_backup_path,
+            occupancy_delta=[(None, record) for record in new_records],
             audit_meta=api._build_audit_meta(
                 action=action,
                 source=source,
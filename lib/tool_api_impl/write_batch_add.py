@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from ..migrate_cell_line_policy import normalize_field_options_policy_data
 from ..schema_aliases import get_input_stored_at
-from ..yaml_ops import append_audit_event, load_yaml, write_yaml
+from ..yaml_ops import load_yaml, write_yaml
 from .audit_details import add_entry_details
 from .write_add_entry import (
     _build_add_entry_records,
@@ -94,6 +94,7 @@ def tool_batch_add_entries(
     candidate_data = deepcopy(data)
     entry_results: List[Dict[str, Any]] = []
     all_audit_metas: List[Dict[str, Any]] = []
+    added_records: List[Dict[str, Any]] = []
     has_failure = False
 
     for idx, entry in enumerate(entries):
@@ -138,6 +139,7 @@ def tool_batch_add_entries(
         # Append to candidate inventory in-memory for next iteration's conflict check
         candidate_inventory = candidate_data.setdefault("inventory", [])
         candidate_inventory.extend(built["new_records"])
+        added_records.extend(built["new_records"])
 
         entry_results.append({
             "ok": True,
@@ -210,7 +212,7 @@ def tool_batch_add_entries(
 
     # Phase 3: Single disk write
     try:
-        # Write with the first audit meta; remaining will be appended separately
+        # One audit event per entry, appended together with the write.
         first_audit = all_audit_metas[0] if all_audit_metas else None
         backup_path = write_yaml(
             candidate_data,
@@ -218,6 +220,8 @@ def tool_batch_add_entries(
             auto_backup=auto_backup,
             backup_path=request_backup_path,
             audit_meta=first_audit,
+            extra_audit_metas=all_audit_metas[1:],
+            occupancy_delta=[(None, record) for record in added_records],
         )
     except Exception as exc:
         return api._failure_result(
@@ -232,20 +236,6 @@ def tool_batch_add_entries(
             before_data=data,
         )
 
-    # Phase 4: Append remaining audit events (skip first, already written by write_yaml)
-    for audit_meta in all_audit_metas[1:]:
-        try:
-            append_audit_event(
-                yaml_path=yaml_path,
-                before_data=data,
-                after_data=candidate_data,
-                backup_path=None,
-                warnings=[],
-                audit_meta=audit_meta,
-            )
-        except Exception:
-            pass  # Audit failures must not affect operation outcome
-
     total_created = sum(r.get("count", 0) for r in entry_results if r.get("ok"))
     return {
         "ok": True,
@@ -17,7 +17,7 @@ from .edit_entry_core import (
     edit_entry_error,
     prepare_edit_document,
 )
-from ..yaml_ops import append_audit_event, load_yaml, write_yaml
+from ..yaml_ops import load_yaml, write_yaml
 from .write_common import api
 
 
@@ -203,6 +203,8 @@ def tool_batch_edit_entries(
             auto_backup=auto_backup,
             backup_path=request_backup_path,
             audit_meta=first_audit,
+            extra_audit_metas=audit_metas[1:],
+            occupancy_delta=(),
         )
     except Exception as exc:
         return api._failure_result(
@@ -217,19 +219,6 @@ def tool_batch_edit_entries(
             before_data=data,
         )
 
-    for audit_meta in audit_metas[1:]:
-        try:
-            append_audit_event(
-                yaml_path=yaml_path,
-                before_data=data,
-                after_data=candidate_data,
-                backup_path=None,
-                warnings=[],
-                audit_meta=audit_meta,
-            )
-        except Exception:
-            pass
-
     return {
         "ok": True,
         "entry_results": entry_results,
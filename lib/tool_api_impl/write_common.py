@@ -101,14 +101,12 @@ def ensure_record_events_list_or_failure(
         )
 
     storage_events = record.get(CANONICAL_STORAGE_EVENTS_KEY)
-    legacy_events = record.get(LEGACY_STORAGE_EVENTS_KEY)
-    if storage_events is None and legacy_events is not None:
-        storage_events = deepcopy(legacy_events)
-        record[CANONICAL_STORAGE_EVENTS_KEY] = storage_events
-    elif storage_events is None:
-        storage_events = []
-        record[CANONICAL_STORAGE_EVENTS_KEY] = storage_events
-    record.pop(LEGACY_STORAGE_EVENTS_KEY, None)
+    legacy_events = record.pop(LEGACY_STORAGE_EVENTS_KEY, None)
+    if storage_events is None:
+        storage_events = deepcopy(legacy_events) if legacy_events is not None else []
+    # Popping the legacy key from a record view drops both spellings, so the
+    # events are stored again under the canonical key only.
+    record[CANONICAL_STORAGE_EVENTS_KEY] = storage_events
     if isinstance(storage_events, list):
         return storage_events, None
     return None, build_integrity_failure(
@@ -142,6 +142,7 @@ def tool_edit_entry(
                 details=edit_result.get("audit_details"),
                 tool_input=tool_input,
             ),
+            occupancy_delta=(),
         )
     except Exception as exc:
         return api._failure_result(
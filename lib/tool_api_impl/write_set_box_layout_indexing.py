@@ -161,6 +161,7 @@ def tool_set_box_layout_indexing(
                 details=audit_details,
                 tool_input=tool_input,
             ),
+            occupancy_delta=(),
         )
     except Exception as exc:
         return api._failure_result(
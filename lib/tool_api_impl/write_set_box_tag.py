@@ -186,6 +186,7 @@ def tool_set_box_tag(
                 details=_audit_details,
                 tool_input=tool_input,
             ),
+            occupancy_delta=(),
         )
     except Exception as exc:
         return api._failure_result(
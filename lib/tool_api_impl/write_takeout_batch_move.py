@@ -464,6 +464,7 @@ def _persist_move_plan(
                     "action": action,
                 },
             ),
+            occupancy_delta=[(records[idx], candidate_records[idx]) for idx in touched_indices],
         )
     except Exception as exc:
         return None, None, build_write_failed_result(
@@ -179,6 +179,7 @@ def _persist_batch_nonmove_plan(
         touched_ids = [
             op.get("record_id") for op in operations if op.get("record_id") is not None
         ]
+        before_by_idx = {op["idx"]: op["record"] for op in operations}
         if api._validate_data_or_error(
             candidate_data, changed_ids=touched_ids or None
         ):
@@ -211,6 +212,9 @@ def _persist_batch_nonmove_plan(
                     "action": action,
                 },
             ),
+            occupancy_delta=[
+                (before, candidate_records[idx]) for idx, before in before_by_idx.items()
+            ],
         )
     except Exception as exc:
         return None, build_write_failed_result(
@@ -250,6 +250,33 @@ _TOOL_DESCRIPTOR_LIST = (
         public_contract=False,
         agent_enabled=False,
     ),
+    _tool(
+        "export_inventory_stream",
+        "Stream inventory rows to a CSV or NDJSON file with optional column projection and incremental since_audit_seq sync.",
+        {
+            "type": "object",
+            "properties": {
+                "output_path": {"type": "string"},
+                "export_format": {"type": "string", "enum": ["csv", "ndjson"]},
+                "columns": {"type": "array", "items": {"type": "string"}},
+                "since_audit_seq": {"type": "integer", "minimum": 0},
+            },
+            "required": ["output_path"],
+            "additionalProperties": False,
+        },
+        gui_bridge=_read_bridge(
+            "export_inventory_stream",
+            "tool_export_inventory_stream",
+            positional_payload_args=("output_path", "export_format", "columns", "since_audit_seq"),
+            defaults={
+                "export_format": "ndjson",
+                "columns": None,
+                "since_audit_seq": None,
+            },
+        ),
+        public_contract=False,
+        agent_enabled=False,
+    ),
     _tool(
         "collect_timeline",
         "Collect aggregated takeout/move timeline statistics for GUI dashboards.",
@@ -475,6 +502,20 @@ _TOOL_DESCRIPTOR_LIST = (
             "additionalProperties": False,
         },
     ),
+    _tool(
+        "inventory_summary",
+        "Return record count, total/occupied/empty slots and per-box occupancy. Cheap; prefer it over generate_stats when no record details are needed.",
+        {
+            "type": "object",
+            "properties": {},
+            "required": [],
+            "additionalProperties": False,
+        },
+        gui_bridge=_read_bridge(
+            "inventory_summary",
+            "tool_inventory_summary",
+        ),
+    ),
     _tool(
         "generate_stats",
         "Generate inventory statistics. With box set, returns box-only statistics.",
@@ -566,7 +607,7 @@ _TOOL_DESCRIPTOR_LIST = (
     ),
     _tool(
         "fs_read",
-        "Read one text file under repository-relative path.",
+        "Read one text file under repository-relative path. Files over 256 KB return only their first 200 lines unless a window is given; use offset/limit, head, tail or pattern to explore large files.",
         {
             "type": "object",
             "properties": {
@@ -575,6 +616,33 @@ _TOOL_DESCRIPTOR_LIST = (
                     "description": "Repository-relative file path.",
                 },
                 "encoding": {"type": "string"},
+                "offset": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": "0-based start of the window, in `unit`s (use next_offset from the previous window).",
+                },
+                "limit": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Window size in `unit`s (max 2000 lines or 262144 bytes; line windows are also cut at 262144 bytes).",
+                },
+                "unit": {"type": "string", "enum": ["lines", "bytes"]},
+                "head": {"type": "integer", "minimum": 1, "description": "Return the first N lines."},
+                "tail": {"type": "integer", "minimum": 1, "description": "Return the last N lines."},
+                "pattern": {
+                    "type": "string",
+                    "description": "Regular expression; returns matching lines (grep-style) instead of content.",
+                },
+                "context": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": "Lines of context around each pattern match.",
+                },
+                "max_matches": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Maximum pattern matches to return (default 50, max 500); match windows are also cut at 262144 bytes.",
+                },
             },
             "required": ["path"],
             "additionalProperties": False,
@@ -1028,6 +1096,20 @@ _TOOL_DESCRIPTOR_LIST = (
             "additionalProperties": False,
         },
     ),
+    _tool(
+        "fetch_more",
+        "Fetch the next page of a large read result using the cursor returned with its previous page.",
+        {
+            "type": "object",
+            "properties": {
+                "cursor": {"type": "string"},
+                "page_size": {"type": "integer", "minimum": 1, "maximum": 100},
+            },
+            "required": ["cursor"],
+            "additionalProperties": False,
+        },
+        notes="Pass result.page.next_cursor unchanged. Cursors expire when the inventory changes; rerun the original query then.",
+    ),
 )
 
 
@@ -1175,6 +1257,27 @@ def build_migration_tool_names() -> frozenset[str]:
     )
 
 
+# Read-classified tools that still change session state (the staged plan).
+_STATEFUL_READ_TOOLS = frozenset({"staged_plan"})
+
+
+def build_speculative_read_tools() -> frozenset[str]:
+    """Agent read tools that are safe to run before the model finishes its step.
+
+    These only read inventory data, never stage or write, and never wait for
+    the user, so a speculative result can simply be dropped when unused.
+    """
+    return frozenset(
+        descriptor.name
+        for descriptor in iter_agent_dispatch_descriptors()
+        if not descriptor.is_write
+        and not descriptor.is_migration
+        and descriptor.write_api_attr is None
+        and (descriptor.gui_bridge is None or descriptor.gui_bridge.strategy == GUI_BRIDGE_READ)
+        and descriptor.name not in _STATEFUL_READ_TOOLS
+    )
+
+
 def build_write_tool_to_plan_action() -> dict[str, str]:
     return {
         descriptor.name: str(descriptor.plan_action)
@@ -1186,6 +1289,7 @@ def build_write_tool_to_plan_action() -> dict[str, str]:
 TOOL_CONTRACTS: dict[str, dict[str, Any]] = build_tool_contracts()
 WRITE_TOOLS: frozenset[str] = build_write_tools()
 MIGRATION_TOOL_NAMES: frozenset[str] = build_migration_tool_names()
+SPECULATIVE_READ_TOOLS: frozenset[str] = build_speculative_read_tools()
 WRITE_TOOL_TO_PLAN_ACTION: dict[str, str] = build_write_tool_to_plan_action()
 VALID_PLAN_ACTIONS: frozenset[str] = frozenset(WRITE_TOOL_TO_PLAN_ACTION.values())
 
@@ -0,0 +1,103 @@
+"""YAML codec shared by inventory, storage and import paths.
+
+Loads and dumps go through libyaml (``yaml.CSafeLoader``/``yaml.CSafeDumper``)
+when PyYAML was built with it, and through the pure-Python safe classes
+otherwise.  The backend can be pinned with ``SNOWFOX_YAML_BACKEND``
+(``auto``/``libyaml``/``python``) or ``set_yaml_backend`` for tests.
+
+Both backends use the same dump options (unicode, key order preserved,
+``width=120``) and load every document to identical Python data.  Emitted
+text is byte-identical for ordinary inventory documents; the emitters only
+disagree on how they fold long double-quoted scalars and whether they escape
+characters outside the BMP, and either text loads back to the same data.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import yaml
+
+from .schema_aliases import StructuralRecordView
+
+
+YAML_BACKEND_ENV_VAR = "SNOWFOX_YAML_BACKEND"
+YAML_BACKEND_LIBYAML = "libyaml"
+YAML_BACKEND_PYTHON = "python"
+_BACKEND_AUTO = "auto"
+_BACKEND_CHOICES = {_BACKEND_AUTO, YAML_BACKEND_LIBYAML, YAML_BACKEND_PYTHON}
+
+DEFAULT_DUMP_OPTIONS = {"allow_unicode": True, "sort_keys": False, "width": 120}
+
+_C_SAFE_LOADER = getattr(yaml, "CSafeLoader", None)
+
+
+def _represent_structural_record_view(representer, data):
+    # Dump the keys the record stores, not the alias partners it answers.
+    return representer.represent_dict(data.stored_items())
+
+
+class _SafeDumper(yaml.SafeDumper):
+    """Safe dumper that writes record views as plain mappings."""
+
+
+_SafeDumper.add_representer(StructuralRecordView, _represent_structural_record_view)
+
+if getattr(yaml, "CSafeDumper", None) is not None:
+
+    class _CSafeDumper(yaml.CSafeDumper):
+        """libyaml safe dumper that writes record views as plain mappings."""
+
+    _CSafeDumper.add_representer(StructuralRecordView, _represent_structural_record_view)
+    _C_SAFE_DUMPER = _CSafeDumper
+else:
+    _C_SAFE_DUMPER = None
+
+_backend_override: str | None = None
+
+
+def libyaml_available() -> bool:
+    """Return whether PyYAML exposes the libyaml safe loader and dumper."""
+    return _C_SAFE_LOADER is not None and _C_SAFE_DUMPER is not None
+
+
+def set_yaml_backend(name: str | None) -> None:
+    """Pin the backend for this process; ``None`` restores env/auto selection."""
+    global _backend_override
+    if name is None:
+        _backend_override = None
+        return
+    normalized = str(name).strip().lower()
+    if normalized not in _BACKEND_CHOICES:
+        raise ValueError(f"unknown YAML backend {name!r}; expected one of {sorted(_BACKEND_CHOICES)}")
+    _backend_override = normalized
+
+
+def yaml_backend(name: str | None = None) -> str:
+    """Resolve the effective backend name (``libyaml`` or ``python``)."""
+    requested = name or _backend_override or os.environ.get(YAML_BACKEND_ENV_VAR) or _BACKEND_AUTO
+    requested = str(requested).strip().lower()
+    if requested == YAML_BACKEND_PYTHON:
+        return YAML_BACKEND_PYTHON
+    # "auto", "libyaml" and unknown values all prefer libyaml when present.
+    return YAML_BACKEND_LIBYAML if libyaml_available() else YAML_BACKEND_PYTHON
+
+
+def safe_load(stream: Any, *, backend: str | None = None) -> Any:
+    """Parse one YAML document with the safe loader of the selected backend."""
+    if yaml_backend(backend) == YAML_BACKEND_LIBYAML:
+        return yaml.load(stream, Loader=_C_SAFE_LOADER)
+    return yaml.load(stream, Loader=yaml.SafeLoader)
+
+
+def safe_dump(data: Any, stream: Any = None, *, backend: str | None = None, **options: Any) -> Any:
+    """Dump ``data`` with the repo's default options and the selected backend.
+
+    Returns the YAML text when ``stream`` is None, like ``yaml.safe_dump``.
+    """
+    dump_options = dict(DEFAULT_DUMP_OPTIONS)
+    dump_options.update(options)
+    if yaml_backend(backend) == YAML_BACKEND_LIBYAML:
+        return yaml.dump(data, stream, Dumper=_C_SAFE_DUMPER, **dump_options)
+    return yaml.dump(data, stream, Dumper=_SafeDumper, **dump_options)
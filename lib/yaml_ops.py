@@ -5,6 +5,7 @@ import contextvars
 import hashlib
 import json
 import os
+import re
 import shutil
 import sys
 import threading
@@ -15,7 +16,7 @@ from copy import deepcopy
 from datetime import datetime
 from typing import Any
 
-import yaml
+from . import yaml_codec
 from .config import (
     BACKUP_KEEP_COUNT,
     BOX_EMPTY_WARNING_THRESHOLD,
@@ -28,7 +29,9 @@ from .inventory_paths import (
 )
 from .legacy_field_policy import canonicalize_legacy_document
 from .position_fmt import get_box_numbers, get_total_slots
+from .read_only_views import freeze_document
 from .schema_aliases import (
+    canonical_form_stamp,
     canonicalize_inventory_document,
     expand_document_structural_aliases,
 )
@@ -46,14 +49,67 @@ _preflight_cache: dict = {}
 # Reads serve from cache; writes go to disk AND update cache.
 _write_through_cache: dict = {}
 
+# ── Write transactions (opened by plan_executor during execute) ──────
+# Same key scheme as _preflight_cache.
+# A transaction belongs to the thread that opened it.  For that thread,
+# reads serve the in-memory document, write_yaml only replaces it and audit
+# appends are queued; commit() validates, writes and appends once.  Other
+# threads keep reading the file on disk, and their writes wait on the path's
+# write lock, which the transaction holds until it ends.
+_write_transactions: dict = {}
+_path_write_locks: dict = {}
+_path_write_locks_guard = threading.Lock()
+
+
+def _path_write_lock(cache_key):
+    with _path_write_locks_guard:
+        lock = _path_write_locks.get(cache_key)
+        if lock is None:
+            lock = _path_write_locks[cache_key] = threading.RLock()
+        return lock
+
+
+def _owned_write_transaction(cache_key):
+    """Return the open transaction on ``cache_key`` if this thread owns it."""
+    transaction = _write_transactions.get(cache_key)
+    if transaction is not None and transaction.owner == threading.get_ident():
+        return transaction
+    return None
+
+# ── Meta header cache ────────────────────────────────────────────────
+# Same key scheme as _preflight_cache.
+# value = (st_ino, st_mtime_ns, st_size, meta) of the file as last loaded or
+# written; a stat mismatch forces the header to be re-read.
+_meta_header_cache: dict = {}
+
+# ── Occupancy counters (maintained by disk writes) ───────────────────
+# Same key scheme as _preflight_cache.
+# value = (file stamp after the write, _OccupancyCounters).  Writes that pass
+# an occupancy delta update the counters instead of recounting the inventory.
+_occupancy_counters: dict = {}
+
+# Guards _meta_header_cache and _occupancy_counters, which the local API's
+# request threads read while GUI and agent writes update them.  Counters are
+# only mutated after being popped from the cache under this lock.
+_header_caches_lock = threading.Lock()
+_TOP_LEVEL_INVENTORY_RE = re.compile(r"inventory\s*:")
+
 # Read snapshot cache for batch read cycles.  A caller can wrap a group of
 # read-only tool calls in ``read_snapshot_context(trace_id)``; all threads that
 # enter with the same snapshot id share one loaded YAML document per path.
+# Shared snapshots (``shared=True``) hand every reader the same read-only
+# view of that document instead of a deep copy, and memoize lookup indexes
+# built over it (``read_snapshot_index``).
 _read_snapshot_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "snowfox_read_snapshot_id",
     default=None,
 )
+_read_snapshot_shared: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "snowfox_read_snapshot_shared",
+    default=False,
+)
 _read_snapshot_caches: dict[str, dict[str, Any]] = {}
+_read_snapshot_indexes: dict[str, dict[tuple[int, str], Any]] = {}
 _read_snapshot_lock = threading.Lock()
 
 
@@ -62,14 +118,21 @@ def _yaml_cache_key(path):
 
 
 @contextmanager
-def read_snapshot_context(snapshot_id=None):
-    """Share read-only YAML loads within a batch read cycle."""
+def read_snapshot_context(snapshot_id=None, *, shared=False):
+    """Share read-only YAML loads within a batch read cycle.
+
+    With ``shared=True`` ``load_yaml`` returns one read-only view of the
+    snapshot document (see ``lib.read_only_views``) instead of a deep copy
+    per call; only callers that never mutate loaded data may opt in.
+    """
 
     sid = str(snapshot_id or "").strip() or f"snapshot-{uuid.uuid4().hex}"
     token = _read_snapshot_id.set(sid)
+    shared_token = _read_snapshot_shared.set(bool(shared))
     try:
         yield sid
     finally:
+        _read_snapshot_shared.reset(shared_token)
         _read_snapshot_id.reset(token)
 
 
@@ -81,6 +144,7 @@ def clear_read_snapshot(snapshot_id=None):
         return
     with _read_snapshot_lock:
         _read_snapshot_caches.pop(sid, None)
+        _read_snapshot_indexes.pop(sid, None)
 
 
 def current_read_snapshot_id():
@@ -97,16 +161,48 @@ def _get_read_snapshot(cache_key):
         cache = _read_snapshot_caches.get(sid) or {}
         if cache_key not in cache:
             return None, False
-        return deepcopy(cache[cache_key]), True
+        data = cache[cache_key]
+    if _read_snapshot_shared.get():
+        return data, True
+    return deepcopy(data), True
 
 
 def _put_read_snapshot(cache_key, data):
+    """Remember ``data`` for the active snapshot; return what the caller gets.
+
+    Shared snapshots keep (and return) a read-only view of ``data``; other
+    snapshots keep a private copy and return ``data`` itself.
+    """
     sid = _read_snapshot_id.get()
     if not sid:
-        return
+        return data
+    stored = freeze_document(data) if _read_snapshot_shared.get() else deepcopy(data)
     with _read_snapshot_lock:
         cache = _read_snapshot_caches.setdefault(sid, {})
-        cache[cache_key] = deepcopy(data)
+        # Threads of one snapshot may race to load the same path; keep the first.
+        stored = cache.setdefault(cache_key, stored)
+    return stored if _read_snapshot_shared.get() else data
+
+
+def read_snapshot_index(data, name, build):
+    """Return ``build(data)``, memoized while ``data`` is a shared snapshot.
+
+    Read tools use this for lookup indexes (records by id or box, occupancy
+    counters) so a batch builds each index once over its shared document.
+    Outside a shared snapshot the index is simply built.
+    """
+    sid = _read_snapshot_id.get()
+    if not sid or not _read_snapshot_shared.get():
+        return build(data)
+    with _read_snapshot_lock:
+        documents = (_read_snapshot_caches.get(sid) or {}).values()
+        if not any(document is data for document in documents):
+            return build(data)
+        indexes = _read_snapshot_indexes.setdefault(sid, {})
+        key = (id(data), str(name))
+        if key not in indexes:
+            indexes[key] = build(data)
+        return indexes[key]
 
 _COMMON_CJK_CHARS = set(
     "\u7684\u4e00\u662f\u5728\u4e0d\u4e86\u6709\u548c\u4eba\u8fd9\u4e2d\u5927\u4e0a\u4e2a\u56fd"
@@ -118,6 +214,24 @@ _COMMON_CJK_CHARS = set(
 _MOJIBAKE_SOURCE_ENCODINGS = ("gb18030", "gbk", "cp936")
 _MOJIBAKE_MARKER_CHARS = set("\u95c4\u7039\u951b\u9350\u93b4\u935a\u7ec9\u93bf\u7481\u9286\u93c4\u9225\u7f01\u9428\u5a13\u9359\u5bee\u6fb6\u6d63")
 
+
+def _build_mojibake_scan_chars():
+    # UTF-8 text mis-decoded as GBK always starts each multi-byte run with a
+    # double-byte char whose lead is a 3/4-byte UTF-8 lead (0xE0-0xF4) and whose
+    # trail is a continuation byte (0x80-0xBF).  Strings without any of these
+    # chars cannot be repaired, so the per-string scorer can be skipped.
+    chars = set(_MOJIBAKE_MARKER_CHARS)
+    for lead in range(0xE0, 0xF5):
+        for trail in range(0x80, 0xC0):
+            for enc in _MOJIBAKE_SOURCE_ENCODINGS:
+                with suppress(UnicodeDecodeError):
+                    chars.add(bytes((lead, trail)).decode(enc))
+    return frozenset(chars)
+
+
+_MOJIBAKE_SCAN_CHARS = _build_mojibake_scan_chars()
+_MOJIBAKE_SCAN_RE = re.compile("[" + "".join(re.escape(ch) for ch in sorted(_MOJIBAKE_SCAN_CHARS)) + "]")
+
 _VALIDATION_SCOPES = {"full", "meta_only"}
 
 
@@ -199,7 +313,7 @@ def resolve_instance_id(yaml_path, mode="read"):
             data["meta"] = meta
             with open(yaml_abs, "w", encoding="utf-8") as f:
                 canonical_data, _alias_errors = canonicalize_inventory_document(data)
-                yaml.safe_dump(canonical_data, f, allow_unicode=True, sort_keys=False, width=120)
+                yaml_codec.safe_dump(canonical_data, f)
         
         return instance_id
     
@@ -393,16 +507,111 @@ def _repair_mojibake_text(value: str) -> str:
     return best
 
 
-def _repair_mojibake_values(node: Any) -> Any:
+def _repair_suspect_mojibake_values(node: Any, stats: dict) -> Any:
+    """Repair only strings that contain a mojibake scan char, in place."""
     if isinstance(node, dict):
-        return {key: _repair_mojibake_values(value) for key, value in node.items()}
+        for key, value in node.items():
+            node[key] = _repair_suspect_mojibake_values(value, stats)
+        return node
     if isinstance(node, list):
-        return [_repair_mojibake_values(value) for value in node]
-    if isinstance(node, str):
-        return _repair_mojibake_text(node)
+        for index, value in enumerate(node):
+            node[index] = _repair_suspect_mojibake_values(value, stats)
+        return node
+    if isinstance(node, str) and _MOJIBAKE_SCAN_RE.search(node) is not None:
+        stats["suspect_strings"] += 1
+        repaired = _repair_mojibake_text(node)
+        if repaired != node:
+            stats["repaired_strings"] += 1
+        return repaired
     return node
 
 
+def _load_yaml_document(abs_path: str) -> tuple[Any, dict]:
+    """Parse one YAML file, repairing mojibake only when the raw text needs it.
+
+    A single regex pass over the raw text decides whether the document can
+    contain mojibake at all; clean documents skip the per-string repair walk.
+    Returns the parsed data plus the scan decision for diagnostics.
+    """
+    data, stats, _stamp = _read_yaml_document(abs_path)
+    return data, stats
+
+
+def _read_yaml_document(abs_path):
+    """``_load_yaml_document`` plus the stamp of the file that was read."""
+    with open(abs_path, "r", encoding="utf-8") as f:
+        file_stat = os.fstat(f.fileno())
+        raw_text = f.read()
+    data = yaml_codec.safe_load(raw_text)
+    stats = {"mojibake_scan": "clean", "suspect_strings": 0, "repaired_strings": 0}
+    if _MOJIBAKE_SCAN_RE.search(raw_text) is not None:
+        stats["mojibake_scan"] = "suspect"
+        data = _repair_suspect_mojibake_values(data, stats)
+    _remember_meta_header(abs_path, file_stat, data)
+    return data, stats, _file_stamp(file_stat)
+
+
+def _file_stamp(file_stat):
+    return (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _remember_meta_header(abs_path, file_stat, data):
+    meta = data.get("meta") if isinstance(data, dict) else None
+    cache_key = os.path.normcase(os.path.normpath(abs_path))
+    entry = (*_file_stamp(file_stat), deepcopy(meta) if isinstance(meta, dict) else {})
+    with _header_caches_lock:
+        _meta_header_cache[cache_key] = entry
+    return entry
+
+
+def _read_meta_header(abs_path):
+    """Return a copy of the ``meta`` mapping of the YAML file on disk.
+
+    Served from the header cache while the file is unchanged since it was
+    last loaded or written.  Otherwise only the text before the top-level
+    ``inventory:`` key is parsed; files that do not put ``meta`` first fall
+    back to a full parse.
+    """
+    cache_key = os.path.normcase(os.path.normpath(abs_path))
+    with _header_caches_lock:
+        cached = _meta_header_cache.get(cache_key)
+    if cached is not None and cached[:3] == _file_stamp(os.stat(abs_path)):
+        return deepcopy(cached[3])
+
+    header_lines = []
+    with open(abs_path, "r", encoding="utf-8") as f:
+        file_stat = os.fstat(f.fileno())
+        for line in f:
+            if _TOP_LEVEL_INVENTORY_RE.match(line):
+                break
+            header_lines.append(line)
+    header = yaml_codec.safe_load("".join(header_lines))
+    if not isinstance(header, dict) or not isinstance(header.get("meta"), dict):
+        data, _scan = _load_yaml_document(abs_path)
+        meta = data.get("meta") if isinstance(data, dict) else None
+        return deepcopy(meta) if isinstance(meta, dict) else {}
+    return deepcopy(_remember_meta_header(abs_path, file_stat, header)[3])
+
+
+def _read_instance_id_header(abs_path):
+    """Return ``meta.inventory_instance_id`` of the YAML file on disk."""
+    return _read_meta_header(abs_path).get("inventory_instance_id")
+
+
+@contextmanager
+def _write_stage(stage, yaml_abs):
+    """Report one write-pipeline stage as a ``yaml.write.stage`` span."""
+    try:
+        from .diagnostics import span
+    except Exception:
+        span = None
+    if span is None:
+        yield {}
+        return
+    with span("yaml.write.stage", yaml_path=yaml_abs, stage=stage) as span_fields:
+        yield span_fields
+
+
 def load_yaml(path=YAML_PATH):
     """Load YAML file and return data."""
     abs_path = _abs_path(path)
@@ -416,6 +625,15 @@ def load_yaml(path=YAML_PATH):
         except Exception:
             pass
         return deepcopy(_preflight_cache[cache_key])
+    transaction = _owned_write_transaction(cache_key)
+    if transaction is not None:
+        try:
+            from .diagnostics import log_event
+
+            log_event("yaml.load", yaml_path=abs_path, source="write_transaction")
+        except Exception:
+            pass
+        return deepcopy(transaction.data)
     if cache_key in _write_through_cache:
         try:
             from .diagnostics import log_event
@@ -441,28 +659,21 @@ def load_yaml(path=YAML_PATH):
         span = None
 
     if span is None:
-        with open(abs_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        data = _repair_mojibake_values(data)
+        data, _scan = _load_yaml_document(abs_path)
         data = expand_document_structural_aliases(data)
-        _put_read_snapshot(cache_key, data)
-        return data
+        return _put_read_snapshot(cache_key, data)
 
-    with span("yaml.load", yaml_path=abs_path, source="disk"):
-        with open(abs_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        data = _repair_mojibake_values(data)
+    with span("yaml.load", yaml_path=abs_path, source="disk", yaml_backend=yaml_codec.yaml_backend()) as span_fields:
+        data, scan = _load_yaml_document(abs_path)
+        span_fields.update(scan)
         data = expand_document_structural_aliases(data)
-    _put_read_snapshot(cache_key, data)
-    return data
+    return _put_read_snapshot(cache_key, data)
 
 
 def load_yaml_raw(path=YAML_PATH):
     """Load one YAML file without expanding runtime alias views."""
-    abs_path = _abs_path(path)
-    with open(abs_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    return _repair_mojibake_values(data)
+    data, _scan = _load_yaml_document(_abs_path(path))
+    return data
 
 
 def inspect_runtime_dataset_migration(path=YAML_PATH):
@@ -748,6 +959,22 @@ def get_audit_log_path(yaml_path=YAML_PATH):
     return get_instance_audit_path(managed_yaml)
 
 
+def dataset_version(yaml_path=YAML_PATH):
+    """Return a cheap change key for an inventory without reading it.
+
+    Combines the YAML file stamp with the audit log's size and mtime; every
+    committed write rewrites the YAML and appends an event (advancing
+    ``audit_seq``), so the key changes whenever the dataset does.
+    """
+    stamps = []
+    for path in (_abs_path(yaml_path), get_audit_log_path(yaml_path)):
+        try:
+            stamps.append(_file_stamp(os.stat(path)))
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
 def get_audit_log_paths(yaml_path=YAML_PATH):
     """Return canonical audit log path list for the active schema."""
     return [get_audit_log_path(yaml_path)]
@@ -841,6 +1068,89 @@ def iter_audit_events_reverse(yaml_path=YAML_PATH):
         yield event
 
 
+def _audit_line_seq(raw_line):
+    try:
+        row = json.loads(raw_line)
+    except Exception:
+        return None
+    if not isinstance(row, dict):
+        return None
+    return coerce_audit_seq(row.get("audit_seq"))
+
+
+def _next_line_start(handle, offset):
+    if offset <= 0:
+        return 0
+    handle.seek(offset - 1)
+    handle.readline()
+    return handle.tell()
+
+
+def _first_seq_from(handle, line_start):
+    handle.seek(line_start)
+    for raw_line in iter(handle.readline, b""):
+        seq = _audit_line_seq(raw_line)
+        if seq is not None:
+            return seq
+    return None
+
+
+def _audit_offset_after_seq(handle, size, after_seq):
+    """Return the byte offset of the first line whose audit_seq exceeds ``after_seq``.
+
+    Sequences grow in append order, so the offset is found by bisecting the
+    file on line boundaries instead of scanning it.
+    """
+    lo, hi = 0, int(size)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        seq = _first_seq_from(handle, _next_line_start(handle, mid))
+        if seq is None or seq > after_seq:
+            hi = mid
+        else:
+            lo = mid + 1
+    return _next_line_start(handle, lo)
+
+
+def iter_audit_events_after(yaml_path=YAML_PATH, after_seq=0):
+    """Yield audit events with ``audit_seq`` greater than ``after_seq``, oldest first.
+
+    Only the tail of the log past ``after_seq`` is read, so incremental
+    readers pay for the events they consume rather than the whole log.
+    """
+    yaml_abs = _abs_path(yaml_path)
+    yaml_abs = assert_allowed_inventory_yaml_path(yaml_abs)
+    path = get_audit_log_path(yaml_abs)
+    if not os.path.exists(path):
+        return
+
+    with open(path, "rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        size = handle.tell()
+        handle.seek(_audit_offset_after_seq(handle, size, int(after_seq or 0)))
+        for raw_line in iter(handle.readline, b""):
+            text = raw_line.strip()
+            if not text:
+                continue
+            try:
+                event = json.loads(text.decode("utf-8", errors="replace"))
+            except Exception:
+                continue
+            if not isinstance(event, dict):
+                continue
+            seq = coerce_audit_seq(event.get("audit_seq"))
+            if seq is None or seq <= after_seq:
+                continue
+            event_yaml = event.get("yaml_path")
+            if isinstance(event_yaml, str) and event_yaml.strip():
+                try:
+                    if _abs_path(event_yaml) != yaml_abs:
+                        continue
+                except Exception:
+                    continue
+            yield event
+
+
 def compute_occupancy(records):
     """
     Compute occupied positions from inventory records.
@@ -864,21 +1174,92 @@ def compute_occupancy(records):
     return {k: sorted(v) for k, v in sorted(occupied.items(), key=lambda x: int(x[0]))}
 
 
-def collect_inventory_stats(data):
-    """Collect compact occupancy stats for warnings/audit."""
-    records = (data or {}).get("inventory", []) if isinstance(data, dict) else []
-    layout = (data or {}).get("meta", {}).get("box_layout", {})
+def _occupancy_slot(record):
+    if not isinstance(record, dict):
+        return None
+    box = record.get("box")
+    position = record.get("position")
+    if box is None or position is None:
+        return None
+    return str(box), int(position)
+
+
+def _normalize_occupancy_delta(delta):
+    """Turn ``(before_record, after_record)`` pairs into slot changes.
+
+    ``None`` on either side means the record is created or dropped.  Returns
+    ``None`` (recount) when ``delta`` is ``None``.
+    """
+    if delta is None:
+        return None
+    changes = []
+    for before, after in delta:
+        record_change = (before is None) - (after is None)
+        changes.append((_occupancy_slot(before), _occupancy_slot(after), record_change))
+    return changes
+
+
+class _OccupancyCounters:
+    """Per-box occupied positions of one inventory, kept up to date by deltas."""
+
+    __slots__ = ("boxes", "record_count")
+
+    def __init__(self):
+        # box key -> {position: number of records holding it}
+        self.boxes = {}
+        self.record_count = 0
+
+    @classmethod
+    def from_records(cls, records):
+        counters = cls()
+        for rec in records:
+            counters.record_count += 1
+            counters._add(_occupancy_slot(rec))
+        return counters
+
+    def _add(self, slot):
+        if slot is None:
+            return
+        positions = self.boxes.setdefault(slot[0], {})
+        positions[slot[1]] = positions.get(slot[1], 0) + 1
+
+    def _remove(self, slot):
+        positions = self.boxes.get(slot[0]) or {}
+        held = positions.get(slot[1], 0)
+        if held <= 0:
+            return False
+        if held == 1:
+            del positions[slot[1]]
+        else:
+            positions[slot[1]] = held - 1
+        return True
+
+    def apply(self, changes):
+        """Apply normalized slot changes; returns False when they do not fit."""
+        for before_slot, after_slot, record_change in changes:
+            self.record_count += record_change
+            if before_slot == after_slot:
+                continue
+            if before_slot is not None and not self._remove(before_slot):
+                return False
+            self._add(after_slot)
+        return self.record_count >= 0
+
+    def occupied_by_box(self):
+        return {box: len(positions) for box, positions in self.boxes.items()}
+
+
+def _occupancy_stats(layout, record_count, occupied_by_box):
     per_box_total = get_total_slots(layout)
     box_numbers = get_box_numbers(layout)
     total_slots = per_box_total * len(box_numbers)
 
-    occupancy = compute_occupancy(records)
     boxes = {}
     total_occupied = 0
 
     for box_num in box_numbers:
         key = str(box_num)
-        occupied = len(occupancy.get(key, []))
+        occupied = occupied_by_box.get(key, 0)
         empty = max(per_box_total - occupied, 0)
         boxes[key] = {"occupied": occupied, "empty": empty, "total": per_box_total}
         total_occupied += occupied
@@ -886,7 +1267,7 @@ def collect_inventory_stats(data):
     total_empty = max(total_slots - total_occupied, 0)
 
     return {
-        "record_count": len(records),
+        "record_count": record_count,
         "total_slots": total_slots,
         "total_occupied": total_occupied,
         "total_empty": total_empty,
@@ -894,13 +1275,90 @@ def collect_inventory_stats(data):
     }
 
 
+def collect_inventory_stats(data):
+    """Collect compact occupancy stats for warnings/audit."""
+    records = (data or {}).get("inventory", []) if isinstance(data, dict) else []
+    layout = (data or {}).get("meta", {}).get("box_layout", {})
+    occupancy = compute_occupancy(records)
+    return _occupancy_stats(
+        layout,
+        len(records),
+        {box: len(positions) for box, positions in occupancy.items()},
+    )
+
+
+def _snapshot_occupancy_counters(data):
+    records = data.get("inventory") if isinstance(data, dict) else None
+    return _OccupancyCounters.from_records(records if isinstance(records, list) else [])
+
+
+def inventory_summary(path=YAML_PATH):
+    """Return ``collect_inventory_stats``-shaped occupancy stats for ``path``.
+
+    Uses the per-box counters maintained by the last write while the file is
+    unchanged, so only the meta header is read; otherwise the inventory is
+    loaded and counted once and the counters are kept for later calls.
+    Inside a read snapshot the snapshot's document is counted instead, so the
+    summary agrees with the other reads of the same batch.
+    Results also carry ``slots_per_box``, ``box_count`` and ``meta``.
+    """
+    yaml_abs = _abs_path(path)
+    cache_key = os.path.normcase(os.path.normpath(yaml_abs))
+    in_memory = cache_key in _preflight_cache or _owned_write_transaction(cache_key) is not None
+    in_snapshot = _read_snapshot_id.get() is not None
+    counted = None
+    if not (in_memory or in_snapshot):
+        current_stamp = _file_stamp(os.stat(yaml_abs))
+        with _header_caches_lock:
+            entry = _occupancy_counters.get(cache_key)
+            if entry is not None and entry[0] == current_stamp:
+                # Read under the lock: a writer pops counters before mutating them.
+                counted = (entry[1].record_count, entry[1].occupied_by_box())
+    if counted is not None:
+        meta = _read_meta_header(yaml_abs)
+        source = "counters"
+    else:
+        if in_memory or in_snapshot:
+            data = load_yaml(yaml_abs)
+            counters = read_snapshot_index(data, "occupancy_counters", _snapshot_occupancy_counters)
+            source = "memory" if in_memory else "read_snapshot"
+        else:
+            data, _scan, stamp = _read_yaml_document(yaml_abs)
+            counters = _snapshot_occupancy_counters(data)
+            with _header_caches_lock:
+                _occupancy_counters[cache_key] = (stamp, counters)
+            source = "scan"
+        meta = data.get("meta") if isinstance(data, dict) else None
+        meta = deepcopy(meta) if isinstance(meta, dict) else {}
+        counted = (counters.record_count, counters.occupied_by_box())
+
+    layout = meta.get("box_layout") or {}
+    stats = _occupancy_stats(layout, *counted)
+    stats["slots_per_box"] = get_total_slots(layout)
+    stats["box_count"] = len(stats["boxes"])
+    stats["meta"] = meta
+    try:
+        from .diagnostics import log_event
+
+        log_event("yaml.inventory_summary", yaml_path=yaml_abs, source=source)
+    except Exception:
+        pass
+    return stats
+
+
 def get_capacity_warnings(
     data,
     total_empty_threshold=TOTAL_EMPTY_WARNING_THRESHOLD,
     box_empty_threshold=BOX_EMPTY_WARNING_THRESHOLD,
+    stats=None,
 ):
-    """Return capacity warning messages based on thresholds."""
-    stats = collect_inventory_stats(data)
+    """Return capacity warning messages based on thresholds.
+
+    ``stats`` may carry precomputed ``collect_inventory_stats`` output (for
+    example from maintained occupancy counters) to skip the inventory scan.
+    """
+    if stats is None:
+        stats = collect_inventory_stats(data)
     warnings = []
 
     total_empty = stats["total_empty"]
@@ -923,25 +1381,31 @@ def emit_capacity_warnings(
     data,
     total_empty_threshold=TOTAL_EMPTY_WARNING_THRESHOLD,
     box_empty_threshold=BOX_EMPTY_WARNING_THRESHOLD,
+    stats=None,
 ):
     """Print capacity warnings and return warning strings."""
     warnings = get_capacity_warnings(
         data,
         total_empty_threshold=total_empty_threshold,
         box_empty_threshold=box_empty_threshold,
+        stats=stats,
     )
     for msg in warnings:
         print(f"[WARN] {msg}")
     return warnings
 
 
-def get_yaml_size_warning(path=YAML_PATH, warn_mb=YAML_SIZE_WARNING_MB):
-    """Return file-size warning message if YAML grows too large."""
+def get_yaml_size_warning(path=YAML_PATH, warn_mb=YAML_SIZE_WARNING_MB, size_bytes=None):
+    """Return file-size warning message if YAML grows too large.
+
+    Pass ``size_bytes`` when the caller already knows the file size.
+    """
     yaml_abs = _abs_path(path)
-    if not os.path.exists(yaml_abs):
-        return None
+    if size_bytes is None:
+        if not os.path.exists(yaml_abs):
+            return None
+        size_bytes = os.path.getsize(yaml_abs)
 
-    size_bytes = os.path.getsize(yaml_abs)
     size_mb = size_bytes / (1024 * 1024)
     threshold = float(warn_mb)
 
@@ -954,9 +1418,9 @@ def get_yaml_size_warning(path=YAML_PATH, warn_mb=YAML_SIZE_WARNING_MB):
     )
 
 
-def emit_yaml_size_warning(path=YAML_PATH, warn_mb=YAML_SIZE_WARNING_MB):
+def emit_yaml_size_warning(path=YAML_PATH, warn_mb=YAML_SIZE_WARNING_MB, size_bytes=None):
     """Print file-size warning and return warning string or None."""
-    warning = get_yaml_size_warning(path=path, warn_mb=warn_mb)
+    warning = get_yaml_size_warning(path=path, warn_mb=warn_mb, size_bytes=size_bytes)
     if warning:
         print(f"⚠️  {warning}")
     return warning
@@ -1022,17 +1486,83 @@ def _next_audit_seq(log_path):
     return _next_audit_seq_full_scan(log_path)
 
 
+# Long-poll readers (the local Open API change feed) wait on this condition so
+# they wake as soon as this process appends an audit event.  The generation
+# counter closes the gap between "checked the log" and "started waiting".
+_audit_append_condition = threading.Condition()
+_audit_append_generation = 0
+
+
+def audit_append_generation():
+    """Return a counter that increases on every in-process audit append."""
+    with _audit_append_condition:
+        return _audit_append_generation
+
+
+def wait_for_audit_append(generation, timeout):
+    """Wait until an audit event is appended after ``generation`` was read.
+
+    Returns True when a newer append happened, False on timeout.  Appends from
+    other processes are not observed; callers should poll with a short timeout.
+    """
+    with _audit_append_condition:
+        return _audit_append_condition.wait_for(
+            lambda: _audit_append_generation != generation,
+            timeout=max(0.0, float(timeout or 0)),
+        )
+
+
+def _notify_audit_append():
+    global _audit_append_generation
+    with _audit_append_condition:
+        _audit_append_generation += 1
+        _audit_append_condition.notify_all()
+
+
 def _append_audit_event(yaml_path, event):
+    transaction = _owned_write_transaction(_yaml_cache_key(yaml_path))
+    if transaction is not None:
+        transaction.entries.append(dict(event or {}))
+        return _audit_log_path(yaml_path)
+    return _append_audit_events(yaml_path, [event])
+
+
+# Serializes seq allocation and the append so concurrent writers in this
+# process never interleave or reuse audit_seq values.
+_audit_write_lock = threading.Lock()
+
+
+def _append_audit_events(yaml_path, events, fsync=False):
+    """Append events with one open/write, numbering those without ``audit_seq``.
+
+    Events lacking a sequence get a contiguous range allocated from a single
+    tail scan of the log.
+    """
+    events = list(events or [])
     log_path = _audit_log_path(yaml_path)
+    if not events:
+        return log_path
     os.makedirs(os.path.dirname(log_path), exist_ok=True)
-    payload = dict(event or {})
-    seq = coerce_audit_seq(payload.get("audit_seq"))
-    if seq is None:
-        seq = _next_audit_seq(log_path)
-    payload["audit_seq"] = seq
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(payload, ensure_ascii=False, sort_keys=True))
-        f.write("\n")
+    with _audit_write_lock:
+        lines = []
+        next_seq = None
+        for event in events:
+            payload = dict(event or {})
+            seq = coerce_audit_seq(payload.get("audit_seq"))
+            if seq is None:
+                if next_seq is None:
+                    next_seq = _next_audit_seq(log_path)
+                seq = next_seq
+            next_seq = seq + 1
+            payload["audit_seq"] = seq
+            lines.append(json.dumps(payload, ensure_ascii=False, sort_keys=True))
+            lines.append("\n")
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    _notify_audit_append()
     return log_path
 
 
@@ -1101,6 +1631,32 @@ def append_audit_event(
     return _append_audit_event(yaml_path, event)
 
 
+def append_audit_events(yaml_path, entries, fsync=False):
+    """Append several audit events in one batch and return the audit log path.
+
+    ``entries`` are dicts of ``append_audit_event`` keyword arguments
+    (``before_data``, ``after_data``, ``backup_path``, ``warnings``,
+    ``audit_meta``).  The events get a contiguous ``audit_seq`` range and are
+    written with a single open/write; ``fsync=True`` also flushes them to disk.
+    """
+    events = [
+        _build_audit_event(
+            yaml_path=yaml_path,
+            before_data=entry.get("before_data"),
+            after_data=entry.get("after_data"),
+            backup_path=entry.get("backup_path"),
+            warnings=entry.get("warnings"),
+            audit_meta=entry.get("audit_meta"),
+        )
+        for entry in (entries or [])
+    ]
+    transaction = _owned_write_transaction(_yaml_cache_key(yaml_path))
+    if transaction is not None:
+        transaction.entries.extend(events)
+        return _audit_log_path(yaml_path)
+    return _append_audit_events(yaml_path, events, fsync=fsync)
+
+
 def append_backup_event(
     yaml_path,
     backup_path,
@@ -1144,6 +1700,8 @@ def write_yaml(
     backup_path=None,
     audit_meta=None,
     validation_scope="full",
+    extra_audit_metas=None,
+    occupancy_delta=None,
 ):
     """Write data to YAML file.
 
@@ -1160,15 +1718,25 @@ def write_yaml(
         validation_scope: ``"full"`` (default) validates full record invariants;
             ``"meta_only"`` validates metadata/schema and undeclared-field
             constraints while skipping per-record value checks.
+        extra_audit_metas: Optional further audit metas (e.g. one per batch
+            item) appended after the write's own event in the same batch.
+        occupancy_delta: Optional ``(before_record, after_record)`` pairs for
+            every record whose box/position changed (``None`` for a created
+            or dropped side; an empty iterable when no slot changed).  Lets
+            the maintained per-box counters update instead of recounting the
+            inventory for capacity warnings.
     """
     yaml_abs = assert_allowed_inventory_yaml_path(_abs_path(path))
-    canonical_data, alias_errors = canonicalize_inventory_document(data)
+    occupancy_changes = _normalize_occupancy_delta(occupancy_delta)
+    with _write_stage("canonicalize_aliases", yaml_abs):
+        canonical_data, alias_errors = canonicalize_inventory_document(data)
     if alias_errors:
         raise ValueError(
             format_validation_errors(alias_errors, prefix="Integrity validation failed")
         )
     data = canonical_data
-    legacy_result = canonicalize_legacy_document(data)
+    with _write_stage("canonicalize_legacy", yaml_abs):
+        legacy_result = canonicalize_legacy_document(data)
     if not legacy_result.get("ok"):
         raise ValueError(str(legacy_result.get("message") or "Failed to canonicalize legacy fields"))
     data = legacy_result.get("data")
@@ -1190,18 +1758,116 @@ def write_yaml(
         except Exception:
             pass
         return None
-    _ensure_inventory_integrity(
-        data,
-        prefix="Integrity validation failed",
-        validation_scope=validation_scope,
-    )
+
+    transaction = _owned_write_transaction(cache_key)
+    if transaction is not None:
+        return transaction.stage_write(
+            data,
+            backup_path=backup_path,
+            audit_meta=audit_meta,
+            validation_scope=validation_scope,
+            extra_audit_metas=extra_audit_metas,
+            occupancy_changes=occupancy_changes,
+        )
+
+    # Waits while another thread holds a write transaction on this path.
+    with _path_write_lock(cache_key):
+        data, before_data, effective_backup_path, guard_info, warnings = _write_yaml_to_disk(
+            data,
+            yaml_abs,
+            auto_backup=auto_backup,
+            backup_path=backup_path,
+            validation_scope=validation_scope,
+            occupancy_changes=occupancy_changes,
+        )
+
+        audit_entries = [
+            {
+                "before_data": before_data,
+                "after_data": data,
+                "warnings": warnings,
+                "audit_meta": _with_instance_guard_details(audit_meta, guard_info),
+            }
+        ]
+        audit_entries.extend(
+            {"before_data": before_data, "after_data": data, "warnings": [], "audit_meta": meta}
+            for meta in (extra_audit_metas or [])
+        )
+        try:
+            append_audit_events(yaml_abs, audit_entries)
+        except Exception as exc:
+            print(f"warning: failed to append audit log: {exc}", file=sys.stderr)
+
+    return effective_backup_path
+
+
+def _with_instance_guard_details(audit_meta, guard_info):
+    effective_audit_meta = dict(audit_meta or {})
+    if guard_info.get("decision") in {"forked_copy", "adopted_rename"}:
+        details = dict(effective_audit_meta.get("details") or {})
+        details.update(
+            {
+                "instance_guard_decision": guard_info.get("decision"),
+                "instance_guard_old_id": guard_info.get("old_instance_id"),
+                "instance_guard_new_id": guard_info.get("new_instance_id"),
+                "instance_guard_origin_path_before": guard_info.get("origin_before"),
+                "instance_guard_origin_path_after": guard_info.get("origin_after"),
+            }
+        )
+        effective_audit_meta["details"] = details
+    return effective_audit_meta
+
+
+def _next_occupancy_counters(cache_key, yaml_abs, data, occupancy_changes):
+    """Counters for ``data``: the previous write's counters plus the changes.
+
+    The previous counters are only trusted while the file on disk is the one
+    they were stamped with; otherwise (or without changes) the inventory is
+    recounted.
+    """
+    with _header_caches_lock:
+        entry = _occupancy_counters.pop(cache_key, None)
+    if entry is not None and occupancy_changes is not None:
+        stamp, counters = entry
+        try:
+            current_stamp = _file_stamp(os.stat(yaml_abs))
+        except OSError:
+            current_stamp = None
+        if stamp == current_stamp and counters.apply(occupancy_changes):
+            return counters, "delta"
+    records = data.get("inventory") if isinstance(data, dict) else None
+    return _OccupancyCounters.from_records(records if isinstance(records, list) else []), "recount"
+
+
+def _write_yaml_to_disk(data, yaml_abs, *, auto_backup, backup_path, validation_scope, occupancy_changes=None):
+    """Validate, guard, back up and serialize canonical ``data`` to ``yaml_abs``.
+
+    ``data`` must already have passed alias and legacy canonicalization; it is
+    stamped canonical so validation does not copy and canonicalize it again.
+
+    Capacity and size warnings come from the maintained occupancy counters
+    (see ``write_yaml``'s ``occupancy_delta``) and the stat of the new file.
+
+    Returns ``(data, before_data, backup_path, guard_info, warnings)``; the
+    caller is responsible for the audit event.  ``before_data`` only carries
+    the previous file's ``meta.inventory_instance_id`` (``None`` for new files),
+    read from the meta header cache rather than a full re-parse.
+    """
+    cache_key = os.path.normcase(os.path.normpath(yaml_abs))
+    with _write_stage("validate", yaml_abs), canonical_form_stamp(data):
+        _ensure_inventory_integrity(
+            data,
+            prefix="Integrity validation failed",
+            validation_scope=validation_scope,
+        )
 
     existing_instance_id = None
     before_data = None
     if os.path.exists(yaml_abs):
         try:
-            before_data = load_yaml(yaml_abs)
-            existing_instance_id = (before_data or {}).get("meta", {}).get("inventory_instance_id")
+            with _write_stage("instance_header", yaml_abs):
+                existing_instance_id = _read_instance_id_header(yaml_abs)
+            before_data = {"meta": {"inventory_instance_id": existing_instance_id}}
         except Exception as exc:
             print(f"warning: failed to load existing YAML before write: {exc}", file=sys.stderr)
 
@@ -1220,16 +1886,20 @@ def write_yaml(
     data["meta"] = meta
     instance_id = str(meta.get("inventory_instance_id") or "").strip()
 
+    with _write_stage("occupancy", yaml_abs) as stage_fields:
+        counters, stage_fields["mode"] = _next_occupancy_counters(cache_key, yaml_abs, data, occupancy_changes)
+
     effective_backup_path = None
     raw_backup = str(backup_path or "").strip()
     if raw_backup:
         effective_backup_path = _abs_path(raw_backup)
     elif auto_backup:
         try:
-            effective_backup_path = create_yaml_backup(
-                yaml_abs,
-                instance_id_override=instance_id,
-            )
+            with _write_stage("backup", yaml_abs):
+                effective_backup_path = create_yaml_backup(
+                    yaml_abs,
+                    instance_id_override=instance_id,
+                )
             if effective_backup_path:
                 print(f"backup created: {effective_backup_path}")
         except Exception as exc:
@@ -1242,7 +1912,9 @@ def write_yaml(
 
     if span is None:
         with open(yaml_abs, "w", encoding="utf-8") as f:
-            yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False, width=120)
+            yaml_codec.safe_dump(data, f)
+            f.flush()
+            file_stat = os.fstat(f.fileno())
     else:
         with span(
             "yaml.write",
@@ -1250,47 +1922,181 @@ def write_yaml(
             source="disk",
             auto_backup=bool(auto_backup),
             validation_scope=validation_scope,
+            yaml_backend=yaml_codec.yaml_backend(),
         ):
             with open(yaml_abs, "w", encoding="utf-8") as f:
-                yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False, width=120)
+                yaml_codec.safe_dump(data, f)
+                f.flush()
+                file_stat = os.fstat(f.fileno())
+    _remember_meta_header(yaml_abs, file_stat, data)
 
     # Update write-through cache if active
     if cache_key in _write_through_cache:
         _write_through_cache[cache_key] = deepcopy(data)
 
+    with _header_caches_lock:
+        _occupancy_counters[cache_key] = (_file_stamp(file_stat), counters)
+    stats = _occupancy_stats(meta.get("box_layout") or {}, counters.record_count, counters.occupied_by_box())
+
     warnings = []
-    warnings.extend(emit_capacity_warnings(data))
-    size_warning = emit_yaml_size_warning(path=yaml_abs)
+    warnings.extend(emit_capacity_warnings(data, stats=stats))
+    size_warning = emit_yaml_size_warning(path=yaml_abs, size_bytes=file_stat.st_size)
     if size_warning:
         warnings.append(size_warning)
-
-    effective_audit_meta = dict(audit_meta or {})
-    if guard_info.get("decision") in {"forked_copy", "adopted_rename"}:
-        details = dict(effective_audit_meta.get("details") or {})
-        details.update(
-            {
-                "instance_guard_decision": guard_info.get("decision"),
-                "instance_guard_old_id": guard_info.get("old_instance_id"),
-                "instance_guard_new_id": guard_info.get("new_instance_id"),
-                "instance_guard_origin_path_before": guard_info.get("origin_before"),
-                "instance_guard_origin_path_after": guard_info.get("origin_after"),
-            }
+    return data, before_data, effective_backup_path, guard_info, warnings
+
+
+class _WriteTransaction:
+    """In-memory document and queued audit events for one ``write_transaction``."""
+
+    def __init__(self, yaml_abs, cache_key, data):
+        self.yaml_abs = yaml_abs
+        self.cache_key = cache_key
+        self.data = data
+        self.owner = threading.get_ident()
+        # Audit events in append order; staged writes are tracked by index so
+        # commit can attach warnings and instance-guard details to them, and
+        # drop them (keeping failure rows) when the write itself fails.
+        self.entries = []
+        self.write_indexes = []
+        self.staged_indexes = set()
+        self.backup_path = None
+        self.validation_scope = "meta_only"
+        # Slot changes of every staged write, or None once any write recounts.
+        self.occupancy_changes = []
+
+    def stage_write(
+        self,
+        data,
+        *,
+        backup_path,
+        audit_meta,
+        validation_scope,
+        extra_audit_metas=None,
+        occupancy_changes=None,
+    ):
+        before_data = self.data
+        self.data = deepcopy(data)
+        if validation_scope != "meta_only":
+            self.validation_scope = "full"
+        if occupancy_changes is None:
+            self.occupancy_changes = None
+        elif self.occupancy_changes is not None:
+            self.occupancy_changes.extend(occupancy_changes)
+        raw_backup = str(backup_path or "").strip()
+        if raw_backup and not self.backup_path:
+            self.backup_path = _abs_path(raw_backup)
+        self.write_indexes.append(len(self.entries))
+        self.staged_indexes.add(len(self.entries))
+        self.entries.append(
+            _build_audit_event(
+                yaml_path=self.yaml_abs,
+                before_data=before_data,
+                after_data=self.data,
+                backup_path=None,
+                warnings=[],
+                audit_meta=audit_meta,
+            )
         )
-        effective_audit_meta["details"] = details
+        for meta in extra_audit_metas or []:
+            self.staged_indexes.add(len(self.entries))
+            self.entries.append(
+                _build_audit_event(
+                    yaml_path=self.yaml_abs,
+                    before_data=before_data,
+                    after_data=self.data,
+                    backup_path=None,
+                    warnings=[],
+                    audit_meta=meta,
+                )
+            )
+        return _abs_path(raw_backup) if raw_backup else None
+
+    def commit(self):
+        """Write the document once and append all queued audit events.
+
+        Staged writes are not validated one by one: only the final document
+        is validated, with full scope when any staged write asked for it.  An
+        intermediate state that would have been rejected on its own is
+        therefore accepted when later writes in the same transaction repair
+        it, and one invalid final document rejects the whole batch.
+
+        Returns the backup path used for the write (``None`` when nothing was
+        staged).  Raises when validation or the disk write fails; in that case
+        the document is not written and the audit events of staged writes are
+        discarded, but queued events that record no write (failed or blocked
+        operations) are still appended.
+        """
+        if _write_transactions.get(self.cache_key) is self:
+            _write_transactions.pop(self.cache_key, None)
+        if not self.write_indexes:
+            if self.entries:
+                _append_audit_events(self.yaml_abs, self.entries)
+            return None
 
-    try:
-        append_audit_event(
-            yaml_path=yaml_abs,
-            before_data=before_data,
-            after_data=data,
-            backup_path=None,
-            warnings=warnings,
-            audit_meta=effective_audit_meta,
-        )
-    except Exception as exc:
-        print(f"warning: failed to append audit log: {exc}", file=sys.stderr)
+        try:
+            data, _before, backup_path, guard_info, warnings = _write_yaml_to_disk(
+                self.data,
+                self.yaml_abs,
+                auto_backup=not self.backup_path,
+                backup_path=self.backup_path,
+                validation_scope=self.validation_scope,
+                occupancy_changes=self.occupancy_changes,
+            )
+        except Exception:
+            unstaged = [
+                event for index, event in enumerate(self.entries) if index not in self.staged_indexes
+            ]
+            if unstaged:
+                try:
+                    _append_audit_events(self.yaml_abs, unstaged)
+                except Exception as exc:
+                    print(f"warning: failed to append audit log: {exc}", file=sys.stderr)
+            raise
+        instance_id = (data.get("meta") or {}).get("inventory_instance_id")
+        for order, index in enumerate(self.write_indexes):
+            event = self.entries[index]
+            event["warnings"] = list(warnings)
+            if instance_id:
+                event["inventory_instance_id"] = instance_id
+            if order == 0:
+                event["details"] = _with_instance_guard_details(
+                    {"details": event.get("details")}, guard_info
+                ).get("details")
+        try:
+            _append_audit_events(self.yaml_abs, self.entries)
+        except Exception as exc:
+            print(f"warning: failed to append audit log: {exc}", file=sys.stderr)
+        return backup_path
 
-    return effective_backup_path
+
+@contextmanager
+def write_transaction(path=YAML_PATH):
+    """Batch every ``write_yaml`` to ``path`` inside the block into one write.
+
+    The transaction is scoped to the calling thread: loads on this thread
+    inside the block see staged writes, while other threads read the file on
+    disk and block in ``write_yaml`` (or when opening their own transaction)
+    until the block ends.  Call ``commit()`` on the yielded transaction to
+    validate the final document once, write it with a single backup
+    reference and append all audit events in one batch; leaving the block
+    without committing discards the staged changes.  Yields ``None`` (plain
+    writes) when this thread already has the path in a transaction or the
+    path is in preflight.
+    """
+    yaml_abs = assert_allowed_inventory_yaml_path(_abs_path(path))
+    cache_key = os.path.normcase(os.path.normpath(yaml_abs))
+    if _owned_write_transaction(cache_key) is not None or cache_key in _preflight_cache:
+        yield None
+        return
+    with _path_write_lock(cache_key):
+        transaction = _WriteTransaction(yaml_abs, cache_key, load_yaml(yaml_abs))
+        _write_transactions[cache_key] = transaction
+        try:
+            yield transaction
+        finally:
+            if _write_transactions.get(cache_key) is transaction:
+                _write_transactions.pop(cache_key, None)
 
 
 def validate_backup_file(backup_path: str) -> dict:
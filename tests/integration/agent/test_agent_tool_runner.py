@@ -22,6 +22,9 @@ ROOT = Path(__file__).resolve().parents[3]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from agent import tool_runner_handlers_read as _runner_read
+from agent import tool_runner_validation as _runner_validation
+from agent.tool_result_cache import ToolResultCache
 from agent.tool_runner import AgentToolRunner
 from lib.app_storage import ensure_data_root_layout, set_session_data_root
 from lib.tool_api_write_validation import resolve_request_backup_path
@@ -789,6 +792,7 @@ class AgentToolRunnerTests(ManagedPathTestCase):
         self.assertEqual(False, params.get("additionalProperties"))
 
     def test_tool_schemas_reuses_yaml_context_for_all_tools(self):
+        _runner_validation.clear_tool_schema_cache()
         runner = AgentToolRunner(yaml_path=self.fake_yaml_path)
 
         with patch.object(runner, "_load_meta", wraps=runner._load_meta) as load_meta, patch.object(
@@ -800,8 +804,182 @@ class AgentToolRunnerTests(ManagedPathTestCase):
 
         self.assertGreater(len(schemas), 1)
         self.assertEqual(1, load_meta.call_count)
-        self.assertEqual(1, load_inventory.call_count)
-        self.assertEqual(1, load_layout.call_count)
+        self.assertEqual(0, load_inventory.call_count)
+        self.assertEqual(0, load_layout.call_count)
+
+    def test_tool_schemas_cached_until_meta_changes(self):
+        _runner_validation.clear_tool_schema_cache()
+        with tempfile.TemporaryDirectory(prefix="ln2_agent_schema_cache_") as temp_dir:
+            yaml_path = Path(temp_dir) / "inventory.yaml"
+            data = make_data([make_record(1, box=1, position=5)])
+            write_yaml(data, path=str(yaml_path), audit_meta={"action": "seed", "source": "tests"})
+            first = AgentToolRunner(yaml_path=str(yaml_path)).tool_schemas()
+
+            runner = AgentToolRunner(yaml_path=str(yaml_path))
+            with patch.object(runner, "_load_meta", wraps=runner._load_meta) as load_meta, patch.object(
+                _runner_validation,
+                "_tool_input_schema",
+                wraps=_runner_validation._tool_input_schema,
+            ) as build_schema:
+                second = runner.tool_schemas()
+            self.assertEqual(first, second)
+            self.assertIsNot(first, second)
+            self.assertEqual(0, load_meta.call_count)
+            self.assertEqual(0, build_schema.call_count)
+            self.assertEqual(
+                json.dumps(second, ensure_ascii=False, separators=(",", ":")),
+                second.compact_json,
+            )
+
+            # A record-only write changes the file but not the schema inputs.
+            data["inventory"].append(make_record(2, box=1, position=6))
+            write_yaml(data, path=str(yaml_path), audit_meta={"action": "seed", "source": "tests"})
+            with patch.object(runner, "_load_meta", wraps=runner._load_meta) as load_meta, patch.object(
+                _runner_validation,
+                "_tool_input_schema",
+                wraps=_runner_validation._tool_input_schema,
+            ) as build_schema:
+                self.assertEqual(first, runner.tool_schemas())
+            self.assertEqual(1, load_meta.call_count)
+            self.assertEqual(0, build_schema.call_count)
+
+            write_yaml(
+                make_data_alphanumeric(data["inventory"]),
+                path=str(yaml_path),
+                audit_meta={"action": "seed", "source": "tests"},
+            )
+            changed = {item["function"]["name"]: item for item in runner.tool_schemas()}
+            positions = changed["add_entry"]["function"]["parameters"]["properties"]["positions"]
+            self.assertEqual("string", positions["items"].get("type"))
+
+    def test_read_tool_results_are_memoized_per_dataset_version(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_agent_result_cache_") as temp_dir:
+            yaml_path = Path(temp_dir) / "inventory.yaml"
+            data = make_data([make_record(1, box=1, position=5)])
+            write_yaml(data, path=str(yaml_path), audit_meta={"action": "seed", "source": "tests"})
+            cache = ToolResultCache()
+            runner = AgentToolRunner(yaml_path=str(yaml_path), result_cache=cache)
+            payload = {"query": "NCCIT"}
+
+            with patch(
+                "agent.tool_runner_handlers_read.tool_search_records",
+                wraps=_runner_read.tool_search_records,
+            ) as search:
+                runner.note_step("trace-a", 1)
+                first = runner.run("search_records", payload, trace_id="trace-a")
+                runner.note_step("trace-a", 3)
+                repeat = runner.run("search_records", payload, trace_id="trace-a")
+                asked_again = runner.run("search_records", payload, trace_id="trace-a")
+                next_run = AgentToolRunner(yaml_path=str(yaml_path), result_cache=cache)
+                next_turn = next_run.run("search_records", payload, trace_id="trace-b")
+                self.assertEqual(1, search.call_count)
+
+                # Writes made outside the runner change the dataset version.
+                data["inventory"].append(make_record(2, box=1, position=6))
+                write_yaml(data, path=str(yaml_path), audit_meta={"action": "seed", "source": "tests"})
+                refreshed = runner.run("search_records", payload, trace_id="trace-a")
+                self.assertEqual(2, search.call_count)
+
+            self.assertTrue(first["ok"])
+            self.assertEqual(1, first["result"]["total_count"])
+            self.assertTrue(repeat["ok"])
+            self.assertTrue(repeat["unchanged"])
+            self.assertEqual(1, repeat["unchanged_since_step"])
+            self.assertIn("step 1", repeat["message"])
+            self.assertNotIn("result", repeat)
+            self.assertEqual(first, asked_again)
+            self.assertEqual(first, next_turn)
+            self.assertEqual(2, refreshed["result"]["total_count"])
+
+    def test_write_tools_clear_memoized_read_results(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_agent_result_cache_") as temp_dir:
+            yaml_path = Path(temp_dir) / "inventory.yaml"
+            write_yaml(
+                make_data([make_record(1, box=1, position=5)]),
+                path=str(yaml_path),
+                audit_meta={"action": "seed", "source": "tests"},
+            )
+            from lib.plan_store import PlanStore
+
+            runner = AgentToolRunner(yaml_path=str(yaml_path), plan_store=PlanStore())
+            runner.run("generate_stats", {})
+            self.assertEqual(1, len(runner._result_cache))
+
+            staged = runner.run("edit_entry", {"record_id": 1, "fields": {"cell_line": "HeLa"}})
+
+            self.assertTrue(staged["ok"])
+            self.assertEqual(0, len(runner._result_cache))
+
+    def test_failed_read_results_are_not_memoized(self):
+        runner = AgentToolRunner(yaml_path=self.fake_yaml_path)
+        response = runner.run("search_records", {"query": "K562", "mode": "bad-mode"})
+
+        self.assertFalse(response["ok"])
+        self.assertEqual(0, len(runner._result_cache))
+
+    def test_large_read_results_are_paged_behind_a_cursor(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_agent_result_pages_") as temp_dir:
+            yaml_path = Path(temp_dir) / "inventory.yaml"
+            records = [make_record(rid, box=1, position=rid) for rid in range(1, 61)]
+            write_yaml(make_data(records), path=str(yaml_path), audit_meta={"action": "seed", "source": "tests"})
+            runner = AgentToolRunner(yaml_path=str(yaml_path))
+
+            with patch(
+                "agent.tool_runner_handlers_read.tool_search_records",
+                wraps=_runner_read.tool_search_records,
+            ) as search:
+                first = runner.run("search_records", {"query": "NCCIT"})
+                cursor = first["result"]["page"]["next_cursor"]
+                second = runner.run("fetch_more", {"cursor": cursor})
+                last = runner.run("fetch_more", {"cursor": second["result"]["page"]["next_cursor"], "page_size": 50})
+            self.assertEqual(1, search.call_count)
+
+            self.assertTrue(first["ok"])
+            self.assertEqual(60, first["result"]["total_count"])
+            self.assertEqual(25, first["result"]["display_count"])
+            self.assertEqual(25, len(first["result"]["records"]))
+            self.assertEqual({"offset": 0, "returned": 25, "available": 60, "has_more": True}, {
+                key: first["result"]["page"][key] for key in ("offset", "returned", "available", "has_more")
+            })
+            self.assertIn("fetch_more", first["_hint"])
+            self.assertIn(cursor, first["_hint"])
+
+            self.assertTrue(second["ok"])
+            self.assertEqual("search_records", second["result"]["tool"])
+            self.assertEqual(25, second["result"]["page"]["offset"])
+            self.assertEqual(25, len(second["result"]["records"]))
+            self.assertEqual(10, len(last["result"]["records"]))
+            self.assertFalse(last["result"]["page"]["has_more"])
+            self.assertIsNone(last["result"]["page"]["next_cursor"])
+            seen = first["result"]["records"] + second["result"]["records"] + last["result"]["records"]
+            self.assertEqual(list(range(1, 61)), sorted(rec["id"] for rec in seen))
+
+    def test_fetch_more_rejects_unknown_and_stale_cursors(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_agent_result_pages_") as temp_dir:
+            yaml_path = Path(temp_dir) / "inventory.yaml"
+            records = [make_record(rid, box=1, position=rid) for rid in range(1, 31)]
+            data = make_data(records)
+            write_yaml(data, path=str(yaml_path), audit_meta={"action": "seed", "source": "tests"})
+            runner = AgentToolRunner(yaml_path=str(yaml_path))
+
+            unknown = runner.run("fetch_more", {"cursor": "cur_missing_25"})
+            first = runner.run("search_records", {"query": "NCCIT"})
+            data["inventory"].append(make_record(31, box=1, position=31))
+            write_yaml(data, path=str(yaml_path), audit_meta={"action": "seed", "source": "tests"})
+            stale = runner.run("fetch_more", {"cursor": first["result"]["page"]["next_cursor"]})
+
+            self.assertFalse(unknown["ok"])
+            self.assertEqual("cursor_not_found", unknown["error_code"])
+            self.assertFalse(stale["ok"])
+            self.assertEqual("cursor_stale", stale["error_code"])
+
+    def test_small_read_results_are_not_paged(self):
+        runner = AgentToolRunner(yaml_path=self.fake_yaml_path)
+        response = runner.run("search_records", {"query": "K562"})
+
+        self.assertTrue(response["ok"])
+        self.assertNotIn("page", response["result"])
+        self.assertEqual(0, len(runner._result_pager))
 
     def test_shell_rejects_workdir_outside_scope(self):
         runner = AgentToolRunner(yaml_path=self.fake_yaml_path)
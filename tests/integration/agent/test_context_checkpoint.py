@@ -138,6 +138,80 @@ class ContextCheckpointTests(ManagedPathTestCase):
         self.assertGreaterEqual(len(capped), 1)
         self.assertLessEqual(build_mock.call_count, 8)
 
+    def test_token_ledger_matches_full_payload_estimate(self):
+        llm = _CheckpointAwareLLM()
+        ledger = context_checkpoint.ContextTokenLedger()
+        history = self._build_long_history()
+        schemas = [{"type": "function", "function": {"name": "inventory_summary", "parameters": {}}}]
+        summary_state = {"summary_text": "## Current Objective\n细胞 import", "checkpoint_id": "checkpoint-abc"}
+
+        for end in range(1, len(history) + 1):
+            messages = history[end // 3:end]
+            for state in (None, summary_state):
+                with self.subTest(end=end, summary=bool(state)):
+                    self.assertEqual(
+                        context_checkpoint.estimate_main_call_tokens("system", messages, schemas, state),
+                        context_checkpoint.estimate_main_call_tokens("system", messages, schemas, state, ledger=ledger),
+                    )
+                    self.assertEqual(
+                        context_checkpoint.select_tail_messages("system", messages, schemas, state, llm),
+                        context_checkpoint.select_tail_messages("system", messages, schemas, state, llm, ledger=ledger),
+                    )
+
+    def test_token_ledger_only_serializes_new_messages(self):
+        ledger = context_checkpoint.ContextTokenLedger()
+        history = self._build_long_history()
+        schemas = [{"type": "function", "function": {"name": "inventory_summary"}}]
+        ledger.main_call_tokens("system", history[:10], schemas, None)
+
+        with patch.object(
+            context_checkpoint,
+            "_dump_json_compact",
+            wraps=context_checkpoint._dump_json_compact,
+        ) as dump_mock:
+            messages = history[4:12]
+            ledger.main_call_tokens("system", messages, schemas, None)
+
+        self.assertEqual([((history[10],), {}), ((history[11],), {})], dump_mock.call_args_list)
+
+    def test_token_ledger_reuses_cached_schema_json(self):
+        runner = AgentToolRunner(yaml_path=self.fake_yaml_path)
+        schemas = runner.tool_schemas()
+        expected = context_checkpoint.estimate_main_call_tokens("system", [], schemas, None)
+
+        with patch.object(
+            context_checkpoint,
+            "_dump_json_compact",
+            wraps=context_checkpoint._dump_json_compact,
+        ) as dump_mock:
+            actual = context_checkpoint.ContextTokenLedger().main_call_tokens("system", [], schemas, None)
+
+        self.assertEqual(expected, actual)
+        self.assertNotIn(((schemas,), {}), dump_mock.call_args_list)
+
+    def test_checkpoint_context_keeps_message_identity(self):
+        llm = _CheckpointAwareLLM()
+        llm._context_window = 100_000
+        history = self._build_long_history()
+
+        messages, state, event = context_checkpoint.checkpoint_context("system", history, [], None, llm)
+
+        self.assertIsNot(history, messages)
+        self.assertTrue(all(kept is original for kept, original in zip(messages, history)))
+        self.assertIsNone(state)
+        self.assertIsNone(event)
+
+    def test_provider_token_counter_replaces_byte_estimate(self):
+        llm = _CheckpointAwareLLM()
+        context_checkpoint.register_token_counter("zhipu", lambda text: 1)
+        self.addCleanup(context_checkpoint.register_token_counter, "zhipu", None)
+
+        ledger = context_checkpoint.ContextTokenLedger.for_client(llm)
+        history = self._build_long_history()
+
+        self.assertEqual(1 + len(history) + 1, ledger.main_call_tokens("system", history, [{"name": "x"}], None))
+        self.assertFalse(context_checkpoint.needs_checkpoint("system", history, [], None, llm, ledger=ledger))
+
 
 if __name__ == "__main__":
     unittest.main()
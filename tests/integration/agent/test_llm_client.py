@@ -189,7 +189,7 @@ class DeepSeekClientParseTests(unittest.TestCase):
             "data: [DONE]",
         ]
 
-        with patch("agent.llm_client.urlrequest.urlopen", return_value=_FakeUrlopenResponse(lines)):
+        with patch("agent.llm_transport.open_request", return_value=_FakeUrlopenResponse(lines)):
             events = list(client.stream_chat(messages=[{"role": "user", "content": "hi"}], tools=[{"type": "function"}]))
 
         answer_parts = [evt.get("text") for evt in events if evt.get("type") == "answer"]
@@ -212,7 +212,7 @@ class DeepSeekClientParseTests(unittest.TestCase):
             "data: [DONE]",
         ]
 
-        with patch("agent.llm_client.urlrequest.urlopen", return_value=_FakeUrlopenResponse(lines)):
+        with patch("agent.llm_transport.open_request", return_value=_FakeUrlopenResponse(lines)):
             events = list(client.stream_chat(messages=[{"role": "user", "content": "hi"}], tools=[]))
 
         thoughts = [evt.get("text") for evt in events if evt.get("type") == "thought"]
@@ -268,7 +268,7 @@ class DeepSeekClientParseTests(unittest.TestCase):
             "data: [DONE]",
         ]
 
-        with patch("agent.llm_client.urlrequest.urlopen", return_value=_FakeUrlopenResponse(lines)):
+        with patch("agent.llm_transport.open_request", return_value=_FakeUrlopenResponse(lines)):
             response = client.chat(messages=[{"role": "user", "content": "hi"}], tools=[{"type": "function"}])
 
         self.assertEqual("Hello world", response.get("content"))
@@ -277,6 +277,38 @@ class DeepSeekClientParseTests(unittest.TestCase):
         self.assertEqual("search_records", tool_calls[0].get("name"))
         self.assertEqual({"query": "K562", "mode": "keywords"}, tool_calls[0].get("arguments"))
 
+    def test_stream_chat_announces_tool_call_once_next_call_starts(self):
+        with patch.dict(os.environ, {"DEEPSEEK_API_KEY": "test-key"}, clear=False):
+            client = DeepSeekLLMClient(model="deepseek-v4-flash")
+
+        def _tool_delta(index, finish_reason=None, **function):
+            delta = {"index": index, "function": function}
+            if "name" in function and index == 0:
+                delta["id"] = "call_first"
+            choice = {"delta": {"tool_calls": [delta]}}
+            if finish_reason:
+                choice["finish_reason"] = finish_reason
+            return f"data: {json.dumps({'choices': [choice]})}"
+
+        lines = [
+            _tool_delta(0, name="search_records", arguments='{"query":'),
+            _tool_delta(0, arguments='"K562"}'),
+            _tool_delta(1, name="filter_records", arguments='{"keywords":'),
+            _tool_delta(1, arguments='"HeLa"}'),
+            _tool_delta(1, finish_reason="tool_calls"),
+            "data: [DONE]",
+        ]
+
+        with patch("agent.llm_transport.open_request", return_value=_FakeUrlopenResponse(lines)):
+            events = list(client.stream_chat(messages=[{"role": "user", "content": "hi"}], tools=[{"type": "function"}]))
+
+        self.assertEqual(["tool_call_ready", "tool_call", "tool_call"], [evt["type"] for evt in events])
+        ready = events[0]["tool_call"]
+        self.assertEqual({"id": "call_first", "name": "search_records", "arguments": {"query": "K562"}}, ready)
+        self.assertEqual(ready, events[1]["tool_call"])
+        self.assertEqual({"keywords": "HeLa"}, events[2]["tool_call"]["arguments"])
+        self.assertTrue(events[2]["tool_call"]["id"])
+
     def test_stream_chat_parses_plain_json_payload(self):
         with patch.dict(os.environ, {"DEEPSEEK_API_KEY": "test-key"}, clear=False):
             client = DeepSeekLLMClient(model="deepseek-v4-flash")
@@ -301,7 +333,7 @@ class DeepSeekClientParseTests(unittest.TestCase):
             ]
         }
 
-        with patch("agent.llm_client.urlrequest.urlopen", return_value=_FakeUrlopenResponse([json.dumps(payload)])):
+        with patch("agent.llm_transport.open_request", return_value=_FakeUrlopenResponse([json.dumps(payload)])):
             events = list(client.stream_chat(messages=[{"role": "user", "content": "hi"}], tools=[{"type": "function"}]))
 
         thoughts = [evt.get("text") for evt in events if evt.get("type") == "thought"]
@@ -323,7 +355,7 @@ class DeepSeekClientParseTests(unittest.TestCase):
         ]
 
         stop_event = threading.Event()
-        with patch("agent.llm_client.urlrequest.urlopen", return_value=_FakeUrlopenResponse(lines)):
+        with patch("agent.llm_transport.open_request", return_value=_FakeUrlopenResponse(lines)):
             iterator = client.stream_chat(messages=[{"role": "user", "content": "hi"}], stop_event=stop_event)
             first = next(iterator)
             stop_event.set()
@@ -392,7 +424,7 @@ class ZhipuClientParseTests(unittest.TestCase):
             "data: [DONE]",
         ]
 
-        with patch("agent.llm_client.urlrequest.urlopen", return_value=_FakeUrlopenResponse(lines)):
+        with patch("agent.llm_transport.open_request", return_value=_FakeUrlopenResponse(lines)):
             events = list(client.stream_chat(messages=[{"role": "user", "content": "hi"}], tools=[{"type": "function"}]))
 
         thoughts = [evt.get("text") for evt in events if evt.get("type") == "thought"]
@@ -480,7 +512,7 @@ class MiniMaxClientParseTests(unittest.TestCase):
             "data: [DONE]",
         ]
 
-        with patch("agent.llm_client.urlrequest.urlopen", return_value=_FakeUrlopenResponse(lines)):
+        with patch("agent.llm_transport.open_request", return_value=_FakeUrlopenResponse(lines)):
             events = list(client.stream_chat(messages=[{"role": "user", "content": "hi"}], tools=[{"type": "function"}]))
 
         thoughts = [evt.get("text") for evt in events if evt.get("type") == "thought"]
@@ -501,7 +533,7 @@ class MiniMaxClientParseTests(unittest.TestCase):
             "data: [DONE]",
         ]
 
-        with patch("agent.llm_client.urlrequest.urlopen", return_value=_FakeUrlopenResponse(lines)):
+        with patch("agent.llm_transport.open_request", return_value=_FakeUrlopenResponse(lines)):
             response = client.chat(messages=[{"role": "user", "content": "hi"}])
 
         self.assertEqual("answer", response.get("content"))
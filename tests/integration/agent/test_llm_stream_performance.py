@@ -0,0 +1,156 @@
+"""
+Module: test_llm_stream_performance
+Layer: integration/agent
+Covers: agent/sse_stream.py, agent/llm_client.py
+
+Replays a recorded-style DeepSeek reasoner stream from a local server and
+compares the block SSE decoder against line-by-line parsing of the same
+bytes: identical text and tool calls, with UI events bounded by the text
+flush window.  A paced server flushing one event per token checks that the
+bound holds for per-token network framing too.
+"""
+
+import json
+import os
+import random
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent import llm_transport
+from agent.llm_client import DeepSeekLLMClient
+from agent.sse_stream import SSE_TEXT_FLUSH_SECONDS
+from tests.integration.agent.test_llm_transport import _MockSSEServer
+
+
+_REASONING_DELTAS = 20000
+_ANSWER_DELTAS = 4000
+_ARGUMENT_DELTAS = 3000
+
+
+def _recorded_reasoner_stream(seed=5):
+    rng = random.Random(seed)
+    words = ["box", "position", "冻存", "K562", "check", "the", "inventory", "细胞", "42", ",", "."]
+    lines = []
+
+    def _chunk(delta, finish_reason=None):
+        choice = {"index": 0, "delta": delta, "finish_reason": finish_reason}
+        body = {"id": "chatcmpl-replay", "object": "chat.completion.chunk", "model": "deepseek-v4-pro", "choices": [choice]}
+        lines.append(f"data: {json.dumps(body, ensure_ascii=False)}\n\n")
+
+    for _ in range(_REASONING_DELTAS):
+        _chunk({"reasoning_content": rng.choice(words) + " "})
+    for _ in range(_ANSWER_DELTAS):
+        _chunk({"content": rng.choice(words) + " "})
+    arguments = json.dumps({"entries": [{"box": i % 9 + 1, "position": i % 81 + 1} for i in range(400)]})
+    step = max(1, len(arguments) // _ARGUMENT_DELTAS)
+    _chunk({"tool_calls": [{"index": 0, "id": "call_replay", "function": {"name": "batch_add", "arguments": ""}}]})
+    for offset in range(0, len(arguments), step):
+        _chunk({"tool_calls": [{"index": 0, "function": {"arguments": arguments[offset:offset + step]}}]})
+    _chunk({}, finish_reason="tool_calls")
+    lines.append("data: [DONE]\n\n")
+    return "".join(lines).encode("utf-8"), json.loads(arguments)
+
+
+class _LineOnlyResponse:
+    """Hide ``read1`` so the client falls back to per-line parsing."""
+
+    def __init__(self, resp):
+        self._resp = resp
+
+    def __enter__(self):
+        self._resp.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._resp.__exit__(exc_type, exc, tb)
+
+    def __iter__(self):
+        return iter(self._resp)
+
+    def close(self):
+        self._resp.close()
+
+
+class LlmStreamBenchmarkTests(unittest.TestCase):
+    def setUp(self):
+        env = patch.dict(os.environ, {"NO_PROXY": "127.0.0.1,localhost", "no_proxy": "127.0.0.1,localhost"})
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop(llm_transport.LLM_TRANSPORT_ENV_VAR, None)
+        llm_transport.default_pool().clear()
+        self.addCleanup(llm_transport.default_pool().clear)
+        self.server = _MockSSEServer()
+        self.addCleanup(self.server.stop)
+        self.client = DeepSeekLLMClient(model="deepseek-v4-pro", api_key="test-key", base_url=self.server.base_url)
+
+    def _replay(self, stream, *, line_only):
+        self.server.queue(("replay", stream))
+        opener = llm_transport.open_request
+        if line_only:
+            opener_patch = patch.object(
+                llm_transport,
+                "open_request",
+                side_effect=lambda *args, **kwargs: _LineOnlyResponse(opener(*args, **kwargs)),
+            )
+        else:
+            opener_patch = patch.object(llm_transport, "open_request", side_effect=opener)
+        with opener_patch:
+            return self._timed_stream()
+
+    def _timed_stream(self):
+        started = time.monotonic()
+        events = list(self.client.stream_chat(messages=[{"role": "user", "content": "hi"}], tools=[{"type": "function"}]))
+        return events, time.monotonic() - started
+
+    @staticmethod
+    def _summarize(events):
+        return {
+            "thought": "".join(e["text"] for e in events if e.get("type") == "thought"),
+            "answer": "".join(e["text"] for e in events if e.get("type") == "answer"),
+            "tool_calls": [e["tool_call"] for e in events if e.get("type") == "tool_call"],
+            "errors": [e for e in events if e.get("type") == "error"],
+        }
+
+    def assertTextEventsBounded(self, events, elapsed):
+        text_events = [e for e in events if e.get("type") in ("thought", "answer")]
+        # One release per flush window, plus the first delta, the flushes
+        # forced by a tool call and the stream end, and a thought/answer split.
+        self.assertLessEqual(len(text_events), elapsed / SSE_TEXT_FLUSH_SECONDS + 5)
+
+    def test_block_decoder_replay_matches_line_parsing_with_bounded_events(self):
+        stream, arguments = _recorded_reasoner_stream()
+
+        line_events, line_elapsed = self._replay(stream, line_only=True)
+        block_events, block_elapsed = self._replay(stream, line_only=False)
+
+        line_summary = self._summarize(line_events)
+        block_summary = self._summarize(block_events)
+
+        self.assertEqual([], block_summary["errors"])
+        self.assertEqual(line_summary, block_summary)
+        self.assertEqual(1, len(block_summary["tool_calls"]))
+        self.assertEqual(arguments, block_summary["tool_calls"][0]["arguments"])
+        self.assertTextEventsBounded(line_events, line_elapsed)
+        self.assertTextEventsBounded(block_events, block_elapsed)
+        self.assertLess(len(block_events) * 10, _REASONING_DELTAS + _ANSWER_DELTAS)
+
+    def test_per_token_flushes_are_merged_over_the_flush_window(self):
+        deltas = [f"t{i} " for i in range(200)]
+        self.server.queue(("paced", (deltas, 0.003)))
+
+        events, elapsed = self._timed_stream()
+
+        self.assertEqual("".join(deltas), self._summarize(events)["answer"])
+        self.assertTextEventsBounded(events, elapsed)
+        self.assertLess(len(events) * 4, len(deltas))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,235 @@
+"""
+Module: test_llm_transport
+Layer: integration/agent
+Covers: agent/llm_transport.py + agent/llm_client.py
+
+Pooled keep-alive transport exercised against a local mock SSE server.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent import llm_transport
+from agent.llm_client import DeepSeekLLMClient
+
+
+def _sse_lines(*texts):
+    lines = [f"data: {json.dumps({'choices': [{'delta': {'content': text}}]})}\n\n" for text in texts]
+    lines.append("data: [DONE]\n\n")
+    return lines
+
+
+class _MockSSEHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.state_lock:
+            self.server.connection_count += 1
+
+    def log_message(self, format, *args):
+        _ = format
+        _ = args
+
+    def _write_chunk(self, text):
+        data = text.encode("utf-8") if isinstance(text, str) else text
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length).decode("utf-8") or "{}")
+        with self.server.state_lock:
+            self.server.requests.append({"path": self.path, "body": body, "headers": dict(self.headers)})
+            behavior = self.server.behaviors.pop(0) if self.server.behaviors else ("sse", ["ok"])
+        kind, arg = behavior
+
+        if kind == "error":
+            payload = json.dumps({"error": {"message": arg}}).encode("utf-8")
+            self.send_response(429)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        if kind == "replay":
+            # Recorded stream bytes, flushed in socket-sized writes.
+            for offset in range(0, len(arg), 16 * 1024):
+                self._write_chunk(arg[offset:offset + 16 * 1024])
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+            return
+        if kind == "paced":
+            # One event per write and flush, like providers streaming tokens.
+            texts, delay = arg
+            for line in _sse_lines(*texts):
+                self._write_chunk(line)
+                time.sleep(delay)
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+            return
+        if kind == "slow":
+            self._write_chunk(_sse_lines("first")[0])
+            self.server.release_slow.wait(timeout=10)
+            self.close_connection = True
+            return
+        for line in _sse_lines(*arg):
+            self._write_chunk(line)
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+        if kind == "sse_then_drop":
+            # Keep-alive was advertised, but the server silently goes away.
+            self.close_connection = True
+
+
+class _MockSSEServer:
+    def __init__(self):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _MockSSEHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state_lock = threading.Lock()
+        self.httpd.connection_count = 0
+        self.httpd.requests = []
+        self.httpd.behaviors = []
+        self.httpd.release_slow = threading.Event()
+        self._thread = threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def connection_count(self):
+        return self.httpd.connection_count
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def queue(self, *behaviors):
+        self.httpd.behaviors.extend(behaviors)
+
+    def stop(self):
+        self.httpd.release_slow.set()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class PooledTransportTests(unittest.TestCase):
+    def setUp(self):
+        env = patch.dict(os.environ, {"NO_PROXY": "127.0.0.1,localhost", "no_proxy": "127.0.0.1,localhost"})
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop(llm_transport.LLM_TRANSPORT_ENV_VAR, None)
+        llm_transport.default_pool().clear()
+        self.addCleanup(llm_transport.default_pool().clear)
+        self.server = _MockSSEServer()
+        self.addCleanup(self.server.stop)
+        self.client = DeepSeekLLMClient(model="deepseek-v4-flash", api_key="test-key", base_url=self.server.base_url)
+
+    def _answers(self, client=None):
+        events = list((client or self.client).stream_chat(messages=[{"role": "user", "content": "hi"}]))
+        errors = [event for event in events if event.get("type") == "error"]
+        self.assertEqual([], errors)
+        return "".join(event.get("text") or "" for event in events if event.get("type") == "answer")
+
+    def test_sequential_requests_reuse_one_connection(self):
+        self.server.queue(("sse", ["Hel", "lo"]), ("sse", ["again"]))
+
+        self.assertEqual("Hello", self._answers())
+        self.assertEqual(1, llm_transport.default_pool().idle_count())
+        self.assertEqual("again", self._answers())
+
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual(1, self.server.connection_count)
+        self.assertEqual("/chat/completions", self.server.requests[0]["path"])
+        self.assertEqual("Bearer test-key", self.server.requests[0]["headers"].get("Authorization"))
+
+    def test_connections_are_shared_across_client_instances(self):
+        self.server.queue(("sse", ["one"]), ("sse", ["two"]))
+        other = DeepSeekLLMClient(model="deepseek-v4-flash", api_key="test-key", base_url=self.server.base_url)
+
+        self.assertEqual("one", self._answers())
+        self.assertEqual("two", self._answers(other))
+        self.assertEqual(1, self.server.connection_count)
+
+    def test_request_stop_aborts_blocked_stream_and_drops_connection(self):
+        self.server.queue(("slow", None), ("sse", ["after"]))
+
+        iterator = self.client.stream_chat(messages=[{"role": "user", "content": "hi"}])
+        first = next(iterator)
+        timer = threading.Timer(0.2, self.client.request_stop)
+        timer.start()
+        started = time.monotonic()
+        remaining = list(iterator)
+        elapsed = time.monotonic() - started
+        timer.join()
+
+        self.assertEqual({"type": "answer", "text": "first"}, first)
+        self.assertEqual([], remaining)
+        self.assertLess(elapsed, 5.0)
+        self.assertEqual(0, llm_transport.default_pool().idle_count())
+
+        self.assertEqual("after", self._answers())
+        self.assertEqual(2, self.server.connection_count)
+
+    def test_http_error_reports_body_and_keeps_connection(self):
+        self.server.queue(("error", "rate limited"), ("sse", ["recovered"]))
+
+        events = list(self.client.stream_chat(messages=[{"role": "user", "content": "hi"}]))
+
+        self.assertEqual(1, len(events))
+        self.assertEqual("llm_http_error", events[0].get("error_code"))
+        self.assertEqual(429, events[0]["details"]["http_status"])
+        self.assertIn("rate limited", events[0]["details"]["response_body"])
+        self.assertEqual("recovered", self._answers())
+        self.assertEqual(1, self.server.connection_count)
+
+    def test_stale_idle_connection_is_retried_on_a_fresh_one(self):
+        self.server.queue(("sse_then_drop", ["one"]), ("sse", ["two"]))
+
+        self.assertEqual("one", self._answers())
+        time.sleep(0.1)
+        self.assertEqual("two", self._answers())
+        self.assertEqual(2, self.server.connection_count)
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_connection_refused_maps_to_transport_error(self):
+        self.server.stop()
+        events = list(self.client.stream_chat(messages=[{"role": "user", "content": "hi"}]))
+
+        self.assertEqual(1, len(events))
+        self.assertEqual("llm_transport_error", events[0].get("error_code"))
+
+    def test_urllib_transport_can_be_pinned_by_env(self):
+        self.server.queue(("sse", ["one"]), ("sse", ["two"]))
+
+        with patch.dict(os.environ, {llm_transport.LLM_TRANSPORT_ENV_VAR: "urllib"}):
+            self.assertEqual(llm_transport.LLM_TRANSPORT_URLLIB, llm_transport.llm_transport())
+            self.assertEqual("one", self._answers())
+            self.assertEqual("two", self._answers())
+
+        self.assertEqual(2, self.server.connection_count)
+        self.assertEqual(0, llm_transport.default_pool().idle_count())
+
+
+if __name__ == "__main__":
+    unittest.main()
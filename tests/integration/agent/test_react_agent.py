@@ -7,9 +7,12 @@ ReAct 循环、工具调用、重试与结束
 """
 
 import json
+import os
+import shutil
 import sys
 import tempfile
 import threading
+import time
 import unittest
 from pathlib import Path
 
@@ -21,6 +24,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from agent.react_agent import ReactAgent
+from agent.tool_result_cache import ToolResultCache
 from agent.tool_runner import AgentToolRunner
 from lib.yaml_ops import write_yaml
 
@@ -217,6 +221,63 @@ class _StreamingAlwaysErrorLLM:
         yield {"type": "error", "error": "persistent stream error"}
 
 
+class _SpeculativeToolLLM:
+    """Announces the first tool call early and waits to see whether it starts."""
+
+    def __init__(self, runner, tool_calls, *, fail_first=False, wait_timeout=2):
+        self._runner = runner
+        self._tool_calls = list(tool_calls)
+        self._fail_first = fail_first
+        self._wait_timeout = wait_timeout
+        self.calls = 0
+        self.started_during_stream = None
+
+    def stream_chat(self, messages, tools=None, temperature=0.0):
+        _ = messages
+        _ = tools
+        _ = temperature
+        self.calls += 1
+        if self.calls == 1:
+            yield {"type": "tool_call_ready", "tool_call": dict(self._tool_calls[0])}
+            self.started_during_stream = self._runner.started.wait(timeout=self._wait_timeout)
+            if self._fail_first:
+                yield {"type": "error", "error": "stream dropped"}
+                return
+            for call in self._tool_calls:
+                yield {"type": "tool_call", "tool_call": dict(call)}
+            return
+        yield {"type": "answer", "text": "done"}
+
+
+class _PrefetchThenRetryLLM:
+    """Prefetches one read call, drops the stream, then issues it on retry."""
+
+    def __init__(self, cache, tool_call, *, wait_timeout=2):
+        self._cache = cache
+        self._tool_call = dict(tool_call)
+        self._wait_timeout = wait_timeout
+        self.calls = 0
+        self.prefetched = False
+
+    def stream_chat(self, messages, tools=None, temperature=0.0):
+        _ = messages
+        _ = tools
+        _ = temperature
+        self.calls += 1
+        if self.calls == 1:
+            yield {"type": "tool_call_ready", "tool_call": dict(self._tool_call)}
+            deadline = time.monotonic() + self._wait_timeout
+            while len(self._cache) == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.prefetched = len(self._cache) > 0
+            yield {"type": "error", "error": "stream dropped"}
+            return
+        if self.calls in (2, 3):
+            yield {"type": "tool_call", "tool_call": dict(self._tool_call, id=f"call_search_{self.calls}")}
+            return
+        yield {"type": "answer", "text": "done"}
+
+
 class _CaptureMessagesLLM:
     def __init__(self):
         self.messages = None
@@ -238,6 +299,7 @@ class _RecordingToolRunner:
         self.max_active = 0
         self._lock = threading.Lock()
         self._release = threading.Event()
+        self.started = threading.Event()
 
     def list_tools(self):
         return list(self._tool_names)
@@ -250,6 +312,7 @@ class _RecordingToolRunner:
             self.active += 1
             self.max_active = max(self.max_active, self.active)
             self.calls.append((tool_name, dict(tool_input or {}), trace_id))
+        self.started.set()
         self._release.wait(timeout=0.02)
         with self._lock:
             self.active -= 1
@@ -397,6 +460,85 @@ class ReactAgentTests(ManagedPathTestCase):
         self.assertEqual(["edit_entry", "edit_entry"], [call[0] for call in runner.calls])
         self.assertEqual(1, runner.max_active)
 
+    def test_react_agent_starts_read_tool_while_response_streams(self):
+        runner = _RecordingToolRunner(["search_records", "filter_records"])
+        llm = _SpeculativeToolLLM(
+            runner,
+            [
+                {"id": "call_search", "name": "search_records", "arguments": {"query": "K562"}},
+                {"id": "call_filter", "name": "filter_records", "arguments": {"keywords": "HeLa"}},
+            ],
+        )
+        agent = ReactAgent(llm_client=llm, tool_runner=runner, max_steps=3)
+        events = []
+
+        result = agent.run("find K562", on_event=lambda e: events.append(dict(e)))
+
+        self.assertTrue(result["ok"])
+        self.assertTrue(llm.started_during_stream)
+        self.assertEqual(
+            [("search_records", {"query": "K562"}), ("filter_records", {"keywords": "HeLa"})],
+            [(name, args) for name, args, _trace in runner.calls],
+        )
+        tool_ends = [e for e in events if e.get("event") == "tool_end"]
+        self.assertEqual(["call_search", "call_filter"], [e.get("tool_call_id") for e in tool_ends])
+
+    def test_react_agent_discards_speculative_read_when_stream_errors(self):
+        runner = _RecordingToolRunner(["search_records"])
+        llm = _SpeculativeToolLLM(
+            runner,
+            [{"id": "call_search", "name": "search_records", "arguments": {"query": "K562"}}],
+            fail_first=True,
+        )
+        agent = ReactAgent(llm_client=llm, tool_runner=runner, max_steps=3)
+        events = []
+
+        result = agent.run("find K562", on_event=lambda e: events.append(dict(e)))
+
+        self.assertTrue(result["ok"])
+        self.assertEqual("done", result["final"])
+        self.assertTrue(llm.started_during_stream)
+        self.assertEqual(1, len(runner.calls))
+        self.assertEqual([], [e for e in events if e.get("event") in {"tool_start", "tool_end"}])
+
+    def test_dropped_prefetch_does_not_mark_cached_read_as_seen(self):
+        cache = ToolResultCache()
+        runner = AgentToolRunner(yaml_path=self.fake_yaml_path, result_cache=cache)
+        llm = _PrefetchThenRetryLLM(
+            cache,
+            {"id": "call_search", "name": "search_records", "arguments": {"query": "K562"}},
+        )
+        agent = ReactAgent(llm_client=llm, tool_runner=runner, max_steps=4)
+        events = []
+
+        result = agent.run("find K562", on_event=lambda e: events.append(dict(e)))
+
+        self.assertTrue(result["ok"])
+        self.assertTrue(llm.prefetched)
+        observations = [e.get("observation") or {} for e in events if e.get("event") == "tool_end"]
+        self.assertEqual(2, len(observations))
+        # The prefetched result never reached the model, so the retried
+        # call is answered in full; only the later repeat points back to it.
+        self.assertTrue(observations[0]["ok"])
+        self.assertNotIn("unchanged", observations[0])
+        self.assertIn("result", observations[0])
+        self.assertTrue(observations[1].get("unchanged"))
+
+    def test_react_agent_does_not_prefetch_write_tools(self):
+        runner = _RecordingToolRunner(["edit_entry"], plan_store=object())
+        llm = _SpeculativeToolLLM(
+            runner,
+            [{"id": "call_edit", "name": "edit_entry", "arguments": {"record_id": 1, "fields": {"note": "a"}}}],
+            wait_timeout=0.1,
+        )
+        agent = ReactAgent(llm_client=llm, tool_runner=runner, max_steps=3)
+
+        result = agent.run("stage edit")
+
+        self.assertTrue(result["ok"])
+        self.assertFalse(llm.started_during_stream)
+        self.assertEqual(["edit_entry"], [call[0] for call in runner.calls])
+
     def test_react_agent_unknown_tool_observation_has_hint(self):
         llm = _SequenceLLM(
             [
@@ -532,6 +674,56 @@ class ReactAgentTests(ManagedPathTestCase):
             self.assertEqual("done", result["final"])
             self.assertTrue(any(e.get("type") == "manage_boxes_confirm" for e in events))
 
+    @unittest.skipUnless(os.name == "posix" and shutil.which("bash"), "persistent shell workers need POSIX bash")
+    def test_shell_output_is_emitted_while_the_command_runs(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_react_shell_stream_") as temp_dir:
+            release = Path(temp_dir) / "release"
+            llm = _SequenceLLM(
+                [
+                    {
+                        "role": "assistant",
+                        "content": "",
+                        "tool_calls": [
+                            {
+                                "id": "call_shell",
+                                "name": "shell",
+                                "arguments": {
+                                    "command": f"echo first; while [ ! -e {release} ]; do sleep 0.05; done; echo second",
+                                    "description": "Stream two lines",
+                                    "timeout": 10000,
+                                },
+                            }
+                        ],
+                    },
+                    {"role": "assistant", "content": "done", "tool_calls": []},
+                ]
+            )
+            runner = AgentToolRunner(yaml_path=self.fake_yaml_path)
+            agent = ReactAgent(llm_client=llm, tool_runner=runner, max_steps=3)
+            events = []
+
+            def _on_event(evt):
+                events.append(dict(evt or {}))
+                if evt.get("type") == "tool_output":
+                    # The command waits for this file, so it only finishes
+                    # once its first line has been delivered as an event.
+                    release.touch()
+
+            result = agent.run("run the command", on_event=_on_event)
+
+        self.assertTrue(result["ok"], result)
+        types = [event.get("type") for event in events]
+        outputs = [event for event in events if event.get("type") == "tool_output"]
+        self.assertTrue(outputs)
+        self.assertLess(types.index("tool_output"), types.index("tool_end"))
+        self.assertEqual("call_shell", outputs[0]["tool_call_id"])
+        self.assertEqual(
+            "first\nsecond\n",
+            "".join(event["data"]["output"]["text"] for event in outputs),
+        )
+        tool_end = next(event for event in events if event.get("type") == "tool_end")
+        self.assertTrue(tool_end["observation"]["ok"], tool_end["observation"])
+
     def test_react_agent_manage_boxes_wait_uses_blocking_event_wait(self):
         llm = _SequenceLLM(
             [
@@ -0,0 +1,211 @@
+"""
+Module: test_shell_worker
+Layer: integration/agent
+Covers: agent/shell_worker.py
+
+常驻 shell 工作进程：复用、命令分帧、输出流式、超时、崩溃恢复与清理
+"""
+
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent import shell_worker
+from agent.shell_session import ShellSessionState
+from agent.shell_worker import PersistentShellWorker, ShellWorkerPool
+
+
+@unittest.skipUnless(os.name == "posix" and shutil.which("bash"), "persistent shell workers need POSIX bash")
+class ShellWorkerPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.pool = ShellWorkerPool()
+        self.addCleanup(self.pool.close)
+
+    def _shell_pid(self, **kwargs):
+        response = self.pool.run("echo $$", timeout_seconds=10, engine="bash", **kwargs)
+        self.assertTrue(response["ok"], response)
+        return response["raw_output"].strip()
+
+    def test_commands_reuse_one_bash_process(self):
+        first = self._shell_pid()
+        failed = self.pool.run("echo boom; exit 7", timeout_seconds=10, engine="bash")
+        second = self._shell_pid()
+
+        self.assertEqual(first, second)
+        self.assertFalse(failed["ok"])
+        self.assertEqual("terminal_nonzero_exit", failed["error_code"])
+        self.assertEqual(7, failed["exit_code"])
+        self.assertEqual("boom\n", failed["raw_output"])
+
+    def test_commands_do_not_leak_state_between_calls(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_shell_worker_") as temp_dir:
+            (Path(temp_dir) / "sub").mkdir()
+            moved = self.pool.run(
+                "export SNOWFOX_TEST_VAR=1; cd sub; printf done",
+                timeout_seconds=10,
+                cwd=temp_dir,
+                engine="bash",
+                capture_cwd=True,
+            )
+            after = self.pool.run(
+                'pwd; printf "%s" "${SNOWFOX_TEST_VAR:-unset}"',
+                timeout_seconds=10,
+                cwd=temp_dir,
+                engine="bash",
+            )
+
+        self.assertEqual("done", moved["raw_output"])
+        self.assertEqual(str(Path(temp_dir).resolve() / "sub"), moved["final_cwd"])
+        self.assertEqual(f"{Path(temp_dir).resolve()}\nunset", after["raw_output"])
+        self.assertEqual("", after["final_cwd"])
+
+    def test_timeout_kills_worker_and_next_command_restarts_it(self):
+        before = self._shell_pid()
+        timed_out = self.pool.run("echo started; sleep 5", timeout_seconds=0.5, engine="bash")
+        after = self._shell_pid()
+
+        self.assertFalse(timed_out["ok"])
+        self.assertEqual("terminal_timeout", timed_out["error_code"])
+        self.assertIn("started", timed_out["raw_output"])
+        self.assertNotEqual(before, after)
+
+    def test_background_job_output_does_not_leak_into_next_command(self):
+        first = self.pool.run(
+            "(sleep 0.3; echo leaked) & echo first",
+            timeout_seconds=10,
+            engine="bash",
+        )
+        second = self.pool.run("sleep 0.6; echo second", timeout_seconds=10, engine="bash")
+
+        self.assertTrue(first["ok"], first)
+        self.assertEqual("first\n", first["raw_output"])
+        self.assertEqual("second\n", second["raw_output"])
+
+    def test_timeout_also_kills_background_jobs_of_the_command(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_shell_worker_") as temp_dir:
+            marker = Path(temp_dir) / "marker"
+            timed_out = self.pool.run(
+                f"(sleep 0.5; touch {marker}) & sleep 5",
+                timeout_seconds=0.2,
+                engine="bash",
+            )
+            self.pool.run("sleep 0.6", timeout_seconds=10, engine="bash")
+
+            self.assertEqual("terminal_timeout", timed_out["error_code"])
+            self.assertFalse(marker.exists())
+
+    def test_crashed_worker_is_replaced(self):
+        before = self._shell_pid()
+        crashed = self.pool.run("kill -9 $$", timeout_seconds=10, engine="bash")
+        after = self._shell_pid()
+
+        self.assertFalse(crashed["ok"])
+        self.assertEqual("terminal_exec_failed", crashed["error_code"])
+        self.assertNotEqual(before, after)
+
+    def test_output_is_streamed_without_the_sentinel(self):
+        chunks = []
+        response = self.pool.run(
+            "for i in 1 2 3; do echo line$i; done; echo err >&2",
+            timeout_seconds=10,
+            engine="bash",
+            on_output=chunks.append,
+        )
+
+        self.assertTrue(response["ok"])
+        self.assertEqual("line1\nline2\nline3\nerr\n", response["raw_output"])
+        self.assertEqual(response["raw_output"], "".join(chunks))
+
+    def test_output_is_streamed_before_the_command_finishes(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_shell_worker_") as temp_dir:
+            release = Path(temp_dir) / "release"
+            chunks = []
+
+            def on_output(text):
+                chunks.append(text)
+                if "first" in "".join(chunks):
+                    release.touch()
+
+            # The command only finishes once "first" has reached on_output.
+            response = self.pool.run(
+                f"echo first; while [ ! -e {release} ]; do sleep 0.05; done; echo second",
+                timeout_seconds=10,
+                engine="bash",
+                on_output=on_output,
+            )
+
+        self.assertTrue(response["ok"], response)
+        self.assertEqual("first\nsecond\n", "".join(chunks))
+
+    def test_environment_change_starts_a_new_worker(self):
+        first = self._shell_pid(extra_env={"LN2_REPO_ROOT": "/a"})
+        same = self._shell_pid(extra_env={"LN2_REPO_ROOT": "/a"})
+        other = self._shell_pid(extra_env={"LN2_REPO_ROOT": "/b"})
+
+        self.assertEqual(first, same)
+        self.assertNotEqual(first, other)
+
+
+@unittest.skipUnless(os.name == "posix" and shutil.which("bash"), "persistent shell workers need POSIX bash")
+class ShellWorkerCleanupTests(unittest.TestCase):
+    @staticmethod
+    def _worker_resources(worker):
+        return worker._process, [worker._cwd_file, worker._job_file]
+
+    def assertShutDown(self, process, temp_files):
+        self.assertIsNotNone(process.poll())
+        self.assertFalse(any(os.path.exists(path) for path in temp_files))
+
+    def test_dropped_worker_is_shut_down_by_its_finalizer(self):
+        worker = PersistentShellWorker(shutil.which("bash"))
+        process, temp_files = self._worker_resources(worker)
+        self.assertIsNone(process.poll())
+
+        del worker
+        gc.collect()
+
+        self.assertShutDown(process, temp_files)
+
+    def test_session_reset_and_close_shut_down_workers(self):
+        state = ShellSessionState()
+        self.addCleanup(state.close)
+        self.assertTrue(state.workers.run("true", timeout_seconds=10, engine="bash")["ok"])
+        first = self._worker_resources(state.workers._idle[0])
+
+        state.reset()
+        self.assertShutDown(*first)
+        self.assertTrue(state.workers.run("true", timeout_seconds=10, engine="bash")["ok"])
+        second = self._worker_resources(state.workers._idle[0])
+
+        state.close()
+        self.assertShutDown(*second)
+
+
+class ShellWorkerFallbackTests(unittest.TestCase):
+    def test_powershell_uses_one_shot_terminal_command(self):
+        pool = ShellWorkerPool()
+        with patch.object(shell_worker, "run_terminal_command", return_value={"ok": True}) as one_shot:
+            response = pool.run("Get-Location", timeout_seconds=5, engine="powershell", capture_cwd=True)
+
+        self.assertEqual({"ok": True}, response)
+        one_shot.assert_called_once_with(
+            "Get-Location",
+            timeout_seconds=5,
+            cwd=None,
+            engine="powershell",
+            extra_env=None,
+            capture_cwd=True,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
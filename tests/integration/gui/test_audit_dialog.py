@@ -21,7 +21,7 @@ if str(ROOT) not in sys.path:
 
 try:
     from PySide6.QtCore import QDate, Qt
-    from PySide6.QtWidgets import QApplication, QTableWidgetItem, QWidget
+    from PySide6.QtWidgets import QApplication, QWidget
 
     from app_gui.ui import audit_dialog as audit_dialog_module
     from app_gui.ui.audit_dialog import AuditLogDialog
@@ -34,7 +34,6 @@ except Exception:
     QDate = None
     Qt = None
     QApplication = None
-    QTableWidgetItem = None
     QWidget = None
     AuditLogDialog = None
     get_audit_log_paths = None
@@ -92,6 +91,44 @@ class _TimelineBridge:
         }
 
 
+class _PagedTimelineBridge:
+    def __init__(self, count):
+        self._events = [
+            {
+                "timestamp": f"2026-02-20T09:{index // 60:02d}:{index % 60:02d}",
+                "action": "takeout",
+                "status": "success",
+                "audit_seq": index + 1,
+                "details": {"op": "takeout", "count": 1, "date": "2026-02-20"},
+            }
+            for index in range(count)
+        ][::-1]
+        self.calls = []
+
+    def list_audit_timeline(
+        self,
+        yaml_path,
+        limit=50,
+        offset=0,
+        action_filter=None,
+        status_filter=None,
+        start_date=None,
+        end_date=None,
+    ):
+        _ = (yaml_path, action_filter, status_filter, start_date, end_date)
+        self.calls.append((offset, limit))
+        end = len(self._events) if limit is None else offset + limit
+        return {
+            "ok": True,
+            "result": {
+                "items": list(self._events[offset:end]),
+                "total": len(self._events),
+                "limit": limit,
+                "offset": offset,
+            },
+        }
+
+
 class _AuditViewUseCase:
     def __init__(self, field_order):
         self._field_order = list(field_order or [])
@@ -102,6 +139,15 @@ class _AuditViewUseCase:
         return list(self._field_order)
 
 
+def _cell_data(dialog, row, col, role=None):
+    model = dialog.audit_table.model()
+    return model.index(row, col).data(Qt.DisplayRole if role is None else role)
+
+
+def _cell_text(dialog, row, col):
+    return str(_cell_data(dialog, row, col) or "")
+
+
 @unittest.skipUnless(PYSIDE_AVAILABLE, "PySide6 not available")
 class AuditDialogTests(ManagedPathTestCase):
     @classmethod
@@ -156,7 +202,7 @@ class AuditDialogTests(ManagedPathTestCase):
             dialog.audit_end_date.setDate(QDate(2099, 12, 31))
             dialog.on_load_audit()
 
-            actions = [dialog.audit_table.item(row, 1).text() for row in range(dialog.audit_table.rowCount())]
+            actions = [_cell_text(dialog, row, 1) for row in range(dialog.audit_table.model().rowCount())]
             self.assertIn("seed", actions)
 
     def test_on_load_audit_works_with_real_gui_bridge(self):
@@ -185,8 +231,8 @@ class AuditDialogTests(ManagedPathTestCase):
         dialog.audit_end_date.setDate(QDate(2099, 12, 31))
         dialog.on_load_audit()
 
-        self.assertGreaterEqual(dialog.audit_table.rowCount(), 1)
-        actions = [dialog.audit_table.item(row, 1).text() for row in range(dialog.audit_table.rowCount())]
+        self.assertGreaterEqual(dialog.audit_table.model().rowCount(), 1)
+        actions = [_cell_text(dialog, row, 1) for row in range(dialog.audit_table.model().rowCount())]
         self.assertIn("seed", actions)
 
     def test_on_load_audit_shows_newest_events_first(self):
@@ -235,9 +281,9 @@ class AuditDialogTests(ManagedPathTestCase):
             dialog.audit_end_date.setDate(QDate(2099, 12, 31))
             dialog.on_load_audit()
 
-            self.assertGreaterEqual(dialog.audit_table.rowCount(), 2)
-            self.assertEqual("2026-02-21T09:00:00", dialog.audit_table.item(0, 0).text())
-            self.assertEqual("move", dialog.audit_table.item(0, 1).text().lower())
+            self.assertGreaterEqual(dialog.audit_table.model().rowCount(), 2)
+            self.assertEqual("2026-02-21T09:00:00", _cell_text(dialog, 0, 0))
+            self.assertEqual("move", _cell_text(dialog, 0, 1).lower())
 
     def test_on_load_audit_prefers_audit_seq_over_timestamp(self):
         bridge = _TimelineBridge(
@@ -261,9 +307,9 @@ class AuditDialogTests(ManagedPathTestCase):
         dialog.audit_end_date.setDate(QDate(2099, 12, 31))
         dialog.on_load_audit()
 
-        self.assertGreaterEqual(dialog.audit_table.rowCount(), 2)
-        self.assertEqual("lower_ts_higher_seq", dialog.audit_table.item(0, 1).text())
-        self.assertEqual("higher_ts_lower_seq", dialog.audit_table.item(1, 1).text())
+        self.assertGreaterEqual(dialog.audit_table.model().rowCount(), 2)
+        self.assertEqual("lower_ts_higher_seq", _cell_text(dialog, 0, 1))
+        self.assertEqual("higher_ts_lower_seq", _cell_text(dialog, 1, 1))
 
     def test_on_load_audit_delegates_field_order_loading_to_use_case(self):
         yaml_path = "D:/tmp/inventory.yaml"
@@ -301,7 +347,7 @@ class AuditDialogTests(ManagedPathTestCase):
         self.assertEqual(["short_name", "plasmid_name"], dialog._audit_field_order)
         self.assertEqual(
             "Box1 Pos2 | short_name=clone-2, plasmid_name=pDemo | x1",
-            dialog.audit_table.item(0, 3).text(),
+            _cell_text(dialog, 0, 3),
         )
 
     def test_on_load_audit_requires_timeline_bridge_method(self):
@@ -316,11 +362,11 @@ class AuditDialogTests(ManagedPathTestCase):
             ("list_audit_timeline" in info_text)
             or (info_text == "operations.failedToLoadAudit")
         )
-        self.assertEqual(0, dialog.audit_table.rowCount())
+        self.assertEqual(0, dialog.audit_table.model().rowCount())
 
     def test_click_row_uses_source_index_after_sort(self):
         dialog = self._new_dialog("D:/tmp/inventory.yaml")
-        dialog._audit_events = [
+        events = [
             {
                 "timestamp": "2026-02-10T09:00:00",
                 "action": "older-event",
@@ -332,29 +378,17 @@ class AuditDialogTests(ManagedPathTestCase):
                 "status": "success",
             },
         ]
-        dialog._setup_table(
-            dialog.audit_table,
-            ["timestamp", "action", "status", "details"],
-            sortable=True,
-        )
-        for idx, event in enumerate(dialog._audit_events):
-            dialog.audit_table.insertRow(idx)
-            ts_item = QTableWidgetItem(event.get("timestamp", ""))
-            ts_item.setData(Qt.UserRole, idx)
-            dialog.audit_table.setItem(idx, 0, ts_item)
-            dialog.audit_table.setItem(idx, 1, QTableWidgetItem(event.get("action", "")))
-            dialog.audit_table.setItem(idx, 2, QTableWidgetItem(event.get("status", "")))
-            dialog.audit_table.setItem(idx, 3, QTableWidgetItem(""))
-
-        dialog.audit_table.sortItems(0, Qt.DescendingOrder)
-        displayed_action = dialog.audit_table.item(0, 1).text()
+        dialog._show_audit_events(events)
+
+        dialog.audit_table.sortByColumn(0, Qt.DescendingOrder)
+        displayed_action = _cell_text(dialog, 0, 1)
         dialog._on_audit_row_clicked(0, 0)
 
         self.assertIn(displayed_action, dialog.event_detail.text())
 
     def test_event_detail_escapes_html_in_details(self):
         dialog = self._new_dialog("D:/tmp/inventory.yaml")
-        dialog._audit_events = [
+        events = [
             {
                 "timestamp": "2026-02-20T09:00:00",
                 "action": "takeout",
@@ -362,18 +396,7 @@ class AuditDialogTests(ManagedPathTestCase):
                 "details": {"note": "<script>alert(1)</script>"},
             }
         ]
-        dialog._setup_table(
-            dialog.audit_table,
-            ["timestamp", "action", "status", "details"],
-            sortable=True,
-        )
-        dialog.audit_table.insertRow(0)
-        ts_item = QTableWidgetItem("2026-02-20T09:00:00")
-        ts_item.setData(Qt.UserRole, 0)
-        dialog.audit_table.setItem(0, 0, ts_item)
-        dialog.audit_table.setItem(0, 1, QTableWidgetItem("takeout"))
-        dialog.audit_table.setItem(0, 2, QTableWidgetItem("success"))
-        dialog.audit_table.setItem(0, 3, QTableWidgetItem(""))
+        dialog._show_audit_events(events)
 
         dialog._on_audit_row_clicked(0, 0)
         detail_html = dialog.event_detail.text()
@@ -409,7 +432,7 @@ class AuditDialogTests(ManagedPathTestCase):
 
         dialog = self._new_dialog("D:/tmp/inventory.yaml")
         dialog._audit_field_order = ["short_name", "plasmid_name", "plasmid_id"]
-        dialog._audit_events = [
+        events = [
             {
                 "timestamp": "2026-02-20T09:00:00",
                 "action": "takeout",
@@ -433,18 +456,7 @@ class AuditDialogTests(ManagedPathTestCase):
                 },
             }
         ]
-        dialog._setup_table(
-            dialog.audit_table,
-            ["timestamp", "action", "status", "details"],
-            sortable=True,
-        )
-        dialog.audit_table.insertRow(0)
-        ts_item = QTableWidgetItem("2026-02-20T09:00:00")
-        ts_item.setData(Qt.UserRole, 0)
-        dialog.audit_table.setItem(0, 0, ts_item)
-        dialog.audit_table.setItem(0, 1, QTableWidgetItem("takeout"))
-        dialog.audit_table.setItem(0, 2, QTableWidgetItem("success"))
-        dialog.audit_table.setItem(0, 3, QTableWidgetItem(""))
+        dialog._show_audit_events(events)
 
         dialog._on_audit_row_clicked(0, 0)
         detail_html = dialog.event_detail.text()
@@ -475,12 +487,12 @@ class AuditDialogTests(ManagedPathTestCase):
         dialog.on_load_audit()
 
         self.assertFalse(dialog.audit_rollback_selected_btn.isEnabled())
-        self.assertEqual(2, dialog.audit_table.rowCount())
+        self.assertEqual(2, dialog.audit_table.model().rowCount())
 
         backup_row = None
         non_backup_row = None
-        for row in range(dialog.audit_table.rowCount()):
-            action = dialog.audit_table.item(row, 1).text()
+        for row in range(dialog.audit_table.model().rowCount()):
+            action = _cell_text(dialog, row, 1)
             if action.lower() == "backup":
                 backup_row = row
             else:
@@ -489,13 +501,13 @@ class AuditDialogTests(ManagedPathTestCase):
         self.assertIsNotNone(backup_row)
         self.assertIsNotNone(non_backup_row)
 
-        self.assertTrue(dialog.audit_table.item(backup_row, 0).font().bold())
-        self.assertFalse(dialog.audit_table.item(non_backup_row, 0).font().bold())
+        self.assertTrue(_cell_data(dialog, backup_row, 0, Qt.FontRole).bold())
+        self.assertIsNone(_cell_data(dialog, non_backup_row, 0, Qt.FontRole))
         self.assertTrue(
-            bool(dialog.audit_table.item(backup_row, 0).data(audit_dialog_module._AUDIT_BACKUP_ROW_ROLE))
+            bool(_cell_data(dialog, backup_row, 0, audit_dialog_module._AUDIT_BACKUP_ROW_ROLE))
         )
         self.assertFalse(
-            bool(dialog.audit_table.item(non_backup_row, 0).data(audit_dialog_module._AUDIT_BACKUP_ROW_ROLE))
+            bool(_cell_data(dialog, non_backup_row, 0, audit_dialog_module._AUDIT_BACKUP_ROW_ROLE))
         )
         self.assertIsInstance(
             dialog.audit_table.itemDelegate(),
@@ -511,5 +523,58 @@ class AuditDialogTests(ManagedPathTestCase):
         self.assertTrue(dialog.audit_rollback_selected_btn.isEnabled())
 
 
+    def test_on_load_audit_pages_timeline_and_prefetches_next_page(self):
+        bridge = _PagedTimelineBridge(450)
+        dialog = self._new_dialog_with_bridge("D:/tmp/inventory.yaml", bridge)
+        dialog.audit_start_date.setDate(QDate(2000, 1, 1))
+        dialog.audit_end_date.setDate(QDate(2099, 12, 31))
+        dialog.on_load_audit()
+
+        model = dialog._audit_model
+        page_size = model.page_size
+        self.assertEqual((0, page_size), bridge.calls[0])
+        self.assertEqual(page_size, model.rowCount())
+        self.assertEqual(450, model.total())
+        self.assertEqual("2026-02-20T09:07:29", _cell_text(dialog, 0, 0))
+
+        # The next page is requested in the background before the view asks for it.
+        self.assertTrue(model._prefetch.done.wait(5))
+        self.assertIn((page_size, page_size), bridge.calls)
+        self.assertTrue(model.canFetchMore())
+        model.fetchMore()
+        self.assertEqual(2 * page_size, model.rowCount())
+        # fetchMore consumed the prefetched page instead of reading it again.
+        self.assertEqual(1, bridge.calls.count((page_size, page_size)))
+
+        while model.canFetchMore():
+            model.fetchMore()
+        self.assertEqual(450, model.rowCount())
+        seqs = [event["audit_seq"] for event in model.events()]
+        self.assertEqual(list(range(450, 0, -1)), seqs)
+        self.assertTrue(all(limit is not None for _offset, limit in bridge.calls))
+
+    def test_details_summaries_are_computed_lazily(self):
+        bridge = _PagedTimelineBridge(50)
+        dialog = self._new_dialog_with_bridge("D:/tmp/inventory.yaml", bridge)
+        calls = []
+        original = audit_dialog_module._summarize_details
+
+        def _counting_summary(details, field_order=None):
+            calls.append(details)
+            return original(details, field_order=field_order)
+
+        audit_dialog_module._summarize_details = _counting_summary
+        try:
+            dialog.audit_start_date.setDate(QDate(2000, 1, 1))
+            dialog.audit_end_date.setDate(QDate(2099, 12, 31))
+            dialog.on_load_audit()
+            self.assertEqual([], calls)
+
+            self.assertEqual("takeout x1 (2026-02-20)", _cell_text(dialog, 3, 3))
+            _cell_text(dialog, 3, 3)
+            self.assertEqual(1, len(calls))
+        finally:
+            audit_dialog_module._summarize_details = original
+
 if __name__ == "__main__":
     unittest.main()
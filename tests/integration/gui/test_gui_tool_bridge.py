@@ -364,6 +364,8 @@ inventory:
             self.assertEqual(str(path), kwargs.get("yaml_path"))
             self.assertIs(tr, kwargs.get("tr_func"))
             self.assertIs(service._shell_state, kwargs.get("shell_state"))
+            self.assertIs(service._tool_result_cache, kwargs.get("result_cache"))
+            self.assertIs(service._tool_result_pager, kwargs.get("result_pager"))
             self.assertNotIn("allowed_tools", kwargs)
             self.assertNotIn("expose_inventory_context", kwargs)
 
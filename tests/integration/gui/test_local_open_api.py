@@ -2,11 +2,14 @@
 
 import json
 import sys
+import threading
+import time
 import unittest
 import urllib.error
 import urllib.parse
 import urllib.request
 from pathlib import Path
+from unittest.mock import patch
 
 from PySide6.QtWidgets import QApplication
 
@@ -15,12 +18,15 @@ ROOT = Path(__file__).resolve().parents[3]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from app_gui.application.open_api.dispatch import MainThreadDispatcher
 from app_gui.application.open_api.http_service import LocalOpenApiService
 from app_gui.application.open_api.service import LocalOpenApiController
 from app_gui.tool_bridge import GuiToolBridge
+from lib import yaml_codec
 from lib.inventory_paths import assert_allowed_inventory_yaml_path
 from lib.plan_item_factory import build_add_plan_item, build_rollback_plan_item
 from lib.plan_store import PlanStore
+from lib.tool_api import tool_edit_entry
 from lib.yaml_ops import write_yaml
 from tests.managed_paths import ManagedPathTestCase
 
@@ -274,6 +280,281 @@ class LocalOpenApiTests(ManagedPathTestCase):
         self.assertNotIn("box_records", result)
         self.assertNotIn("inventory_preview", result)
 
+    def test_http_inventory_summary_route_returns_per_box_occupancy(self):
+        status, payload = self._request("/api/v1/inventory/summary")
+
+        self.assertEqual(200, status)
+        self.assertTrue(payload["ok"])
+        result = payload.get("result") or {}
+        self.assertEqual(405, result.get("total_slots"))
+        self.assertEqual(1, result.get("record_count"))
+        self.assertEqual(1, result.get("total_occupied"))
+        self.assertEqual(5, result.get("box_count"))
+        self.assertEqual({"occupied": 1, "empty": 80, "total": 81}, result["boxes"]["1"])
+        self.assertNotIn("inventory_preview", result)
+
+    def test_http_batch_route_runs_read_operations_against_one_snapshot(self):
+        with patch("lib.yaml_codec.safe_load", wraps=yaml_codec.safe_load) as load_mock:
+            status, payload = self._request(
+                "/api/v1/batch",
+                method="POST",
+                payload={
+                    "operations": [
+                        {"id": "by-id", "op": "search", "params": {"record_id": 1}},
+                        {"id": "by-name", "op": "search", "params": {"query": "rec-1", "mode": "exact"}},
+                        {"op": "filter", "params": {"column_filters": {}, "limit": 5}},
+                        {"op": "stats", "params": {"summary_only": True}},
+                        {"op": "add_entry", "params": {"box": 1}},
+                        {"op": "search", "params": {"box": "not-a-number"}},
+                    ]
+                },
+            )
+
+        self.assertEqual(200, status)
+        self.assertTrue(payload["ok"], payload)
+        self.assertEqual(1, load_mock.call_count)
+        result = payload.get("result") or {}
+        self.assertEqual(6, result.get("count"))
+        self.assertEqual(4, result.get("succeeded_count"))
+        self.assertEqual(2, result.get("failed_count"))
+        results = list(result.get("results") or [])
+        self.assertEqual([0, 1, 2, 3, 4, 5], [item.get("index") for item in results])
+        self.assertEqual("by-id", results[0].get("id"))
+        self.assertEqual(1, results[0]["response"]["result"]["total_count"])
+        self.assertEqual(1, results[1]["response"]["result"]["total_count"])
+        self.assertTrue(results[2]["ok"], results[2])
+        self.assertTrue(results[3]["response"]["result"]["summary_only"])
+        self.assertEqual(400, results[4]["status_code"])
+        self.assertEqual("operations[4].op", results[4]["response"]["field"])
+        self.assertEqual(400, results[5]["status_code"])
+        self.assertEqual("box", results[5]["response"]["field"])
+
+    def test_http_batch_route_shares_one_document_and_its_indexes(self):
+        from lib import yaml_ops
+        from lib.tool_api_impl import read_ops
+
+        document_copies = []
+        original_deepcopy = yaml_ops.deepcopy
+
+        def _counting_deepcopy(value, *args):
+            if isinstance(value, dict) and "inventory" in value:
+                document_copies.append(value)
+            return original_deepcopy(value, *args)
+
+        index_builds = []
+        original_index = read_ops._index_records_by_int_field
+
+        def _counting_index(data, field):
+            index_builds.append(field)
+            return original_index(data, field)
+
+        operations = [
+            {"op": "search", "params": {"record_id": 1}},
+            {"op": "search", "params": {"record_id": 1, "status": "active"}},
+            {"op": "search", "params": {"box": 1}},
+            {"op": "search", "params": {"box": 1, "position": 1}},
+            {"op": "filter", "params": {"limit": 5}},
+            {"op": "stats", "params": {}},
+            {"op": "summary"},
+            {"op": "summary"},
+            {"op": "validate"},
+        ]
+        with patch("lib.yaml_codec.safe_load", wraps=yaml_codec.safe_load) as load_mock, patch.object(
+            yaml_ops, "deepcopy", _counting_deepcopy
+        ), patch.object(read_ops, "_index_records_by_int_field", _counting_index):
+            status, payload = self._request("/api/v1/batch", method="POST", payload={"operations": operations})
+
+        self.assertEqual(200, status)
+        results = payload["result"]["results"]
+        self.assertEqual(len(operations), payload["result"]["succeeded_count"], results)
+        self.assertEqual(1, load_mock.call_count)
+        self.assertEqual([], document_copies)
+        self.assertEqual(["id", "box"], index_builds)
+        self.assertEqual(1, results[0]["response"]["result"]["total_count"])
+        self.assertEqual("occupied", results[3]["response"]["result"]["slot_lookup"]["status"])
+        self.assertEqual(1, results[6]["response"]["result"]["record_count"])
+
+    def test_http_changes_route_long_polls_for_record_deltas(self):
+        status, payload = self._request("/api/v1/changes")
+        self.assertEqual(200, status)
+        self.assertTrue(payload["ok"], payload)
+        result = payload.get("result") or {}
+        self.assertEqual(["seed"], [item.get("action") for item in result.get("changes") or []])
+        self.assertTrue(result.get("full_resync"))
+        seed_seq = result.get("next_after_seq")
+        self.assertEqual(seed_seq, result.get("latest_audit_seq"))
+
+        def _edit_later():
+            threading.Event().wait(0.3)
+            tool_edit_entry(
+                yaml_path=self.fake_yaml_path,
+                record_id=1,
+                fields={"frozen_at": "2024-02-02"},
+            )
+
+        writer = threading.Thread(target=_edit_later)
+        writer.start()
+        try:
+            status, payload = self._request(f"/api/v1/changes?after_seq={seed_seq}&wait_seconds=4")
+        finally:
+            writer.join()
+
+        self.assertEqual(200, status)
+        result = payload.get("result") or {}
+        changes = list(result.get("changes") or [])
+        self.assertEqual(["edit_entry"], [item.get("action") for item in changes])
+        self.assertEqual([1], changes[0].get("record_ids"))
+        self.assertFalse(result.get("full_resync"))
+        self.assertEqual(changes[0]["audit_seq"], result.get("next_after_seq"))
+        self.assertEqual(["2024-02-02"], [rec.get("frozen_at") for rec in result.get("records") or []])
+        self.assertEqual([], result.get("removed_record_ids"))
+
+        status, payload = self._request(f"/api/v1/changes?after_seq={result['next_after_seq']}")
+        self.assertEqual(200, status)
+        self.assertEqual([], payload["result"]["changes"])
+
+        status, payload = self._request("/api/v1/changes?after_seq=-1")
+        self.assertEqual(400, status)
+        self.assertEqual("after_seq", payload.get("field"))
+
+    def _wait_for_dispatch_metric(self, dispatcher, key, expected):
+        deadline = time.monotonic() + 5
+        while dispatcher.metrics()[key] < expected:
+            if time.monotonic() > deadline:
+                self.fail(f"dispatcher metric {key} never reached {expected}: {dispatcher.metrics()}")
+            time.sleep(0.01)
+
+    def _drain_dispatcher(self, threads):
+        deadline = time.monotonic() + 5
+        while any(thread.is_alive() for thread in threads) and time.monotonic() < deadline:
+            self._app.processEvents()
+            time.sleep(0.01)
+        for thread in threads:
+            thread.join(timeout=1)
+
+    def test_main_thread_dispatcher_coalesces_identical_pending_calls(self):
+        dispatcher = MainThreadDispatcher()
+        runs = []
+        results = []
+
+        def _worker():
+            results.append(
+                dispatcher.call(lambda: runs.append("run") or len(runs), coalesce_key=("prefill", "same"))
+            )
+
+        workers = [threading.Thread(target=_worker) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        self._wait_for_dispatch_metric(dispatcher, "coalesced", 2)
+        self._drain_dispatcher(workers)
+
+        self.assertEqual(["run"], runs)
+        self.assertEqual([1, 1, 1], results)
+        metrics = dispatcher.metrics()
+        self.assertEqual(1, metrics["calls"])
+        self.assertEqual(1, metrics["completed"])
+        self.assertEqual(0, metrics["pending"])
+        self.assertGreaterEqual(metrics["queue_wait_ms_max"], 0.0)
+
+    def test_main_thread_dispatcher_yields_between_calls_after_time_budget(self):
+        dispatcher = MainThreadDispatcher(drain_budget=0)
+        runs = []
+        workers = [
+            threading.Thread(target=lambda index=index: dispatcher.call(lambda: runs.append(index)))
+            for index in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        self._wait_for_dispatch_metric(dispatcher, "calls", 3)
+
+        dispatcher._drain()
+        self.assertEqual(1, len(runs))
+        self.assertEqual(2, dispatcher.metrics()["pending"])
+
+        self._drain_dispatcher(workers)
+        self.assertEqual(3, len(runs))
+        self.assertEqual(0, dispatcher.metrics()["pending"])
+
+    def test_main_thread_dispatcher_skips_calls_whose_waiters_timed_out(self):
+        dispatcher = MainThreadDispatcher()
+        runs = []
+        errors = []
+
+        def _worker():
+            try:
+                dispatcher.call(lambda: runs.append("late"), timeout=0.05)
+            except TimeoutError as exc:
+                errors.append(exc)
+
+        worker = threading.Thread(target=_worker)
+        worker.start()
+        worker.join(timeout=5)
+        self._drain_dispatcher([])
+        self._app.processEvents()
+
+        self.assertEqual(1, len(errors))
+        self.assertEqual([], runs)
+        metrics = dispatcher.metrics()
+        self.assertEqual(1, metrics["abandoned"])
+        self.assertEqual(0, metrics["completed"])
+        self.assertEqual(0, metrics["pending"])
+
+    def test_http_gui_handoff_returns_429_when_dispatch_queue_is_full(self):
+        dispatcher = MainThreadDispatcher(max_pending=1, retry_after=2)
+        self.controller._gui_dispatcher = dispatcher
+        self.service.start(port=0)
+        blocker = threading.Thread(target=lambda: dispatcher.call(lambda: None))
+        blocker.start()
+        self._wait_for_dispatch_metric(dispatcher, "calls", 1)
+
+        url = f"http://127.0.0.1:{self.service.bound_port}/api/v1/gui/focus"
+        request = urllib.request.Request(url, data=b"", method="POST")
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            urllib.request.urlopen(request, timeout=5)
+        error = ctx.exception
+        payload = json.loads(error.read().decode("utf-8"))
+        self._drain_dispatcher([blocker])
+
+        self.assertEqual(429, error.code)
+        self.assertEqual("2", error.headers.get("Retry-After"))
+        self.assertEqual("gui_busy", payload.get("error_code"))
+        self.assertEqual(2.0, payload.get("retry_after_seconds"))
+        self.assertEqual([], self.focus_calls)
+        self.assertEqual(1, dispatcher.metrics()["rejected"])
+
+        status, payload = self._request("/api/v1/health")
+        self.assertEqual(200, status)
+        self.assertEqual(1, payload["result"]["gui_dispatch"]["completed"])
+
+    def test_http_export_route_streams_chunked_ndjson_with_column_projection(self):
+        if not self.service.is_running():
+            self.service.start(port=0)
+        url = f"http://127.0.0.1:{self.service.bound_port}/api/v1/inventory/export?columns=id,box,position"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            self.assertEqual(200, response.status)
+            self.assertEqual("chunked", response.headers.get("Transfer-Encoding"))
+            self.assertTrue(response.headers.get("Content-Type", "").startswith("application/x-ndjson"))
+            self.assertEqual("1", response.headers.get("X-SnowFox-Record-Count"))
+            lines = response.read().decode("utf-8").splitlines()
+
+        self.assertEqual([{"id": 1, "box": 1, "position": "1"}], [json.loads(line) for line in lines])
+
+        status, payload = self._request("/api/v1/inventory/export?format=xml")
+        self.assertEqual(400, status)
+        self.assertEqual("format", payload["field"])
+
+        status, payload = self._request("/api/v1/inventory/export?columns=id,missing")
+        self.assertEqual(400, status)
+        self.assertEqual("invalid_tool_input", payload["error_code"])
+
+    def test_http_batch_route_rejects_empty_operations(self):
+        status, payload = self._request("/api/v1/batch", method="POST", payload={"operations": []})
+
+        self.assertEqual(400, status)
+        self.assertFalse(payload["ok"])
+        self.assertEqual("operations", payload["field"])
+        self.assertIn("search", payload.get("accepted_values") or [])
+
     def test_http_datasets_and_switch_dataset_routes_work_for_managed_sessions(self):
         status, payload = self._request("/api/v1/datasets")
 
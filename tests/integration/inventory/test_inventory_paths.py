@@ -30,7 +30,7 @@ from lib.inventory_paths import (
     managed_dataset_name_from_yaml_path,
     rename_managed_dataset_yaml_path,
 )
-from lib.app_storage import set_session_data_root
+from lib.app_storage import path_cache_stats, set_session_data_root
 from lib import yaml_ops
 
 
@@ -75,6 +75,51 @@ def test_assert_allowed_inventory_yaml_path_blocks_external_when_locked(monkeypa
         assert_allowed_inventory_yaml_path(str(outside_yaml), must_exist=True)
 
 
+def test_managed_path_checks_are_cached_until_data_root_changes(monkeypatch, tmp_path):
+    _enable_frozen(monkeypatch, tmp_path)
+
+    managed_yaml = create_managed_dataset_yaml_path("dataset-cached")
+    _write_inventory(managed_yaml)
+    assert_allowed_inventory_yaml_path(managed_yaml, must_exist=True)
+
+    before = path_cache_stats()
+    for _ in range(3):
+        assert_allowed_inventory_yaml_path(managed_yaml, must_exist=True)
+    after = path_cache_stats()
+    assert after["managed_path_hits"] - before["managed_path_hits"] == 3
+    assert after["managed_path_misses"] == before["managed_path_misses"]
+
+    other_root = tmp_path / "other-root"
+    other_root.mkdir()
+    set_session_data_root(str(other_root))
+    assert path_cache_stats()["generation"] > after["generation"]
+    with pytest.raises(InventoryPathError):
+        assert_allowed_inventory_yaml_path(managed_yaml, must_exist=True)
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unavailable")
+def test_managed_path_check_sees_dataset_dir_swapped_for_symlink(monkeypatch, tmp_path):
+    _enable_frozen(monkeypatch, tmp_path)
+
+    managed_yaml = create_managed_dataset_yaml_path("dataset-swapped")
+    _write_inventory(managed_yaml)
+    assert assert_allowed_inventory_yaml_path(managed_yaml, must_exist=True)
+
+    outside_dir = tmp_path / "outside-swapped"
+    _write_inventory(str(outside_dir / "inventory.yaml"))
+    dataset_dir = Path(managed_yaml).parent
+    for child in dataset_dir.iterdir():
+        child.unlink()
+    dataset_dir.rmdir()
+    try:
+        os.symlink(str(outside_dir), str(dataset_dir), target_is_directory=True)
+    except OSError:
+        pytest.skip("symlink creation not permitted")
+
+    with pytest.raises(InventoryPathError):
+        assert_allowed_inventory_yaml_path(managed_yaml, must_exist=True)
+
+
 def test_list_managed_datasets_without_migration(monkeypatch, tmp_path):
     _enable_frozen(monkeypatch, tmp_path)
 
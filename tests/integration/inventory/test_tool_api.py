@@ -10,6 +10,7 @@ import csv
 import json
 import sys
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -28,6 +29,7 @@ from lib.tool_api import (
     tool_collect_timeline,
     tool_edit_entry,
     tool_export_inventory_csv,
+    tool_export_inventory_stream,
     tool_move,
     tool_rollback,
     tool_set_box_layout_indexing,
@@ -42,11 +44,14 @@ from lib.tool_api import (
     tool_recommend_positions,
     tool_search_records,
     tool_generate_stats,
+    tool_inventory_summary,
     tool_list_empty_positions,
 )
 from lib.path_policy import PathPolicyError
 from lib.tool_api_write_validation import resolve_request_backup_path
+from lib import yaml_ops
 from lib.yaml_ops import (
+    collect_inventory_stats,
     create_yaml_backup,
     get_audit_log_path,
     load_yaml,
@@ -909,6 +914,48 @@ class ToolApiTests(ManagedPathTestCase):
             self.assertEqual("7", rows[1]["passage_number"])
             self.assertEqual("中文备注", rows[0]["note"])
 
+    def test_tool_export_inventory_stream_since_audit_seq_exports_changed_records(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_tool_export_stream_") as temp_dir:
+            yaml_path = Path(temp_dir) / "inventory.yaml"
+            output_path = Path(temp_dir) / "delta.ndjson"
+            write_yaml(
+                make_data([make_record(1, box=1, position=1), make_record(2, box=1, position=2)]),
+                path=str(yaml_path),
+                audit_meta={"action": "seed", "source": "tests"},
+            )
+            seed_seq = read_audit_events(str(yaml_path))[-1]["audit_seq"]
+            edited = tool_edit_entry(
+                yaml_path=str(yaml_path),
+                record_id=2,
+                fields={"frozen_at": "2026-02-01"},
+            )
+            self.assertTrue(edited["ok"], edited)
+
+            response = tool_export_inventory_stream(
+                yaml_path=str(yaml_path),
+                output_path=str(output_path),
+                columns=["id", "frozen_at"],
+                since_audit_seq=seed_seq,
+            )
+
+            self.assertTrue(response["ok"], response)
+            result = response["result"]
+            self.assertEqual("ndjson", result["format"])
+            self.assertFalse(result["full_resync"])
+            self.assertEqual(1, result["count"])
+            self.assertGreater(result["latest_audit_seq"], seed_seq)
+            rows = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+            self.assertEqual([{"id": 2, "frozen_at": "2026-02-01"}], rows)
+
+            full = tool_export_inventory_stream(
+                yaml_path=str(yaml_path),
+                output_path=str(output_path),
+                since_audit_seq=0,
+            )
+            self.assertTrue(full["ok"], full)
+            self.assertTrue(full["result"]["full_resync"])
+            self.assertEqual(2, full["result"]["count"])
+
     def test_tool_export_inventory_csv_requires_output_path(self):
         with tempfile.TemporaryDirectory(prefix="ln2_tool_export_csv_path_") as temp_dir:
             yaml_path = Path(temp_dir) / "inventory.yaml"
@@ -1102,6 +1149,112 @@ class ToolApiTests(ManagedPathTestCase):
             self.assertNotIn("stats", result)
             self.assertNotIn("occupancy", result)
 
+    def test_tool_inventory_summary_follows_write_tool_deltas_without_recount(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_tool_summary_") as temp_dir:
+            yaml_path = Path(temp_dir) / "inventory.yaml"
+            write_yaml(
+                make_data([make_record(1, box=1, position=1), make_record(2, box=1, position=2)]),
+                path=str(yaml_path),
+                audit_meta={"action": "seed", "source": "tests"},
+            )
+
+            with patch.object(
+                yaml_ops._OccupancyCounters,
+                "from_records",
+                wraps=yaml_ops._OccupancyCounters.from_records,
+            ) as recount:
+                self.assertTrue(
+                    tool_add_entry(
+                        yaml_path=str(yaml_path),
+                        box=2,
+                        positions=[5, 6],
+                        frozen_at="2026-02-10",
+                        fields={"cell_line": "K562"},
+                    )["ok"]
+                )
+                self.assertTrue(
+                    tool_batch_takeout(
+                        yaml_path=str(yaml_path),
+                        entries=[takeout_entry(1, 1, 1)],
+                        date_str="2026-02-11",
+                    )["ok"]
+                )
+                self.assertTrue(
+                    tool_batch_move(
+                        yaml_path=str(yaml_path),
+                        entries=[move_entry(2, 1, 2, 3, 7)],
+                        date_str="2026-02-12",
+                    )["ok"]
+                )
+                self.assertTrue(tool_edit_entry(yaml_path=str(yaml_path), record_id=3, fields={"note": "edited"})["ok"])
+                response = tool_inventory_summary(str(yaml_path))
+
+            recount.assert_not_called()
+            self.assertTrue(response["ok"])
+            result = response["result"]
+            expected = collect_inventory_stats(load_yaml(str(yaml_path)))
+            for key in ("record_count", "total_slots", "total_occupied", "total_empty", "boxes"):
+                self.assertEqual(expected[key], result[key], key)
+            self.assertEqual(4, result["record_count"])
+            self.assertEqual(3, result["total_occupied"])
+            self.assertEqual({"occupied": 0, "empty": 81, "total": 81}, result["boxes"]["1"])
+            self.assertEqual(2, result["boxes"]["2"]["occupied"])
+            self.assertEqual(1, result["boxes"]["3"]["occupied"])
+            self.assertEqual(81, result["slots_per_box"])
+
+    def test_tool_inventory_summary_recounts_after_external_edit(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_tool_summary_stale_") as temp_dir:
+            yaml_path = Path(temp_dir) / "inventory.yaml"
+            write_yaml(
+                make_data([make_record(1, box=1, position=1)]),
+                path=str(yaml_path),
+                audit_meta={"action": "seed", "source": "tests"},
+            )
+            write_raw_yaml(
+                yaml_path,
+                make_data([make_record(1, box=1, position=1), make_record(2, box=4, position=9)]),
+            )
+
+            response = tool_inventory_summary(str(yaml_path))
+
+            self.assertTrue(response["ok"])
+            self.assertEqual(2, response["result"]["record_count"])
+            self.assertEqual(1, response["result"]["boxes"]["4"]["occupied"])
+
+    def test_tool_inventory_summary_reads_the_active_snapshot(self):
+        with tempfile.TemporaryDirectory(prefix="ln2_tool_summary_snapshot_") as temp_dir:
+            yaml_path = Path(temp_dir) / "inventory.yaml"
+            write_yaml(
+                make_data([make_record(1, box=1, position=1)]),
+                path=str(yaml_path),
+                audit_meta={"action": "seed", "source": "tests"},
+            )
+
+            with yaml_ops.read_snapshot_context(shared=True) as snapshot_id:
+                try:
+                    self.assertEqual(1, len(load_yaml(str(yaml_path))["inventory"]))
+                    # A write from another thread lands on disk mid-snapshot.
+                    writer = threading.Thread(
+                        target=tool_add_entry,
+                        kwargs={
+                            "yaml_path": str(yaml_path),
+                            "box": 2,
+                            "positions": [5],
+                            "frozen_at": "2026-02-10",
+                            "fields": {"cell_line": "K562"},
+                        },
+                    )
+                    writer.start()
+                    writer.join()
+                    in_snapshot = tool_inventory_summary(str(yaml_path))
+                finally:
+                    yaml_ops.clear_read_snapshot(snapshot_id)
+            after = tool_inventory_summary(str(yaml_path))
+
+            self.assertEqual(1, in_snapshot["result"]["record_count"])
+            self.assertEqual(0, in_snapshot["result"]["boxes"]["2"]["occupied"])
+            self.assertEqual(2, after["result"]["record_count"])
+
     def test_tool_generate_stats_include_inactive_returns_taken_out_records(self):
         with tempfile.TemporaryDirectory(prefix="ln2_tool_stats_box_inactive_") as temp_dir:
             yaml_path = Path(temp_dir) / "inventory.yaml"
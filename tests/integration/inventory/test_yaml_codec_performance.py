@@ -0,0 +1,44 @@
+"""
+Module: test_yaml_codec_performance
+Layer: integration/inventory
+Covers: lib/yaml_codec.py, lib/yaml_ops.py
+
+真实规模库存文件的 YAML 读写：默认选用 libyaml 后端，且与纯 Python
+后端的 load/dump 结果逐字节一致。
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from lib import yaml_codec
+from tests.unit.test_yaml_codec import _inventory_document
+
+
+_RECORDS = 2000
+
+
+@unittest.skipUnless(yaml_codec.libyaml_available(), "PyYAML built without libyaml")
+class YamlCodecBackendTests(unittest.TestCase):
+    def test_libyaml_is_default_and_matches_python_on_generated_inventory_file(self):
+        self.assertEqual(yaml_codec.YAML_BACKEND_LIBYAML, yaml_codec.yaml_backend("auto"))
+        data = _inventory_document(_RECORDS)
+        with tempfile.TemporaryDirectory() as td:
+            texts = {}
+            for backend in (yaml_codec.YAML_BACKEND_PYTHON, yaml_codec.YAML_BACKEND_LIBYAML):
+                path = Path(td) / f"{backend}.yaml"
+                with open(path, "w", encoding="utf-8") as handle:
+                    yaml_codec.safe_dump(data, handle, backend=backend)
+                texts[backend] = path.read_text(encoding="utf-8")
+                self.assertEqual(data, yaml_codec.safe_load(texts[backend], backend=backend))
+
+        self.assertEqual(texts[yaml_codec.YAML_BACKEND_PYTHON], texts[yaml_codec.YAML_BACKEND_LIBYAML])
+
+if __name__ == "__main__":
+    unittest.main()
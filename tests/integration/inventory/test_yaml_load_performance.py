@@ -0,0 +1,146 @@
+"""
+Module: test_yaml_load_performance
+Layer: integration/inventory
+Covers: lib/yaml_ops.py, lib/schema_aliases.py
+
+乱码快速扫描：干净文档跳过修复遍历，可疑文档只修复含扫描字符的字符串。
+结构别名视图：加载时不复制别名键，保存时规范化结果与逐条补齐一致。
+"""
+
+import sys
+from copy import deepcopy
+from pathlib import Path
+from unittest.mock import patch
+
+
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from lib import yaml_ops
+from lib.schema_aliases import (
+    canonicalize_inventory_document,
+    expand_document_structural_aliases,
+    expand_record_structural_aliases,
+)
+
+
+_TARGET_BYTES = 2 * 1024 * 1024
+
+
+def _record(rec_id):
+    return {
+        "id": rec_id,
+        "box": rec_id % 100 + 1,
+        "position": rec_id % 81 + 1,
+        "frozen_at": f"2025-01-{rec_id % 28 + 1:02d}",
+        "parent_cell_line": "NCCIT",
+        "short_name": f"rec-{rec_id}",
+        "note": f"vial {rec_id} thawed once; 细胞冻存 batch {rec_id % 50}",
+        "thaw_events": [],
+    }
+
+
+def _render_record(record):
+    return (
+        f"- id: {record['id']}\n"
+        f"  box: {record['box']}\n"
+        f"  position: {record['position']}\n"
+        f"  frozen_at: '{record['frozen_at']}'\n"
+        f"  parent_cell_line: {record['parent_cell_line']}\n"
+        f"  short_name: {record['short_name']}\n"
+        f"  note: {record['note']}\n"
+        "  thaw_events: []\n"
+    )
+
+
+def _generate_document():
+    records = []
+    chunks = ["meta:\n  box_layout:\n    rows: 9\n    cols: 9\ninventory:\n"]
+    size = len(chunks[0])
+    while size < _TARGET_BYTES:
+        record = _record(len(records) + 1)
+        chunk = _render_record(record)
+        records.append(record)
+        chunks.append(chunk)
+        size += len(chunk.encode("utf-8"))
+    data = {"meta": {"box_layout": {"rows": 9, "cols": 9}}, "inventory": records}
+    return "".join(chunks), data
+
+
+def _mojibake(text):
+    for enc in ("gb18030", "gbk", "cp936"):
+        try:
+            return text.encode("utf-8").decode(enc)
+        except UnicodeDecodeError:
+            continue
+    raise AssertionError("Failed to synthesize mojibake sample")
+
+
+def _load_with_repair_spy(tmp_path, raw_text):
+    yaml_path = tmp_path / "inventory.yaml"
+    yaml_path.write_text(raw_text, encoding="utf-8")
+    with patch.object(yaml_ops, "_repair_mojibake_text", wraps=yaml_ops._repair_mojibake_text) as repair:
+        data, scan = yaml_ops._load_yaml_document(str(yaml_path))
+    return data, scan, repair
+
+
+def test_clean_document_skips_the_mojibake_repair_walk(tmp_path):
+    raw_text, expected = _generate_document()
+
+    data, scan, repair = _load_with_repair_spy(tmp_path, raw_text)
+
+    assert scan == {"mojibake_scan": "clean", "suspect_strings": 0, "repaired_strings": 0}
+    repair.assert_not_called()
+    assert data == expected
+
+
+def test_suspect_document_repairs_only_strings_with_scan_chars(tmp_path):
+    raw_text, expected = _generate_document()
+    original = "\u4f60\u662f\u6570\u636e\u6e05\u6d17\u4e0e\u7ed3\u6784\u5316\u52a9\u624b"
+    clean_line = f"  note: {expected['inventory'][9]['note']}\n"
+    raw_text = raw_text.replace(clean_line, f"  note: {_mojibake(original)}\n", 1)
+    expected["inventory"][9]["note"] = original
+
+    data, scan, repair = _load_with_repair_spy(tmp_path, raw_text)
+
+    assert scan == {"mojibake_scan": "suspect", "suspect_strings": 1, "repaired_strings": 1}
+    assert repair.call_count == 1
+    assert data == expected
+
+
+def _expand_every_record(data):
+    # Pre-view behaviour: copy each alias value into its partner key.
+    for record in data["inventory"]:
+        expand_record_structural_aliases(record)
+    return data
+
+
+def test_structural_alias_views_store_no_duplicate_keys_and_save_canonically():
+    canonical_records = [
+        {
+            "id": rec_id,
+            "box": rec_id % 100 + 1,
+            "position": rec_id % 81 + 1,
+            "stored_at": f"2025-01-{rec_id % 28 + 1:02d}",
+            "storage_events": [{"date": "2025-02-01", "action": "takeout", "positions": [rec_id % 81 + 1]}],
+            "note": f"vial {rec_id}",
+        }
+        for rec_id in range(1, 2001)
+    ]
+    loaded = {"meta": {"box_layout": {"rows": 9, "cols": 9}}, "inventory": canonical_records}
+
+    expanded = _expand_every_record(deepcopy(loaded))
+    viewed = expand_document_structural_aliases(deepcopy(loaded))
+
+    for canonical, record in zip(canonical_records, viewed["inventory"]):
+        # Only the stored keys are kept; alias keys resolve on access.
+        assert list(dict.keys(record)) == list(canonical)
+        assert record["frozen_at"] == canonical["stored_at"]
+        assert record.get("thaw_events") is dict.__getitem__(record, "storage_events")
+    assert all("frozen_at" in dict.keys(record) for record in expanded["inventory"])
+
+    canonical_from_expanded, errors_expanded = canonicalize_inventory_document(expanded)
+    canonical_from_views, errors_views = canonicalize_inventory_document(viewed)
+    assert errors_expanded == errors_views == []
+    assert canonical_from_views["inventory"] == canonical_from_expanded["inventory"] == canonical_records
@@ -10,8 +10,10 @@ import json
 import shutil
 import sys
 import tempfile
+import threading
 import unittest
 from contextlib import contextmanager
+from copy import deepcopy
 from pathlib import Path
 from unittest.mock import patch
 
@@ -24,10 +26,13 @@ if str(ROOT) not in sys.path:
 
 from lib.app_storage import clear_session_data_root, migrate_data_root, set_session_data_root
 from lib.inventory_paths import InventoryPathError, create_managed_dataset_yaml_path
+from lib import yaml_ops
 from lib.yaml_ops import (
+    append_audit_events,
     create_yaml_backup,
     get_audit_log_path,
     get_audit_log_paths,
+    iter_audit_events_after,
     list_yaml_backups,
     load_yaml,
     read_audit_events,
@@ -141,6 +146,50 @@ class YamlOpsWriteTests(unittest.TestCase):
             rec = loaded.get("inventory", [])[0]
             self.assertEqual(original_note, rec.get("note"))
 
+    def test_load_yaml_repairs_only_suspect_strings_and_records_scan(self):
+        with managed_inventory_root("ln2_yaml_repair_scan_"):
+            yaml_path = _managed_yaml("repair-scan")
+            original = "\u4f60\u662f\u6570\u636e\u6e05\u6d17\u4e0e\u7ed3\u6784\u5316\u52a9\u624b"
+            valid_note = "\u8bb0\u5f55 #20 (id=20): thaw_events[1] has invalid action"
+
+            data = make_data([make_record(1, box=1, position=1), make_record(2, box=1, position=2)])
+            data["inventory"][0]["note"] = make_utf8_mojibake(original)
+            data["inventory"][1]["note"] = valid_note
+
+            with open(yaml_path, "w", encoding="utf-8") as handle:
+                yaml.safe_dump(data, handle, allow_unicode=True, sort_keys=False, width=120)
+
+            with patch("lib.yaml_ops._repair_mojibake_text", wraps=yaml_ops._repair_mojibake_text) as repair, patch(
+                "lib.diagnostics.diagnostics_enabled", return_value=True
+            ), patch("lib.diagnostics.log_event") as logged:
+                loaded = load_yaml(str(yaml_path))
+
+            self.assertEqual(original, loaded["inventory"][0]["note"])
+            self.assertEqual(valid_note, loaded["inventory"][1]["note"])
+            self.assertEqual(1, repair.call_count)
+            load_calls = [call for call in logged.call_args_list if call.args[0] == "yaml.load"]
+            self.assertEqual("suspect", load_calls[-1].kwargs["mojibake_scan"])
+            self.assertEqual(1, load_calls[-1].kwargs["repaired_strings"])
+
+    def test_load_yaml_skips_repair_walk_for_clean_documents(self):
+        with managed_inventory_root("ln2_yaml_clean_scan_"):
+            yaml_path = _managed_yaml("clean-scan")
+            data = make_data([make_record(1, box=1, position=1)])
+            data["inventory"][0]["note"] = "\u7ec6\u80de\u51bb\u5b58 batch A"
+
+            with open(yaml_path, "w", encoding="utf-8") as handle:
+                yaml.safe_dump(data, handle, allow_unicode=True, sort_keys=False, width=120)
+
+            with patch("lib.yaml_ops._repair_mojibake_text") as repair, patch(
+                "lib.diagnostics.diagnostics_enabled", return_value=True
+            ), patch("lib.diagnostics.log_event") as logged:
+                loaded = load_yaml(str(yaml_path))
+
+            self.assertEqual(data["inventory"][0]["note"], loaded["inventory"][0]["note"])
+            repair.assert_not_called()
+            load_calls = [call for call in logged.call_args_list if call.args[0] == "yaml.load"]
+            self.assertEqual("clean", load_calls[-1].kwargs["mojibake_scan"])
+
 
 class YamlOpsSafetyTests(unittest.TestCase):
     def test_audit_seq_increases_monotonically(self):
@@ -209,6 +258,228 @@ class YamlOpsSafetyTests(unittest.TestCase):
             self.assertEqual(10001, int(events[-1].get("audit_seq")))
             self.assertEqual("hot_append", events[-1].get("action"))
 
+    def test_append_audit_events_allocates_contiguous_range_in_one_write(self):
+        with managed_inventory_root("ln2_audit_bulk_"):
+            yaml_path = _managed_yaml("bulk-append")
+            write_yaml(
+                make_data([make_record(1, box=1, position=1)]),
+                path=str(yaml_path),
+                audit_meta={"action": "seed", "source": "tests"},
+                auto_backup=False,
+            )
+
+            entries = [
+                {"audit_meta": {"action": f"bulk_{index}", "source": "tests"}}
+                for index in range(50)
+            ]
+            with patch("lib.yaml_ops._next_audit_seq", wraps=yaml_ops._next_audit_seq) as next_seq, patch(
+                "lib.yaml_ops.os.fsync"
+            ) as fsync:
+                append_audit_events(str(yaml_path), entries, fsync=True)
+
+            self.assertEqual(1, next_seq.call_count)
+            self.assertEqual(1, fsync.call_count)
+            events = read_audit_events(str(yaml_path))
+            self.assertEqual(list(range(1, 52)), [int(row["audit_seq"]) for row in events])
+            self.assertEqual([f"bulk_{index}" for index in range(50)], [row["action"] for row in events[1:]])
+
+    def test_iter_audit_events_after_seeks_past_consumed_events(self):
+        with managed_inventory_root("ln2_audit_after_"):
+            yaml_path = _managed_yaml("audit-after")
+            write_yaml(
+                make_data([make_record(1, box=1, position=1)]),
+                path=str(yaml_path),
+                audit_meta={"action": "seed", "source": "tests"},
+                auto_backup=False,
+            )
+            append_audit_events(
+                str(yaml_path),
+                [{"audit_meta": {"action": f"bulk_{index}", "source": "tests"}} for index in range(40)],
+            )
+            with open(get_audit_log_path(str(yaml_path)), "a", encoding="utf-8") as handle:
+                handle.write('{"action": "legacy_without_seq"}\nnot json\n\n')
+            append_audit_events(str(yaml_path), [{"audit_meta": {"action": "tail", "source": "tests"}}])
+
+            all_seqs = [int(row["audit_seq"]) for row in read_audit_events(str(yaml_path)) if row.get("audit_seq")]
+            self.assertEqual(42, len(all_seqs))
+            for after in (0, 1, 20, 40, 41, all_seqs[-1], 100):
+                seqs = [int(row["audit_seq"]) for row in iter_audit_events_after(str(yaml_path), after)]
+                self.assertEqual([seq for seq in all_seqs if seq > after], seqs, after)
+
+            with patch("lib.yaml_ops.json.loads", wraps=json.loads) as parsed:
+                first = next(iter_audit_events_after(str(yaml_path), 0))
+            self.assertEqual(1, int(first["audit_seq"]))
+            self.assertLess(parsed.call_count, 20)
+
+    def test_write_yaml_appends_extra_audit_metas_with_write_event(self):
+        with managed_inventory_root("ln2_audit_extra_"):
+            yaml_path = _managed_yaml("extra-audit")
+            with patch("lib.yaml_ops.open", create=True, wraps=open) as opened:
+                write_yaml(
+                    make_data([make_record(1, box=1, position=1)]),
+                    path=str(yaml_path),
+                    audit_meta={"action": "first", "source": "tests"},
+                    extra_audit_metas=[
+                        {"action": "second", "source": "tests"},
+                        {"action": "third", "source": "tests"},
+                    ],
+                    auto_backup=False,
+                )
+
+            audit_opens = [
+                call for call in opened.call_args_list if str(call.args[0]).endswith(".jsonl")
+            ]
+            self.assertEqual(1, len(audit_opens))
+            events = read_audit_events(str(yaml_path))
+            self.assertEqual(["first", "second", "third"], [row["action"] for row in events])
+            self.assertEqual([1, 2, 3], [int(row["audit_seq"]) for row in events])
+
+    def test_write_yaml_reads_previous_instance_id_from_header_cache(self):
+        with managed_inventory_root("ln2_instance_header_"):
+            yaml_path = _managed_yaml("instance-header")
+            write_yaml(
+                make_data([make_record(1, box=1, position=1)]),
+                path=str(yaml_path),
+                audit_meta={"action": "seed", "source": "tests"},
+            )
+            first_id = load_yaml(str(yaml_path))["meta"]["inventory_instance_id"]
+
+            with patch("lib.yaml_ops._load_yaml_document") as full_load, patch(
+                "lib.yaml_codec.safe_load"
+            ) as parsed:
+                write_yaml(
+                    make_data([make_record(1, box=1, position=2)]),
+                    path=str(yaml_path),
+                    audit_meta={"action": "update", "source": "tests"},
+                )
+
+            full_load.assert_not_called()
+            parsed.assert_not_called()
+            self.assertEqual(first_id, load_yaml(str(yaml_path))["meta"]["inventory_instance_id"])
+            self.assertEqual(first_id, read_audit_events(str(yaml_path))[-1]["inventory_instance_id"])
+
+    def test_instance_header_is_reread_after_external_replace(self):
+        with managed_inventory_root("ln2_instance_header_stale_"):
+            yaml_path = _managed_yaml("instance-header-stale")
+            write_yaml(
+                make_data([make_record(1, box=1, position=1)]),
+                path=str(yaml_path),
+                audit_meta={"action": "seed", "source": "tests"},
+            )
+            replaced = yaml_ops.load_yaml_raw(str(yaml_path))
+            replaced["meta"]["inventory_instance_id"] = "replaced-instance-id"
+            staging = Path(str(yaml_path) + ".tmp")
+            with open(staging, "w", encoding="utf-8") as handle:
+                yaml.safe_dump(replaced, handle, allow_unicode=True, sort_keys=False, width=120)
+            staging.replace(yaml_path)
+
+            with patch("lib.yaml_ops._load_yaml_document") as full_load:
+                instance_id = yaml_ops._read_instance_id_header(str(yaml_path))
+
+            self.assertEqual("replaced-instance-id", instance_id)
+            full_load.assert_not_called()
+
+    def test_write_yaml_canonicalizes_once_and_reports_stage_spans(self):
+        with managed_inventory_root("ln2_write_stages_"):
+            yaml_path = _managed_yaml("write-stages")
+            write_yaml(
+                make_data([make_record(1, box=1, position=1)]),
+                path=str(yaml_path),
+                audit_meta={"action": "seed", "source": "tests"},
+            )
+
+            record = make_record(1, box=1, position=2)
+            record["stored_at"] = record.pop("frozen_at")
+            with patch("lib.schema_aliases.deepcopy", wraps=deepcopy) as copied, patch(
+                "lib.diagnostics.diagnostics_enabled", return_value=True
+            ), patch("lib.diagnostics.log_event") as logged:
+                write_yaml(
+                    make_data([record]),
+                    path=str(yaml_path),
+                    audit_meta={"action": "update", "source": "tests"},
+                )
+
+            self.assertEqual(1, copied.call_count)
+            stages = [
+                call.kwargs["stage"] for call in logged.call_args_list if call.args[0] == "yaml.write.stage"
+            ]
+            self.assertEqual(
+                ["canonicalize_aliases", "canonicalize_legacy", "validate", "instance_header", "occupancy", "backup"],
+                stages,
+            )
+            self.assertIn("yaml.write", [call.args[0] for call in logged.call_args_list])
+
+    def test_write_transaction_applies_staged_occupancy_deltas_once(self):
+        with managed_inventory_root("ln2_occupancy_tx_"):
+            yaml_path = _managed_yaml("occupancy-tx")
+            seed = make_data([make_record(1, box=1, position=1)])
+            write_yaml(seed, path=str(yaml_path), audit_meta={"action": "seed", "source": "tests"})
+
+            first = make_data([make_record(1, box=1, position=1), make_record(2, box=2, position=3)])
+            moved = make_data([make_record(1, box=1, position=1), make_record(2, box=2, position=4)])
+            with patch.object(
+                yaml_ops._OccupancyCounters,
+                "from_records",
+                wraps=yaml_ops._OccupancyCounters.from_records,
+            ) as recount:
+                with yaml_ops.write_transaction(str(yaml_path)) as transaction:
+                    write_yaml(first, path=str(yaml_path), occupancy_delta=[(None, first["inventory"][1])])
+                    write_yaml(
+                        moved,
+                        path=str(yaml_path),
+                        occupancy_delta=[(first["inventory"][1], moved["inventory"][1])],
+                    )
+                    transaction.commit()
+
+            recount.assert_not_called()
+            summary = yaml_ops.inventory_summary(str(yaml_path))
+            self.assertEqual(2, summary["record_count"])
+            self.assertEqual(1, summary["boxes"]["2"]["occupied"])
+            self.assertEqual(
+                yaml_ops.collect_inventory_stats(load_yaml(str(yaml_path)))["boxes"],
+                summary["boxes"],
+            )
+
+    def test_write_transaction_is_scoped_to_its_thread(self):
+        with managed_inventory_root("ln2_tx_scope_"):
+            yaml_path = _managed_yaml("tx-scope")
+            seed = make_data([make_record(1, box=1, position=1)])
+            write_yaml(seed, path=str(yaml_path), audit_meta={"action": "seed", "source": "tests"})
+
+            staged = make_data([make_record(1, box=1, position=1), make_record(2, box=1, position=2)])
+            foreign = make_data([make_record(1, box=1, position=5)])
+            seen = {}
+            foreign_written = threading.Event()
+
+            def _foreign_reader():
+                seen["ids"] = [rec["id"] for rec in load_yaml(str(yaml_path))["inventory"]]
+
+            def _foreign_writer():
+                write_yaml(foreign, path=str(yaml_path), audit_meta={"action": "edit", "source": "tests"})
+                foreign_written.set()
+
+            with yaml_ops.write_transaction(str(yaml_path)) as transaction:
+                write_yaml(staged, path=str(yaml_path))
+                self.assertEqual(2, len(load_yaml(str(yaml_path))["inventory"]))
+
+                reader = threading.Thread(target=_foreign_reader)
+                reader.start()
+                reader.join(5)
+                self.assertEqual([1], seen["ids"])
+
+                writer = threading.Thread(target=_foreign_writer)
+                writer.start()
+                self.assertFalse(foreign_written.wait(0.2))
+                transaction.commit()
+                self.assertFalse(foreign_written.is_set())
+
+            writer.join(5)
+            self.assertTrue(foreign_written.is_set())
+            records = load_yaml(str(yaml_path))["inventory"]
+            self.assertEqual([(1, 5)], [(rec["id"], rec["position"]) for rec in records])
+            actions = [event.get("action") for event in read_audit_events(str(yaml_path))]
+            self.assertEqual("edit", actions[-1])
+
     def test_write_yaml_creates_backup_and_audit(self):
         with managed_inventory_root("ln2_safety_"):
             yaml_path = _managed_yaml("write-safety")
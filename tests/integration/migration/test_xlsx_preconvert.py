@@ -12,6 +12,7 @@ from datetime import date
 import json
 from pathlib import Path
 import tempfile
+import threading
 
 from openpyxl import Workbook
 
@@ -103,3 +104,89 @@ def test_convert_staged_files_handles_invalid_xlsx_with_failed_status():
         assert report["status"] == "failed"
         assert report["xlsx_detected"] == 1
         assert report["sources"][0]["status"] == "failed"
+
+
+def _write_multi_sheet_workbook(path, *, sheets=3, rows=40):
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for sheet_number in range(sheets):
+        ws = workbook.create_sheet(f"Box {sheet_number + 1}")
+        ws.append(["box", "position", "frozen_at", "cell_line"])
+        for row_number in range(rows):
+            ws.append([sheet_number + 1, row_number + 1, date(2025, 1, 1 + row_number % 28), f"line-{row_number % 5}"])
+    workbook.save(path)
+
+
+def _sheet_outputs(result):
+    outputs = []
+    for source in result.report["sources"]:
+        summary = _read_json(source["schema_summary_path"])
+        for sheet in summary["sheets"]:
+            csv_text = Path(sheet["csv_path"]).read_text(encoding="utf-8-sig")
+            outputs.append(
+                (
+                    summary["source_name"],
+                    sheet["sheet_index"],
+                    sheet["row_count"],
+                    sheet["columns"],
+                    sheet["header_candidate"],
+                    csv_text,
+                )
+            )
+    return outputs
+
+
+def test_parallel_conversion_matches_sequential_output():
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        sources = []
+        for index in range(2):
+            source_path = root / f"legacy_{index}.xlsx"
+            _write_multi_sheet_workbook(source_path, sheets=3, rows=25)
+            sources.append(str(source_path))
+
+        service = XlsxPreconvertService(max_workers=2, chunk_rows=7)
+        events = []
+        sequential = service.convert_staged_files(sources, normalized_root=str(root / "seq"), parallel=False)
+        parallel = service.convert_staged_files(
+            sources,
+            normalized_root=str(root / "par"),
+            parallel=True,
+            progress_callback=events.append,
+        )
+
+        assert sequential.status == "ok"
+        assert parallel.status == "ok"
+        assert parallel.report["mode"] == "parallel"
+        assert _sheet_outputs(parallel) == _sheet_outputs(sequential)
+        done = [event for event in events if event.get("status") == "done"]
+        assert len(done) == 6
+        assert {event["rows"] for event in done} == {26}
+
+
+def test_conversion_reports_chunk_progress_and_stops_when_cancelled():
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        source_path = root / "legacy.xlsx"
+        _write_multi_sheet_workbook(source_path, sheets=2, rows=30)
+        cancel_event = threading.Event()
+        events = []
+
+        def _on_progress(event):
+            events.append(event)
+            cancel_event.set()
+
+        result = XlsxPreconvertService(chunk_rows=10).convert_staged_files(
+            [str(source_path)],
+            normalized_root=str(root / "normalized"),
+            progress_callback=_on_progress,
+            cancel_event=cancel_event,
+        )
+
+        assert result.status == "cancelled"
+        assert "fallback" in result.message.lower()
+        assert events[0]["status"] == "running"
+        assert events[0]["rows"] == 10
+        report = _read_json(result.report_path)
+        assert report["sources"][0]["status"] == "cancelled"
+        assert report["sources"][0]["sheet_count"] == 0
@@ -0,0 +1,114 @@
+"""
+Module: test_xlsx_preconvert_performance
+Layer: integration/migration
+Covers: app_gui/xlsx_preconvert.py
+
+多工作簿 / 多 Sheet 预转换：生成测试工作簿，确认进程池模式与顺序模式
+输出一致（工作进程以 spawn 启动），且工作进程退出时关闭已打开的工作簿。
+"""
+
+import os
+from pathlib import Path
+import tempfile
+
+from openpyxl import Workbook
+
+from app_gui.xlsx_preconvert import XlsxPreconvertService
+
+
+_WORKBOOKS = 3
+_SHEETS_PER_WORKBOOK = 3
+_ROWS_PER_SHEET = 2000
+
+
+def _generate_workbook(path, workbook_index):
+    workbook = Workbook(write_only=True)
+    for sheet_index in range(_SHEETS_PER_WORKBOOK):
+        ws = workbook.create_sheet(f"Rack {sheet_index + 1}")
+        ws.append(["box", "position", "frozen_at", "cell_line", "note"])
+        for row_index in range(_ROWS_PER_SHEET):
+            ws.append(
+                [
+                    workbook_index * 10 + sheet_index + 1,
+                    row_index % 81 + 1,
+                    f"2025-{row_index % 12 + 1:02d}-{row_index % 28 + 1:02d}",
+                    f"line-{row_index % 17}",
+                    f"vial {row_index} of workbook {workbook_index}",
+                ]
+            )
+    workbook.save(path)
+
+
+def _csv_payloads(result):
+    payloads = {}
+    for source in result.report["sources"]:
+        for csv_path in source["generated_files"]:
+            if csv_path.endswith(".csv"):
+                relative = Path(csv_path).relative_to(result.normalized_root)
+                payloads[str(relative)] = Path(csv_path).read_bytes()
+    return payloads
+
+
+def test_parallel_preconvert_matches_sequential_on_generated_multi_sheet_files(monkeypatch):
+    from app_gui import xlsx_preconvert
+
+    start_methods = []
+    real_pool = xlsx_preconvert.ProcessPoolExecutor
+
+    def _recording_pool(*args, **kwargs):
+        start_methods.append(kwargs["mp_context"].get_start_method())
+        return real_pool(*args, **kwargs)
+
+    monkeypatch.setattr(xlsx_preconvert, "ProcessPoolExecutor", _recording_pool)
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        sources = []
+        for workbook_index in range(_WORKBOOKS):
+            source_path = root / f"legacy_{workbook_index}.xlsx"
+            _generate_workbook(source_path, workbook_index)
+            sources.append(str(source_path))
+
+        workers = max(2, min(4, os.cpu_count() or 1))
+        service = XlsxPreconvertService(max_workers=workers)
+
+        sequential = service.convert_staged_files(sources, normalized_root=str(root / "seq"), parallel=False)
+        parallel = service.convert_staged_files(sources, normalized_root=str(root / "par"), parallel=True)
+
+        assert sequential.status == "ok"
+        assert parallel.status == "ok"
+        assert sequential.report["mode"] == "sequential"
+        assert parallel.report["mode"] == "parallel"
+        assert len(_csv_payloads(parallel)) == _WORKBOOKS * _SHEETS_PER_WORKBOOK
+        assert _csv_payloads(parallel) == _csv_payloads(sequential)
+        assert start_methods == ["spawn"]
+
+
+def test_worker_workbooks_are_closed_by_the_exit_finalizer(monkeypatch):
+    from multiprocessing import util as multiprocessing_util
+
+    from app_gui import xlsx_preconvert
+
+    closed = []
+
+    class _Workbook:
+        def __init__(self, name):
+            self.name = name
+
+        def close(self):
+            closed.append(self.name)
+
+    registered = []
+    monkeypatch.setattr(
+        multiprocessing_util,
+        "Finalize",
+        lambda obj, callback, exitpriority=None: registered.append((callback, exitpriority)),
+    )
+    monkeypatch.setattr(xlsx_preconvert, "_WORKER_WORKBOOKS", {"a.xlsx": _Workbook("a"), "b.xlsx": _Workbook("b")})
+
+    xlsx_preconvert._init_preconvert_worker(None)
+    [(callback, exitpriority)] = registered
+    assert exitpriority is not None
+    callback()
+
+    assert sorted(closed) == ["a", "b"]
+    assert xlsx_preconvert._WORKER_WORKBOOKS == {}
@@ -9,7 +9,7 @@ import sys
 import time
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 ROOT = Path(__file__).resolve().parents[3]
 if str(ROOT) not in sys.path:
@@ -236,5 +236,39 @@ class TestBatchExecutePerformance(ManagedPathTestCase):
         self.assertGreaterEqual(blocked_count, 1)
 
 
+    def test_1000_add_plan_appends_audit_events_in_one_batch(self):
+        """1,000 add audit events are appended as one contiguous batch."""
+        from lib import yaml_ops
+        from lib.yaml_ops import read_audit_events
+
+        plan = [
+            _make_add_item(box=box, position=pos)
+            for box in range(1, 14)
+            for pos in range(1, 82)
+        ][:1000]
+        data = _make_data()
+        data["meta"]["box_layout"]["box_count"] = 13
+        data["meta"]["box_layout"]["box_numbers"] = list(range(1, 14))
+        yaml_path = self.ensure_dataset_yaml("audit_bulk", data)
+
+        with patch.object(
+            yaml_ops,
+            "_append_audit_events",
+            wraps=yaml_ops._append_audit_events,
+        ) as appender:
+            result = run_plan(str(yaml_path), plan, bridge=MagicMock(), mode="execute")
+
+        self.assertTrue(result["ok"], result.get("summary"))
+        add_events = [e for e in read_audit_events(str(yaml_path)) if e.get("action") == "add_entry"]
+        self.assertEqual(1000, len(add_events))
+        seqs = [int(e["audit_seq"]) for e in add_events]
+        self.assertEqual(list(range(seqs[0], seqs[0] + 1000)), seqs)
+        # One append for the request-backup event before the write cycle,
+        # and one append carrying every event of the committed batch.
+        batch_sizes = [len(call.args[1]) for call in appender.call_args_list]
+        self.assertEqual(1, sum(1 for size in batch_sizes if size >= 1000))
+        self.assertLessEqual(len(batch_sizes), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1326,6 +1326,151 @@ class MultiAddPreflightTests(ManagedPathTestCase):
         self.assertEqual(1, takeout_mock.call_count)
 
 
+class TransactionalRunPlanTests(ManagedPathTestCase):
+    def _seed_managed_yaml(self, dataset_name, records):
+        yaml_path = Path(self.ensure_dataset_yaml(dataset_name))
+        write_yaml(
+            make_data(records),
+            path=str(yaml_path),
+            audit_meta={"action": "seed", "source": "tests"},
+        )
+        return yaml_path
+
+    @staticmethod
+    def _mixed_plan():
+        return [
+            make_add_item(box=1, positions=[10]),
+            make_edit_item(record_id=1, box=1, position=1, fields={"note": "edited"}),
+            make_move_item(record_id=2, box=1, position=2, to_position=20),
+            make_takeout_item(record_id=3, box=1, position=3),
+        ]
+
+    def _run(self, dataset_name, items, *, transactional):
+        from lib import yaml_ops
+        from lib.yaml_ops import read_audit_events
+
+        yaml_path = self._seed_managed_yaml(
+            dataset_name,
+            [make_record(1, box=1, position=1), make_record(2, box=1, position=2), make_record(3, box=1, position=3)],
+        )
+        seed_events = len(read_audit_events(str(yaml_path)))
+        with patch.object(yaml_ops, "_write_yaml_to_disk", wraps=yaml_ops._write_yaml_to_disk) as disk_write:
+            result = run_plan(
+                str(yaml_path),
+                items,
+                bridge=GuiToolBridge(session_id=dataset_name),
+                mode="execute",
+                transactional=transactional,
+            )
+        events = read_audit_events(str(yaml_path))[seed_events:]
+        return yaml_path, result, disk_write.call_count, events
+
+    @staticmethod
+    def _inventory_state(yaml_path):
+        return sorted(
+            (rec["id"], rec.get("box"), rec.get("position"), rec.get("note"))
+            for rec in load_yaml(str(yaml_path))["inventory"]
+        )
+
+    @staticmethod
+    def _report_shape(result):
+        return [
+            (report["item"]["action"], report["ok"], report["blocked"], report.get("error_code"))
+            for report in result["items"]
+        ]
+
+    def test_mixed_plan_writes_once_with_same_outcome_as_phased_execution(self):
+        phased_path, phased, phased_writes, phased_events = self._run(
+            "txn-mixed-phased", self._mixed_plan(), transactional=False
+        )
+        txn_path, txn, txn_writes, txn_events = self._run(
+            "txn-mixed-single", self._mixed_plan(), transactional=True
+        )
+
+        self.assertTrue(phased["ok"])
+        self.assertTrue(txn["ok"])
+        self.assertEqual(4, phased_writes)
+        self.assertEqual(1, txn_writes)
+        self.assertEqual(self._report_shape(phased), self._report_shape(txn))
+        self.assertEqual(phased["stats"], txn["stats"])
+        self.assertEqual(self._inventory_state(phased_path), self._inventory_state(txn_path))
+
+        # Same per-item audit records, appended as one contiguous sequence.
+        self.assertEqual(
+            [event["action"] for event in phased_events],
+            [event["action"] for event in txn_events],
+        )
+        seqs = [event["audit_seq"] for event in txn_events]
+        self.assertEqual(list(range(seqs[0], seqs[0] + len(seqs))), seqs)
+        backups = {event.get("backup_path") for event in txn_events if event["action"] == "backup"}
+        self.assertEqual({txn["backup_path"]}, backups)
+
+    def test_blocked_phase_keeps_per_item_semantics(self):
+        items = [
+            make_add_item(box=1, positions=[10]),
+            make_move_item(record_id=2, box=1, position=7, to_position=20),
+            make_takeout_item(record_id=3, box=1, position=3),
+        ]
+        phased_path, phased, _writes, _events = self._run("txn-blocked-phased", list(items), transactional=False)
+        txn_path, txn, txn_writes, _events = self._run("txn-blocked-single", list(items), transactional=True)
+
+        self.assertTrue(txn["blocked"])
+        self.assertEqual(1, txn_writes)
+        self.assertEqual(self._report_shape(phased), self._report_shape(txn))
+        self.assertEqual(
+            [item["action"] for item in phased["remaining_items"]],
+            [item["action"] for item in txn["remaining_items"]],
+        )
+        self.assertEqual(self._inventory_state(phased_path), self._inventory_state(txn_path))
+
+    def test_commit_failure_falls_back_to_phased_writes_and_keeps_failure_audit(self):
+        from lib import yaml_ops
+
+        items = [
+            make_add_item(box=1, positions=[10]),
+            make_move_item(record_id=2, box=1, position=7, to_position=20),
+            make_takeout_item(record_id=3, box=1, position=3),
+        ]
+        phased_path, phased, _writes, phased_events = self._run(
+            "txn-commit-failure-phased", list(items), transactional=False
+        )
+
+        real_write = yaml_ops._write_yaml_to_disk
+        calls = []
+
+        def fail_plan_commit(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 2:  # the first call seeds the dataset
+                raise OSError("disk full")
+            return real_write(*args, **kwargs)
+
+        with patch.object(yaml_ops, "_write_yaml_to_disk", side_effect=fail_plan_commit):
+            txn_path, txn, _writes, txn_events = self._run(
+                "txn-commit-failure", list(items), transactional=True
+            )
+
+        # Seed, the failed single write, then one write per passing phase.
+        self.assertEqual(4, len(calls))
+        self.assertTrue(txn["blocked"])
+        self.assertEqual(self._report_shape(phased), self._report_shape(txn))
+        self.assertEqual(phased["stats"], txn["stats"])
+        self.assertEqual(
+            [item["action"] for item in phased["remaining_items"]],
+            [item["action"] for item in txn["remaining_items"]],
+        )
+        self.assertEqual(self._inventory_state(phased_path), self._inventory_state(txn_path))
+        self.assertIsNotNone(txn["backup_path"])
+        self.assertEqual({}, yaml_ops._write_transactions)
+
+        # The blocked move's failure row survives the failed commit, and each
+        # audit row is written exactly once.
+        def audit_rows(events):
+            return sorted((event["action"], event.get("status")) for event in events)
+
+        self.assertIn(("move", "failed"), audit_rows(txn_events))
+        self.assertEqual(audit_rows(phased_events), audit_rows(txn_events))
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -17,7 +17,8 @@ ROOT = Path(__file__).resolve().parents[3]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from app_gui.plan_preview import simulate_plan_pos_map
+from app_gui.plan_preview import PlanPreviewOverlay, simulate_plan_pos_map
+from lib.schema_aliases import StructuralRecordView
 from lib.yaml_ops import write_yaml
 
 
@@ -164,6 +165,128 @@ class PlanPreviewSimTests(ManagedPathTestCase):
             self.assertEqual(7, out["pos_map"][(2, 3)]["id"])
 
 
+class PlanPreviewOverlayTests(unittest.TestCase):
+    @staticmethod
+    def _reorg_fixture(boxes=10, per_box=60):
+        base = {}
+        rid = 1
+        for box in range(1, boxes + 1):
+            for pos in range(1, per_box + 1):
+                base[rid] = make_record(rid, box=box, pos=pos)
+                rid += 1
+        # Move the first 20 records of each box into the empty slots 61-80.
+        moves = []
+        for rec in base.values():
+            if rec["position"] <= 20:
+                item = move_item(rec["id"], rec["position"], rec["position"] + 60)
+                item["box"] = rec["box"]
+                moves.append(item)
+        return base, moves
+
+    def test_appending_items_applies_only_the_new_item(self):
+        base, moves = self._reorg_fixture(boxes=2)
+        overlay = PlanPreviewOverlay(base)
+        staged = []
+        for item in moves:
+            staged.append(item)
+            overlay.update(list(staged))
+            self.assertEqual(1, overlay.last_applied_count)
+
+        overlay.update(list(staged))
+        self.assertEqual(0, overlay.last_applied_count)
+        self.assertEqual(simulate_plan_pos_map(base_records_by_id=base, plan_items=staged), overlay.result())
+
+    def test_removing_and_adding_items_matches_full_simulation(self):
+        base = {
+            1: make_record(1, box=1, pos=1),
+            2: make_record(2, box=1, pos=2),
+            3: make_record(3, box=1, pos=3),
+        }
+        overlay = PlanPreviewOverlay(base)
+        plan = [move_item(1, 1, 2), takeout_item(3, 3), add_item(1, [4], short="new")]
+        overlay.update(plan)
+        self.assertEqual(simulate_plan_pos_map(base_records_by_id=base, plan_items=plan), overlay.result())
+
+        plan = [plan[0], plan[2]]
+        overlay.update(plan)
+        result = overlay.result()
+        self.assertEqual(simulate_plan_pos_map(base_records_by_id=base, plan_items=plan), result)
+        self.assertEqual(3, result["pos_map"][(1, 3)]["id"])
+        # Only the takeout phase changed, so adds/moves were not re-applied.
+        self.assertEqual(0, overlay.last_applied_count)
+
+        overlay.update([])
+        self.assertEqual({(1, 1): base[1], (1, 2): base[2], (1, 3): base[3]}, overlay.pos_map())
+        self.assertEqual({}, overlay.changed_slots())
+
+    def test_validation_state_changes_do_not_trigger_replay(self):
+        base = {1: make_record(1, box=1, pos=1)}
+        overlay = PlanPreviewOverlay(base)
+        item = move_item(1, 1, 5)
+        overlay.update([item])
+        validated = dict(item, validation={"status": "valid"})
+        overlay.update([validated])
+        self.assertEqual(0, overlay.last_applied_count)
+
+    def test_swap_preview_keeps_record_view_alias_reads(self):
+        base = {
+            1: StructuralRecordView(make_record(1, box=1, pos=1)),
+            2: StructuralRecordView(make_record(2, box=1, pos=2)),
+        }
+        overlay = PlanPreviewOverlay(base)
+        overlay.update([move_item(1, 1, 2)])
+
+        swapped = overlay.record_at((1, 1))
+        moved = overlay.record_at((1, 2))
+        self.assertEqual((2, 1), (swapped["id"], swapped["position"]))
+        self.assertEqual((1, 2), (moved["id"], moved["position"]))
+        for record in (swapped, moved):
+            self.assertIsInstance(record, StructuralRecordView)
+            self.assertEqual("2026-02-10", record["stored_at"])
+
+    def test_base_records_are_never_mutated(self):
+        base = {
+            1: make_record(1, box=1, pos=1),
+            2: make_record(2, box=1, pos=2),
+        }
+        snapshot = {rid: dict(rec) for rid, rec in base.items()}
+        overlay = PlanPreviewOverlay(base)
+        overlay.update([move_item(1, 1, 2), takeout_item(2, 1)])
+        self.assertTrue(overlay.result()["ok"])
+        self.assertEqual(snapshot, base)
+        self.assertIsNone(overlay.record_at((1, 1)))
+        self.assertEqual(1, overlay.record_at((1, 2))["id"])
+        self.assertEqual({(1, 1), (1, 2)}, set(overlay.changed_slots()))
+
+    def test_reorganization_preview_recomputes_only_changed_phases(self):
+        base, moves = self._reorg_fixture(boxes=25)
+        self.assertEqual(500, len(moves))
+        add = add_item(1, [81], short="new")
+        takeout = takeout_item(base[25]["id"], base[25]["position"])
+        takeout["box"] = base[25]["box"]
+
+        overlay = PlanPreviewOverlay(base)
+        overlay.update([add])
+        staged = [add]
+        applied = 0
+        for item in moves:
+            staged.append(item)
+            overlay.update(list(staged))
+            applied += overlay.last_applied_count
+        # Staging 500 moves one by one applies each move exactly once.
+        self.assertEqual(len(moves), applied)
+
+        staged.append(takeout)
+        overlay.update(list(staged))
+        self.assertEqual(1, overlay.last_applied_count)
+
+        # Editing one move replays the move and takeout phases, never the adds.
+        edited = dict(moves[250], to_position=moves[250]["to_position"] + 10)
+        staged[1 + 250] = edited
+        overlay.update(list(staged))
+        self.assertEqual(len(moves) + 1, overlay.last_applied_count)
+        self.assertEqual(simulate_plan_pos_map(base_records_by_id=base, plan_items=staged), overlay.result())
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -29,6 +29,31 @@ class AppStorageTests(unittest.TestCase):
         )
         self.assertEqual(expected, remapped)
 
+    def test_load_configured_data_root_caches_until_config_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir, "config.yaml")
+            config_path.write_text("data_root: /tmp/snowfox-a\n", encoding="utf-8")
+            before = app_storage.path_cache_stats()
+
+            first = app_storage.load_configured_data_root(str(config_path))
+            second = app_storage.load_configured_data_root(str(config_path))
+            stats = app_storage.path_cache_stats()
+            self.assertEqual(os.path.abspath("/tmp/snowfox-a"), first)
+            self.assertEqual(first, second)
+            self.assertEqual(1, stats["data_root_misses"] - before["data_root_misses"])
+            self.assertEqual(1, stats["data_root_hits"] - before["data_root_hits"])
+
+            config_path.write_text("data_root: /tmp/snowfox-bb\n", encoding="utf-8")
+            self.assertEqual(
+                os.path.abspath("/tmp/snowfox-bb"),
+                app_storage.load_configured_data_root(str(config_path)),
+            )
+
+            app_storage.invalidate_path_caches()
+            app_storage.load_configured_data_root(str(config_path))
+            stats = app_storage.path_cache_stats()
+            self.assertEqual(3, stats["data_root_misses"] - before["data_root_misses"])
+
     def test_migrate_data_root_copies_inventories_and_migrate(self):
         with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as target_dir:
             Path(source_dir, "inventories", "demo").mkdir(parents=True, exist_ok=True)
@@ -1,5 +1,10 @@
+import os
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+import pytest
+
+from lib import builtin_skills
 from lib.builtin_skills import build_skill_catalog_prompt, list_builtin_skills, load_builtin_skill
 
 
@@ -59,3 +64,70 @@ def test_skill_markdown_files_exist():
     assert (root / "agent_skills" / "migration" / "SKILL.md").is_file()
     assert (root / "agent_skills" / "snowfox-system" / "SKILL.md").is_file()
     assert (root / "agent_skills" / "yaml-repair" / "SKILL.md").is_file()
+
+
+def _write_skill(skills_root, name, description):
+    skill_root = skills_root / name
+    (skill_root / "references").mkdir(parents=True, exist_ok=True)
+    (skill_root / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n",
+        encoding="utf-8",
+    )
+    return skill_root
+
+
+def _bump_mtime(path, step):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + step * 1_000_000_000))
+
+
+def test_skill_registry_caches_catalog_until_skill_files_change(tmp_path, monkeypatch):
+    skills_root = tmp_path / "agent_skills"
+    skill_root = _write_skill(skills_root, "alpha", "First skill.")
+    monkeypatch.setattr(builtin_skills, "_candidate_skill_roots", lambda: [skills_root])
+    builtin_skills.clear_builtin_skill_cache()
+    load_file = MagicMock(wraps=builtin_skills._load_skill_file)
+    monkeypatch.setattr(builtin_skills, "_load_skill_file", load_file)
+    try:
+        assert "`alpha`: First skill." in build_skill_catalog_prompt()
+        assert [row["name"] for row in list_builtin_skills()] == ["alpha"]
+        assert load_file.call_count == 1
+
+        (skill_root / "SKILL.md").write_text(
+            "---\nname: alpha\ndescription: Edited skill.\n---\n\n# alpha\n",
+            encoding="utf-8",
+        )
+        _bump_mtime(skill_root / "SKILL.md", 1)
+        assert "`alpha`: Edited skill." in build_skill_catalog_prompt()
+
+        _write_skill(skills_root, "beta", "Second skill.")
+        _bump_mtime(skills_root, 2)
+        assert [row["name"] for row in list_builtin_skills()] == ["alpha", "beta"]
+        assert load_file.call_count == 4
+    finally:
+        builtin_skills.clear_builtin_skill_cache()
+
+
+def test_skill_registry_rereads_reference_documents_only_after_changes(tmp_path, monkeypatch):
+    skills_root = tmp_path / "agent_skills"
+    skill_root = _write_skill(skills_root, "alpha", "First skill.")
+    reference = skill_root / "references" / "guide.md"
+    reference.write_text("version one", encoding="utf-8")
+    monkeypatch.setattr(builtin_skills, "_candidate_skill_roots", lambda: [skills_root])
+    builtin_skills.clear_builtin_skill_cache()
+    try:
+        first = load_builtin_skill("alpha")
+        with patch.object(Path, "read_text", side_effect=AssertionError("resource re-read")):
+            assert load_builtin_skill("alpha") == first
+
+        reference.write_text("version two, longer", encoding="utf-8")
+        _bump_mtime(reference, 1)
+        updated = load_builtin_skill("alpha")
+        assert [doc["content"] for doc in updated["reference_documents"]] == ["version two, longer"]
+
+        with pytest.raises(builtin_skills.BuiltinSkillError) as excinfo:
+            load_builtin_skill("missing")
+        assert excinfo.value.code == "unknown_skill"
+        assert excinfo.value.details["available_skills"] == ["alpha"]
+    finally:
+        builtin_skills.clear_builtin_skill_cache()
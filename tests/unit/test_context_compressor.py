@@ -90,6 +90,20 @@ class TestSummarizeToolResult(unittest.TestCase):
         self.assertTrue(parsed["truncated"])
         self.assertEqual(len(parsed["records"]), 2)
 
+    def test_paged_query_keeps_next_cursor(self):
+        records = [{"id": i} for i in range(25)]
+        content = json.dumps({
+            "ok": True,
+            "result": {
+                "records": records,
+                "page": {"offset": 0, "returned": 25, "available": 60, "has_more": True, "next_cursor": "cur_abc_25"},
+            },
+        })
+        parsed = json.loads(_summarize_tool_result(content))
+        self.assertEqual(parsed["count"], 25)
+        self.assertEqual(parsed["available"], 60)
+        self.assertEqual(parsed["next_cursor"], "cur_abc_25")
+
     def test_query_with_few_records_kept(self):
         records = [{"id": 1}, {"id": 2}]
         content = json.dumps({
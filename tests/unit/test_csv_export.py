@@ -6,6 +6,7 @@ Covers: lib/csv_export.py
 Export columns should be derived from effective fields declared in metadata.
 """
 
+import json
 import sys
 import unittest
 from pathlib import Path
@@ -15,7 +16,12 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from lib.csv_export import build_export_columns, build_export_rows
+from lib.csv_export import (
+    build_export_columns,
+    build_export_rows,
+    iter_export_lines,
+    prepare_inventory_export,
+)
 
 
 class CsvExportColumnsTests(unittest.TestCase):
@@ -93,5 +99,38 @@ class CsvExportColumnsTests(unittest.TestCase):
         self.assertEqual("2026-03-21 move A2->B1", payload["rows"][0]["thaw_events"])
 
 
+class StreamingExportTests(unittest.TestCase):
+    DATA = {
+        "meta": {"box_layout": {"rows": 3, "cols": 3}},
+        "inventory": [
+            {"id": 2, "box": 1, "position": 5, "frozen_at": "2026-03-22", "note": "b"},
+            {"id": 1, "box": 1, "position": 1, "frozen_at": "2026-03-21", "note": "a"},
+            {"id": 3, "box": 2, "position": 1, "frozen_at": "2026-03-23", "note": "c"},
+        ],
+    }
+
+    def test_iter_export_lines_ndjson_projects_columns_and_filters_record_ids(self):
+        prepared = prepare_inventory_export(self.DATA, columns="note,id", record_ids={1, 2})
+
+        lines = list(iter_export_lines(prepared, fmt="ndjson"))
+
+        self.assertEqual(["note", "id"], prepared["columns"])
+        self.assertEqual(
+            [{"note": "a", "id": 1}, {"note": "b", "id": 2}],
+            [json.loads(line) for line in lines],
+        )
+
+    def test_iter_export_lines_csv_yields_header_then_one_line_per_record(self):
+        prepared = prepare_inventory_export(self.DATA, columns=["id", "box", "position"])
+
+        lines = list(iter_export_lines(prepared, fmt="csv"))
+
+        self.assertEqual(["id,box,position\r\n", "1,1,1\r\n", "2,1,5\r\n", "3,2,1\r\n"], lines)
+
+    def test_prepare_inventory_export_rejects_unknown_columns(self):
+        with self.assertRaises(ValueError):
+            prepare_inventory_export(self.DATA, columns=["id", "missing_column"])
+
+
 if __name__ == "__main__":
     unittest.main()
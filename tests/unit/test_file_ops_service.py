@@ -55,6 +55,50 @@ def test_handle_shell_defaults_to_repo_root_and_injects_migration_env(monkeypatc
     }
 
 
+def test_handle_shell_runs_on_session_shell_pool(monkeypatch, tmp_path):
+    repo_root = tmp_path / "repo"
+    migrate_root = repo_root / "migrate"
+    (repo_root / "scripts").mkdir(parents=True, exist_ok=True)
+    captured = {}
+
+    class FakePool:
+        def run(self, command, timeout_seconds, cwd, engine, extra_env=None, capture_cwd=False, on_output=None):
+            captured.update(command=command, cwd=cwd, capture_cwd=capture_cwd, on_output=on_output)
+            return {
+                "ok": True,
+                "exit_code": 0,
+                "raw_output": "ok",
+                "effective_cwd": cwd,
+                "engine": "bash",
+                "final_cwd": str(repo_root / "scripts"),
+            }
+
+    def fail_one_shot(*_args, **_kwargs):
+        raise AssertionError("one-shot shell should not be used")
+
+    monkeypatch.setattr(file_ops_service, "run_terminal_command", fail_one_shot)
+
+    response = file_ops_service.handle_request(
+        {
+            "tool": "shell",
+            "args": {"command": "cd scripts", "description": "enter scripts"},
+            "repo_root": str(repo_root),
+            "migrate_root": str(migrate_root),
+        },
+        shell_pool=FakePool(),
+        on_output=print,
+    )
+
+    assert response["ok"] is True
+    assert captured == {
+        "command": "cd scripts",
+        "cwd": str(repo_root.resolve()),
+        "capture_cwd": True,
+        "on_output": print,
+    }
+    assert response["current_workdir"] == "scripts"
+
+
 def test_handle_fs_copy_copies_existing_file_into_migrate(tmp_path):
     repo_root = tmp_path / "repo"
     migrate_root = repo_root / "migrate"
@@ -119,3 +163,167 @@ def test_handle_fs_copy_requires_explicit_overwrite_for_existing_destination(tmp
     assert denied["error_code"] == "file_exists_and_overwrite_false"
     assert allowed["ok"] is True
     assert Path(allowed["resolved_path"]).read_text(encoding="utf-8") == "new\n"
+
+
+def _fs_read(repo_root, **args):
+    return file_ops_service.handle_request(
+        {
+            "tool": "fs_read",
+            "args": {"path": "migrate/inputs/big.csv", **args},
+            "repo_root": str(repo_root),
+            "migrate_root": str(repo_root / "migrate"),
+        }
+    )
+
+
+def _write_numbered_csv(repo_root, count):
+    target = repo_root / "migrate" / "inputs" / "big.csv"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text("".join(f"{idx},row-{idx}\n" for idx in range(1, count + 1)), encoding="utf-8")
+    return target
+
+
+def test_handle_fs_read_returns_line_windows_tail_and_byte_ranges(tmp_path):
+    repo_root = tmp_path / "repo"
+    _write_numbered_csv(repo_root, 10)
+
+    window = _fs_read(repo_root, offset=2, limit=3)
+    tail = _fs_read(repo_root, tail=2)
+    head = _fs_read(repo_root, head=1)
+    raw = _fs_read(repo_root, unit="bytes", offset=4, limit=5)
+
+    assert window["content"] == "3,row-3\n4,row-4\n5,row-5\n"
+    assert (window["start_line"], window["end_line"], window["total_lines"]) == (3, 5, 10)
+    assert window["has_more"] is True
+    assert window["next_offset"] == 5
+    assert tail["content"] == "9,row-9\n10,row-10\n"
+    assert tail["has_more"] is False
+    assert tail["next_offset"] is None
+    assert head["content"] == "1,row-1\n"
+    assert raw["content"] == "w-1\n2"
+    assert (raw["byte_offset"], raw["byte_end"], raw["next_offset"]) == (4, 9, 9)
+
+
+def test_handle_fs_read_returns_grep_style_match_windows(tmp_path):
+    repo_root = tmp_path / "repo"
+    _write_numbered_csv(repo_root, 20)
+
+    response = _fs_read(repo_root, pattern=r"row-(4|5|15)$", context=1)
+    limited = _fs_read(repo_root, pattern=r"row-1\d", max_matches=2)
+
+    assert "content" not in response
+    assert response["match_count"] == 3
+    assert response["truncated"] is False
+    assert [(m["start_line"], m["end_line"], m["match_lines"]) for m in response["matches"]] == [
+        (3, 6, [4, 5]),
+        (14, 16, [15]),
+    ]
+    assert response["matches"][1]["content"] == "14,row-14\n15,row-15\n16,row-16\n"
+    assert limited["match_count"] == 2
+    assert limited["truncated"] is True
+
+
+def test_handle_fs_read_windows_large_files_by_default(tmp_path, monkeypatch):
+    repo_root = tmp_path / "repo"
+    _write_numbered_csv(repo_root, 500)
+    monkeypatch.setattr(file_ops_service, "_FS_READ_FULL_MAX_BYTES", 100)
+
+    response = _fs_read(repo_root)
+
+    assert response["ok"] is True
+    assert response["truncated"] is True
+    assert (response["start_line"], response["end_line"], response["total_lines"]) == (1, 200, 500)
+    assert response["content"].endswith("200,row-200\n")
+    assert "offset/limit" in response["message"]
+
+
+def test_line_index_is_cached_per_file_version(tmp_path, monkeypatch):
+    from agent import file_line_index
+
+    repo_root = tmp_path / "repo"
+    target = _write_numbered_csv(repo_root, 30)
+    file_line_index.clear_line_index_cache()
+    builds = []
+    original = file_line_index._build_line_starts
+    monkeypatch.setattr(
+        file_line_index,
+        "_build_line_starts",
+        lambda path, size: builds.append(path) or original(path, size),
+    )
+
+    _fs_read(repo_root, offset=0, limit=5)
+    _fs_read(repo_root, offset=5, limit=5)
+    target.write_text("only,line\n", encoding="utf-8")
+    changed = _fs_read(repo_root, offset=0, limit=5)
+
+    assert len(builds) == 2
+    assert changed["content"] == "only,line\n"
+    assert changed["total_lines"] == 1
+    file_line_index.clear_line_index_cache()
+
+
+def test_handle_fs_read_windows_utf16_files_without_byte_index(tmp_path):
+    repo_root = tmp_path / "repo"
+    target = repo_root / "migrate" / "inputs" / "big.csv"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text("a\nb\nc\n", encoding="utf-16")
+
+    response = _fs_read(repo_root, encoding="utf-16", tail=1)
+
+    assert response["content"] == "c\n"
+    assert response["total_lines"] == 3
+
+
+def test_handle_fs_read_rejects_conflicting_window_arguments(tmp_path):
+    repo_root = tmp_path / "repo"
+    _write_numbered_csv(repo_root, 3)
+
+    conflicting = _fs_read(repo_root, head=1, tail=1)
+    bad_pattern = _fs_read(repo_root, pattern="(")
+
+    assert conflicting["ok"] is False
+    assert conflicting["error_code"] == "invalid_tool_input"
+    assert bad_pattern["error_code"] == "invalid_tool_input"
+
+
+def test_handle_fs_read_caps_line_windows_by_bytes(tmp_path, monkeypatch):
+    repo_root = tmp_path / "repo"
+    target = repo_root / "migrate" / "inputs" / "big.csv"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text("a" * 40 + "\n" + "b" * 40 + "\n" + "é" * 100 + "\n" + "c\n", encoding="utf-8")
+    monkeypatch.setattr(file_ops_service, "_FS_READ_MAX_BYTES", 100)
+    monkeypatch.setattr(file_ops_service, "_FS_READ_FULL_MAX_BYTES", 10)
+
+    head = _fs_read(repo_root, head=4)
+    long_line = _fs_read(repo_root, offset=2, limit=2)
+    tail = _fs_read(repo_root, tail=4)
+    default = _fs_read(repo_root)
+
+    assert head["content"] == "a" * 40 + "\n" + "b" * 40 + "\n"
+    assert (head["end_line"], head["has_more"], head["next_offset"]) == (2, True, 2)
+    assert long_line["content"] == "é" * 50
+    assert (long_line["truncated_line"], long_line["next_offset"]) == (3, 3)
+    assert tail["content"] == "c\n"
+    assert tail["start_line"] == 4
+    assert default["truncated"] is True
+    assert default["end_line"] == 2
+
+
+def test_handle_fs_read_caps_match_count_and_match_bytes(tmp_path, monkeypatch):
+    repo_root = tmp_path / "repo"
+    _write_numbered_csv(repo_root, 40)
+    monkeypatch.setattr(file_ops_service, "_FS_READ_MAX_MATCHES", 5)
+
+    capped_count = _fs_read(repo_root, pattern="row", max_matches=1000)
+    monkeypatch.setattr(file_ops_service, "_FS_READ_MAX_BYTES", 20)
+    capped_bytes = _fs_read(repo_root, pattern=r"^(1|10|30),")
+    one_window = _fs_read(repo_root, pattern=r"row-20$", context=5)
+
+    assert capped_count["match_count"] == 5
+    assert capped_count["truncated"] is True
+    assert [m["match_lines"] for m in capped_bytes["matches"]] == [[1], [10]]
+    assert capped_bytes["match_count"] == 2
+    assert capped_bytes["truncated"] is True
+    assert one_window["matches"][0]["content"] == "15,row-15\n16,row-16\n"
+    assert one_window["matches"][0]["content_truncated"] is True
+    assert one_window["truncated"] is True
@@ -1,6 +1,8 @@
 """Unit tests for YAML read snapshot caching."""
 
 import builtins
+import copy
+import json
 import sys
 import tempfile
 import unittest
@@ -12,11 +14,13 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from lib.schema_aliases import StructuralRecordView
 from lib.yaml_ops import (
     clear_read_snapshot,
     current_read_snapshot_id,
     load_yaml,
     read_snapshot_context,
+    read_snapshot_index,
 )
 
 
@@ -48,6 +52,46 @@ class ReadSnapshotTests(unittest.TestCase):
             finally:
                 clear_read_snapshot("unit-snapshot")
 
+    def test_shared_snapshot_hands_out_one_read_only_document(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            yaml_path = Path(tmp) / "inventory.yaml"
+            yaml_path.write_text(
+                "meta:\n  box_layout:\n    rows: 9\n    cols: 9\n"
+                "inventory:\n- id: 1\n  box: 1\n  position: 1\n  frozen_at: '2024-01-01'\n  thaw_events: []\n",
+                encoding="utf-8",
+            )
+            builds = []
+
+            try:
+                with read_snapshot_context("unit-shared", shared=True):
+                    first = load_yaml(str(yaml_path))
+                    second = load_yaml(str(yaml_path))
+                    by_box = read_snapshot_index(first, "by_box", lambda doc: builds.append(doc) or {1: 1})
+                    again = read_snapshot_index(second, "by_box", lambda doc: builds.append(doc) or {})
+            finally:
+                clear_read_snapshot("unit-shared")
+
+            self.assertIs(first, second)
+            self.assertEqual({1: 1}, by_box)
+            self.assertIs(by_box, again)
+            self.assertEqual(1, len(builds))
+            record = first["inventory"][0]
+            self.assertEqual("2024-01-01", record["stored_at"])
+            for mutate in (
+                lambda: first["inventory"].append({}),
+                lambda: first["meta"].update({}),
+                lambda: record.__setitem__("box", 2),
+                lambda: record.pop("box"),
+                lambda: first["inventory"].sort(),
+            ):
+                with self.assertRaises(TypeError):
+                    mutate()
+            scratch = copy.deepcopy(first)
+            scratch["inventory"][0]["box"] = 2
+            self.assertIs(type(scratch["inventory"][0]), StructuralRecordView)
+            self.assertEqual(1, record["box"])
+            self.assertEqual("2024-01-01", json.loads(json.dumps(first))["inventory"][0]["frozen_at"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,18 @@
+import copy
+import json
+import pickle
 import unittest
 
+import yaml
+
+from lib import yaml_codec
 from lib.schema_aliases import (
+    StructuralRecordView,
+    canonical_form_stamp,
+    canonicalize_inventory_document,
+    canonicalize_record_structural_aliases,
     coalesce_stored_at_value,
+    expand_document_structural_aliases,
     expand_record_structural_aliases,
     expand_structural_aliases_in_sections,
     get_storage_events,
@@ -142,6 +153,149 @@ class TestSchemaAliases(unittest.TestCase):
         self.assertEqual("2026-02-11", get_stored_at(record))
         self.assertEqual([{"action": "move"}], get_storage_events(record))
 
+    def test_expand_document_wraps_records_without_duplicate_keys(self):
+        data = {"inventory": [{"id": 1, "stored_at": "2026-02-10", "storage_events": [{"action": "takeout"}]}]}
+
+        expand_document_structural_aliases(data)
+
+        record = data["inventory"][0]
+        self.assertIsInstance(record, StructuralRecordView)
+        self.assertEqual(["id", "stored_at", "storage_events"], list(dict.keys(record)))
+        self.assertEqual(["id", "stored_at", "storage_events", "frozen_at", "thaw_events"], list(record))
+        self.assertEqual("2026-02-10", record["frozen_at"])
+        self.assertEqual("2026-02-10", record.get("frozen_at"))
+        self.assertIn("thaw_events", record)
+        self.assertIs(record["storage_events"], record["thaw_events"])
+        self.assertEqual("2026-02-10", record.get_stored_at())
+        self.assertEqual([{"action": "takeout"}], record.get_alias_value("storage_events"))
+        self.assertIsNone(record.get("missing"))
+        with self.assertRaises(KeyError):
+            record["missing"]
+
+    def test_record_view_resolves_canonical_from_legacy_only_record(self):
+        record = StructuralRecordView({"id": 1, "frozen_at": "2026-02-11"})
+
+        self.assertEqual("2026-02-11", record["stored_at"])
+        self.assertEqual("2026-02-11", get_stored_at(record))
+        self.assertNotIn("storage_events", record)
+        self.assertEqual([], record.setdefault("storage_events", []))
+        self.assertEqual([], dict.__getitem__(record, "storage_events"))
+
+    def test_record_view_pop_and_del_remove_both_spellings(self):
+        record = StructuralRecordView({"id": 1, "thaw_events": "broken", "stored_at": "2026-02-10"})
+
+        self.assertEqual("broken", record.pop("storage_events"))
+        self.assertNotIn("thaw_events", record)
+        self.assertNotIn("storage_events", record)
+        self.assertIsNone(record.pop("thaw_events", None))
+        with self.assertRaises(KeyError):
+            record.pop("thaw_events")
+
+        del record["frozen_at"]
+        self.assertEqual({"id": 1}, dict(record))
+        with self.assertRaises(KeyError):
+            del record["stored_at"]
+
+    def test_record_view_spells_out_aliases_for_dict_and_json(self):
+        record = StructuralRecordView({"id": 1, "stored_at": "2026-02-10", "storage_events": []})
+        expanded = {
+            "id": 1,
+            "stored_at": "2026-02-10",
+            "storage_events": [],
+            "frozen_at": "2026-02-10",
+            "thaw_events": [],
+        }
+
+        self.assertEqual(expanded, dict(record))
+        self.assertEqual(expanded, {**record})
+        self.assertEqual(5, len(record))
+        self.assertEqual(expanded, json.loads(json.dumps(record)))
+        self.assertEqual(expanded, json.loads(json.dumps(record, indent=2)))
+
+    def test_record_view_equality_and_writes_agree_with_its_keys(self):
+        record = StructuralRecordView({"id": 1, "stored_at": "2026-02-10"})
+
+        self.assertEqual(record, dict(record))
+        self.assertEqual(dict(record), record)
+        self.assertNotEqual({"id": 1, "stored_at": "2026-02-10"}, record)
+
+        record["frozen_at"] = "2026-03-01"
+        record.update({"thaw_events": [{"action": "move"}]}, note="x")
+        record |= {"id": 2}
+
+        self.assertEqual(
+            [("id", 2), ("stored_at", "2026-03-01"), ("thaw_events", [{"action": "move"}]), ("note", "x")],
+            record.stored_items(),
+        )
+        self.assertEqual("2026-03-01", {**record}["stored_at"])
+        self.assertEqual(len(dict(record)), len(record))
+        self.assertEqual(record, dict(record))
+
+    def test_record_view_dumps_and_pickles_stored_keys_only(self):
+        record = StructuralRecordView({"id": 1, "stored_at": "2026-02-10"})
+        document = {"inventory": [record]}
+
+        for backend in ("python", "libyaml"):
+            dumped = yaml_codec.safe_dump(document, backend=backend)
+            self.assertEqual({"inventory": [{"id": 1, "stored_at": "2026-02-10"}]}, yaml.safe_load(dumped))
+        # The representer lives on the codec's dumpers, not on PyYAML's globals.
+        self.assertNotIn(StructuralRecordView, yaml.SafeDumper.yaml_representers)
+        self.assertNotIn(StructuralRecordView, yaml.representer.Representer.yaml_representers)
+
+        restored = pickle.loads(pickle.dumps(record))
+        self.assertIsInstance(restored, StructuralRecordView)
+        self.assertEqual([("id", 1), ("stored_at", "2026-02-10")], restored.stored_items())
+
+    def test_record_view_copies_stay_views(self):
+        record = StructuralRecordView({"id": 1, "stored_at": "2026-02-10", "storage_events": [{"action": "move"}]})
+
+        shallow = record.copy()
+        deep = copy.deepcopy(record)
+
+        self.assertIsInstance(shallow, StructuralRecordView)
+        self.assertIsInstance(deep, StructuralRecordView)
+        self.assertEqual(record.stored_items(), shallow.stored_items())
+        self.assertEqual(record.stored_items(), deep.stored_items())
+        self.assertEqual("2026-02-10", deep["frozen_at"])
+        self.assertIsNot(record["storage_events"], deep["storage_events"])
+
+    def test_canonicalize_skips_records_without_legacy_keys(self):
+        clean = StructuralRecordView({"id": 1, "stored_at": "2026-02-10"})
+        legacy = {"id": 2, "frozen_at": "2026-02-11", "thaw_events": []}
+
+        plain = {"id": 3, "stored_at": "2026-02-12"}
+        self.assertIs(plain, canonicalize_record_structural_aliases(plain)[0])
+        unwrapped = canonicalize_record_structural_aliases(clean)[0]
+        self.assertIs(type(unwrapped), dict)
+        self.assertEqual({"id": 1, "stored_at": "2026-02-10"}, unwrapped)
+        canonical, errors = canonicalize_inventory_document({"inventory": [clean, legacy]})
+
+        self.assertEqual([], errors)
+        self.assertIs(type(canonical["inventory"][0]), dict)
+        self.assertEqual({"id": 1, "stored_at": "2026-02-10"}, canonical["inventory"][0])
+        self.assertEqual({"id": 2, "stored_at": "2026-02-11", "storage_events": []}, canonical["inventory"][1])
+
+    def test_canonicalize_legacy_only_view_keeps_canonical_value(self):
+        record = StructuralRecordView({"id": 1, "frozen_at": "2026-02-11"})
+
+        canonical, errors = canonicalize_record_structural_aliases(record)
+
+        self.assertEqual([], errors)
+        self.assertEqual({"id": 1, "stored_at": "2026-02-11"}, canonical)
+
+    def test_canonical_form_stamp_skips_copy_only_inside_block(self):
+        document = {"inventory": [{"id": 1, "stored_at": "2026-02-10"}]}
+
+        with canonical_form_stamp(document):
+            stamped, errors = canonicalize_inventory_document(document)
+            copied, _errors = canonicalize_inventory_document(copy.deepcopy(document))
+        after, _errors = canonicalize_inventory_document(document)
+
+        self.assertIs(document, stamped)
+        self.assertEqual([], errors)
+        self.assertEqual(document, copied)
+        self.assertIsNot(document, after)
+
 
 if __name__ == "__main__":
     unittest.main()
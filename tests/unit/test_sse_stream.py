@@ -0,0 +1,137 @@
+"""Unit tests for incremental SSE decoding, stream event coalescing and text throttling."""
+
+import io
+import json
+import random
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent.sse_stream import (
+    SSE_DATA,
+    SSE_PLAIN,
+    SSEDecoder,
+    TextDeltaThrottle,
+    coalesce_text_events,
+    iter_sse_items,
+)
+
+
+class _BlockResponse:
+    """Readable stream that hands out pre-cut blocks through ``read1``."""
+
+    def __init__(self, blocks):
+        self._blocks = list(blocks)
+
+    def read1(self, _size):
+        return self._blocks.pop(0) if self._blocks else b""
+
+
+class SSEDecoderTests(unittest.TestCase):
+    def test_payloads_split_across_blocks_are_reassembled(self):
+        stream = b'data: {"a": 1}\n\ndata: {"b": "\xe7\xbb\x86\xe8\x83\x9e"}\r\n\r\ndata: [DONE]\n\n'
+        rng = random.Random(3)
+        for _ in range(50):
+            cuts = sorted(rng.sample(range(1, len(stream)), 6))
+            blocks = [stream[i:j] for i, j in zip([0] + cuts, cuts + [len(stream)])]
+            items = [item for group in iter_sse_items(_BlockResponse(blocks)) for item in group]
+            self.assertEqual(
+                [(SSE_DATA, b'{"a": 1}'), (SSE_DATA, '{"b": "细胞"}'.encode("utf-8")), (SSE_DATA, b"[DONE]")],
+                items,
+            )
+
+    def test_plain_lines_blank_lines_and_indented_prefix(self):
+        decoder = SSEDecoder()
+        items = decoder.feed(b'{"choices": []}\n  \n   data:{"x":1}\n: keep-alive\n')
+        self.assertEqual(
+            [(SSE_PLAIN, b'{"choices": []}'), (SSE_DATA, b'{"x":1}'), (SSE_PLAIN, b": keep-alive")],
+            items,
+        )
+
+    def test_unterminated_last_line_is_flushed(self):
+        items = list(iter_sse_items(io.BytesIO(b'data: {"a": 1}\ndata: {"b": 2}')))
+        self.assertEqual([[(SSE_DATA, b'{"a": 1}')], [(SSE_DATA, b'{"b": 2}')]], items)
+
+    def test_line_iterable_responses_are_one_block_per_line(self):
+        class _Lines:
+            def __iter__(self):
+                return iter([b'data: {"a": 1}', 'data: {"b": 2}'])
+
+        self.assertEqual(
+            [[(SSE_DATA, b'{"a": 1}')], [(SSE_DATA, b'{"b": 2}')]],
+            list(iter_sse_items(_Lines())),
+        )
+
+    def test_payload_bytes_feed_json_directly(self):
+        payload = {"choices": [{"delta": {"content": "冻存 ok"}}]}
+        stream = f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8")
+        [[(kind, data)]] = list(iter_sse_items(_BlockResponse([stream])))
+        self.assertEqual(SSE_DATA, kind)
+        self.assertEqual(payload, json.loads(data))
+
+
+class TextDeltaThrottleTests(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.throttle = TextDeltaThrottle(interval=0.04, clock=lambda: self.now)
+
+    def _push(self, at, *texts):
+        self.now = at
+        return self.throttle.push([{"type": "answer", "text": text} for text in texts])
+
+    def test_holds_deltas_within_the_window_and_merges_them(self):
+        self.assertEqual([{"type": "answer", "text": "a"}], self._push(0.0, "a"))
+        self.assertEqual([], self._push(0.01, "b"))
+        self.assertEqual([], self._push(0.03, "c"))
+        self.assertEqual([{"type": "answer", "text": "bcd"}], self._push(0.05, "d"))
+        self.assertEqual([], self._push(0.06, "e"))
+        self.assertEqual([{"type": "answer", "text": "e"}], self.throttle.flush())
+        self.assertEqual([], self.throttle.flush())
+
+    def test_other_events_release_held_text_first(self):
+        tool_event = {"type": "tool_call", "tool_call": {"name": "x"}}
+        self._push(0.0, "a")
+        self._push(0.01, "b")
+
+        self.now = 0.02
+        self.assertEqual(
+            [{"type": "answer", "text": "b"}, tool_event],
+            self.throttle.push([tool_event]),
+        )
+
+
+class CoalesceTextEventsTests(unittest.TestCase):
+    def test_merges_consecutive_same_type_text_only(self):
+        tool_event = {"type": "tool_call", "tool_call": {"name": "x"}}
+        events = [
+            {"type": "thought", "text": "a"},
+            {"type": "thought", "text": "b"},
+            {"type": "answer", "text": "c"},
+            {"type": "answer", "text": "d"},
+            tool_event,
+            {"type": "answer", "text": "e"},
+            {"type": "answer", "text": "f", "meta": 1},
+        ]
+
+        self.assertEqual(
+            [
+                {"type": "thought", "text": "ab"},
+                {"type": "answer", "text": "cd"},
+                tool_event,
+                {"type": "answer", "text": "e"},
+                {"type": "answer", "text": "f", "meta": 1},
+            ],
+            coalesce_text_events(events),
+        )
+
+    def test_empty_input(self):
+        self.assertEqual([], coalesce_text_events([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""Unit tests for the YAML codec backend selection and round-trip equivalence."""
+
+import os
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from lib import yaml_codec
+
+
+_EXAMPLES_DIR = ROOT / "migration_assets" / "examples"
+_BACKENDS = (yaml_codec.YAML_BACKEND_LIBYAML, yaml_codec.YAML_BACKEND_PYTHON)
+
+
+def _inventory_document(count, seed=7):
+    rng = random.Random(seed)
+    notes = [
+        "",
+        None,
+        "active tube",
+        "细胞冻存 批次A，复苏后活率 92%",
+        "split 1:3 on 2024-05-01",
+        "yes",
+        "123",
+        "#tagged",
+        "- dash lead",
+        "'quoted'",
+        "key: value",
+        "长备注" * 60,
+    ]
+    records = []
+    for rec_id in range(1, count + 1):
+        events = None
+        if rec_id % 4 == 0:
+            events = [
+                {"action": "takeout", "date": f"2024-{rec_id % 12 + 1:02d}-17", "positions": [rec_id % 81 + 1]},
+                {"action": "move", "date": "2024-07-01", "from_position": 3, "to_position": 4},
+            ]
+        records.append(
+            {
+                "id": rec_id,
+                "box": rec_id % 20 + 1,
+                "position": None if rec_id % 9 == 0 else rec_id % 81 + 1,
+                "stored_at": f"2024-{rec_id % 12 + 1:02d}-{rec_id % 28 + 1:02d}",
+                "cell_line": rng.choice(["K562", "HeLa", "NCCIT", "293T", "未分类"]),
+                "note": rng.choice(notes),
+                "batch": f"BATCH-{rec_id % 37:03d}",
+                "passage": rng.randint(1, 40),
+                "viability": round(rng.uniform(0.5, 1.0), 3),
+                "mycoplasma_free": rng.choice([True, False, None]),
+                "storage_events": events,
+            }
+        )
+    return {
+        "meta": {
+            "version": "1.0",
+            "inventory_instance_id": "0f2c5a8e-2d7d-4c1b-9a55-3e1f0c6b7a10",
+            "box_layout": {"rows": 9, "cols": 9, "box_count": 20, "indexing": "numeric"},
+            "custom_fields": [
+                {"key": "batch", "label": "Batch", "type": "str", "required": False},
+                {"key": "passage", "label": "代次", "type": "int", "required": False},
+            ],
+        },
+        "inventory": records,
+    }
+
+
+@unittest.skipUnless(yaml_codec.libyaml_available(), "PyYAML built without libyaml")
+class YamlCodecEquivalenceTests(unittest.TestCase):
+    def test_inventory_documents_dump_byte_identical_across_backends(self):
+        data = _inventory_document(500)
+        outputs = {backend: yaml_codec.safe_dump(data, backend=backend) for backend in _BACKENDS}
+
+        self.assertEqual(outputs[yaml_codec.YAML_BACKEND_PYTHON], outputs[yaml_codec.YAML_BACKEND_LIBYAML])
+        for backend in _BACKENDS:
+            self.assertEqual(data, yaml_codec.safe_load(outputs[yaml_codec.YAML_BACKEND_LIBYAML], backend=backend))
+
+    def test_example_inventory_files_load_identically(self):
+        for path in sorted(_EXAMPLES_DIR.glob("*.yaml")):
+            text = path.read_text(encoding="utf-8")
+            with self.subTest(path=path.name):
+                loaded = {backend: yaml_codec.safe_load(text, backend=backend) for backend in _BACKENDS}
+                self.assertEqual(loaded[yaml_codec.YAML_BACKEND_PYTHON], loaded[yaml_codec.YAML_BACKEND_LIBYAML])
+                dumped = {backend: yaml_codec.safe_dump(loaded[backend], backend=backend) for backend in _BACKENDS}
+                self.assertEqual(dumped[yaml_codec.YAML_BACKEND_PYTHON], dumped[yaml_codec.YAML_BACKEND_LIBYAML])
+
+    def test_awkward_strings_round_trip_to_same_data_on_both_backends(self):
+        rng = random.Random(11)
+        pieces = ["vial", "细胞", "a:b", "#x", "\n", "\t", "  ", "x" * 50, "中文" * 30, "\u0085", "\U0001f9ea", "，", "'", '"']
+        for _ in range(300):
+            text = "".join(rng.choice(pieces) + rng.choice(["", " "]) for _ in range(rng.randint(1, 40)))
+            data = {"note": text, "events": [{"note": text}]}
+            for dump_backend in _BACKENDS:
+                dumped = yaml_codec.safe_dump(data, backend=dump_backend)
+                for load_backend in _BACKENDS:
+                    self.assertEqual(data, yaml_codec.safe_load(dumped, backend=load_backend))
+
+
+class YamlCodecOptionsTests(unittest.TestCase):
+    def test_default_dump_options_keep_unicode_order_and_width(self):
+        data = {"zeta": "冻存", "alpha": "x " * 70}
+        for backend in _BACKENDS:
+            with self.subTest(backend=backend):
+                text = yaml_codec.safe_dump(data, backend=backend)
+                self.assertTrue(text.startswith("zeta: 冻存\nalpha:"))
+                self.assertEqual(yaml.safe_dump(data, allow_unicode=True, sort_keys=False, width=120), text)
+
+    def test_explicit_options_override_defaults(self):
+        text = yaml_codec.safe_dump({"b": 1, "a": 2}, sort_keys=True)
+        self.assertEqual("a: 2\nb: 1\n", text)
+
+
+class YamlCodecBackendSelectionTests(unittest.TestCase):
+    def tearDown(self):
+        yaml_codec.set_yaml_backend(None)
+
+    def test_env_var_pins_python_backend(self):
+        with patch.dict(os.environ, {yaml_codec.YAML_BACKEND_ENV_VAR: "python"}):
+            self.assertEqual(yaml_codec.YAML_BACKEND_PYTHON, yaml_codec.yaml_backend())
+
+    def test_override_takes_precedence_over_env(self):
+        yaml_codec.set_yaml_backend("python")
+        with patch.dict(os.environ, {yaml_codec.YAML_BACKEND_ENV_VAR: "libyaml"}):
+            self.assertEqual(yaml_codec.YAML_BACKEND_PYTHON, yaml_codec.yaml_backend())
+
+    def test_unknown_override_is_rejected(self):
+        with self.assertRaises(ValueError):
+            yaml_codec.set_yaml_backend("fast")
+
+    def test_falls_back_to_python_without_libyaml(self):
+        with patch.object(yaml_codec, "_C_SAFE_LOADER", None), patch.object(yaml_codec, "_C_SAFE_DUMPER", None):
+            self.assertFalse(yaml_codec.libyaml_available())
+            self.assertEqual(yaml_codec.YAML_BACKEND_PYTHON, yaml_codec.yaml_backend("libyaml"))
+            self.assertEqual({"a": [1, 2]}, yaml_codec.safe_load(yaml_codec.safe_dump({"a": [1, 2]})))
+
+    @unittest.skipUnless(yaml_codec.libyaml_available(), "PyYAML built without libyaml")
+    def test_auto_prefers_libyaml(self):
+        with patch.dict(os.environ, {yaml_codec.YAML_BACKEND_ENV_VAR: ""}):
+            self.assertEqual(yaml_codec.YAML_BACKEND_LIBYAML, yaml_codec.yaml_backend())
+
+
+if __name__ == "__main__":
+    unittest.main()